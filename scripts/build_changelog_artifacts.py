@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# dependencies = ["brotli", "pydantic>=2"]
+# ///
+"""Build minified, precompressed dashboard artifacts from changelog.json.
+
+Writes into the output directory:
+
+- ``changelog.min.json``: every entry, unchanged, without whitespace.
+- ``changelog.<audience>.min.json`` for ``oss``, ``pro`` and ``all``: the
+  published entries a client of that audience shows (its own audience plus
+  ``all``; the ``all`` split holds only ``all`` entries), newest first, with
+  fields that equal their schema default left out.
+- ``.gz`` and ``.br`` variants of each file. Brotli needs the ``brotli``
+  package; without it the ``.br`` files are skipped.
+- ``delta/since-<id>.min.json`` for each of the ``DELTA_WINDOW`` ids below the
+  newest: every entry with a higher id, newest first, so a client that has
+  seen ``<id>`` downloads only what is new.
+- ``manifest.json`` with the SHA-256 and byte size of every file, so clients
+  can compare hashes and skip downloads when nothing changed.
+- ``head.json``: the newest id and its ``published_at``, the ids that have a
+  delta file, and the source hash. Polling clients fetch only this until it
+  changes; ``scripts/changelog_feed_reader.py`` is the reference reader.
+
+Output is deterministic: the same changelog.json always produces the same bytes.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+try:
+    import brotli
+except ModuleNotFoundError:  # pragma: no cover - optional outside the PEP 723 environment
+    brotli = None  # type: ignore[assignment]
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CHANGELOG_PATH = REPO_ROOT / "changelog.json"
+DEFAULT_SCHEMA_PATH = REPO_ROOT / "changelog_schema" / "announcement-schema.json"
+DEFAULT_OUTPUT_DIR = REPO_ROOT / "dist" / "changelog"
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+HEAD_FILE = "head.json"
+HEAD_VERSION = 1
+DELTA_DIR = "delta"
+DELTA_WINDOW = 20
+_DELTA_NAME_PATTERN = re.compile(r"^since-\d+\.min\.json(?:\.gz|\.br)?$")
+AUDIENCES = ("oss", "pro", "all")
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+class ArtifactEncoding(BaseModel):
+    path: str
+    sha256: str
+    bytes: int
+
+
+class ArtifactFile(BaseModel):
+    path: str
+    sha256: str
+    bytes: int
+    entries: int
+    # Keyed by `Content-Encoding` name: `gzip`, `br`.
+    encodings: Dict[str, ArtifactEncoding] = Field(default_factory=dict)
+
+
+class ArtifactManifest(BaseModel):
+    version: int = MANIFEST_VERSION
+    source_sha256: str
+    files: Dict[str, ArtifactFile] = Field(default_factory=dict)
+
+
+class ChangelogHead(BaseModel):
+    version: int = HEAD_VERSION
+    max_id: int
+    # Latest `published_at` of any entry. Ids are not ordered by publish time,
+    # so this is not necessarily the `max_id` entry's timestamp.
+    published_at: str
+    entries: int
+    source_sha256: str
+    # Ids with a `delta/since-<id>.min.json` file, newest first.
+    delta_ids: List[int] = Field(default_factory=list)
+    # Latest `published_at` among entries at or below the oldest delta id: a
+    # client that has seen everything up to this time can use the oldest delta.
+    delta_floor_published_at: str | None = None
+
+
+def minified_json(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def gzip_bytes(data: bytes) -> bytes:
+    # mtime=0 keeps the output reproducible.
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def brotli_bytes(data: bytes) -> Optional[bytes]:
+    if brotli is None:
+        return None
+    return brotli.compress(data, quality=BROTLI_QUALITY)
+
+
+def schema_defaults(schema_path: Path) -> Dict[str, Any]:
+    properties = json.loads(schema_path.read_text())["items"]["properties"]
+    return {name: spec["default"] for name, spec in properties.items() if "default" in spec}
+
+
+def compact_entry(entry: Dict[str, Any], defaults: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in entry.items() if key not in defaults or value != defaults[key]}
+
+
+def audience_entries(
+    entries: List[Dict[str, Any]],
+    audience: str,
+    defaults: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """Published entries shown to `audience` clients, newest first, with default-valued fields dropped."""
+    default_audience = defaults.get("audience", "all")
+    default_published = defaults.get("published", True)
+    visible = {audience, "all"}
+    return [
+        compact_entry(entry, defaults)
+        for entry in sorted(entries, key=lambda entry: entry["id"], reverse=True)
+        if entry.get("published", default_published) and entry.get("audience", default_audience) in visible
+    ]
+
+
+def delta_path(entry_id: int) -> str:
+    return f"{DELTA_DIR}/since-{entry_id}.min.json"
+
+
+def delta_entries(entries: List[Dict[str, Any]], window: int) -> Dict[int, List[Dict[str, Any]]]:
+    """For each of the `window` ids below the newest, the entries above it, newest first. Keyed newest id first."""
+    ordered = sorted(entries, key=lambda entry: entry["id"], reverse=True)
+    return {entry["id"]: ordered[:position] for position, entry in enumerate(ordered[1 : window + 1], 1)}
+
+
+def changelog_head(
+    entries: List[Dict[str, Any]],
+    *,
+    source_sha256: str,
+    delta_ids: List[int],
+) -> ChangelogHead:
+    published = [str(entry["published_at"]) for entry in entries]
+    floor = [str(entry["published_at"]) for entry in entries if delta_ids and entry["id"] <= delta_ids[-1]]
+    return ChangelogHead(
+        max_id=max((entry["id"] for entry in entries), default=0),
+        published_at=max(published, key=published_at_key) if published else "",
+        entries=len(entries),
+        source_sha256=source_sha256,
+        delta_ids=delta_ids,
+        delta_floor_published_at=max(floor, key=published_at_key) if floor else None,
+    )
+
+
+def published_at_key(published_at: str) -> datetime:
+    return datetime.fromisoformat(re.sub(r"[Zz]$", "+00:00", published_at))
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def _remove_stale_deltas(output_dir: Path, keep: set[str]) -> None:
+    delta_dir = output_dir / DELTA_DIR
+    if not delta_dir.is_dir():
+        return
+    for path in delta_dir.iterdir():
+        if _DELTA_NAME_PATTERN.match(path.name) and f"{DELTA_DIR}/{path.name}" not in keep:
+            path.unlink()
+
+
+def build_changelog_artifacts(
+    *,
+    changelog_path: Path = DEFAULT_CHANGELOG_PATH,
+    schema_path: Path = DEFAULT_SCHEMA_PATH,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    delta_window: int = DELTA_WINDOW,
+) -> ArtifactManifest:
+    """Write the artifacts, manifest and head. Files whose bytes did not change are left untouched."""
+    source = changelog_path.read_bytes()
+    entries = json.loads(source)
+    defaults = schema_defaults(schema_path)
+    outputs: Dict[str, Any] = {"changelog.min.json": entries}
+    for audience in AUDIENCES:
+        outputs[f"changelog.{audience}.min.json"] = audience_entries(entries, audience, defaults)
+    deltas = delta_entries(entries, delta_window)
+    outputs.update({delta_path(entry_id): newer for entry_id, newer in deltas.items()})
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = ArtifactManifest(source_sha256=sha256_hex(source))
+    for name, data in outputs.items():
+        raw = minified_json(data)
+        _write_if_changed(output_dir / name, raw)
+        artifact = ArtifactFile(path=name, sha256=sha256_hex(raw), bytes=len(raw), entries=len(data))
+        for encoding, suffix, encoded in (("gzip", ".gz", gzip_bytes(raw)), ("br", ".br", brotli_bytes(raw))):
+            if encoded is None:
+                continue
+            _write_if_changed(output_dir / f"{name}{suffix}", encoded)
+            artifact.encodings[encoding] = ArtifactEncoding(
+                path=f"{name}{suffix}",
+                sha256=sha256_hex(encoded),
+                bytes=len(encoded),
+            )
+        manifest.files[name] = artifact
+    written = {path for artifact in manifest.files.values() for path in _artifact_paths(artifact)}
+    _remove_stale_deltas(output_dir, written)
+    _write_if_changed(
+        output_dir / MANIFEST_FILE,
+        (json.dumps(manifest.model_dump(mode="json"), indent=2, sort_keys=True) + "\n").encode("utf-8"),
+    )
+    head = changelog_head(entries, source_sha256=manifest.source_sha256, delta_ids=list(deltas))
+    _write_if_changed(output_dir / HEAD_FILE, minified_json(head.model_dump(mode="json")))
+    return manifest
+
+
+def _artifact_paths(artifact: ArtifactFile) -> List[str]:
+    return [artifact.path, *(encoding.path for encoding in artifact.encodings.values())]
+
+
+def format_artifact_summary(manifest: ArtifactManifest, source_bytes: int) -> str:
+    lines = [f"Changelog artifacts (source {source_bytes} bytes):"]
+    deltas = [artifact for artifact in manifest.files.values() if artifact.path.startswith(f"{DELTA_DIR}/")]
+    for artifact in manifest.files.values():
+        if artifact in deltas:
+            continue
+        sizes = ", ".join(f"{name} {encoding.bytes}" for name, encoding in artifact.encodings.items())
+        lines.append(f"  {artifact.path}: {artifact.entries} entries, {artifact.bytes} bytes ({sizes})")
+    if deltas:
+        sizes = [artifact.bytes for artifact in deltas]
+        lines.append(f"  {DELTA_DIR}/: {len(deltas)} delta files, {min(sizes)}-{max(sizes)} bytes")
+    return "\n".join(lines)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--changelog", type=Path, default=DEFAULT_CHANGELOG_PATH)
+    parser.add_argument("--schema", type=Path, default=DEFAULT_SCHEMA_PATH)
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--delta-window", type=int, default=DELTA_WINDOW)
+    args = parser.parse_args(argv)
+
+    if brotli is None:
+        print("Warning: the brotli package is not installed; skipping .br artifacts.")
+    manifest = build_changelog_artifacts(
+        changelog_path=args.changelog,
+        schema_path=args.schema,
+        output_dir=args.output_dir,
+        delta_window=args.delta_window,
+    )
+    print(format_artifact_summary(manifest, args.changelog.stat().st_size))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -24,6 +24,9 @@ def is_production_artifact_path(path: Path, *, repo_root: Path) -> bool:
     """Return whether a path is a production changelog/release-note artifact."""
     resolved = path.resolve()
     gitbook_dir = (repo_root / "gitbook-release-notes").resolve()
-    return resolved in production_artifact_paths(repo_root) or (
-        resolved.is_relative_to(gitbook_dir) and resolved.suffix == ".md"
+    shards_dir = (repo_root / "changelog_shards").resolve()
+    return (
+        resolved in production_artifact_paths(repo_root)
+        or (resolved.is_relative_to(gitbook_dir) and resolved.suffix == ".md")
+        or (resolved.is_relative_to(shards_dir) and resolved.suffix == ".json")
     )
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 from slugify import slugify
 
@@ -13,6 +13,7 @@ try:
         REPO_CONFIG,
     )
     from scripts.changelog_llm_outputs import ChangelogLabel, GroupedChangelogOutput
+    from scripts.changelog_pr_similarity import expand_collapsed_pr_numbers, expand_collapsed_prs
     from scripts.changelog_validators import validate_grouped_changelog_output
 except ModuleNotFoundError:  # pragma: no cover
     from changelog_config import (  # type: ignore[no-redef]
@@ -22,11 +23,30 @@ except ModuleNotFoundError:  # pragma: no cover
         REPO_CONFIG,
     )
     from changelog_llm_outputs import ChangelogLabel, GroupedChangelogOutput  # type: ignore[no-redef]
+    from changelog_pr_similarity import expand_collapsed_pr_numbers, expand_collapsed_prs  # type: ignore[no-redef]
     from changelog_validators import validate_grouped_changelog_output  # type: ignore[no-redef]
 
 def slugify_title(title: str) -> str:
     return slugify(title)
 
+def with_unique_slugs(entries: List[Dict[str, Any]], taken: Iterable[str] = ()) -> List[Dict[str, Any]]:
+    """Suffix `-2`, `-3`, ... onto slugs already in `taken` or earlier in `entries`.
+
+    Slugs come from titles, so two groups (or a group and an older entry) with
+    the same title would otherwise break the unique-slug invariant.
+    """
+    used = set(taken)
+    unique: List[Dict[str, Any]] = []
+    for entry in entries:
+        slug = base = entry["slug"]
+        suffix = 2
+        while slug in used:
+            slug = f"{base}-{suffix}"
+            suffix += 1
+        used.add(slug)
+        unique.append(entry if slug == base else {**entry, "slug": slug})
+    return unique
+
 def map_labels(pr_labels: List[str], suggested: List[ChangelogLabel]) -> List[str]:
     mapped = []
     for label in pr_labels:
@@ -46,10 +66,16 @@ def build_grouped_changelog_entries(
     published_at: str,
     starting_id: int,
 ) -> List[Dict[str, Any]]:
-    """Convert grouped LLM output into schema-compliant changelog entries."""
+    """Convert grouped LLM output into schema-compliant changelog entries.
+
+    `prs` are the PRs the model was prompted with. Near-duplicate members
+    collapsed into a representative are expanded back after validation, so
+    labels aggregate over every PR in the group.
+    """
     validate_grouped_changelog_output(grouped_output=grouped_output, prs=prs)
+    grouped_output = expand_collapsed_pr_numbers(grouped_output, prs)
 
-    pr_by_number: Dict[int, Dict[str, Any]] = {pr["number"]: pr for pr in prs}
+    pr_by_number: Dict[int, Dict[str, Any]] = {pr["number"]: pr for pr in expand_collapsed_prs(prs)}
     config = REPO_CONFIG[source_repo]
     entries: List[Dict[str, Any]] = []
     group_count = len(grouped_output.entries)
@@ -84,5 +110,5 @@ def build_grouped_changelog_entries(
             }
         )
 
-    return entries
+    return with_unique_slugs(entries)
 
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# dependencies = ["pydantic>=2"]
+# ///
+"""Poll the changelog artifacts for new entries using head.json and the delta files.
+
+A poll downloads `head.json` (a few hundred bytes). Only when it reports a
+newer id does the reader fetch the smallest delta that covers what the
+client has seen, falling back to the full `changelog.min.json` when the
+client is older than the delta window.
+
+    uv run scripts/changelog_feed_reader.py dist/changelog --since-id 60
+    uv run scripts/changelog_feed_reader.py https://example.com/changelog --since 2026-06-01T00:00:00Z
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+from urllib.request import urlopen
+
+try:
+    from scripts.build_changelog_artifacts import HEAD_FILE, ChangelogHead, delta_path, published_at_key
+except ModuleNotFoundError:  # pragma: no cover - direct script execution
+    from build_changelog_artifacts import (  # type: ignore[no-redef]
+        HEAD_FILE,
+        ChangelogHead,
+        delta_path,
+        published_at_key,
+    )
+
+FULL_CHANGELOG_FILE = "changelog.min.json"
+FETCH_TIMEOUT_SECONDS = 10
+
+
+def location_fetcher(base: str) -> Callable[[str], bytes]:
+    """Fetch artifact names relative to an http(s) base URL or a local directory."""
+    if urlsplit(base).scheme in {"http", "https"}:
+        prefix = base.rstrip("/") + "/"
+
+        def fetch_url(name: str) -> bytes:
+            with urlopen(prefix + name, timeout=FETCH_TIMEOUT_SECONDS) as response:  # noqa: S310 - http(s) only
+                return response.read()
+
+        return fetch_url
+
+    directory = Path(base)
+    return lambda name: (directory / name).read_bytes()
+
+
+class ChangelogFeedReader:
+    """Reads new changelog entries from a built artifact directory, counting the bytes it downloads."""
+
+    def __init__(self, fetch: Callable[[str], bytes]) -> None:
+        self._fetch = fetch
+        self.bytes_fetched = 0
+        self.fetched: List[str] = []
+
+    @classmethod
+    def from_location(cls, base: str) -> "ChangelogFeedReader":
+        return cls(location_fetcher(base))
+
+    def _get_json(self, name: str) -> Any:
+        data = self._fetch(name)
+        self.bytes_fetched += len(data)
+        self.fetched.append(name)
+        return json.loads(data)
+
+    def head(self) -> ChangelogHead:
+        return ChangelogHead.model_validate(self._get_json(HEAD_FILE))
+
+    def _full_changelog(self) -> List[Dict[str, Any]]:
+        return self._get_json(FULL_CHANGELOG_FILE)
+
+    def entries_since_id(self, last_seen_id: int, head: Optional[ChangelogHead] = None) -> List[Dict[str, Any]]:
+        """Entries with an id above `last_seen_id`, newest first."""
+        head = head or self.head()
+        if last_seen_id >= head.max_id:
+            return []
+        # The newest delta whose id the client has already seen holds the fewest extra entries.
+        covering = next((delta_id for delta_id in head.delta_ids if delta_id <= last_seen_id), None)
+        entries = self._get_json(delta_path(covering)) if covering is not None else self._full_changelog()
+        return sorted(
+            (entry for entry in entries if entry["id"] > last_seen_id),
+            key=lambda entry: entry["id"],
+            reverse=True,
+        )
+
+    def entries_since(self, published_at: str, head: Optional[ChangelogHead] = None) -> List[Dict[str, Any]]:
+        """Entries published after `published_at`, newest first."""
+        head = head or self.head()
+        cutoff = published_at_key(published_at)
+        if not head.entries or published_at_key(head.published_at) <= cutoff:
+            return []
+        floor = head.delta_floor_published_at
+        if floor is not None and published_at_key(floor) <= cutoff:
+            entries = self._get_json(delta_path(head.delta_ids[-1]))
+        else:
+            entries = self._full_changelog()
+        return sorted(
+            (entry for entry in entries if published_at_key(str(entry["published_at"])) > cutoff),
+            key=lambda entry: entry["id"],
+            reverse=True,
+        )
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("location", help="Artifact directory or base URL (the build's --output-dir).")
+    since = parser.add_mutually_exclusive_group(required=True)
+    since.add_argument("--since-id", type=int)
+    since.add_argument("--since", help="RFC 3339 timestamp; entries published after it are printed.")
+    args = parser.parse_args(argv)
+
+    reader = ChangelogFeedReader.from_location(args.location)
+    if args.since_id is not None:
+        entries = reader.entries_since_id(args.since_id)
+    else:
+        entries = reader.entries_since(args.since)
+    print(json.dumps(entries, indent=2))
+    print(
+        f"{len(entries)} new entries; fetched {reader.bytes_fetched} bytes ({', '.join(reader.fetched)})",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
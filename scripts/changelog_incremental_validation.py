@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+
+try:
+    from scripts.changelog_env import env_value
+    from scripts.changelog_schema_validation import validate_changelog_data
+except ModuleNotFoundError:  # pragma: no cover
+    from changelog_env import env_value  # type: ignore[no-redef]
+    from changelog_schema_validation import validate_changelog_data  # type: ignore[no-redef]
+
+# The index describes the last changelog.json this automation validated: the
+# hash of its exact text, the schema it was checked against, and the ids and
+# slugs it holds. Like the LLM output history it is a cache restored between
+# workflow runs; when it is missing or does not match the file, the existing
+# entries are validated in full once and the index is rebuilt.
+CHANGELOG_VALIDATION_INDEX_ENV = "CHANGELOG_VALIDATION_INDEX"
+
+
+class ChangelogInvariantError(RuntimeError):
+    """Raised when changelog entries break a cross-entry rule the schema cannot express."""
+
+    def __init__(self, details: List[str]) -> None:
+        self.details = details
+        super().__init__("\n".join(f"- {detail}" for detail in details))
+
+
+class ChangelogIndex(BaseModel):
+    schema_sha256: str
+    content_sha256: str
+    # Newest first, matching the file order.
+    ids: List[int] = Field(default_factory=list)
+    slugs: List[str] = Field(default_factory=list)
+
+
+def text_sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def changelog_invariant_errors(entries: List[Dict[str, Any]], index: Optional[ChangelogIndex] = None) -> List[str]:
+    """Check unique ids and slugs and strictly descending ids, for `entries` placed before `index`."""
+    details: List[str] = []
+    seen_ids = set(index.ids) if index else set()
+    seen_slugs = set(index.slugs) if index else set()
+    previous_id = None
+    for position, entry in enumerate(entries):
+        entry_id = entry.get("id")
+        slug = entry.get("slug")
+        if entry_id in seen_ids:
+            details.append(f"Entry {position} reuses id {entry_id}.")
+        if slug in seen_slugs:
+            details.append(f"Entry {position} reuses slug {slug!r}.")
+        if previous_id is not None and isinstance(entry_id, (int, float)) and entry_id >= previous_id:
+            details.append(f"Entry {position} (id {entry_id}) is not below the previous id {previous_id}.")
+        seen_ids.add(entry_id)
+        seen_slugs.add(slug)
+        if isinstance(entry_id, (int, float)):
+            previous_id = entry_id
+    if index and index.ids and previous_id is not None and previous_id <= index.ids[0]:
+        details.append(f"New entries must have ids above the newest existing id {index.ids[0]}.")
+    return details
+
+
+def existing_changelog_slugs(existing_text: str, index: Optional[ChangelogIndex] = None) -> List[str]:
+    """Slugs in `existing_text`, from `index` when it was built for exactly this text."""
+    if index is not None and index.content_sha256 == text_sha256(existing_text):
+        return list(index.slugs)
+    return [str(entry.get("slug")) for entry in json.loads(existing_text)]
+
+
+def build_changelog_index(entries: List[Dict[str, Any]], *, content_sha256: str, schema_path: Path) -> ChangelogIndex:
+    """Fully validate `entries` and index them."""
+    validate_changelog_data(entries, schema_path)
+    details = changelog_invariant_errors(entries)
+    if details:
+        raise ChangelogInvariantError(details)
+    return ChangelogIndex(
+        schema_sha256=text_sha256(schema_path.read_text()),
+        content_sha256=content_sha256,
+        ids=[int(entry["id"]) for entry in entries],
+        slugs=[str(entry["slug"]) for entry in entries],
+    )
+
+
+def validate_changelog_update(
+    *,
+    new_entries: List[Dict[str, Any]],
+    load_existing_entries: Callable[[], List[Dict[str, Any]]],
+    existing_text: str,
+    updated_text: str,
+    schema_path: Path,
+    index: Optional[ChangelogIndex] = None,
+) -> ChangelogIndex:
+    """Validate the new entries placed before the existing ones and return the index for `updated_text`.
+
+    Only the new entries are schema-checked when `index` matches the existing
+    file text and the current schema. Otherwise the existing entries are
+    loaded and validated in full first.
+    """
+    schema_sha256 = text_sha256(schema_path.read_text())
+    existing_sha256 = text_sha256(existing_text)
+    if index is None or (index.schema_sha256, index.content_sha256) != (schema_sha256, existing_sha256):
+        index = build_changelog_index(load_existing_entries(), content_sha256=existing_sha256, schema_path=schema_path)
+    validate_changelog_data(new_entries, schema_path)
+    details = changelog_invariant_errors(new_entries, index)
+    if details:
+        raise ChangelogInvariantError(details)
+    return ChangelogIndex(
+        schema_sha256=schema_sha256,
+        content_sha256=text_sha256(updated_text),
+        ids=[int(entry["id"]) for entry in new_entries] + index.ids,
+        slugs=[str(entry["slug"]) for entry in new_entries] + index.slugs,
+    )
+
+
+def read_changelog_index(path: Path) -> Optional[ChangelogIndex]:
+    if not path.exists():
+        return None
+    try:
+        return ChangelogIndex.model_validate_json(path.read_text())
+    except (ValidationError, ValueError) as error:
+        print(f"Warning: ignoring unreadable changelog validation index {path}: {error}")
+        return None
+
+
+def write_changelog_index(index: ChangelogIndex, path: Path) -> None:
+    path.write_text(json.dumps(index.model_dump(mode="json")) + "\n")
+
+
+def changelog_index_path_from_env() -> Optional[Path]:
+    raw = env_value(CHANGELOG_VALIDATION_INDEX_ENV)
+    return Path(raw) if raw else None
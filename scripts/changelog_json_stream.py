@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Incremental reader for the items of top-level JSON arrays.
+
+`iter_json_array_items` reads a text stream in chunks and yields one array
+item at a time, so memory holds the current item plus a chunk rather than
+the whole document. Several arrays written back to back (concatenated
+changelog files) are read in turn.
+
+Each item's extent is found by scanning only structural characters and
+strings with regexes; the item text is then parsed with `json.loads`, so
+malformed items get the standard library's error messages.
+"""
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Iterator, Optional, TextIO, Tuple
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE_PATTERN = re.compile(r"[ \t\n\r]*")
+_STRUCTURAL_PATTERN = re.compile(r'[{}\[\]"]')
+_STRING_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_SCALAR_END_PATTERN = re.compile(r"[ \t\n\r,\]}]")
+
+
+class JSONStreamError(ValueError):
+    """Raised for input that is not a sequence of JSON arrays."""
+
+    def __init__(self, message: str, offset: int) -> None:
+        self.offset = offset
+        super().__init__(f"{message} (at character {offset})")
+
+
+def _value_end(buffer: str, pos: int) -> Optional[int]:
+    """End of the JSON value starting at `pos`, or None if the buffer may not hold all of it yet."""
+    first = buffer[pos]
+    if first == '"':
+        match = _STRING_PATTERN.match(buffer, pos)
+        return match.end() if match else None
+    if first not in "{[":
+        match = _SCALAR_END_PATTERN.search(buffer, pos)
+        return match.start() if match else None
+    depth = 0
+    index = pos
+    while True:
+        match = _STRUCTURAL_PATTERN.search(buffer, index)
+        if match is None:
+            return None
+        if match.group() == '"':
+            string = _STRING_PATTERN.match(buffer, match.start())
+            if string is None:
+                return None
+            index = string.end()
+            continue
+        depth += 1 if match.group() in "{[" else -1
+        index = match.end()
+        if depth == 0:
+            return index
+
+
+class _ChunkReader:
+    def __init__(self, stream: TextIO, chunk_size: int) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        # Characters dropped from the front of the buffer, for error offsets.
+        self.dropped = 0
+        self.eof = False
+
+    @property
+    def offset(self) -> int:
+        return self.dropped + self.pos
+
+    def read_more(self) -> bool:
+        if self.eof:
+            return False
+        # Growing reads keep rescanning a large item linear overall.
+        chunk = self.stream.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.dropped += self.pos
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it, or "" at the end."""
+        while True:
+            self.pos = _WHITESPACE_PATTERN.match(self.buffer, self.pos).end()  # type: ignore[union-attr]
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.read_more():
+                return ""
+
+    def value(self) -> Any:
+        while True:
+            end = _value_end(self.buffer, self.pos)
+            if end is not None or not self.read_more():
+                break
+        end = len(self.buffer) if end is None else end
+        try:
+            value = json.loads(self.buffer[self.pos : end])
+        except json.JSONDecodeError as error:
+            raise JSONStreamError(f"Invalid JSON: {error.msg}", self.offset + error.pos) from error
+        self.pos = end
+        return value
+
+
+def iter_json_array_items(
+    stream: TextIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Tuple[int, int, Any]]:
+    """Yield `(array number, index in array, item)` for every item of every top-level array in `stream`."""
+    reader = _ChunkReader(stream, chunk_size)
+    document = 0
+    while True:
+        char = reader.peek()
+        if char == "":
+            if document == 0:
+                raise JSONStreamError("Expected a JSON array, found no data", reader.offset)
+            return
+        if char != "[":
+            raise JSONStreamError(f"Expected '[' to start a JSON array, found {char!r}", reader.offset)
+        reader.pos += 1
+        index = 0
+        if reader.peek() == "]":
+            reader.pos += 1
+        else:
+            while True:
+                if reader.peek() == "":
+                    raise JSONStreamError("Unterminated JSON array", reader.offset)
+                yield document, index, reader.value()
+                index += 1
+                char = reader.peek()
+                if char == ",":
+                    reader.pos += 1
+                    continue
+                if char == "]":
+                    reader.pos += 1
+                    break
+                found = repr(char) if char else "the end of the input"
+                raise JSONStreamError(f"Expected ',' or ']' after array item {index - 1}, found {found}", reader.offset)
+        document += 1
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import inspect
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from anthropic import transform_schema
+from anthropic.types.beta import BetaMessage
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    from openai.types.responses import Response as OpenAIResponse
+except ModuleNotFoundError:  # pragma: no cover - direct runs without PEP 723 resolution
+    OpenAIResponse = None  # type: ignore[assignment,misc]
+
+try:
+    from scripts.changelog_llm_outputs import LLMUsage
+    from scripts.changelog_llm_providers import (
+        ANTHROPIC_STRUCTURED_OUTPUTS_BETA,
+        LLM_PROVIDER_ANTHROPIC,
+        AnthropicStructuredLLMClient,
+        LLMProviderName,
+        OpenAIStructuredLLMClient,
+        anthropic_usage_from_response,
+        openai_response_has_refusal,
+        openai_usage_from_response,
+    )
+except ModuleNotFoundError:  # pragma: no cover
+    from changelog_llm_outputs import LLMUsage  # type: ignore[no-redef]
+    from changelog_llm_providers import (  # type: ignore[no-redef]
+        ANTHROPIC_STRUCTURED_OUTPUTS_BETA,
+        LLM_PROVIDER_ANTHROPIC,
+        AnthropicStructuredLLMClient,
+        LLMProviderName,
+        OpenAIStructuredLLMClient,
+        anthropic_usage_from_response,
+        openai_response_has_refusal,
+        openai_usage_from_response,
+    )
+
+# Request and result lines use each provider's own batch format: OpenAI Batch
+# API JSONL (`/v1/responses` bodies) and Anthropic Message Batches entries
+# (`custom_id` plus `params`), so the files can be submitted unchanged. The
+# local runner below answers the same files through the synchronous APIs.
+OPENAI_BATCH_ENDPOINT = "/v1/responses"
+LOCAL_BATCH_MAX_WORKERS = 8
+
+
+class LLMBatchError(RuntimeError):
+    """Raised for malformed batch request or result files."""
+
+
+class LLMBatchResult(BaseModel):
+    custom_id: str
+    text: Optional[str] = None
+    error: Optional[str] = None
+    usage: Optional[LLMUsage] = None
+
+
+def _strict_json_schema(schema: Dict[str, Any], root: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply OpenAI's strict structured-output rules to one (sub)schema.
+
+    Objects are closed and list every property as required, `None` defaults
+    are dropped, and a `$ref` with sibling keywords is inlined, since strict
+    mode only accepts a bare `$ref`.
+    """
+    ref = schema.get("$ref")
+    if ref and len(schema) > 1:
+        resolved: Any = root
+        for key in str(ref).removeprefix("#/").split("/"):
+            resolved = resolved[key]
+        schema = {**resolved, **{key: value for key, value in schema.items() if key != "$ref"}}
+    strict = dict(schema)
+    for key in ("$defs", "properties"):
+        if isinstance(strict.get(key), dict):
+            strict[key] = {name: _strict_json_schema(child, root) for name, child in strict[key].items()}
+    if isinstance(strict.get("items"), dict):
+        strict["items"] = _strict_json_schema(strict["items"], root)
+    for key in ("anyOf", "allOf"):
+        if isinstance(strict.get(key), list):
+            strict[key] = [_strict_json_schema(child, root) for child in strict[key]]
+    if strict.get("type") == "object":
+        strict.setdefault("additionalProperties", False)
+    if isinstance(strict.get("properties"), dict):
+        strict["required"] = list(strict["properties"])
+    if "default" in strict and strict["default"] is None:
+        del strict["default"]
+    return strict
+
+
+def openai_text_format(output_model: type[BaseModel]) -> Dict[str, Any]:
+    """The Responses API `text.format` parameter for a strict JSON schema of `output_model`."""
+    schema = output_model.model_json_schema()
+    return {
+        "type": "json_schema",
+        "strict": True,
+        "name": output_model.__name__,
+        "schema": _strict_json_schema(schema, schema),
+    }
+
+
+def openai_batch_request(
+    client: OpenAIStructuredLLMClient,
+    *,
+    custom_id: str,
+    prompt: str,
+    output_model: type[BaseModel],
+    max_output_tokens: int,
+    call_name: str,
+) -> Dict[str, Any]:
+    body = client.request_kwargs(
+        prompt=prompt,
+        output_model=output_model,
+        max_output_tokens=max_output_tokens,
+        call_name=call_name,
+    )
+    body["text"] = {"format": openai_text_format(body.pop("text_format"))}
+    return {"custom_id": custom_id, "method": "POST", "url": OPENAI_BATCH_ENDPOINT, "body": body}
+
+
+def anthropic_batch_request(
+    client: AnthropicStructuredLLMClient,
+    *,
+    custom_id: str,
+    prompt: str,
+    output_model: type[BaseModel],
+    max_output_tokens: int,
+    call_name: str,
+) -> Dict[str, Any]:
+    params = client.request_kwargs(
+        prompt=prompt,
+        output_model=output_model,
+        max_output_tokens=max_output_tokens,
+        call_name=call_name,
+    )
+    # The structured-outputs beta is a header on the batch-create call, not a per-request param.
+    params.pop("betas")
+    schema = transform_schema(TypeAdapter(params.pop("output_format")).json_schema())
+    params.update(params.pop("extra_body"))
+    params["output_config"] = {"format": {"type": "json_schema", "schema": schema}}
+    return {"custom_id": custom_id, "params": params}
+
+
+def read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    lines: List[Dict[str, Any]] = []
+    for line_number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            lines.append(json.loads(line))
+        except json.JSONDecodeError as error:
+            raise LLMBatchError(f"{path}:{line_number} is not valid JSON: {error}") from error
+    return lines
+
+
+def write_jsonl(path: Path, lines: Iterable[Dict[str, Any]]) -> None:
+    path.write_text("".join(json.dumps(line, sort_keys=True) + "\n" for line in lines), encoding="utf-8")
+
+
+def parse_openai_batch_result(line: Dict[str, Any], *, call_name: str, model: str) -> LLMBatchResult:
+    custom_id = str(line.get("custom_id"))
+    response = line.get("response") or {}
+    if line.get("error") or response.get("status_code") != 200:
+        error = line.get("error") or (response.get("body") or {}).get("error")
+        return LLMBatchResult(custom_id=custom_id, error=f"OpenAI batch request failed: {error}")
+    # Built without validation: result bodies are provider output, and strict SDK
+    # models reject fields that older API versions (or the eval stub) omit.
+    parsed = OpenAIResponse.model_construct(**response["body"])
+    usage = openai_usage_from_response(parsed, call_name=call_name, model=model, latency_seconds=0.0)
+    if parsed.status == "incomplete":
+        return LLMBatchResult(
+            custom_id=custom_id,
+            error=f"OpenAI structured output for {call_name} was incomplete; details={parsed.incomplete_details}",
+            usage=usage,
+        )
+    if openai_response_has_refusal(parsed):
+        return LLMBatchResult(custom_id=custom_id, error=f"OpenAI structured output for {call_name} was refused")
+    return LLMBatchResult(custom_id=custom_id, text=parsed.output_text, usage=usage)
+
+
+def parse_anthropic_batch_result(line: Dict[str, Any], *, call_name: str, model: str) -> LLMBatchResult:
+    custom_id = str(line.get("custom_id"))
+    result = line.get("result") or {}
+    if result.get("type") != "succeeded":
+        detail = result.get("error") or result.get("type")
+        return LLMBatchResult(custom_id=custom_id, error=f"Anthropic batch request failed: {detail}")
+    message = BetaMessage.model_construct(**result["message"])
+    usage = anthropic_usage_from_response(message, call_name=call_name, model=model, latency_seconds=0.0)
+    if message.stop_reason in ("max_tokens", "refusal"):
+        return LLMBatchResult(
+            custom_id=custom_id,
+            error=f"Anthropic structured output for {call_name} stopped with stop_reason={message.stop_reason}",
+            usage=usage,
+        )
+    text = "".join(block.text for block in message.content if block.type == "text")
+    return LLMBatchResult(custom_id=custom_id, text=text, usage=usage)
+
+
+def parse_batch_result(
+    provider: LLMProviderName,
+    line: Dict[str, Any],
+    *,
+    call_name: str,
+    model: str,
+) -> LLMBatchResult:
+    if provider == LLM_PROVIDER_ANTHROPIC:
+        return parse_anthropic_batch_result(line, call_name=call_name, model=model)
+    return parse_openai_batch_result(line, call_name=call_name, model=model)
+
+
+def _run_openai_request(client: Any, request: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        response = client.responses.create(**request["body"])
+    except Exception as error:  # noqa: BLE001 - recorded per line like the Batch API does
+        return {"custom_id": request["custom_id"], "response": None, "error": {"message": str(error)}}
+    body = response.to_dict()
+    return {"custom_id": request["custom_id"], "response": {"status_code": 200, "body": body}, "error": None}
+
+
+def _run_anthropic_request(client: Any, request: Dict[str, Any]) -> Dict[str, Any]:
+    create = client.beta.messages.create
+    # Batch params are the raw API body; fields the SDK method has no argument for go through extra_body.
+    accepted = inspect.signature(create).parameters
+    params = {key: value for key, value in request["params"].items() if key in accepted}
+    extra_body = {key: value for key, value in request["params"].items() if key not in accepted}
+    try:
+        message = create(**params, extra_body=extra_body, betas=[ANTHROPIC_STRUCTURED_OUTPUTS_BETA])
+    except Exception as error:  # noqa: BLE001 - recorded per line like Message Batches does
+        return {"custom_id": request["custom_id"], "result": {"type": "errored", "error": {"message": str(error)}}}
+    return {"custom_id": request["custom_id"], "result": {"type": "succeeded", "message": message.to_dict()}}
+
+
+def run_batch_locally(
+    *,
+    provider: LLMProviderName,
+    client: Any,
+    requests_path: Path,
+    results_path: Path,
+    max_workers: int = LOCAL_BATCH_MAX_WORKERS,
+) -> int:
+    """Answer a provider batch request file through the synchronous API, writing a result file.
+
+    A local stand-in for the provider batch endpoints: the same request file goes
+    in and a result file in the provider's batch output format comes out, so the
+    ingest step cannot tell the two apart. Returns the number of requests sent.
+    """
+    requests = read_jsonl(requests_path)
+    run_request = _run_anthropic_request if provider == LLM_PROVIDER_ANTHROPIC else _run_openai_request
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        results = list(executor.map(lambda request: run_request(client, request), requests))
+    write_jsonl(results_path, results)
+    return len(results)
@@ -1,46 +1,260 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import copy
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from pydantic import BaseModel, ConfigDict
 
 try:
     from scripts.changelog_llm_outputs import (
         LLM_CALL_BREAKING_CHANGES,
+        LLM_CALL_GROUPED_CHANGELOG_CHUNK,
         LLM_CALL_GROUPED_CHANGELOG_ENTRIES,
+        LLM_CALL_GROUPED_CHANGELOG_MERGE,
+        LLM_CALL_GROUPED_CHANGELOG_REPAIR,
         LLM_CALL_RELEASE_NOTES_BODY,
+        LLM_CALL_RELEASE_NOTES_BODY_CHUNK,
+        LLM_CALL_RELEASE_NOTES_BODY_MERGE,
         BreakingChangesOutput,
+        ChangelogLabel,
+        GroupedChangelogEntry,
         GroupedChangelogOutput,
+        LLMUsage,
         MarkdownSection,
     )
-    from scripts.changelog_llm_providers import StructuredLLMClient
+    from scripts.changelog_llm_providers import (
+        LLMCallCancelledError,
+        LLMOutputIncompleteError,
+        StreamValidator,
+        StructuredLLMClient,
+        record_llm_usage,
+    )
+    from scripts.changelog_output_sizing import (
+        OUTPUT_TOKEN_SIZER,
+        escalated_max_output_tokens,
+        estimate_prompt_tokens,
+    )
     from scripts.changelog_prompts import (
+        CHARS_PER_TOKEN,
         build_breaking_changes_prompt,
         build_grouped_changelog_entries_prompt,
+        build_grouped_changelog_merge_prompt,
+        build_grouped_changelog_repair_prompt,
+        build_release_notes_body_merge_prompt,
         build_release_notes_body_prompt,
     )
     from scripts.changelog_validators import (
+        GroupedChangelogSemanticError,
+        breaking_changes_stream_validator,
+        release_notes_body_stream_validator,
+        repair_grouped_changelog_output,
         validate_breaking_changes_output,
+        validate_grouped_changelog_output,
         validate_release_notes_body_output,
     )
+    from scripts.changelog_pr_similarity import expand_collapsed_prs
 except ModuleNotFoundError:  # pragma: no cover
     from changelog_llm_outputs import (  # type: ignore[no-redef]
         LLM_CALL_BREAKING_CHANGES,
+        LLM_CALL_GROUPED_CHANGELOG_CHUNK,
         LLM_CALL_GROUPED_CHANGELOG_ENTRIES,
+        LLM_CALL_GROUPED_CHANGELOG_MERGE,
+        LLM_CALL_GROUPED_CHANGELOG_REPAIR,
         LLM_CALL_RELEASE_NOTES_BODY,
+        LLM_CALL_RELEASE_NOTES_BODY_CHUNK,
+        LLM_CALL_RELEASE_NOTES_BODY_MERGE,
         BreakingChangesOutput,
+        ChangelogLabel,
+        GroupedChangelogEntry,
         GroupedChangelogOutput,
+        LLMUsage,
         MarkdownSection,
     )
-    from changelog_llm_providers import StructuredLLMClient  # type: ignore[no-redef]
+    from changelog_llm_providers import (  # type: ignore[no-redef]
+        LLMCallCancelledError,
+        LLMOutputIncompleteError,
+        StreamValidator,
+        StructuredLLMClient,
+        record_llm_usage,
+    )
+    from changelog_output_sizing import (  # type: ignore[no-redef]
+        OUTPUT_TOKEN_SIZER,
+        escalated_max_output_tokens,
+        estimate_prompt_tokens,
+    )
     from changelog_prompts import (  # type: ignore[no-redef]
+        CHARS_PER_TOKEN,
         build_breaking_changes_prompt,
         build_grouped_changelog_entries_prompt,
+        build_grouped_changelog_merge_prompt,
+        build_grouped_changelog_repair_prompt,
+        build_release_notes_body_merge_prompt,
         build_release_notes_body_prompt,
     )
     from changelog_validators import (  # type: ignore[no-redef]
+        GroupedChangelogSemanticError,
+        breaking_changes_stream_validator,
+        release_notes_body_stream_validator,
+        repair_grouped_changelog_output,
         validate_breaking_changes_output,
+        validate_grouped_changelog_output,
         validate_release_notes_body_output,
     )
+    from changelog_pr_similarity import expand_collapsed_prs  # type: ignore[no-redef]
+
+TChunkResult = TypeVar("TChunkResult")
+TOutput = TypeVar("TOutput")
+
+# Releases above these bounds are generated hierarchically: PR chunks are
+# summarized in parallel, then one final call combines the partial results.
+HIERARCHICAL_CHUNK_MAX_PRS = 40
+HIERARCHICAL_CHUNK_MAX_CHARS = 24_000
+HIERARCHICAL_MAX_WORKERS = 4
+HIERARCHICAL_BODY_TOKENS_PER_PR = 90
+HIERARCHICAL_BODY_MAX_OUTPUT_TOKENS = 16_000
+
+
+# Built-in output caps, used until the sizer has enough history for a call and model.
+GROUPED_MAX_OUTPUT_TOKENS = 1200
+BREAKING_MAX_OUTPUT_TOKENS = 900
+RELEASE_NOTES_BODY_MAX_OUTPUT_TOKENS = 1800
+
+# Opt-in speculative grouping sends several grouped requests at once and keeps
+# the first valid output. Attempt i samples at temperature i of this cycle where
+# the client exposes a temperature. The spend cap is checked against estimated
+# tokens before anything is sent; the usage log has what the attempts really used.
+SPECULATIVE_GROUPED_TEMPERATURES = (0.0, 0.5, 0.8, 1.0)
+SPECULATIVE_GROUPED_MAX_SPEND_TOKENS = 40_000
+
+
+def _client_model(client: StructuredLLMClient, call_name: str) -> str:
+    model_for_call = getattr(client, "model_for_call", None)
+    return model_for_call(call_name) if callable(model_for_call) else str(getattr(client, "model", ""))
+
+
+def _parse_sized_output(
+    client: StructuredLLMClient,
+    *,
+    prompt: str,
+    output_model: type[TOutput],
+    default_max_output_tokens: int,
+    call_name: str,
+    stream_validator_factory: Optional[Callable[[], StreamValidator]] = None,
+) -> TOutput:
+    """Parse with a learned output cap, escalating the cap once on an incomplete response."""
+    max_output_tokens = OUTPUT_TOKEN_SIZER.max_output_tokens(
+        call_name=call_name,
+        model=_client_model(client, call_name),
+        prompt=prompt,
+        default=default_max_output_tokens,
+    )
+    def parse(cap: int) -> TOutput:
+        return client.parse_structured_output(
+            prompt=prompt,
+            output_model=output_model,
+            max_output_tokens=cap,
+            call_name=call_name,
+            stream_validator=stream_validator_factory() if stream_validator_factory else None,
+        )
+
+    try:
+        return parse(max_output_tokens)
+    except LLMOutputIncompleteError:
+        escalated = escalated_max_output_tokens(max_output_tokens, default_max_output_tokens)
+        if escalated <= max_output_tokens:
+            raise
+        print(
+            f"LLM call {call_name} stopped at max_output_tokens={max_output_tokens}; "
+            f"retrying once with {escalated}"
+        )
+        return parse(escalated)
+
+
+def _pr_prompt_chars(pr: Dict[str, Any]) -> int:
+    # Rough per-PR prompt size used only to size chunks; the prompt builders pack
+    # the actual body slices into each call's input-token budget.
+    body = pr.get("body") or ""
+    labels = ", ".join(pr.get("labels", []))
+    return len(str(pr.get("title", ""))) + len(str(pr.get("url", ""))) + len(labels) + min(len(body), 700) + 64
+
+
+def chunk_prs(
+    prs: List[Dict[str, Any]],
+    *,
+    max_prs: int = HIERARCHICAL_CHUNK_MAX_PRS,
+    max_chars: int = HIERARCHICAL_CHUNK_MAX_CHARS,
+) -> List[List[Dict[str, Any]]]:
+    """Split PRs into order-preserving chunks bounded by PR count and prompt size."""
+    chunks: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    current_chars = 0
+    for pr in prs:
+        pr_chars = _pr_prompt_chars(pr)
+        if current and (len(current) >= max_prs or current_chars + pr_chars > max_chars):
+            chunks.append(current)
+            current = []
+            current_chars = 0
+        current.append(pr)
+        current_chars += pr_chars
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _map_chunks(
+    chunks: List[List[Dict[str, Any]]],
+    generate_chunk: Callable[[List[Dict[str, Any]]], TChunkResult],
+    max_workers: int,
+) -> List[TChunkResult]:
+    if len(chunks) == 1 or max_workers <= 1:
+        return [generate_chunk(chunk) for chunk in chunks]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        return list(executor.map(generate_chunk, chunks))
+
+
+def _hierarchical_body_output_tokens(prs: List[Dict[str, Any]], minimum: int) -> int:
+    return min(
+        HIERARCHICAL_BODY_MAX_OUTPUT_TOKENS,
+        max(minimum, HIERARCHICAL_BODY_TOKENS_PER_PR * len(prs)),
+    )
+
+
+def _leftover_partial_entry(prs: List[Dict[str, Any]]) -> GroupedChangelogEntry:
+    titles = "; ".join(str(pr["title"]) for pr in prs)
+    return GroupedChangelogEntry(
+        title="Other changes",
+        description=f"Ungrouped changes: {titles}",
+        suggested_labels=[ChangelogLabel.IMPROVEMENT],
+        pr_numbers=[pr["number"] for pr in prs],
+    )
+
+
+def _partial_grouped_entries(
+    client: StructuredLLMClient,
+    chunk: List[Dict[str, Any]],
+    source_repo: str,
+    pregroup_hints: bool,
+) -> List[GroupedChangelogEntry]:
+    """Pre-group one chunk, accounting for every chunk PR exactly once."""
+    output = _parse_sized_output(
+        client,
+        prompt=build_grouped_changelog_entries_prompt(chunk, source_repo, pregroup_hints=pregroup_hints),
+        output_model=GroupedChangelogOutput,
+        default_max_output_tokens=GROUPED_MAX_OUTPUT_TOKENS,
+        call_name=LLM_CALL_GROUPED_CHANGELOG_CHUNK,
+    )
+    repaired, missing_numbers = repair_grouped_changelog_output(output, chunk)
+    entries = list(repaired.entries) if repaired else []
+    if missing_numbers:
+        missing = set(missing_numbers)
+        entries.append(_leftover_partial_entry([pr for pr in chunk if pr["number"] in missing]))
+    return entries
 
 
 def generate_grouped_changelog_output(
@@ -49,64 +263,362 @@ def generate_grouped_changelog_output(
     prs: List[Dict[str, Any]],
     source_repo: str,
     retry_feedback: Optional[str] = None,
+    max_chunk_prs: int = HIERARCHICAL_CHUNK_MAX_PRS,
+    max_chunk_chars: int = HIERARCHICAL_CHUNK_MAX_CHARS,
+    max_workers: int = HIERARCHICAL_MAX_WORKERS,
+    pregroup_hints: bool = True,
 ) -> GroupedChangelogOutput:
-    """Generate grouped changelog structured output with an explicit client."""
+    """Generate grouped changelog structured output with an explicit client.
+
+    Large releases are pre-grouped per PR chunk in parallel and merged by one
+    final call; the merged output goes through the same validators as a
+    single-call grouping. `pregroup_hints` adds the local starting-group
+    proposal to each PR-list prompt.
+    """
     if not prs:
         raise RuntimeError("No PRs provided to generate_grouped_changelog_output")
-    prompt = build_grouped_changelog_entries_prompt(prs, source_repo, retry_feedback)
-    return client.parse_structured_output(
+    chunks = chunk_prs(prs, max_prs=max_chunk_prs, max_chars=max_chunk_chars)
+    if len(chunks) > 1:
+        partial_entries = [
+            entry
+            for chunk_entries in _map_chunks(
+                chunks,
+                lambda chunk: _partial_grouped_entries(client, chunk, source_repo, pregroup_hints),
+                max_workers,
+            )
+            for entry in chunk_entries
+        ]
+        prompt = build_grouped_changelog_merge_prompt(partial_entries, prs, source_repo, retry_feedback)
+        return _parse_sized_output(
+            client,
+            prompt=prompt,
+            output_model=GroupedChangelogOutput,
+            default_max_output_tokens=GROUPED_MAX_OUTPUT_TOKENS,
+            call_name=LLM_CALL_GROUPED_CHANGELOG_MERGE,
+        )
+
+    prompt = build_grouped_changelog_entries_prompt(prs, source_repo, retry_feedback, pregroup_hints=pregroup_hints)
+    return _parse_sized_output(
+        client,
         prompt=prompt,
         output_model=GroupedChangelogOutput,
-        max_output_tokens=1200,
+        default_max_output_tokens=GROUPED_MAX_OUTPUT_TOKENS,
         call_name=LLM_CALL_GROUPED_CHANGELOG_ENTRIES,
     )
 
 
-def generate_breaking_changes_output(
+class SpeculativeGroupedOutput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    output: GroupedChangelogOutput
+    valid: bool
+    attempts_sent: int
+    first_valid_attempt: Optional[int] = None
+    first_valid_seconds: Optional[float] = None
+
+
+class CancellableLLMClient:
+    """Client wrapper whose calls stop once `cancelled` is set.
+
+    Calls are streamed, so one in flight aborts at its next text delta and one
+    not yet sent is never sent. An aborted stream has no provider usage; an
+    estimate (the whole prompt plus the text streamed so far) is recorded in
+    the usage log in its place.
+    """
+
+    def __init__(self, client: StructuredLLMClient, cancelled: threading.Event) -> None:
+        self.client = client
+        self.cancelled = cancelled
+
+    def __getattr__(self, name: str) -> Any:
+        # `model`, `temperature` and `model_for_call` come from the wrapped client.
+        return getattr(self.client, name)
+
+    def parse_structured_output(
+        self,
+        *,
+        prompt: str,
+        output_model: type[TOutput],
+        max_output_tokens: int,
+        call_name: str,
+        stream_validator: Optional[StreamValidator] = None,
+    ) -> TOutput:
+        streamed = ""
+
+        def check(text: str) -> None:
+            nonlocal streamed
+            streamed = text
+            if self.cancelled.is_set():
+                raise LLMCallCancelledError(f"LLM call {call_name} was cancelled")
+            if stream_validator is not None:
+                stream_validator(text)
+
+        check("")
+        try:
+            return self.client.parse_structured_output(
+                prompt=prompt,
+                output_model=output_model,
+                max_output_tokens=max_output_tokens,
+                call_name=call_name,
+                stream_validator=check,
+            )
+        except LLMCallCancelledError:
+            if streamed:
+                record_llm_usage(
+                    LLMUsage(
+                        call_name=call_name,
+                        model=_client_model(self.client, call_name),
+                        input_tokens=estimate_prompt_tokens(prompt),
+                        output_tokens=math.ceil(len(streamed) / CHARS_PER_TOKEN),
+                        truncated=True,
+                    )
+                )
+            raise
+
+
+def speculative_attempt_client(client: StructuredLLMClient, attempt: int) -> StructuredLLMClient:
+    """Return a client sampling at this attempt's temperature, or `client` when it has none to vary."""
+    if getattr(client, "temperature", None) is None:
+        return client
+    variant = copy.copy(client)
+    temperature = SPECULATIVE_GROUPED_TEMPERATURES[attempt % len(SPECULATIVE_GROUPED_TEMPERATURES)]
+    variant.temperature = temperature  # type: ignore[attr-defined]
+    return variant
+
+
+def speculative_grouped_attempt_count(
+    prs: List[Dict[str, Any]],
+    source_repo: str,
+    attempts: int,
+    max_spend_tokens: int = SPECULATIVE_GROUPED_MAX_SPEND_TOKENS,
+    *,
+    max_chunk_prs: int = HIERARCHICAL_CHUNK_MAX_PRS,
+    max_chunk_chars: int = HIERARCHICAL_CHUNK_MAX_CHARS,
+) -> int:
+    """Cap parallel attempts so their estimated input plus output tokens fit `max_spend_tokens`."""
+    chunk_count = len(chunk_prs(prs, max_prs=max_chunk_prs, max_chars=max_chunk_chars))
+    calls_per_attempt = chunk_count + (1 if chunk_count > 1 else 0)
+    call_tokens = estimate_prompt_tokens(build_grouped_changelog_entries_prompt(prs, source_repo))
+    attempt_tokens = calls_per_attempt * (call_tokens + GROUPED_MAX_OUTPUT_TOKENS)
+    return max(1, min(attempts, max_spend_tokens // attempt_tokens))
+
+
+def generate_speculative_grouped_changelog_output(
+    *,
+    client: StructuredLLMClient,
+    prs: List[Dict[str, Any]],
+    source_repo: str,
+    attempts: int,
+    retry_feedback: Optional[str] = None,
+    max_spend_tokens: int = SPECULATIVE_GROUPED_MAX_SPEND_TOKENS,
+    pregroup_hints: bool = True,
+) -> SpeculativeGroupedOutput:
+    """Send up to `attempts` grouped requests at once and keep the first valid output.
+
+    Outputs are checked with `validate_grouped_changelog_output` as they arrive.
+    Once one is valid, the other attempts are cancelled: unsent calls are
+    dropped and streamed ones stop at their next token. This waits for them to
+    stop so their (estimated) usage lands in this run's usage log. When no
+    attempt is valid, the first output to arrive is returned for repair.
+    """
+    attempts = speculative_grouped_attempt_count(prs, source_repo, attempts, max_spend_tokens)
+    start = time.perf_counter()
+    cancelled = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=attempts)
+    futures = {
+        executor.submit(
+            generate_grouped_changelog_output,
+            client=CancellableLLMClient(speculative_attempt_client(client, attempt), cancelled),
+            prs=prs,
+            source_repo=source_repo,
+            retry_feedback=retry_feedback,
+            pregroup_hints=pregroup_hints,
+        ): attempt
+        for attempt in range(attempts)
+    }
+    first_output: Optional[GroupedChangelogOutput] = None
+    last_error: Optional[BaseException] = None
+    try:
+        for future in as_completed(futures):
+            try:
+                output = future.result()
+            except Exception as error:  # noqa: BLE001 - another attempt may still succeed
+                last_error = error
+                continue
+            if first_output is None:
+                first_output = output
+            try:
+                validate_grouped_changelog_output(output, prs)
+            except GroupedChangelogSemanticError:
+                continue
+            return SpeculativeGroupedOutput(
+                output=output,
+                valid=True,
+                attempts_sent=attempts,
+                first_valid_attempt=futures[future] + 1,
+                first_valid_seconds=time.perf_counter() - start,
+            )
+    finally:
+        cancelled.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+    if first_output is None:
+        assert last_error is not None
+        raise last_error
+    return SpeculativeGroupedOutput(output=first_output, valid=False, attempts_sent=attempts)
+
+
+def generate_grouped_changelog_repair_output(
     *,
+    client: StructuredLLMClient,
+    grouped_output: GroupedChangelogOutput,
+    unassigned_prs: List[Dict[str, Any]],
+    source_repo: str,
+) -> GroupedChangelogOutput:
+    """Ask the model to place only the unassigned PRs into an otherwise valid grouping."""
+    if not unassigned_prs:
+        return grouped_output
+    prompt = build_grouped_changelog_repair_prompt(grouped_output.entries, unassigned_prs, source_repo)
+    return _parse_sized_output(
+        client,
+        prompt=prompt,
+        output_model=GroupedChangelogOutput,
+        default_max_output_tokens=GROUPED_MAX_OUTPUT_TOKENS,
+        call_name=LLM_CALL_GROUPED_CHANGELOG_REPAIR,
+    )
+
+
+def _breaking_changes_chunk_output(
     client: StructuredLLMClient,
     breaking_prs: List[Dict[str, Any]],
     source_repo: str,
     include_pr_links: bool,
-) -> tuple[BreakingChangesOutput, list[str]]:
-    """Generate and validate breaking-change bullets with an explicit client."""
-    if not breaking_prs:
-        return BreakingChangesOutput(bullets=[]), []
+) -> BreakingChangesOutput:
     prompt = build_breaking_changes_prompt(breaking_prs, source_repo, include_pr_links)
-    output = client.parse_structured_output(
+    return _parse_sized_output(
+        client,
         prompt=prompt,
         output_model=BreakingChangesOutput,
-        max_output_tokens=900,
+        default_max_output_tokens=BREAKING_MAX_OUTPUT_TOKENS,
         call_name=LLM_CALL_BREAKING_CHANGES,
+        stream_validator_factory=partial(
+            breaking_changes_stream_validator,
+            breaking_prs=expand_collapsed_prs(breaking_prs),
+            include_pr_links=include_pr_links,
+        ),
+    )
+
+
+def generate_breaking_changes_output(
+    *,
+    client: StructuredLLMClient,
+    breaking_prs: List[Dict[str, Any]],
+    source_repo: str,
+    include_pr_links: bool,
+    max_chunk_prs: int = HIERARCHICAL_CHUNK_MAX_PRS,
+    max_chunk_chars: int = HIERARCHICAL_CHUNK_MAX_CHARS,
+    max_workers: int = HIERARCHICAL_MAX_WORKERS,
+) -> tuple[BreakingChangesOutput, list[str]]:
+    """Generate and validate breaking-change bullets with an explicit client.
+
+    Bullets are written per breaking PR, so large sets are generated per chunk
+    in parallel and concatenated in input order before validation. PRs
+    collapsed into a representative must still be linked individually.
+    """
+    if not breaking_prs:
+        return BreakingChangesOutput(bullets=[]), []
+    chunks = chunk_prs(breaking_prs, max_prs=max_chunk_prs, max_chars=max_chunk_chars)
+    chunk_outputs = _map_chunks(
+        chunks,
+        lambda chunk: _breaking_changes_chunk_output(client, chunk, source_repo, include_pr_links),
+        max_workers,
+    )
+    output = (
+        chunk_outputs[0]
+        if len(chunk_outputs) == 1
+        else BreakingChangesOutput(bullets=[bullet for chunk in chunk_outputs for bullet in chunk.bullets])
     )
     warnings = validate_breaking_changes_output(
         bullets=output.bullets,
-        breaking_prs=breaking_prs,
+        breaking_prs=expand_collapsed_prs(breaking_prs),
         include_pr_links=include_pr_links,
     )
     return output, warnings
 
 
+def _release_notes_body_draft(
+    client: StructuredLLMClient,
+    prs: List[Dict[str, Any]],
+    source_repo: str,
+    include_pr_links: bool,
+) -> str:
+    prompt = build_release_notes_body_prompt(prs, source_repo, include_pr_links)
+    output = _parse_sized_output(
+        client,
+        prompt=prompt,
+        output_model=MarkdownSection,
+        default_max_output_tokens=_hierarchical_body_output_tokens(prs, RELEASE_NOTES_BODY_MAX_OUTPUT_TOKENS),
+        call_name=LLM_CALL_RELEASE_NOTES_BODY_CHUNK,
+        stream_validator_factory=partial(
+            release_notes_body_stream_validator,
+            prs=expand_collapsed_prs(prs),
+            include_pr_links=include_pr_links,
+        ),
+    )
+    validate_release_notes_body_output(
+        body=output.content,
+        prs=expand_collapsed_prs(prs),
+        include_pr_links=include_pr_links,
+    )
+    return output.content
+
+
 def generate_release_notes_body_output(
     *,
     client: StructuredLLMClient,
     prs: List[Dict[str, Any]],
     source_repo: str,
     include_pr_links: bool,
+    max_chunk_prs: int = HIERARCHICAL_CHUNK_MAX_PRS,
+    max_chunk_chars: int = HIERARCHICAL_CHUNK_MAX_CHARS,
+    max_workers: int = HIERARCHICAL_MAX_WORKERS,
 ) -> tuple[MarkdownSection, list[str]]:
-    """Generate and validate release-note body markdown with an explicit client."""
+    """Generate and validate release-note body markdown with an explicit client.
+
+    Large releases get one validated draft per PR chunk, written in parallel,
+    and a final call that merges the drafts into a single body. Validation
+    runs against the expanded PR list, so collapsed near-duplicates keep their links.
+    """
     if not prs:
         return MarkdownSection(content=""), []
-    prompt = build_release_notes_body_prompt(prs, source_repo, include_pr_links)
-    output = client.parse_structured_output(
+    chunks = chunk_prs(prs, max_prs=max_chunk_prs, max_chars=max_chunk_chars)
+    if len(chunks) > 1:
+        drafts = _map_chunks(
+            chunks,
+            lambda chunk: _release_notes_body_draft(client, chunk, source_repo, include_pr_links),
+            max_workers,
+        )
+        prompt = build_release_notes_body_merge_prompt(drafts, prs, source_repo, include_pr_links)
+        max_output_tokens = _hierarchical_body_output_tokens(prs, RELEASE_NOTES_BODY_MAX_OUTPUT_TOKENS)
+        call_name = LLM_CALL_RELEASE_NOTES_BODY_MERGE
+    else:
+        prompt = build_release_notes_body_prompt(prs, source_repo, include_pr_links)
+        max_output_tokens = RELEASE_NOTES_BODY_MAX_OUTPUT_TOKENS
+        call_name = LLM_CALL_RELEASE_NOTES_BODY
+    output = _parse_sized_output(
+        client,
         prompt=prompt,
         output_model=MarkdownSection,
-        max_output_tokens=1800,
-        call_name=LLM_CALL_RELEASE_NOTES_BODY,
+        default_max_output_tokens=max_output_tokens,
+        call_name=call_name,
+        stream_validator_factory=partial(
+            release_notes_body_stream_validator,
+            prs=expand_collapsed_prs(prs),
+            include_pr_links=include_pr_links,
+        ),
     )
     warnings = validate_release_notes_body_output(
         body=output.content,
-        prs=prs,
+        prs=expand_collapsed_prs(prs),
         include_pr_links=include_pr_links,
     )
     return output, warnings
@@ -21,12 +21,36 @@ LLM_CALL_CHANGELOG_COPY = "changelog_copy"
 
 LLM_CALL_GROUPED_CHANGELOG_ENTRIES = "grouped_changelog_entries"
 
+LLM_CALL_GROUPED_CHANGELOG_REPAIR = "grouped_changelog_repair"
+
 LLM_CALL_BREAKING_CHANGES = "breaking_changes"
 
 LLM_CALL_RELEASE_NOTES_BODY = "release_notes_body"
 
 LLM_CALL_MARKDOWN_SECTION = "markdown_section"
 
+# Hierarchical generation: per-chunk calls and the final merge call.
+LLM_CALL_GROUPED_CHANGELOG_CHUNK = "grouped_changelog_chunk"
+
+LLM_CALL_GROUPED_CHANGELOG_MERGE = "grouped_changelog_merge"
+
+LLM_CALL_RELEASE_NOTES_BODY_CHUNK = "release_notes_body_chunk"
+
+LLM_CALL_RELEASE_NOTES_BODY_MERGE = "release_notes_body_merge"
+
+# Sub-calls keep their own name in usage and output-size history, but pick
+# models and eval fixtures like the call they are part of.
+LLM_CALL_ROUTES = {
+    LLM_CALL_GROUPED_CHANGELOG_CHUNK: LLM_CALL_GROUPED_CHANGELOG_ENTRIES,
+    LLM_CALL_GROUPED_CHANGELOG_MERGE: LLM_CALL_GROUPED_CHANGELOG_ENTRIES,
+    LLM_CALL_RELEASE_NOTES_BODY_CHUNK: LLM_CALL_RELEASE_NOTES_BODY,
+    LLM_CALL_RELEASE_NOTES_BODY_MERGE: LLM_CALL_RELEASE_NOTES_BODY,
+}
+
+
+def routed_llm_call(call_name: str) -> str:
+    return LLM_CALL_ROUTES.get(call_name, call_name)
+
 class StrictLLMOutput(BaseModel):
     """Base for model-produced structured outputs.
 
@@ -79,3 +103,17 @@ class BreakingChangesOutput(StrictLLMOutput):
 class MarkdownSection(StrictLLMOutput):
     content: str = Field(..., description="Complete markdown section for the release notes")
 
+
+class LLMUsage(BaseModel):
+    """Token usage reported by the provider for one LLM response."""
+
+    model_config = ConfigDict(frozen=True)
+
+    call_name: str
+    model: str
+    input_tokens: int = Field(..., ge=0, description="All prompt tokens, including cached ones.")
+    output_tokens: int = Field(..., ge=0, description="All completion tokens, including reasoning ones.")
+    cached_input_tokens: int = Field(default=0, ge=0)
+    reasoning_tokens: int = Field(default=0, ge=0)
+    latency_seconds: float = Field(default=0.0, ge=0)
+    truncated: bool = Field(default=False, description="The output stopped at the max_output_tokens cap.")
@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-from typing import Any, Final, List, Literal, Protocol, TypeVar
+import hashlib
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Final, List, Literal, Protocol, TypeVar
 
 from anthropic import (
     Anthropic,
@@ -10,7 +16,7 @@ from anthropic import (
     RateLimitError as AnthropicRateLimitError,
 )
 from pydantic import BaseModel, ValidationError
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from tenacity import RetryCallState, retry, retry_if_exception_type
 
 try:
     from openai import (
@@ -53,14 +59,20 @@ try:
         LLM_CALL_BREAKING_CHANGES,
         LLM_CALL_GROUPED_CHANGELOG_ENTRIES,
         LLM_CALL_RELEASE_NOTES_BODY,
+        LLMUsage,
+        routed_llm_call,
     )
+    from scripts.changelog_prompts import prompt_cache_segments
 except ModuleNotFoundError:  # pragma: no cover
     from changelog_env import env_value, require_env_values  # type: ignore[no-redef]
     from changelog_llm_outputs import (  # type: ignore[no-redef]
         LLM_CALL_BREAKING_CHANGES,
         LLM_CALL_GROUPED_CHANGELOG_ENTRIES,
         LLM_CALL_RELEASE_NOTES_BODY,
+        LLMUsage,
+        routed_llm_call,
     )
+    from changelog_prompts import prompt_cache_segments  # type: ignore[no-redef]
 
 TLLMOutput = TypeVar("TLLMOutput", bound=BaseModel)
 
@@ -88,12 +100,32 @@ LLM_MODEL_GROUPED_ENV = "CHANGELOG_LLM_MODEL_GROUPED"
 LLM_MODEL_BREAKING_ENV = "CHANGELOG_LLM_MODEL_BREAKING"
 LLM_MODEL_RELEASE_NOTES_ENV = "CHANGELOG_LLM_MODEL_RELEASE_NOTES"
 
+ANTHROPIC_STRUCTURED_OUTPUTS_BETA = "structured-outputs-2025-11-13"
+
+LLM_RETRY_BUDGET_SECONDS_ENV = "CHANGELOG_LLM_RETRY_BUDGET_SECONDS"
+DEFAULT_LLM_RETRY_BUDGET_SECONDS = 300.0
+LLM_RETRY_MAX_ATTEMPTS = 5
+
 class LLMProviderRetryableError(RuntimeError):
     """Retryable provider/API failure at the structured-output seam."""
 
+    def __init__(self, message: str, *, retry_after_seconds: float | None = None) -> None:
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(message)
+
 class LLMProviderNonRetryableError(RuntimeError):
     """Non-retryable provider/API failure at the structured-output seam."""
 
+class LLMOutputIncompleteError(LLMProviderNonRetryableError):
+    """Structured output stopped at the `max_output_tokens` cap before it was complete."""
+
+    def __init__(self, message: str, *, max_output_tokens: int) -> None:
+        self.max_output_tokens = max_output_tokens
+        super().__init__(message)
+
+class LLMCallCancelledError(LLMProviderNonRetryableError):
+    """A call abandoned by its caller, before it was sent or at its next streamed delta."""
+
 class LLMOutputValidationError(LLMProviderRetryableError):
     """Retryable failure when structured model content violates hard contracts."""
 
@@ -101,6 +133,10 @@ class LLMOutputValidationError(LLMProviderRetryableError):
         self.details = details
         super().__init__("\n".join(f"- {detail}" for detail in details))
 
+# Called with the raw structured-output text received so far. Raising
+# LLMOutputValidationError cancels the streamed request.
+StreamValidator = Callable[[str], None]
+
 class StructuredLLMClient(Protocol):
     def parse_structured_output(
         self,
@@ -109,13 +145,19 @@ class StructuredLLMClient(Protocol):
         output_model: type[TLLMOutput],
         max_output_tokens: int,
         call_name: str,
+        stream_validator: StreamValidator | None = None,
     ) -> TLLMOutput:
-        """Parse a prompt into a Pydantic model using the configured provider."""
+        """Parse a prompt into a Pydantic model using the configured provider.
+
+        When `stream_validator` is given, the response is streamed and the
+        validator runs on every text delta so hard violations abort early.
+        """
 
 class AnthropicStructuredLLMClient:
-    def __init__(self, client: Anthropic, model: str = DEFAULT_ANTHROPIC_MODEL) -> None:
+    def __init__(self, client: Anthropic, model: str = DEFAULT_ANTHROPIC_MODEL, temperature: float = 0) -> None:
         self.client = client
         self.model = model
+        self.temperature = temperature
 
     def parse_structured_output(
         self,
@@ -124,21 +166,79 @@ class AnthropicStructuredLLMClient:
         output_model: type[TLLMOutput],
         max_output_tokens: int,
         call_name: str,
+        stream_validator: StreamValidator | None = None,
     ) -> TLLMOutput:
+        request_kwargs = self.request_kwargs(
+            prompt=prompt,
+            output_model=output_model,
+            max_output_tokens=max_output_tokens,
+            call_name=call_name,
+        )
+        clear_last_llm_usage()
+        start = time.perf_counter()
         try:
-            response = self.client.beta.messages.parse(
-                model=self.model,
-                betas=["structured-outputs-2025-11-13"],
-                max_tokens=max_output_tokens,
-                temperature=0,
-                output_format=output_model,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            if stream_validator is None:
+                response = self.client.beta.messages.parse(**request_kwargs)
+            else:
+                response = self._stream_message(request_kwargs, stream_validator)
         except AnthropicAuthenticationError:
             raise
         except (AnthropicAPIError, AnthropicRateLimitError) as error:
-            raise LLMProviderRetryableError(str(error)) from error
-        return response.parsed_output
+            raise LLMProviderRetryableError(
+                str(error),
+                retry_after_seconds=retry_after_seconds_from_error(error),
+            ) from error
+        usage = anthropic_usage_from_response(
+            response,
+            call_name=call_name,
+            model=self.model,
+            latency_seconds=time.perf_counter() - start,
+        )
+        if usage is not None:
+            record_llm_usage(usage)
+
+        stop_reason = getattr(response, "stop_reason", None)
+        if stop_reason == "max_tokens":
+            raise LLMOutputIncompleteError(
+                f"Anthropic structured output for {call_name} was incomplete; stop_reason={stop_reason}. "
+                "Increase the max_output_tokens cap or inspect the prompt.",
+                max_output_tokens=max_output_tokens,
+            )
+        if stop_reason == "refusal":
+            raise LLMProviderNonRetryableError(f"Anthropic structured output for {call_name} was refused")
+        parsed = getattr(response, "parsed_output", None)
+        if parsed is None:
+            raise LLMProviderRetryableError(f"Anthropic structured output for {call_name} did not include parsed_output")
+        return parsed
+
+    def request_kwargs(
+        self,
+        *,
+        prompt: str,
+        output_model: type[BaseModel],
+        max_output_tokens: int,
+        call_name: str,
+    ) -> dict[str, Any]:
+        """Return the `beta.messages.parse` keyword arguments for one call."""
+        return {
+            "model": self.model,
+            "betas": [ANTHROPIC_STRUCTURED_OUTPUTS_BETA],
+            "max_tokens": max_output_tokens,
+            "output_format": output_model,
+            # Sent as a raw body field: newer SDKs dropped the typed kwarg on beta parse/stream.
+            "extra_body": {"temperature": self.temperature},
+            "messages": [{"role": "user", "content": anthropic_prompt_content(prompt)}],
+        }
+
+    def _stream_message(self, request_kwargs: dict[str, Any], stream_validator: StreamValidator) -> Any:
+        text = ""
+        # Leaving the context manager early closes the HTTP stream.
+        with self.client.beta.messages.stream(**request_kwargs) as stream:
+            for event in stream:
+                if getattr(event, "type", None) == "text":
+                    text += event.text
+                    stream_validator(text)
+            return stream.get_final_message()
 
 class OpenAIStructuredLLMClient:
     def __init__(
@@ -154,7 +254,7 @@ class OpenAIStructuredLLMClient:
         self.models_by_call = models_by_call or {}
 
     def model_for_call(self, call_name: str) -> str:
-        return self.models_by_call.get(call_name, self.model)
+        return self.models_by_call.get(routed_llm_call(call_name), self.model)
 
     def parse_structured_output(
         self,
@@ -163,19 +263,21 @@ class OpenAIStructuredLLMClient:
         output_model: type[TLLMOutput],
         max_output_tokens: int,
         call_name: str,
+        stream_validator: StreamValidator | None = None,
     ) -> TLLMOutput:
-        request_kwargs: dict[str, Any] = {
-            "model": self.model_for_call(call_name),
-            "input": [{"role": "user", "content": prompt}],
-            "text_format": output_model,
-            "max_output_tokens": max_output_tokens,
-            "store": False,
-        }
-        if self.temperature is not None:
-            request_kwargs["temperature"] = self.temperature
-
+        request_kwargs = self.request_kwargs(
+            prompt=prompt,
+            output_model=output_model,
+            max_output_tokens=max_output_tokens,
+            call_name=call_name,
+        )
+        clear_last_llm_usage()
+        start = time.perf_counter()
         try:
-            response = self.client.responses.parse(**request_kwargs)
+            if stream_validator is None:
+                response = self.client.responses.parse(**request_kwargs)
+            else:
+                response = self._stream_response(request_kwargs, stream_validator)
         except (OpenAIAuthenticationError, OpenAIPermissionDeniedError, OpenAIBadRequestError):
             raise
         except (
@@ -184,13 +286,27 @@ class OpenAIStructuredLLMClient:
             OpenAIRateLimitError,
             OpenAIAPIError,
         ) as error:
-            raise LLMProviderRetryableError(str(error)) from error
+            raise LLMProviderRetryableError(
+                str(error),
+                retry_after_seconds=retry_after_seconds_from_error(error),
+            ) from error
+
+        # Incomplete and refused responses are still billed, so record them first.
+        usage = openai_usage_from_response(
+            response,
+            call_name=call_name,
+            model=request_kwargs["model"],
+            latency_seconds=time.perf_counter() - start,
+        )
+        if usage is not None:
+            record_llm_usage(usage)
 
         if getattr(response, "status", None) == "incomplete":
             details = getattr(response, "incomplete_details", None)
-            raise LLMProviderNonRetryableError(
+            raise LLMOutputIncompleteError(
                 f"OpenAI structured output for {call_name} was incomplete; details={details}. "
-                "Increase the max_output_tokens cap or inspect the prompt."
+                "Increase the max_output_tokens cap or inspect the prompt.",
+                max_output_tokens=max_output_tokens,
             )
         if openai_response_has_refusal(response):
             raise LLMProviderNonRetryableError(f"OpenAI structured output for {call_name} was refused")
@@ -200,6 +316,113 @@ class OpenAIStructuredLLMClient:
             raise LLMProviderRetryableError(f"OpenAI structured output for {call_name} did not include output_parsed")
         return parsed
 
+    def request_kwargs(
+        self,
+        *,
+        prompt: str,
+        output_model: type[BaseModel],
+        max_output_tokens: int,
+        call_name: str,
+    ) -> dict[str, Any]:
+        """Return the `responses.parse` keyword arguments for one call."""
+        segments = prompt_cache_segments(prompt)
+        request_kwargs: dict[str, Any] = {
+            "model": self.model_for_call(call_name),
+            "input": [{"role": "user", "content": "\n\n".join(segments)}],
+            "text_format": output_model,
+            "max_output_tokens": max_output_tokens,
+            "store": False,
+            "prompt_cache_key": openai_prompt_cache_key(call_name, segments[0]),
+        }
+        if self.temperature is not None:
+            request_kwargs["temperature"] = self.temperature
+        return request_kwargs
+
+    def _stream_response(self, request_kwargs: dict[str, Any], stream_validator: StreamValidator) -> Any:
+        text = ""
+        incomplete_response = None
+        # Leaving the context manager early closes the HTTP stream.
+        with self.client.responses.stream(**request_kwargs) as stream:
+            for event in stream:
+                event_type = getattr(event, "type", None)
+                if event_type == "response.output_text.delta":
+                    text += event.delta
+                    stream_validator(text)
+                elif event_type == "response.incomplete":
+                    incomplete_response = event.response
+            # The SDK only assembles a final response from `response.completed`.
+            return incomplete_response or stream.get_final_response()
+
+def anthropic_prompt_content(prompt: str) -> str | list[dict[str, Any]]:
+    """Send each stable prompt segment as its own block behind a cache breakpoint."""
+    segments = prompt_cache_segments(prompt)
+    if len(segments) == 1:
+        return prompt
+    blocks: list[dict[str, Any]] = [
+        {"type": "text", "text": segment, "cache_control": {"type": "ephemeral"}} for segment in segments[:-1]
+    ]
+    blocks.append({"type": "text", "text": segments[-1]})
+    return blocks
+
+
+def openai_prompt_cache_key(call_name: str, instructions: str) -> str:
+    """Route calls that share an instruction prefix to the same OpenAI prompt cache."""
+    digest = hashlib.sha256(instructions.encode("utf-8")).hexdigest()[:16]
+    return f"zenml-changelog:{call_name}:{digest}"
+
+
+def _usage_count(container: Any, name: str) -> int:
+    value = getattr(container, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def anthropic_usage_from_response(
+    response: Any,
+    *,
+    call_name: str,
+    model: str,
+    latency_seconds: float,
+) -> LLMUsage | None:
+    """Read token usage from a Messages response; `None` when the response has none."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None
+    cached = _usage_count(usage, "cache_read_input_tokens")
+    # Anthropic reports cache reads and writes separately from `input_tokens`.
+    input_tokens = _usage_count(usage, "input_tokens") + cached + _usage_count(usage, "cache_creation_input_tokens")
+    return LLMUsage(
+        call_name=call_name,
+        model=model,
+        input_tokens=input_tokens,
+        output_tokens=_usage_count(usage, "output_tokens"),
+        cached_input_tokens=cached,
+        latency_seconds=latency_seconds,
+        truncated=getattr(response, "stop_reason", None) == "max_tokens",
+    )
+
+
+def openai_usage_from_response(
+    response: Any,
+    *,
+    call_name: str,
+    model: str,
+    latency_seconds: float,
+) -> LLMUsage | None:
+    """Read token usage from a Responses API response; `None` when the response has none."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None
+    return LLMUsage(
+        call_name=call_name,
+        model=model,
+        input_tokens=_usage_count(usage, "input_tokens"),
+        output_tokens=_usage_count(usage, "output_tokens"),
+        cached_input_tokens=_usage_count(getattr(usage, "input_tokens_details", None), "cached_tokens"),
+        reasoning_tokens=_usage_count(getattr(usage, "output_tokens_details", None), "reasoning_tokens"),
+        latency_seconds=latency_seconds,
+        truncated=getattr(response, "status", None) == "incomplete",
+    )
+
 def openai_response_has_refusal(response: Any) -> bool:
     """Detect refusals across the common Responses SDK object shapes."""
     if getattr(response, "refusal", None):
@@ -300,11 +523,247 @@ def build_structured_llm_client_from_env() -> StructuredLLMClient:
         models_by_call=openai_models_by_call_from_env(model_override),
     )
 
-def llm_retryable() -> Any:
+def retry_after_seconds_from_error(error: BaseException) -> float | None:
+    """Read `retry-after-ms` / `retry-after` hints from a provider HTTP error response."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    raw_ms = headers.get("retry-after-ms")
+    if raw_ms:
+        try:
+            return max(0.0, float(raw_ms) / 1000)
+        except ValueError:
+            pass
+
+    raw = headers.get("retry-after")
+    if not raw:
+        return None
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class LLMRetryBudget:
+    """Per-run cap on wall-clock seconds lost to failed LLM attempts and retry waits.
+
+    One budget is shared by every retried call in the process, so a degraded
+    provider fails the run instead of hanging it across several call sites.
+    """
+
+    def __init__(self, total_seconds: float = DEFAULT_LLM_RETRY_BUDGET_SECONDS) -> None:
+        self.total_seconds = total_seconds
+        self.spent_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        with self._lock:
+            return max(0.0, self.total_seconds - self.spent_seconds)
+
+    def charge(self, seconds: float) -> None:
+        with self._lock:
+            self.spent_seconds += max(0.0, seconds)
+
+    def reset(self, total_seconds: float | None = None) -> None:
+        with self._lock:
+            if total_seconds is not None:
+                self.total_seconds = total_seconds
+            self.spent_seconds = 0.0
+
+
+LLM_RETRY_BUDGET = LLMRetryBudget()
+
+
+def llm_retry_budget_seconds_from_env() -> float:
+    """Return the configured per-run retry budget, treating blank values as missing."""
+    raw = env_value(LLM_RETRY_BUDGET_SECONDS_ENV)
+    if raw is None:
+        return DEFAULT_LLM_RETRY_BUDGET_SECONDS
+    try:
+        seconds = float(raw)
+    except ValueError as error:
+        raise RuntimeError(
+            f"Invalid {LLM_RETRY_BUDGET_SECONDS_ENV}={raw!r}. Expected a number of seconds."
+        ) from error
+    if seconds < 0:
+        raise RuntimeError(f"Invalid {LLM_RETRY_BUDGET_SECONDS_ENV}={raw!r}. Expected a non-negative value.")
+    return seconds
+
+
+def reset_llm_retry_budget(total_seconds: float | None = None) -> LLMRetryBudget:
+    """Start a fresh per-run retry budget, reading the env default when not given."""
+    LLM_RETRY_BUDGET.reset(
+        total_seconds if total_seconds is not None else llm_retry_budget_seconds_from_env()
+    )
+    return LLM_RETRY_BUDGET
+
+
+class LLMUsageLog:
+    """Thread-safe record of provider-reported usage for every LLM response in a run."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._records: List[LLMUsage] = []
+
+    def record(self, usage: LLMUsage) -> None:
+        with self._lock:
+            self._records.append(usage)
+
+    def records(self) -> List[LLMUsage]:
+        with self._lock:
+            return list(self._records)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+
+LLM_USAGE_LOG = LLMUsageLog()
+_LAST_LLM_USAGE = threading.local()
+
+
+def record_llm_usage(usage: LLMUsage) -> None:
+    LLM_USAGE_LOG.record(usage)
+    _LAST_LLM_USAGE.usage = usage
+
+
+def clear_last_llm_usage() -> None:
+    _LAST_LLM_USAGE.usage = None
+
+
+def last_llm_usage() -> LLMUsage | None:
+    """Usage of the latest LLM response on the current thread, if the provider reported any."""
+    return getattr(_LAST_LLM_USAGE, "usage", None)
+
+
+def reset_llm_usage_log() -> LLMUsageLog:
+    LLM_USAGE_LOG.reset()
+    clear_last_llm_usage()
+    return LLM_USAGE_LOG
+
+
+def format_llm_usage_summary(records: List[LLMUsage]) -> str:
+    input_tokens = sum(record.input_tokens for record in records)
+    cached_tokens = sum(record.cached_input_tokens for record in records)
+    output_tokens = sum(record.output_tokens for record in records)
+    reasoning_tokens = sum(record.reasoning_tokens for record in records)
+    return (
+        f"LLM usage: {len(records)} responses, {input_tokens} input tokens ({cached_tokens} cached, "
+        f"{format_cache_hit_rate(cached_tokens, input_tokens)} hit rate), "
+        f"{output_tokens} output tokens ({reasoning_tokens} reasoning)"
+    )
+
+
+def format_cache_hit_rate(cached_tokens: int, input_tokens: int) -> str:
+    return f"{cached_tokens / input_tokens:.0%}" if input_tokens else "n/a"
+
+
+def llm_cache_hit_rates(records: List[LLMUsage]) -> dict[str, str]:
+    """Return the cached share of input tokens per LLM call name, in first-seen order."""
+    totals: dict[str, list[int]] = {}
+    for record in records:
+        call_totals = totals.setdefault(record.call_name, [0, 0])
+        call_totals[0] += record.cached_input_tokens
+        call_totals[1] += record.input_tokens
+    return {call_name: format_cache_hit_rate(cached, total) for call_name, (cached, total) in totals.items()}
+
+
+class LLMRetryPolicy:
+    """Tenacity stop/wait policy that picks the retry wait from the error class.
+
+    - Structured-output validation failures retry immediately.
+    - Provider errors carrying a `Retry-After` hint wait for the hint plus jitter.
+    - Other retryable provider errors use jittered exponential backoff.
+
+    Every failed attempt and wait is charged to the shared retry budget; a retry
+    whose wait would overrun the remaining budget is not attempted.
+    """
+
+    def __init__(
+        self,
+        *,
+        budget: LLMRetryBudget | None = None,
+        max_attempts: int = LLM_RETRY_MAX_ATTEMPTS,
+        backoff_min_seconds: float = 2.0,
+        backoff_max_seconds: float = 60.0,
+        hint_jitter_seconds: float = 1.0,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.budget = budget or LLM_RETRY_BUDGET
+        self.max_attempts = max_attempts
+        self.backoff_min_seconds = backoff_min_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.hint_jitter_seconds = hint_jitter_seconds
+        self.rng = rng or random.Random()
+
+    def wait_for_error(self, error: BaseException | None, attempt_number: int) -> float:
+        if isinstance(error, (LLMOutputValidationError, ValidationError)):
+            return 0.0
+        retry_after = getattr(error, "retry_after_seconds", None)
+        if retry_after is not None:
+            return retry_after + self.rng.uniform(0, self.hint_jitter_seconds)
+        ceiling = min(self.backoff_max_seconds, self.backoff_min_seconds * 2 ** (attempt_number - 1))
+        return self.rng.uniform(ceiling / 2, ceiling)
+
+    def _charge_elapsed(self, retry_state: RetryCallState) -> None:
+        elapsed = retry_state.seconds_since_start or 0.0
+        charged = getattr(retry_state, "llm_retry_charged_seconds", 0.0)
+        self.budget.charge(elapsed - charged)
+        retry_state.llm_retry_charged_seconds = elapsed  # type: ignore[attr-defined]
+
+    def _decide(self, retry_state: RetryCallState) -> tuple[float, bool]:
+        """Return `(wait seconds, stop)` for the attempt that just failed, deciding once per attempt.
+
+        Tenacity calls `wait` before `stop` (and older releases the other way
+        round), so both read this one decision instead of relying on the order.
+        """
+        decided = getattr(retry_state, "llm_retry_decision", None)
+        if decided is not None and decided[0] == retry_state.attempt_number:
+            return decided[1], decided[2]
+        self._charge_elapsed(retry_state)
+        wait_seconds, stop = 0.0, True
+        if retry_state.attempt_number < self.max_attempts:
+            error = retry_state.outcome.exception() if retry_state.outcome else None
+            wait_seconds = self.wait_for_error(error, retry_state.attempt_number)
+            remaining = self.budget.remaining()
+            if wait_seconds > remaining:
+                print(
+                    f"Stopping LLM retries after attempt {retry_state.attempt_number}: next wait "
+                    f"{wait_seconds:.1f}s exceeds the remaining retry budget ({remaining:.1f}s)."
+                )
+                wait_seconds = 0.0
+            else:
+                stop = False
+                self.budget.charge(wait_seconds)
+                retry_state.llm_retry_charged_seconds += wait_seconds  # type: ignore[attr-defined]
+        retry_state.llm_retry_decision = (  # type: ignore[attr-defined]
+            retry_state.attempt_number,
+            wait_seconds,
+            stop,
+        )
+        return wait_seconds, stop
+
+    def stop(self, retry_state: RetryCallState) -> bool:
+        return self._decide(retry_state)[1]
+
+    def wait(self, retry_state: RetryCallState) -> float:
+        return self._decide(retry_state)[0]
+
+
+def llm_retryable(policy: LLMRetryPolicy | None = None) -> Any:
+    retry_policy = policy or LLMRetryPolicy()
     return retry(
         reraise=True,
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=2, min=2, max=60),
+        stop=retry_policy.stop,
+        wait=retry_policy.wait,
         retry=retry_if_exception_type((LLMProviderRetryableError, ValidationError)),
     )
-
@@ -0,0 +1,642 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "requests",
+#     "PyGithub",
+#     "anthropic",
+#     "openai",
+#     "jsonschema",
+#     "pydantic>=2",
+#     "python-slugify",
+#     "tenacity",
+# ]
+# ///
+"""Local stand-in for the OpenAI Responses and Anthropic Messages APIs.
+
+The server implements only the subset the structured clients use: one
+structured-output request per call, optionally streamed. It replays eval
+fixture outputs with configurable latency and injected 429/5xx errors,
+refusals and incomplete responses, so the real clients can be load-tested
+for retries and concurrency without network access or API keys.
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import math
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Literal, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_llm_providers as providers
+from scripts import evaluate_changelog_llms as evaluator
+from scripts.changelog_llm_outputs import (
+    BreakingChangesOutput,
+    GroupedChangelogOutput,
+    MarkdownSection,
+)
+
+StubFault = Literal["rate_limit", "server_error", "refusal", "incomplete"]
+
+# Output models are recognised by the JSON-schema title both SDKs send.
+OUTPUT_MODEL_FIXTURE_FIELDS = {
+    GroupedChangelogOutput.__name__: "grouped_changelog_entries",
+    BreakingChangesOutput.__name__: "breaking_changes",
+    MarkdownSection.__name__: "release_notes_body",
+}
+STUB_OUTPUT_MODELS = {
+    "grouped_changelog_entries": GroupedChangelogOutput,
+    "breaking_changes": BreakingChangesOutput,
+    "release_notes_body": MarkdownSection,
+}
+STUB_API_KEY = "stub-api-key"
+
+
+class StubServerError(RuntimeError):
+    """Raised for stand-in server configuration errors."""
+
+
+class LatencyDistribution(BaseModel):
+    """Per-request latency in seconds: `fixed`, `uniform` or `lognormal`."""
+
+    model_config = ConfigDict(frozen=True)
+
+    kind: Literal["fixed", "uniform", "lognormal"] = "fixed"
+    # fixed: (seconds,), uniform: (low, high), lognormal: (median, sigma)
+    params: Tuple[float, ...] = (0.0,)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            low, high = self.params
+            return rng.uniform(low, high)
+        if self.kind == "lognormal":
+            median, sigma = self.params
+            return rng.lognormvariate(math.log(median), sigma)
+        return self.params[0]
+
+
+def parse_latency(value: str) -> LatencyDistribution:
+    """Parse `fixed:0.2`, `uniform:0.1:0.8` or `lognormal:0.4:0.5` (seconds)."""
+    kind, _, raw_params = value.partition(":")
+    expected_params = {"fixed": 1, "uniform": 2, "lognormal": 2}
+    if kind not in expected_params:
+        raise argparse.ArgumentTypeError(f"Unknown latency distribution {kind!r}.")
+    try:
+        params = tuple(float(param) for param in raw_params.split(":")) if raw_params else ()
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"Invalid latency parameters in {value!r}.") from error
+    if len(params) != expected_params[kind] or any(param < 0 for param in params):
+        raise argparse.ArgumentTypeError(
+            f"Latency {kind!r} expects {expected_params[kind]} non-negative parameter(s), got {value!r}."
+        )
+    return LatencyDistribution(kind=kind, params=params)  # type: ignore[arg-type]
+
+
+class StubFaultRates(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    rate_limit: float = Field(default=0.0, ge=0, le=1)
+    server_error: float = Field(default=0.0, ge=0, le=1)
+    refusal: float = Field(default=0.0, ge=0, le=1)
+    incomplete: float = Field(default=0.0, ge=0, le=1)
+
+
+class StubServerConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    # Keyed by eval fixture field, e.g. `release_notes_body`.
+    outputs: Dict[str, Dict[str, Any]]
+    latency: LatencyDistribution = Field(default_factory=LatencyDistribution)
+    fault_rates: StubFaultRates = Field(default_factory=StubFaultRates)
+    # Faults applied to the first requests in order, before the random rates.
+    scripted_faults: List[Optional[StubFault]] = Field(default_factory=list)
+    retry_after_seconds: float = Field(default=1.0, ge=0)
+    stream_chunk_chars: int = Field(default=24, ge=1)
+    seed: Optional[int] = None
+
+
+class StubServerStats(BaseModel):
+    requests: int = 0
+    streamed: int = 0
+    completed: int = 0
+    rate_limited: int = 0
+    server_errors: int = 0
+    refusals: int = 0
+    incomplete: int = 0
+
+
+def stub_config_from_fixture(
+    fixture_path: Path,
+    *,
+    candidate_id: Optional[str] = None,
+    **overrides: Any,
+) -> StubServerConfig:
+    """Build a server config that replays one offline candidate of an eval fixture."""
+    fixture = evaluator.EvalFixture.model_validate_json(fixture_path.read_text(encoding="utf-8"))
+    candidates = [
+        candidate
+        for candidate in fixture.offline_candidates
+        if candidate_id is None or candidate.candidate_id == candidate_id
+    ]
+    if not candidates:
+        raise StubServerError(f"Fixture {fixture.fixture_id} has no offline candidate {candidate_id!r}.")
+    outputs = {
+        field: payload
+        for field, payload in candidates[0].outputs.model_dump().items()
+        if payload is not None
+    }
+    return StubServerConfig(outputs=outputs, **overrides)
+
+
+class _StubState:
+    def __init__(self, config: StubServerConfig) -> None:
+        self.config = config
+        self.stats = StubServerStats()
+        self._lock = threading.Lock()
+        self._rng = random.Random(config.seed)
+        self._scripted = list(config.scripted_faults)
+        self._ids = itertools.count(1)
+
+    def next_request(self, *, streamed: bool) -> Tuple[int, Optional[StubFault], float]:
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.streamed += int(streamed)
+            fault = self._scripted.pop(0) if self._scripted else self._random_fault()
+            self._count(fault)
+            return next(self._ids), fault, self.config.latency.sample(self._rng)
+
+    def _random_fault(self) -> Optional[StubFault]:
+        roll = self._rng.random()
+        for fault, rate in self.config.fault_rates.model_dump().items():
+            if roll < rate:
+                return fault
+            roll -= rate
+        return None
+
+    def _count(self, fault: Optional[StubFault]) -> None:
+        if fault is None:
+            self.stats.completed += 1
+        elif fault == "rate_limit":
+            self.stats.rate_limited += 1
+        elif fault == "server_error":
+            self.stats.server_errors += 1
+        elif fault == "refusal":
+            self.stats.refusals += 1
+        else:
+            self.stats.incomplete += 1
+
+    def snapshot(self) -> StubServerStats:
+        with self._lock:
+            return self.stats.model_copy()
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, (len(text) + 3) // 4)
+
+
+def _chunks(text: str, size: int) -> Iterator[str]:
+    for start in range(0, len(text), size):
+        yield text[start : start + size]
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    server: "_StubHTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        return
+
+    def do_POST(self) -> None:  # noqa: N802 - stdlib naming
+        path = self.path.split("?", 1)[0]
+        payload = json.loads(self.rfile.read(int(self.headers.get("content-length", 0))) or b"{}")
+        if path == "/v1/responses":
+            api: Literal["openai", "anthropic"] = "openai"
+            schema = payload.get("text", {}).get("format", {}).get("schema", {})
+        elif path == "/v1/messages":
+            api = "anthropic"
+            schema = payload.get("output_config", {}).get("format", {}).get("schema", {})
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {path}", "type": "not_found_error"}})
+            return
+
+        field = OUTPUT_MODEL_FIXTURE_FIELDS.get(str(schema.get("title")))
+        output = self.server.state.config.outputs.get(field or "")
+        if output is None:
+            self._send_error(api, 400, "invalid_request_error", f"No stub output for schema {schema.get('title')!r}.")
+            return
+
+        streamed = bool(payload.get("stream"))
+        request_id, fault, latency = self.server.state.next_request(streamed=streamed)
+        if fault == "rate_limit":
+            time.sleep(latency)
+            self._send_error(api, 429, "rate_limit_error", "Stub rate limit reached.", retry_after=True)
+            return
+        if fault == "server_error":
+            time.sleep(latency)
+            self._send_error(api, 503, "api_error", "Stub server overloaded.")
+            return
+
+        text = "" if fault in {"refusal", "incomplete"} else json.dumps(output)
+        prompt_tokens = _estimate_tokens(json.dumps(payload.get("input") or payload.get("messages")))
+        if api == "openai":
+            response = _openai_response(request_id, payload, text, fault, prompt_tokens)
+            if streamed:
+                self._stream_events(_openai_events(response, text, self.server.state.config), latency)
+            else:
+                time.sleep(latency)
+                self._send_json(200, response)
+        else:
+            message = _anthropic_message(request_id, payload, text, fault, prompt_tokens)
+            if streamed:
+                self._stream_events(_anthropic_events(message, text, self.server.state.config), latency)
+            else:
+                time.sleep(latency)
+                self._send_json(200, message)
+
+    def _send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        encoded = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(encoded)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def _send_error(
+        self,
+        api: Literal["openai", "anthropic"],
+        status: int,
+        error_type: str,
+        message: str,
+        *,
+        retry_after: bool = False,
+    ) -> None:
+        error = {"type": error_type, "message": message}
+        body = {"error": error} if api == "openai" else {"type": "error", "error": error}
+        headers = {"retry-after": str(self.server.state.config.retry_after_seconds)} if retry_after else None
+        self._send_json(status, body, headers)
+
+    def _stream_events(self, events: List[Tuple[str, Dict[str, Any]]], latency: float) -> None:
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.end_headers()
+        delay = latency / len(events)
+        try:
+            for name, data in events:
+                time.sleep(delay)
+                self.wfile.write(f"event: {name}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # The client cancelled the stream, e.g. after a streaming validator failed.
+            return
+
+
+def _openai_response(
+    request_id: int,
+    payload: Dict[str, Any],
+    text: str,
+    fault: Optional[StubFault],
+    prompt_tokens: int,
+) -> Dict[str, Any]:
+    content: List[Dict[str, Any]] = []
+    if fault == "refusal":
+        content = [{"type": "refusal", "refusal": "Stub refusal."}]
+    elif fault is None:
+        content = [{"type": "output_text", "text": text, "annotations": []}]
+    output = [
+        {
+            "id": f"msg_stub_{request_id}",
+            "type": "message",
+            "role": "assistant",
+            "status": "completed",
+            "content": content,
+        }
+    ]
+    return {
+        "id": f"resp_stub_{request_id}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "model": payload.get("model", "stub"),
+        "status": "incomplete" if fault == "incomplete" else "completed",
+        "incomplete_details": {"reason": "max_output_tokens"} if fault == "incomplete" else None,
+        "error": None,
+        "output": [] if fault == "incomplete" else output,
+        "parallel_tool_calls": False,
+        "tool_choice": "auto",
+        "tools": [],
+        "text": payload.get("text", {}),
+        "usage": {
+            "input_tokens": prompt_tokens,
+            "input_tokens_details": {"cached_tokens": 0},
+            "output_tokens": _estimate_tokens(text),
+            "output_tokens_details": {"reasoning_tokens": 0},
+            "total_tokens": prompt_tokens + _estimate_tokens(text),
+        },
+    }
+
+
+def _openai_events(
+    response: Dict[str, Any],
+    text: str,
+    config: StubServerConfig,
+) -> List[Tuple[str, Dict[str, Any]]]:
+    in_progress = {**response, "status": "in_progress", "output": []}
+    events: List[Tuple[str, Dict[str, Any]]] = [("response.created", {"response": in_progress})]
+    for output_index, item in enumerate(response["output"]):
+        events.append(
+            ("response.output_item.added", {"output_index": output_index, "item": {**item, "content": []}})
+        )
+        for content_index, part in enumerate(item["content"]):
+            location = {"item_id": item["id"], "output_index": output_index, "content_index": content_index}
+            if part["type"] != "output_text":
+                events.append(("response.content_part.added", {**location, "part": part}))
+                events.append(("response.content_part.done", {**location, "part": part}))
+                continue
+            events.append(("response.content_part.added", {**location, "part": {**part, "text": ""}}))
+            for delta in _chunks(text, config.stream_chunk_chars):
+                events.append(("response.output_text.delta", {**location, "delta": delta, "logprobs": []}))
+            events.append(("response.output_text.done", {**location, "text": text, "logprobs": []}))
+            events.append(("response.content_part.done", {**location, "part": part}))
+        events.append(("response.output_item.done", {"output_index": output_index, "item": item}))
+    terminal = "response.incomplete" if response["status"] == "incomplete" else "response.completed"
+    events.append((terminal, {"response": response}))
+    return [
+        (name, {"type": name, "sequence_number": sequence, **data})
+        for sequence, (name, data) in enumerate(events)
+    ]
+
+
+def _anthropic_message(
+    request_id: int,
+    payload: Dict[str, Any],
+    text: str,
+    fault: Optional[StubFault],
+    prompt_tokens: int,
+) -> Dict[str, Any]:
+    stop_reason = {"refusal": "refusal", "incomplete": "max_tokens"}.get(fault or "", "end_turn")
+    return {
+        "id": f"msg_stub_{request_id}",
+        "type": "message",
+        "role": "assistant",
+        "model": payload.get("model", "stub"),
+        "content": [{"type": "text", "text": text}] if text else [],
+        "stop_reason": stop_reason,
+        "stop_sequence": None,
+        "usage": {
+            "input_tokens": prompt_tokens,
+            "output_tokens": _estimate_tokens(text),
+            "cache_read_input_tokens": 0,
+            "cache_creation_input_tokens": 0,
+        },
+    }
+
+
+def _anthropic_events(
+    message: Dict[str, Any],
+    text: str,
+    config: StubServerConfig,
+) -> List[Tuple[str, Dict[str, Any]]]:
+    start = {**message, "content": [], "stop_reason": None, "usage": {**message["usage"], "output_tokens": 0}}
+    events: List[Tuple[str, Dict[str, Any]]] = [("message_start", {"message": start})]
+    if text:
+        events.append(("content_block_start", {"index": 0, "content_block": {"type": "text", "text": ""}}))
+        for delta in _chunks(text, config.stream_chunk_chars):
+            events.append(("content_block_delta", {"index": 0, "delta": {"type": "text_delta", "text": delta}}))
+        events.append(("content_block_stop", {"index": 0}))
+    events.append(
+        (
+            "message_delta",
+            {
+                "delta": {"stop_reason": message["stop_reason"], "stop_sequence": None},
+                "usage": {"output_tokens": message["usage"]["output_tokens"]},
+            },
+        )
+    )
+    events.append(("message_stop", {}))
+    return [(name, {"type": name, **data}) for name, data in events]
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], state: _StubState) -> None:
+        self.state = state
+        super().__init__(address, _StubRequestHandler)
+
+
+class LLMStubServer:
+    """Background-thread stand-in server; use as a context manager."""
+
+    def __init__(self, config: StubServerConfig, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        self._state = _StubState(config)
+        self._server = _StubHTTPServer((host, port), self._state)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def stats(self) -> StubServerStats:
+        return self._state.snapshot()
+
+    def start(self) -> "LLMStubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="llm-stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "LLMStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+def build_stub_client(
+    provider: providers.LLMProviderName,
+    url: str,
+    *,
+    model: str = "stub-model",
+) -> providers.StructuredLLMClient:
+    """Build a real structured client whose SDK talks to the stand-in server."""
+    if provider == providers.LLM_PROVIDER_OPENAI:
+        if providers.OpenAI is None:
+            raise StubServerError("The openai package is required for the OpenAI stand-in client.")
+        return providers.OpenAIStructuredLLMClient(
+            providers.OpenAI(api_key=STUB_API_KEY, base_url=f"{url}/v1", max_retries=0),
+            model=model,
+        )
+    return providers.AnthropicStructuredLLMClient(
+        providers.Anthropic(api_key=STUB_API_KEY, base_url=url, max_retries=0),
+        model=model,
+    )
+
+
+class LoadTestReport(BaseModel):
+    provider: providers.LLMProviderName
+    calls: int
+    concurrency: int
+    streamed: bool
+    succeeded: int
+    failed: int
+    wall_seconds: float
+    p50_seconds: float
+    p95_seconds: float
+    errors: Dict[str, int]
+    server: StubServerStats
+
+
+def run_load_test(
+    *,
+    config: StubServerConfig,
+    provider: providers.LLMProviderName,
+    calls: int,
+    concurrency: int,
+    stream: bool = False,
+    retry_budget_seconds: float = providers.DEFAULT_LLM_RETRY_BUDGET_SECONDS,
+) -> LoadTestReport:
+    """Drive the real client and retry policy against a fresh stand-in server."""
+    output_fields = sorted(config.outputs)
+    if not output_fields:
+        raise StubServerError("The stand-in server has no fixture outputs to replay.")
+    providers.reset_llm_retry_budget(retry_budget_seconds)
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    lock = threading.Lock()
+
+    with LLMStubServer(config) as server:
+        client = build_stub_client(provider, server.url)
+
+        @providers.llm_retryable()
+        def call(output_model: type[BaseModel]) -> BaseModel:
+            return client.parse_structured_output(
+                prompt="Stand-in load test prompt.",
+                output_model=output_model,
+                max_output_tokens=1000,
+                call_name=output_model.__name__,
+                stream_validator=(lambda text: None) if stream else None,
+            )
+
+        def timed_call(index: int) -> None:
+            output_model = STUB_OUTPUT_MODELS[output_fields[index % len(output_fields)]]
+            start = time.perf_counter()
+            try:
+                call(output_model)
+            except Exception as error:  # noqa: BLE001 - tallied into the report
+                with lock:
+                    errors[type(error).__name__] = errors.get(type(error).__name__, 0) + 1
+                return
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(timed_call, range(calls)))
+        wall_seconds = time.perf_counter() - start
+        server_stats = server.stats
+
+    ordered = sorted(latencies)
+    return LoadTestReport(
+        provider=provider,
+        calls=calls,
+        concurrency=concurrency,
+        streamed=stream,
+        succeeded=len(latencies),
+        failed=calls - len(latencies),
+        wall_seconds=wall_seconds,
+        p50_seconds=statistics.median(ordered) if ordered else 0.0,
+        p95_seconds=ordered[max(0, math.ceil(len(ordered) * 0.95) - 1)] if ordered else 0.0,
+        errors=errors,
+        server=server_stats,
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve_parser = subparsers.add_parser("serve", help="Run the stand-in server until interrupted.")
+    load_parser = subparsers.add_parser("load-test", help="Benchmark a real client against the stand-in server.")
+    for subparser in (serve_parser, load_parser):
+        subparser.add_argument("--fixture", type=Path, required=True, help="Eval fixture JSON to replay.")
+        subparser.add_argument("--candidate", default=None, help="Offline candidate id (default: first).")
+        subparser.add_argument("--latency", type=parse_latency, default=LatencyDistribution())
+        subparser.add_argument("--rate-limit-rate", type=float, default=0.0)
+        subparser.add_argument("--server-error-rate", type=float, default=0.0)
+        subparser.add_argument("--refusal-rate", type=float, default=0.0)
+        subparser.add_argument("--incomplete-rate", type=float, default=0.0)
+        subparser.add_argument("--retry-after", type=float, default=1.0, help="Seconds sent with 429 responses.")
+        subparser.add_argument("--seed", type=int, default=None)
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8089)
+    load_parser.add_argument("--provider", choices=sorted(providers.SUPPORTED_LLM_PROVIDERS), default="openai")
+    load_parser.add_argument("--calls", type=int, default=100)
+    load_parser.add_argument("--concurrency", type=int, default=8)
+    load_parser.add_argument("--stream", action="store_true", help="Use the streaming request path.")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        config = stub_config_from_fixture(
+            args.fixture,
+            candidate_id=args.candidate,
+            latency=args.latency,
+            fault_rates=StubFaultRates(
+                rate_limit=args.rate_limit_rate,
+                server_error=args.server_error_rate,
+                refusal=args.refusal_rate,
+                incomplete=args.incomplete_rate,
+            ),
+            retry_after_seconds=args.retry_after,
+            seed=args.seed,
+        )
+    except StubServerError as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 2
+
+    if args.command == "serve":
+        server = LLMStubServer(config, host=args.host, port=args.port).start()
+        print(f"Serving stand-in OpenAI ({server.url}/v1) and Anthropic ({server.url}) APIs; Ctrl-C to stop.")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.stop()
+            print(server.stats.model_dump_json(indent=2))
+        return 0
+
+    report = run_load_test(
+        config=config,
+        provider=args.provider,
+        calls=args.calls,
+        concurrency=args.concurrency,
+        stream=args.stream,
+    )
+    print(report.model_dump_json(indent=2))
+    return 0 if report.failed == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
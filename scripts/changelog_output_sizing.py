@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import math
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+
+try:
+    from scripts.changelog_env import env_value
+    from scripts.changelog_llm_outputs import LLMUsage
+    from scripts.changelog_prompts import CHARS_PER_TOKEN, render_prompt
+except ModuleNotFoundError:  # pragma: no cover
+    from changelog_env import env_value  # type: ignore[no-redef]
+    from changelog_llm_outputs import LLMUsage  # type: ignore[no-redef]
+    from changelog_prompts import CHARS_PER_TOKEN, render_prompt  # type: ignore[no-redef]
+
+# Output caps are learned from the output sizes of earlier runs, per LLM call
+# and model. The history is a cache (restored between workflow runs), not a
+# ledger: a missing or unreadable file only means the built-in defaults apply.
+LLM_OUTPUT_HISTORY_ENV = "CHANGELOG_LLM_OUTPUT_HISTORY"
+OUTPUT_HISTORY_MAX_SAMPLES = 50
+OUTPUT_SIZING_MIN_SAMPLES = 5
+OUTPUT_SIZING_PERCENTILE = 0.95
+OUTPUT_SIZING_HEADROOM = 1.25
+OUTPUT_SIZING_MIN_TOKENS = 256
+OUTPUT_SIZING_MAX_TOKENS = 16_000
+# An incomplete response is retried once with its cap multiplied by this
+# factor, and never below the call's built-in default.
+OUTPUT_ESCALATION_FACTOR = 2
+
+
+class OutputTokenSample(BaseModel):
+    input_tokens: int = Field(..., ge=0)
+    output_tokens: int = Field(..., ge=0)
+
+
+class OutputTokenHistory(BaseModel):
+    # Keyed by `<call_name>:<model>`, oldest sample first.
+    samples: Dict[str, List[OutputTokenSample]] = Field(default_factory=dict)
+
+    def samples_for(self, call_name: str, model: str) -> List[OutputTokenSample]:
+        return self.samples.get(_history_key(call_name, model), [])
+
+    def record(self, usage: LLMUsage) -> None:
+        """Add one response's sizes; truncated outputs only show the old cap and are skipped."""
+        if usage.truncated or usage.output_tokens <= 0:
+            return
+        samples = self.samples.setdefault(_history_key(usage.call_name, usage.model), [])
+        samples.append(OutputTokenSample(input_tokens=usage.input_tokens, output_tokens=usage.output_tokens))
+        del samples[:-OUTPUT_HISTORY_MAX_SAMPLES]
+
+
+def _history_key(call_name: str, model: str) -> str:
+    return f"{call_name}:{model}"
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def read_output_token_history(path: Path) -> OutputTokenHistory:
+    if not path.exists():
+        return OutputTokenHistory()
+    try:
+        return OutputTokenHistory.model_validate_json(path.read_text() or "{}")
+    except (ValidationError, ValueError) as error:
+        print(f"Warning: ignoring unreadable LLM output history {path}: {error}")
+        return OutputTokenHistory()
+
+
+def write_output_token_history(history: OutputTokenHistory, path: Path) -> None:
+    path.write_text(json.dumps(history.model_dump(mode="json"), indent=2, sort_keys=True) + "\n")
+
+
+def output_token_history_path_from_env() -> Optional[Path]:
+    raw = env_value(LLM_OUTPUT_HISTORY_ENV)
+    return Path(raw) if raw else None
+
+
+def estimate_prompt_tokens(prompt: str) -> int:
+    return math.ceil(len(render_prompt(prompt)) / CHARS_PER_TOKEN)
+
+
+class OutputTokenSizer:
+    """Pick `max_output_tokens` per call from learned output-size percentiles.
+
+    With enough history for a call and model, the cap is the larger of the
+    95th-percentile output size and the 95th-percentile output/input ratio
+    scaled to this prompt's size, plus headroom. Otherwise the call's built-in
+    default is used unchanged.
+    """
+
+    def __init__(self, history: Optional[OutputTokenHistory] = None) -> None:
+        self._lock = threading.Lock()
+        self.history = history or OutputTokenHistory()
+
+    def max_output_tokens(self, *, call_name: str, model: str, prompt: str, default: int) -> int:
+        with self._lock:
+            samples = list(self.history.samples_for(call_name, model))
+        if len(samples) < OUTPUT_SIZING_MIN_SAMPLES:
+            return default
+        output_p95 = percentile([sample.output_tokens for sample in samples], OUTPUT_SIZING_PERCENTILE)
+        ratio_p95 = percentile(
+            [sample.output_tokens / max(1, sample.input_tokens) for sample in samples],
+            OUTPUT_SIZING_PERCENTILE,
+        )
+        predicted = max(output_p95, ratio_p95 * estimate_prompt_tokens(prompt))
+        cap = math.ceil(predicted * OUTPUT_SIZING_HEADROOM)
+        return min(OUTPUT_SIZING_MAX_TOKENS, max(OUTPUT_SIZING_MIN_TOKENS, cap))
+
+    def record(self, records: List[LLMUsage]) -> None:
+        with self._lock:
+            for usage in records:
+                self.history.record(usage)
+
+    def reset(self, history: Optional[OutputTokenHistory] = None) -> None:
+        with self._lock:
+            self.history = history or OutputTokenHistory()
+
+
+def escalated_max_output_tokens(max_output_tokens: int, default: int = 0) -> int:
+    """The cap for the retry of an incomplete response.
+
+    A learned cap can sit far below the call's default (down to
+    `OUTPUT_SIZING_MIN_TOKENS`), where one doubling may still be too small.
+    """
+    return min(OUTPUT_SIZING_MAX_TOKENS, max(default, max_output_tokens * OUTPUT_ESCALATION_FACTOR))
+
+
+OUTPUT_TOKEN_SIZER = OutputTokenSizer()
+
+
+def reset_output_token_sizer(history: Optional[OutputTokenHistory] = None) -> OutputTokenSizer:
+    """Start a run with the given history, or with built-in defaults when none is given."""
+    OUTPUT_TOKEN_SIZER.reset(history)
+    return OUTPUT_TOKEN_SIZER
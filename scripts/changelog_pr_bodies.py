@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+# PR-template sections that never describe the change itself. Matched against the
+# heading text, case-insensitively, after stripping markdown emphasis.
+TEMPLATE_SECTION_TITLES = frozenset(
+    {
+        "pre-requisites",
+        "prerequisites",
+        "types of changes",
+        "type of change",
+        "checklist",
+        "how has this been tested?",
+        "how has this been tested",
+        "screenshots",
+        "screenshots (if appropriate)",
+        "related issues",
+    }
+)
+
+# Placeholder lines left behind when authors do not fill the template in.
+TEMPLATE_PLACEHOLDER_LINES = frozenset(
+    {
+        "i implemented/fixed _ to achieve _.",
+        "please ensure you have done the following:",
+    }
+)
+
+# Key on a PR dict holding its cached short digest (see changelog_pr_digests).
+PR_DIGEST_KEY = "digest"
+# Key on a PR dict holding a zero-argument callable that makes its digest on
+# first use, for summarizers too costly to run for PRs whose bodies fit.
+PR_PENDING_DIGEST_KEY = "pending_digest"
+
+_HTML_COMMENT_PATTERN = re.compile(r"<!--.*?(?:-->|$)", flags=re.DOTALL)
+_CODE_FENCE_PATTERN = re.compile(r"^(```|~~~).*?(?:^\1[^\n]*$|\Z)", flags=re.DOTALL | re.MULTILINE)
+_LINKED_IMAGE_PATTERN = re.compile(r"\[!\[[^\]]*\]\([^)]*\)\]\([^)]*\)")
+_MARKDOWN_IMAGE_PATTERN = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_HTML_IMAGE_PATTERN = re.compile(r"<\s*img\b[^>]*>", flags=re.IGNORECASE)
+_CHECKBOX_LINE_PATTERN = re.compile(r"^\s*(?:[-*+]|\d+\.)\s+\[[ xX]\].*$", flags=re.MULTILINE)
+_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+class PRBodyNormalizationMetric(BaseModel):
+    repo: str
+    number: int
+    raw_bytes: int
+    normalized_bytes: int
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.raw_bytes - self.normalized_bytes
+
+
+def _strip_template_sections(text: str) -> str:
+    kept: List[str] = []
+    skip_level: int | None = None
+    for line in text.splitlines():
+        heading = _HEADING_PATTERN.match(line)
+        if heading:
+            level = len(heading.group(1))
+            title = heading.group(2).strip("*_ ").lower()
+            if skip_level is not None and level > skip_level:
+                continue
+            skip_level = level if title in TEMPLATE_SECTION_TITLES else None
+            if skip_level is None:
+                # Keep the author's heading text but drop the markdown marker.
+                kept.append(heading.group(2))
+            continue
+        if skip_level is not None:
+            continue
+        if line.strip().lower() in TEMPLATE_PLACEHOLDER_LINES:
+            continue
+        kept.append(line)
+    return "\n".join(kept)
+
+
+@lru_cache(maxsize=2048)
+def normalize_pr_body(body: str) -> str:
+    """Strip PR-template noise from a body and collapse it onto a single line.
+
+    Removes HTML comments, fenced code blocks, images and badges, checkbox
+    lists, and known template sections so prompt budgets go to the PR's own
+    description.
+    """
+    text = _HTML_COMMENT_PATTERN.sub("", body.replace("\r\n", "\n"))
+    text = _CODE_FENCE_PATTERN.sub("", text)
+    text = _LINKED_IMAGE_PATTERN.sub("", text)
+    text = _MARKDOWN_IMAGE_PATTERN.sub("", text)
+    text = _HTML_IMAGE_PATTERN.sub("", text)
+    text = _CHECKBOX_LINE_PATTERN.sub("", text)
+    text = _strip_template_sections(text)
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def normalized_pr_body(pr: Dict[str, Any]) -> str:
+    return normalize_pr_body(pr.get("body") or "")
+
+
+def prompt_pr_body(pr: Dict[str, Any]) -> str:
+    """Return the body text prompts should use: the PR's digest when attached, else its normalized body."""
+    return pr.get(PR_DIGEST_KEY) or normalized_pr_body(pr)
+
+
+def without_pr_digest(pr: Dict[str, Any]) -> Dict[str, Any]:
+    digest_keys = (PR_DIGEST_KEY, PR_PENDING_DIGEST_KEY)
+    if not any(key in pr for key in digest_keys):
+        return pr
+    return {key: value for key, value in pr.items() if key not in digest_keys}
+
+
+def with_resolved_pr_digest(pr: Dict[str, Any]) -> Dict[str, Any]:
+    """Return `pr` with its pending digest, if any, made and attached under `digest`."""
+    pending = pr.get(PR_PENDING_DIGEST_KEY)
+    if pending is None:
+        return pr
+    digest = pending()
+    resolved = without_pr_digest(pr)
+    return {**resolved, PR_DIGEST_KEY: digest} if digest else resolved
+
+
+def pr_body_normalization_metrics(prs: List[Dict[str, Any]]) -> List[PRBodyNormalizationMetric]:
+    """Return raw vs normalized body sizes in UTF-8 bytes for each PR."""
+    return [
+        PRBodyNormalizationMetric(
+            repo=pr.get("repo") or "",
+            number=int(pr["number"]),
+            raw_bytes=len((pr.get("body") or "").encode("utf-8")),
+            normalized_bytes=len(normalized_pr_body(pr).encode("utf-8")),
+        )
+        for pr in prs
+    ]
+
+
+def format_pr_body_normalization_summary(metrics: List[PRBodyNormalizationMetric]) -> str:
+    raw_bytes = sum(metric.raw_bytes for metric in metrics)
+    saved_bytes = sum(metric.saved_bytes for metric in metrics)
+    percent = (saved_bytes / raw_bytes * 100) if raw_bytes else 0.0
+    return (
+        f"Normalized {len(metrics)} PR bodies: saved {saved_bytes} of {raw_bytes} bytes "
+        f"({percent:.0f}%) before prompt truncation"
+    )
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+
+try:
+    from scripts.changelog_env import env_value
+    from scripts.changelog_pr_bodies import PR_DIGEST_KEY, PR_PENDING_DIGEST_KEY, normalized_pr_body
+except ModuleNotFoundError:  # pragma: no cover
+    from changelog_env import env_value  # type: ignore[no-redef]
+    from changelog_pr_bodies import (  # type: ignore[no-redef]
+        PR_DIGEST_KEY,
+        PR_PENDING_DIGEST_KEY,
+        normalized_pr_body,
+    )
+
+# Prompt builders fall back to a short per-PR digest when the normalized bodies
+# do not fit a call's input budget. Digests are cached across runs, keyed by
+# repo, PR number and a hash of the raw body, so a PR that shows up again
+# (re-runs, eval fixtures, late labels in another target) is summarized once. Like the output-size history, the file
+# is a cache: a missing or unreadable one only means digests are made again.
+PR_DIGEST_CACHE_ENV = "CHANGELOG_PR_DIGEST_CACHE"
+PR_DIGEST_SUMMARIZER_ENV = "CHANGELOG_PR_DIGEST_SUMMARIZER"
+PR_DIGEST_MAX_CHARS = 600
+PR_DIGEST_CACHE_MAX_ENTRIES = 5000
+# Bump when a summarizer changes its output, so older digests are made again.
+PR_DIGEST_VERSION = 1
+
+PRDigestSource = Literal["extractive", "llm"]
+PRDigestSummarizer = Callable[[Dict[str, Any]], str]
+
+_SENTENCE_END_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+
+class PRDigest(BaseModel):
+    summary: str
+    source: PRDigestSource
+    version: int = PR_DIGEST_VERSION
+
+
+class PRDigestStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    # Digests deferred until a prompt needs them and not made yet.
+    pending: int = 0
+
+
+class PRDigestCache(BaseModel):
+    # Keyed by `<repo>#<number>@<body hash>`, least recently used first.
+    digests: Dict[str, PRDigest] = Field(default_factory=dict)
+
+    def get(self, pr: Dict[str, Any], source: PRDigestSource) -> Optional[PRDigest]:
+        key = pr_digest_key(pr)
+        digest = self.digests.get(key)
+        if digest is None or digest.source != source or digest.version != PR_DIGEST_VERSION:
+            return None
+        self.digests[key] = self.digests.pop(key)
+        return digest
+
+    def put(self, pr: Dict[str, Any], digest: PRDigest) -> None:
+        key = pr_digest_key(pr)
+        self.digests.pop(key, None)
+        self.digests[key] = digest
+        for stale in list(self.digests)[: max(0, len(self.digests) - PR_DIGEST_CACHE_MAX_ENTRIES)]:
+            del self.digests[stale]
+
+
+def pr_body_hash(pr: Dict[str, Any]) -> str:
+    return hashlib.sha256((pr.get("body") or "").encode("utf-8")).hexdigest()[:16]
+
+
+def pr_digest_key(pr: Dict[str, Any]) -> str:
+    return f"{pr.get('repo') or ''}#{pr['number']}@{pr_body_hash(pr)}"
+
+
+def extractive_pr_digest(pr: Dict[str, Any], *, max_chars: int = PR_DIGEST_MAX_CHARS) -> str:
+    """Return the leading whole sentences of the normalized body, up to `max_chars`.
+
+    A first sentence longer than the limit is cut at a word boundary instead.
+    """
+    body = normalized_pr_body(pr)
+    if len(body) <= max_chars:
+        return body
+    kept: List[str] = []
+    length = 0
+    for sentence in _SENTENCE_END_PATTERN.split(body):
+        if length + len(sentence) + bool(kept) > max_chars:
+            break
+        kept.append(sentence)
+        length += len(sentence) + 1
+    if kept:
+        return " ".join(kept)
+    return body[:max_chars].rsplit(" ", 1)[0]
+
+
+class PendingPRDigest:
+    """Make, cache and count one PR's digest the first time a prompt asks for it.
+
+    Prompts for chunks and speculative attempts are built on worker threads, so
+    the summarizer runs at most once per PR and cache updates are serialized.
+    """
+
+    _cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        pr: Dict[str, Any],
+        cache: PRDigestCache,
+        summarize: PRDigestSummarizer,
+        source: PRDigestSource,
+        stats: Optional[PRDigestStats],
+    ) -> None:
+        self._pr = pr
+        self._cache = cache
+        self._summarize = summarize
+        self._source = source
+        self._stats = stats
+        self._lock = threading.Lock()
+        self._summary: Optional[str] = None
+
+    def __call__(self) -> str:
+        with self._lock:
+            if self._summary is None:
+                digest = PRDigest(summary=self._summarize(self._pr).strip(), source=self._source)
+                with self._cache_lock:
+                    self._cache.put(self._pr, digest)
+                    if self._stats is not None:
+                        self._stats.misses += 1
+                        self._stats.pending -= 1
+                self._summary = digest.summary
+            return self._summary
+
+
+def attach_pr_digests(
+    prs: List[Dict[str, Any]],
+    cache: PRDigestCache,
+    *,
+    summarize: PRDigestSummarizer = extractive_pr_digest,
+    source: PRDigestSource = "extractive",
+    stats: Optional[PRDigestStats] = None,
+    lazy: bool = False,
+) -> List[Dict[str, Any]]:
+    """Return copies of `prs` with a cached or freshly made digest under `digest`.
+
+    With `lazy`, a PR missing from the cache gets a `PendingPRDigest` under
+    `pending_digest` instead, so the summarizer only runs for PRs whose prompt
+    falls back to digests. PRs with an empty normalized body are returned
+    unchanged. Input PR dicts are not modified.
+    """
+    digested: List[Dict[str, Any]] = []
+    for pr in prs:
+        if not normalized_pr_body(pr):
+            digested.append(pr)
+            continue
+        digest = cache.get(pr, source)
+        if digest is None and lazy:
+            if stats is not None:
+                stats.pending += 1
+            digested.append({**pr, PR_PENDING_DIGEST_KEY: PendingPRDigest(pr, cache, summarize, source, stats)})
+            continue
+        if stats is not None:
+            if digest is None:
+                stats.misses += 1
+            else:
+                stats.hits += 1
+        if digest is None:
+            digest = PRDigest(summary=summarize(pr).strip(), source=source)
+            cache.put(pr, digest)
+        digested.append({**pr, PR_DIGEST_KEY: digest.summary} if digest.summary else pr)
+    return digested
+
+
+def read_pr_digest_cache(path: Path) -> PRDigestCache:
+    if not path.exists():
+        return PRDigestCache()
+    try:
+        return PRDigestCache.model_validate_json(path.read_text() or "{}")
+    except (ValidationError, ValueError) as error:
+        print(f"Warning: ignoring unreadable PR digest cache {path}: {error}")
+        return PRDigestCache()
+
+
+def write_pr_digest_cache(cache: PRDigestCache, path: Path) -> None:
+    path.write_text(json.dumps(cache.model_dump(mode="json"), indent=2) + "\n")
+
+
+def pr_digest_cache_path_from_env() -> Optional[Path]:
+    raw = env_value(PR_DIGEST_CACHE_ENV)
+    return Path(raw) if raw else None
+
+
+def pr_digest_source_from_env() -> PRDigestSource:
+    raw = (env_value(PR_DIGEST_SUMMARIZER_ENV) or "extractive").lower()
+    if raw not in ("extractive", "llm"):
+        raise RuntimeError(f"Invalid {PR_DIGEST_SUMMARIZER_ENV}={raw!r}. Expected 'extractive' or 'llm'.")
+    return raw  # type: ignore[return-value]
+
+
+def format_pr_digest_summary(stats: PRDigestStats, source: PRDigestSource) -> str:
+    summary = f"PR digests ({source}): {stats.hits} reused from cache, {stats.misses} made"
+    if source == "llm" and stats.misses:
+        summary += " (one LLM call each)"
+    if stats.pending:
+        summary += f", {stats.pending} not needed"
+    return summary
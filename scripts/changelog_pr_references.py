@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import FrozenSet, List, Tuple
+
+# Each pattern below is one of the PR-reference shapes the release-note
+# validators care about. The text is scanned once per shape and the results
+# are kept as sets, so checking N PRs is N set lookups instead of N regex
+# passes over the body.
+_PULL_URL_PATTERN = re.compile(r"https://github\.com/[^\s)]+/pull/\d+")
+# The link patterns are zero-width so overlapping candidates (a link inside
+# another link's URL) are all seen, exactly like a per-PR `re.search` would.
+_MARKDOWN_PR_LINK_PATTERN = re.compile(r"(?=\[PR #(\d+)\]\(([^)]*)\))")
+_LINK_LABEL_PATTERN = re.compile(r"(?=\[([^\]]*)\]\([^)]*\))")
+_LABEL_NUMBER_PATTERN = re.compile(r"(?:PR\s*#?\s*|#)(\d+)", flags=re.IGNORECASE)
+_PR_MENTION_PATTERN = re.compile(r"\bPR\s*#?\s*(\d+)\b", flags=re.IGNORECASE)
+_BARE_HASH_PATTERN = re.compile(r"(?<![\w/])#(\d+)\b")
+
+
+class PRReferences:
+    """PR references found in one piece of text.
+
+    Numbers are kept as their digit strings: `#01` does not reference PR 1.
+    """
+
+    __slots__ = ("has_pull_url", "markdown_links", "mentioned_numbers")
+
+    def __init__(
+        self,
+        *,
+        has_pull_url: bool,
+        markdown_links: FrozenSet[Tuple[str, str]],
+        mentioned_numbers: FrozenSet[str],
+    ) -> None:
+        self.has_pull_url = has_pull_url
+        self.markdown_links = markdown_links
+        self.mentioned_numbers = mentioned_numbers
+
+    def has_markdown_link(self, number: int, url: str) -> bool:
+        return (str(number), url) in self.markdown_links
+
+    def mentions(self, number: int) -> bool:
+        return str(number) in self.mentioned_numbers
+
+
+def _link_label_numbers(text: str) -> List[str]:
+    numbers: List[str] = []
+    for label in _LINK_LABEL_PATTERN.finditer(text):
+        # Labels match `#{n}` without a trailing boundary, so `[#123](...)`
+        # references PR 1 and PR 12 as well as PR 123.
+        for match in _LABEL_NUMBER_PATTERN.finditer(label.group(1)):
+            digits = match.group(1)
+            numbers.extend(digits[:end] for end in range(1, len(digits) + 1))
+    return numbers
+
+
+@lru_cache(maxsize=256)
+def scan_pr_references(text: str) -> PRReferences:
+    """Tokenize `text` into PR links, pull URLs, `PR n` mentions and bare `#n` tokens."""
+    mentioned = set(_link_label_numbers(text))
+    mentioned.update(match.group(1) for match in _PR_MENTION_PATTERN.finditer(text))
+    mentioned.update(match.group(1) for match in _BARE_HASH_PATTERN.finditer(text))
+    return PRReferences(
+        has_pull_url=_PULL_URL_PATTERN.search(text) is not None,
+        markdown_links=frozenset(
+            (match.group(1), match.group(2)) for match in _MARKDOWN_PR_LINK_PATTERN.finditer(text)
+        ),
+        mentioned_numbers=frozenset(mentioned),
+    )
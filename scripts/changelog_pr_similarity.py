@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from scripts.changelog_llm_outputs import GroupedChangelogOutput
+    from scripts.changelog_pr_bodies import normalized_pr_body
+except ModuleNotFoundError:  # pragma: no cover
+    from changelog_llm_outputs import GroupedChangelogOutput  # type: ignore[no-redef]
+    from changelog_pr_bodies import normalized_pr_body  # type: ignore[no-redef]
+
+# Near-duplicate PRs (backports, API/dashboard counterparts) are collapsed into
+# one representative for the grouped, body and breaking-change prompts. MinHash with LSH banding finds
+# candidate pairs; the exact shingle Jaccard similarity confirms them.
+NEAR_DUPLICATE_JACCARD_THRESHOLD = 0.8
+SHINGLE_CHARS = 5
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16
+MINHASH_SEED = 20240611
+
+# Key on a representative PR listing the near-duplicates it stands in for.
+COLLAPSED_PRS_KEY = "collapsed_prs"
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_TITLE_TAG_PATTERN = re.compile(r"^\s*(?:\[[^\]]*\]\s*|(?:backport|cherry[- ]pick)\b\s*:?\s*)+", re.IGNORECASE)
+_NON_WORD_PATTERN = re.compile(r"[^a-z0-9]+")
+
+_rng = random.Random(MINHASH_SEED)
+_PERMUTATIONS: Tuple[Tuple[int, int], ...] = tuple(
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(MINHASH_PERMUTATIONS)
+)
+
+
+def _similarity_text(pr: Dict[str, Any]) -> str:
+    title = _TITLE_TAG_PATTERN.sub("", str(pr.get("title", "")))
+    return _NON_WORD_PATTERN.sub(" ", f"{title} {normalized_pr_body(pr)}".lower()).strip()
+
+
+def pr_shingles(pr: Dict[str, Any], *, size: int = SHINGLE_CHARS) -> Set[int]:
+    """Hash the character shingles of a PR's normalized title and body."""
+    text = _similarity_text(pr)
+    return {
+        int.from_bytes(hashlib.blake2b(text[start : start + size].encode("utf-8"), digest_size=8).digest(), "big")
+        for start in range(len(text) - size + 1)
+    }
+
+
+def minhash_signature(shingles: Iterable[int]) -> Tuple[int, ...]:
+    values = list(shingles)
+    return tuple(min((a * value + b) % _MERSENNE_PRIME for value in values) for a, b in _PERMUTATIONS)
+
+
+def jaccard_similarity(left: Set[int], right: Set[int]) -> float:
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+def _candidate_pairs(signatures: List[Optional[Tuple[int, ...]]]) -> Set[Tuple[int, int]]:
+    rows = MINHASH_PERMUTATIONS // MINHASH_BANDS
+    pairs: Set[Tuple[int, int]] = set()
+    for band in range(MINHASH_BANDS):
+        buckets: Dict[Tuple[int, ...], List[int]] = {}
+        for index, signature in enumerate(signatures):
+            if signature is not None:
+                buckets.setdefault(signature[band * rows : (band + 1) * rows], []).append(index)
+        for bucket in buckets.values():
+            pairs.update((left, right) for position, left in enumerate(bucket) for right in bucket[position + 1 :])
+    return pairs
+
+
+def near_duplicate_pr_clusters(
+    prs: List[Dict[str, Any]],
+    *,
+    threshold: float = NEAR_DUPLICATE_JACCARD_THRESHOLD,
+) -> List[List[int]]:
+    """Return input indexes of near-duplicate PRs, one sorted list per cluster of two or more."""
+    shingles = [pr_shingles(pr) for pr in prs]
+    signatures = [minhash_signature(pr_shingle) if pr_shingle else None for pr_shingle in shingles]
+    parents = list(range(len(prs)))
+
+    def root(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    for left, right in sorted(_candidate_pairs(signatures)):
+        if jaccard_similarity(shingles[left], shingles[right]) >= threshold:
+            left_root, right_root = root(left), root(right)
+            parents[max(left_root, right_root)] = min(left_root, right_root)
+
+    clusters: Dict[int, List[int]] = {}
+    for index in range(len(prs)):
+        clusters.setdefault(root(index), []).append(index)
+    return [members for members in clusters.values() if len(members) > 1]
+
+
+def collapse_near_duplicate_prs(
+    prs: List[Dict[str, Any]],
+    *,
+    threshold: float = NEAR_DUPLICATE_JACCARD_THRESHOLD,
+) -> List[Dict[str, Any]]:
+    """Replace each near-duplicate cluster with one representative PR.
+
+    The representative is the member with the longest normalized body, placed
+    at the cluster's first input position; the other members are attached to it
+    under `collapsed_prs`. Input PR dicts are not modified.
+    """
+    representatives: Dict[int, Dict[str, Any]] = {}
+    collapsed: Set[int] = set()
+    for members in near_duplicate_pr_clusters(prs, threshold=threshold):
+        chosen = max(members, key=lambda index: (len(normalized_pr_body(prs[index])), -index))
+        representatives[members[0]] = {
+            **prs[chosen],
+            COLLAPSED_PRS_KEY: [prs[index] for index in members if index != chosen],
+        }
+        collapsed.update(members[1:])
+    return [representatives.get(index, pr) for index, pr in enumerate(prs) if index not in collapsed]
+
+
+def expand_collapsed_prs(prs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Undo `collapse_near_duplicate_prs`, listing every member after its representative."""
+    expanded: List[Dict[str, Any]] = []
+    for pr in prs:
+        members = pr.get(COLLAPSED_PRS_KEY) or []
+        expanded.append({key: value for key, value in pr.items() if key != COLLAPSED_PRS_KEY} if members else pr)
+        expanded.extend(members)
+    return expanded
+
+
+def expand_collapsed_pr_numbers(
+    grouped_output: GroupedChangelogOutput,
+    prs: List[Dict[str, Any]],
+) -> GroupedChangelogOutput:
+    """Add the collapsed members after each representative PR number in the grouping."""
+    members_by_number = {
+        pr["number"]: [member["number"] for member in pr[COLLAPSED_PRS_KEY]]
+        for pr in prs
+        if pr.get(COLLAPSED_PRS_KEY)
+    }
+    if not members_by_number:
+        return grouped_output
+    return grouped_output.model_copy(
+        update={
+            "entries": [
+                entry.model_copy(
+                    update={
+                        "pr_numbers": [
+                            expanded
+                            for number in entry.pr_numbers
+                            for expanded in [number, *members_by_number.get(number, [])]
+                        ]
+                    }
+                )
+                for entry in grouped_output.entries
+            ]
+        }
+    )
+
+
+def format_near_duplicate_summary(prs: List[Dict[str, Any]]) -> str:
+    representatives = [pr for pr in prs if pr.get(COLLAPSED_PRS_KEY)]
+    collapsed = sum(len(pr[COLLAPSED_PRS_KEY]) for pr in representatives)
+    details = "; ".join(
+        f"#{pr['number']} covers " + ", ".join(f"#{member['number']}" for member in pr[COLLAPSED_PRS_KEY])
+        for pr in representatives
+    )
+    return f"Collapsed {collapsed} near-duplicate PRs into {len(representatives)} representatives: {details}"
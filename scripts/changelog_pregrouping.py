@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+from pydantic import BaseModel
+
+try:
+    from scripts.changelog_config import LABEL_MAPPING
+except ModuleNotFoundError:  # pragma: no cover
+    from changelog_config import LABEL_MAPPING  # type: ignore[no-redef]
+
+# A local pre-pass proposes starting groups for the grouped prompt, so the model
+# refines a grouping instead of building one from scratch. It only looks at
+# labels, source repo and title keywords, and is deterministic for a given input.
+PREGROUP_MAX_GROUPS = 3
+PREGROUP_MIN_SPLIT_PRS = 4
+PREGROUP_HINT_KEYWORDS = 3
+
+# When a PR maps to several dashboard labels, the first one here wins.
+_LABEL_PRIORITY = ("deprecation", "feature", "bugfix", "improvement")
+_DEFAULT_LABEL = "improvement"
+_TITLE_WORD_PATTERN = re.compile(r"[a-z][a-z0-9_+-]{2,}")
+TITLE_STOPWORDS = frozenset(
+    {
+        "add", "added", "adds", "allow", "and", "backport", "bump", "can", "fix", "fixed", "fixes", "for",
+        "from", "improve", "improved", "in", "into", "make", "new", "not", "now", "of", "on", "remove",
+        "support", "the", "to", "update", "updated", "use", "when", "with", "zenml",
+    }
+)
+
+
+class PRGroupHint(BaseModel):
+    label: str
+    repos: List[str]
+    keywords: List[str]
+    pr_numbers: List[int]
+
+
+def title_keywords(title: str) -> List[str]:
+    """Return distinct, lower-cased title words that can tell PR themes apart."""
+    words = _TITLE_WORD_PATTERN.findall(re.sub(r"\[[^\]]*\]", " ", title.lower()))
+    return list(dict.fromkeys(word for word in words if word not in TITLE_STOPWORDS))
+
+
+def primary_label(pr: Dict[str, Any]) -> str:
+    mapped = {LABEL_MAPPING.get(label.lower()) for label in pr.get("labels", [])}
+    return next((label for label in _LABEL_PRIORITY if label in mapped), _DEFAULT_LABEL)
+
+
+class _Bucket:
+    def __init__(self, members: List[Tuple[int, Dict[str, Any]]]) -> None:
+        self.members = members
+        self.labels: Counter[str] = Counter(primary_label(pr) for _, pr in members)
+        self.repos: Counter[str] = Counter(pr.get("repo") or "" for _, pr in members)
+        self.keywords: Counter[str] = Counter(
+            keyword for _, pr in members for keyword in title_keywords(str(pr.get("title", "")))
+        )
+
+    @property
+    def position(self) -> int:
+        return min(position for position, _ in self.members)
+
+    def absorb(self, other: "_Bucket") -> None:
+        self.members.extend(other.members)
+        self.labels.update(other.labels)
+        self.repos.update(other.repos)
+        self.keywords.update(other.keywords)
+
+    def hint(self) -> PRGroupHint:
+        keywords = sorted(self.keywords.items(), key=lambda item: (-item[1], item[0]))
+        return PRGroupHint(
+            label=min(self.labels, key=lambda label: (-self.labels[label], _LABEL_PRIORITY.index(label))),
+            repos=sorted(repo for repo in self.repos if repo),
+            keywords=[keyword for keyword, _ in keywords[:PREGROUP_HINT_KEYWORDS]],
+            pr_numbers=[pr["number"] for _, pr in sorted(self.members, key=lambda member: member[0])],
+        )
+
+
+def _bucket_similarity(left: _Bucket, right: _Bucket) -> float:
+    keywords_union = set(left.keywords) | set(right.keywords)
+    keyword_overlap = len(set(left.keywords) & set(right.keywords)) / len(keywords_union) if keywords_union else 0.0
+    same_label = 0.5 if left.labels.most_common(1)[0][0] == right.labels.most_common(1)[0][0] else 0.0
+    same_repo = 0.25 if set(left.repos) & set(right.repos) else 0.0
+    return keyword_overlap + same_label + same_repo
+
+
+def _merge_closest(buckets: List[_Bucket]) -> None:
+    def merge_key(pair: Tuple[int, int]) -> Tuple[float, int, int, int]:
+        left, right = buckets[pair[0]], buckets[pair[1]]
+        return (-_bucket_similarity(left, right), len(left.members) + len(right.members), pair[0], pair[1])
+
+    pairs = [(left, right) for left in range(len(buckets)) for right in range(left + 1, len(buckets))]
+    left, right = min(pairs, key=merge_key)
+    buckets[left].absorb(buckets.pop(right))
+
+
+def _split_by_keyword(bucket: _Bucket) -> List[_Bucket]:
+    size = len(bucket.members)
+    candidates = [
+        keyword
+        for keyword, count in sorted(bucket.keywords.items(), key=lambda item: (-item[1], item[0]))
+        if size / 4 <= count <= size * 3 / 4
+    ]
+    if not candidates:
+        return [bucket]
+    matched = [
+        member for member in bucket.members if candidates[0] in title_keywords(str(member[1].get("title", "")))
+    ]
+    matched_positions = {position for position, _ in matched}
+    rest = [member for member in bucket.members if member[0] not in matched_positions]
+    return sorted((_Bucket(matched), _Bucket(rest)), key=lambda half: half.position)
+
+
+def propose_pr_group_hints(
+    prs: List[Dict[str, Any]],
+    *,
+    max_groups: int = PREGROUP_MAX_GROUPS,
+) -> List[PRGroupHint]:
+    """Propose up to `max_groups` starting groups for the grouped prompt.
+
+    PRs are bucketed by primary dashboard label and source repo, then the
+    closest buckets (shared title keywords, label, repo) are merged until at
+    most `max_groups` remain (fewer for small releases, about one group per
+    two PRs). A release that lands in one bucket is split on its most
+    discriminating title keyword.
+    """
+    if len(prs) < 2:
+        return []
+    max_groups = min(max_groups, max(1, len(prs) // 2))
+    by_key: Dict[Tuple[str, str], List[Tuple[int, Dict[str, Any]]]] = {}
+    for position, pr in enumerate(prs):
+        by_key.setdefault((primary_label(pr), pr.get("repo") or ""), []).append((position, pr))
+    buckets = [_Bucket(members) for members in by_key.values()]
+    while len(buckets) > max_groups:
+        _merge_closest(buckets)
+    if len(buckets) == 1 and len(prs) >= PREGROUP_MIN_SPLIT_PRS and max_groups > 1:
+        buckets = _split_by_keyword(buckets[0])
+    return [bucket.hint() for bucket in sorted(buckets, key=lambda bucket: bucket.position)]
+
+
+def format_pr_group_hints(hints: List[PRGroupHint]) -> str:
+    lines = []
+    for index, hint in enumerate(hints, start=1):
+        details = ", ".join([hint.label, *hint.repos, *hint.keywords])
+        numbers = ", ".join(f"#{number}" for number in hint.pr_numbers)
+        lines.append(f"- Suggested group {index} ({details}): {numbers}")
+    return "\n".join(lines)
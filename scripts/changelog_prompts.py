@@ -1,12 +1,28 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 try:
     from scripts.changelog_config import REPO_CONFIG
+    from scripts.changelog_pr_bodies import (
+        normalized_pr_body,
+        prompt_pr_body,
+        with_resolved_pr_digest,
+        without_pr_digest,
+    )
+    from scripts.changelog_pr_similarity import COLLAPSED_PRS_KEY
+    from scripts.changelog_pregrouping import format_pr_group_hints, propose_pr_group_hints
 except ModuleNotFoundError:  # pragma: no cover
     from changelog_config import REPO_CONFIG  # type: ignore[no-redef]
+    from changelog_pr_bodies import (  # type: ignore[no-redef]
+        normalized_pr_body,
+        prompt_pr_body,
+        with_resolved_pr_digest,
+        without_pr_digest,
+    )
+    from changelog_pr_similarity import COLLAPSED_PRS_KEY  # type: ignore[no-redef]
+    from changelog_pregrouping import format_pr_group_hints, propose_pr_group_hints  # type: ignore[no-redef]
 
 
 def _audience_for_repo_type(repo_type: str) -> str:
@@ -17,26 +33,140 @@ def _audience_for_source_repo(source_repo: str) -> str:
     return _audience_for_repo_type(REPO_CONFIG[source_repo]["type"])
 
 
+# Prompts are laid out as stable instructions first, then the release's PR data,
+# then per-attempt retry feedback, joined by this marker. Provider clients split
+# on it to place cache breakpoints and never send the marker itself.
+PROMPT_CACHE_BOUNDARY = "\n\n[[prompt-cache-boundary]]\n\n"
+
+
+def join_prompt_segments(*segments: str) -> str:
+    return PROMPT_CACHE_BOUNDARY.join(segment for segment in segments if segment)
+
+
+def prompt_cache_segments(prompt: str) -> List[str]:
+    """Split a prompt into its cacheable prefix segments and final suffix."""
+    return prompt.split(PROMPT_CACHE_BOUNDARY)
+
+
+def render_prompt(prompt: str) -> str:
+    """Return the prompt text as the model should see it, without cache markers."""
+    return "\n\n".join(prompt_cache_segments(prompt))
+
+
+# Per-call input-token budgets for the PR list prompts. Body slices are packed
+# into what remains after the fixed instructions and per-PR headers.
+CHARS_PER_TOKEN = 4
+GROUPED_PROMPT_INPUT_TOKENS = 6000
+GROUPED_REPAIR_PROMPT_INPUT_TOKENS = 3000
+BREAKING_PROMPT_INPUT_TOKENS = 4000
+RELEASE_NOTES_BODY_PROMPT_INPUT_TOKENS = 7000
+PACKED_BODY_MAX_CHARS = 2000
+
+
+def pack_pr_body_chars(
+    prs: List[Dict[str, Any]],
+    budget_chars: int,
+    *,
+    max_chars_per_pr: int = PACKED_BODY_MAX_CHARS,
+) -> List[int]:
+    """Split a body-character budget across PRs, aligned with the input order.
+
+    Every PR is offered an equal share; bodies shorter than their share keep
+    only what they need and the unused space is redistributed to longer ones.
+    """
+    demands = [min(len(prompt_pr_body(pr)), max_chars_per_pr) for pr in prs]
+    limits = [0] * len(prs)
+    remaining = max(0, budget_chars)
+    pending = sorted(range(len(prs)), key=lambda index: demands[index])
+    for position, index in enumerate(pending):
+        share = remaining // (len(pending) - position)
+        if demands[index] > share:
+            for unfilled in pending[position:]:
+                limits[unfilled] = share
+            break
+        limits[index] = demands[index]
+        remaining -= demands[index]
+    return limits
+
+
+def _packed_pr_summaries(
+    prs: List[Dict[str, Any]],
+    summarize: Callable[[Dict[str, Any], int], str],
+    *,
+    input_token_budget: int,
+    reserved_chars: int,
+) -> str:
+    """Render PR summaries whose body slices fit the call's input-token budget.
+
+    Attached digests are only used when the normalized bodies do not all fit;
+    pending digests are only made then.
+    """
+    header_chars = sum(len(summarize(pr, 0)) + 1 for pr in prs)
+    budget_chars = input_token_budget * CHARS_PER_TOKEN - reserved_chars - header_chars
+    if sum(min(len(normalized_pr_body(pr)), PACKED_BODY_MAX_CHARS) for pr in prs) <= budget_chars:
+        prs = [without_pr_digest(pr) for pr in prs]
+    else:
+        prs = [with_resolved_pr_digest(pr) for pr in prs]
+    body_limits = pack_pr_body_chars(prs, budget_chars)
+    return "\n".join(summarize(pr, limit) for pr, limit in zip(prs, body_limits))
+
+
 def _single_line_body(pr: Dict[str, Any], max_chars: int) -> str:
-    return (pr.get("body") or "")[:max_chars].replace(chr(10), " ")
+    return prompt_pr_body(pr)[:max_chars]
 
 
 def _labels_summary(pr: Dict[str, Any]) -> str:
     return ", ".join(pr.get("labels", [])) or "none"
 
 
-def _detailed_pr_summary(pr: Dict[str, Any], *, body_chars: int) -> str:
+def _collapsed_prs_summary(pr: Dict[str, Any], include_pr_links: Optional[bool] = None) -> str:
+    """Describe the near-duplicates a representative PR stands in for.
+
+    Grouping prompts (`include_pr_links` None) assign the members through the
+    representative's number. Prose prompts cover them in the representative's
+    bullet, linking each one when the output carries PR links.
+    """
+    members = pr.get(COLLAPSED_PRS_KEY) or []
+    if not members:
+        return ""
+    if include_pr_links is None:
+        covered = "; ".join(
+            f"#{member['number']} {member['title']} ({member.get('repo') or 'same repo'})" for member in members
+        )
+        return (
+            f"\n  Also covers near-duplicate PRs (group them via #{pr['number']}, do not list their numbers): "
+            f"{covered}"
+        )
+    if include_pr_links:
+        covered = "; ".join(f"#{member['number']} {member['title']} ({member['url']})" for member in members)
+        return (
+            f"\n  Also covers near-duplicate PRs (describe them in the same bullet as #{pr['number']} "
+            f"and link each one there): {covered}"
+        )
+    covered = "; ".join(str(member["title"]) for member in members)
+    return f"\n  Also covers near-duplicate PRs (describe them together with this change): {covered}"
+
+
+def _detailed_pr_summary(pr: Dict[str, Any], *, body_chars: int, include_pr_links: Optional[bool] = None) -> str:
     return (
         f"- #{pr['number']}: {pr['title']}\n"
         f"  Labels: {_labels_summary(pr)}\n"
         f"  URL: {pr['url']}\n"
         f"  Body (truncated): {_single_line_body(pr, body_chars)}"
+        f"{_collapsed_prs_summary(pr, include_pr_links)}"
     )
 
 
-def _inline_pr_summary(pr: Dict[str, Any], *, body_chars: int, include_number_prefix: bool) -> str:
+def _inline_pr_summary(
+    pr: Dict[str, Any],
+    *,
+    body_chars: int,
+    include_number_prefix: bool,
+    include_pr_links: Optional[bool] = None,
+) -> str:
     prefix = f"{pr['title']} (#{pr['number']})" if include_number_prefix else pr["title"]
-    return f"- {prefix}: {pr['url']} — {_single_line_body(pr, body_chars)}"
+    summary = f"- {prefix}: {pr['url']} — {_single_line_body(pr, body_chars)}"
+    return summary if include_pr_links is None else summary + _collapsed_prs_summary(pr, include_pr_links)
 
 
 def build_changelog_copy_prompt(pr_title: str, pr_body: str, pr_url: str, repo_type: str) -> str:
@@ -58,21 +188,30 @@ def build_grouped_changelog_entries_prompt(
     prs: List[Dict[str, Any]],
     source_repo: str,
     retry_feedback: Optional[str] = None,
+    *,
+    input_token_budget: int = GROUPED_PROMPT_INPUT_TOKENS,
+    pregroup_hints: bool = True,
 ) -> str:
     audience = _audience_for_source_repo(source_repo)
-    pr_summaries = "\n".join(_detailed_pr_summary(pr, body_chars=400) for pr in prs)
-
-    prompt = (
+    hints = format_pr_group_hints(propose_pr_group_hints(prs)) if pregroup_hints else ""
+    hint_instructions = (
+        "- The PR list is followed by suggested starting groups built from labels, source repos and "
+        "title keywords only. Treat them as a draft: keep what fits, move PRs whose theme differs, "
+        "and merge or rename groups freely.\n"
+        if hints
+        else ""
+    )
+    instructions = (
         "You are helping write grouped changelog entries for ZenML, an MLOps platform.\n\n"
-        "Here is the list of merged PRs with the `release-notes` label for this release. "
-        "Each PR includes its number, title, labels, URL, and a truncated body:\n\n"
-        f"{pr_summaries}\n\n"
+        "You will get the list of merged PRs with the `release-notes` label for a release. "
+        "Each PR includes its number, title, labels, URL, and a truncated body.\n\n"
         f"The audience is {audience}. Focus on what users can now do or benefit from.\n\n"
         "Your task:\n"
         "- Group these PRs into 2-3 thematic user-facing changelog entries when possible. "
         "For very small releases, 1 entry is acceptable.\n"
         "- Each entry should summarize a coherent theme or area of improvement.\n"
         "- Every PR must appear in exactly one group.\n"
+        f"{hint_instructions}"
         "- Do not include PR numbers in the titles or descriptions.\n"
         "- Use markdown-friendly prose in the descriptions (1-3 sentences).\n\n"
         "Output format rules:\n"
@@ -81,28 +220,137 @@ def build_grouped_changelog_entries_prompt(
         "- Each title MUST be at most 60 characters. Keep titles concise and punchy.\n"
         "- Titles should be short, generic, benefit-oriented dashboard-card titles.\n"
         "- Avoid over-specific titles that name one narrow implementation detail when the group covers a broader user benefit.\n"
-        "- `pr_numbers` must be a list of the PR numbers from the list above that this entry covers.\n"
+        "- `pr_numbers` must be a list of the PR numbers from the PR list that this entry covers.\n"
         "- Use `suggested_labels` based on the overall theme of the grouped PRs, using only: "
         "feature, improvement, bugfix, deprecation. Return [] if no label applies.\n"
         "Avoid low-level implementation details and emphasize user-facing value."
     )
+    heading = "Merged PRs with the `release-notes` label for this release:\n\n"
+    feedback = (
+        "Previous grouped output failed validation.\n\n"
+        f"{retry_feedback}\n\n"
+        "Generate the grouped changelog entries again. Every PR number from the input list "
+        "must appear exactly once. Do not invent, duplicate, or omit PR numbers."
+        if retry_feedback
+        else ""
+    )
+    hint_section = f"\n\nSuggested starting groups:\n\n{hints}" if hints else ""
+    pr_summaries = _packed_pr_summaries(
+        prs,
+        lambda pr, body_chars: _detailed_pr_summary(pr, body_chars=body_chars),
+        input_token_budget=input_token_budget,
+        reserved_chars=len(join_prompt_segments(instructions, heading + hint_section, feedback)),
+    )
+    return join_prompt_segments(instructions, heading + pr_summaries + hint_section, feedback)
 
-    if retry_feedback:
-        prompt += (
-            "\n\nPrevious grouped output failed validation.\n\n"
-            f"{retry_feedback}\n\n"
-            "Generate the grouped changelog entries again. Every PR number from the input list "
-            "must appear exactly once. Do not invent, duplicate, or omit PR numbers."
-        )
-    return prompt
+def _grouped_entry_summary(index: int, entry: Any) -> str:
+    labels = ", ".join(label.value for label in entry.suggested_labels) or "none"
+    numbers = ", ".join(str(number) for number in entry.pr_numbers)
+    return (
+        f"- Entry {index}: {entry.title}\n"
+        f"  Description: {entry.description}\n"
+        f"  Suggested labels: {labels}\n"
+        f"  PR numbers: [{numbers}]"
+    )
+
+
+def build_grouped_changelog_repair_prompt(
+    valid_entries: List[Any],
+    unassigned_prs: List[Dict[str, Any]],
+    source_repo: str,
+    *,
+    input_token_budget: int = GROUPED_REPAIR_PROMPT_INPUT_TOKENS,
+) -> str:
+    audience = _audience_for_source_repo(source_repo)
+    grouping_summary = "\n".join(
+        _grouped_entry_summary(index, entry) for index, entry in enumerate(valid_entries, start=1)
+    )
+    instructions = (
+        "You are repairing grouped changelog entries for ZenML, an MLOps platform.\n\n"
+        "A previous grouping was valid except that some PRs were not assigned to any entry. "
+        "You will get the valid part of that grouping and the unassigned merged PRs with the "
+        "`release-notes` label.\n\n"
+        f"The audience is {audience}. Focus on what users can now do or benefit from.\n\n"
+        "Your task:\n"
+        "- Return the complete grouping with every unassigned PR added to exactly one entry.\n"
+        "- Keep every existing entry and its existing `pr_numbers`; do not move, drop, or duplicate them.\n"
+        "- Add an unassigned PR to the existing entry whose theme fits best. Only add a new entry when no "
+        "existing entry fits and the total stays at 3 entries or fewer.\n"
+        "- You may lightly revise a title or description so it also covers newly added PRs. Titles MUST be "
+        "at most 60 characters and must not include PR numbers.\n"
+        "- Use `suggested_labels` from: feature, improvement, bugfix, deprecation. Return [] if no label applies.\n"
+        "- Do not invent PR numbers."
+    )
+    heading = (
+        "Valid part of the previous grouping:\n\n"
+        f"{grouping_summary}\n\n"
+        "Unassigned merged PRs with the `release-notes` label:\n\n"
+    )
+    pr_summaries = _packed_pr_summaries(
+        unassigned_prs,
+        lambda pr, body_chars: _detailed_pr_summary(pr, body_chars=body_chars),
+        input_token_budget=input_token_budget,
+        reserved_chars=len(join_prompt_segments(instructions, heading)),
+    )
+    return join_prompt_segments(instructions, heading + pr_summaries)
+
+def _pr_index_line(pr: Dict[str, Any], include_pr_links: Optional[bool] = None) -> str:
+    return f"- #{pr['number']}: {pr['title']} ({pr['url']}){_collapsed_prs_summary(pr, include_pr_links)}"
+
+
+def build_grouped_changelog_merge_prompt(
+    partial_entries: List[Any],
+    prs: List[Dict[str, Any]],
+    source_repo: str,
+    retry_feedback: Optional[str] = None,
+) -> str:
+    audience = _audience_for_source_repo(source_repo)
+    partial_summary = "\n".join(
+        _grouped_entry_summary(index, entry) for index, entry in enumerate(partial_entries, start=1)
+    )
+    pr_index = "\n".join(_pr_index_line(pr) for pr in prs)
+    instructions = (
+        "You are helping write grouped changelog entries for ZenML, an MLOps platform.\n\n"
+        "This release is large, so its merged PRs were first grouped in batches. "
+        "You will get the partial groups from every batch and the full list of PRs in the release.\n\n"
+        f"The audience is {audience}. Focus on what users can now do or benefit from.\n\n"
+        "Your task:\n"
+        "- Merge the partial groups into 2-3 thematic user-facing changelog entries.\n"
+        "- Move whole partial groups into the final entries; every PR number from the full list must "
+        "appear in exactly one final entry.\n"
+        "- Do not include PR numbers in the titles or descriptions.\n"
+        "- Use markdown-friendly prose in the descriptions (1-3 sentences).\n\n"
+        "Output format rules:\n"
+        "- Produce between 1 and 3 entries in total.\n"
+        "- For each entry, set `title`, `description`, `suggested_labels`, and `pr_numbers`.\n"
+        "- Each title MUST be at most 60 characters. Keep titles concise and punchy.\n"
+        "- Use `suggested_labels` from: feature, improvement, bugfix, deprecation. Return [] if no label applies.\n"
+        "Avoid low-level implementation details and emphasize user-facing value."
+    )
+    release_data = (
+        "Here are the partial groups from every batch:\n\n"
+        f"{partial_summary}\n\n"
+        "Here is the full list of PRs in this release:\n\n"
+        f"{pr_index}"
+    )
+    feedback = (
+        "Previous grouped output failed validation.\n\n"
+        f"{retry_feedback}\n\n"
+        "Generate the grouped changelog entries again. Every PR number from the full list "
+        "must appear exactly once. Do not invent, duplicate, or omit PR numbers."
+        if retry_feedback
+        else ""
+    )
+    return join_prompt_segments(instructions, release_data, feedback)
 
 def build_breaking_changes_prompt(
     breaking_prs: List[Dict[str, Any]],
     source_repo: str,
     include_pr_links: bool,
+    *,
+    input_token_budget: int = BREAKING_PROMPT_INPUT_TOKENS,
 ) -> str:
     audience = _audience_for_source_repo(source_repo)
-    pr_summaries = "\n".join(_detailed_pr_summary(pr, body_chars=700) for pr in breaking_prs)
     link_instruction = (
         "Include a markdown link to the PR in each bullet using the exact format "
         "[PR #<number>](<url>). If you combine closely related breaking PRs into one bullet, "
@@ -110,12 +358,10 @@ def build_breaking_changes_prompt(
         if include_pr_links
         else "Do not include PR links, raw URLs, or PR numbers in the bullets; keep the prose concise."
     )
-    return (
+    instructions = (
         "You are writing the \"Breaking Changes\" section for ZenML release notes.\n\n"
         f"Repository: {source_repo}\n"
         f"Audience: {audience}\n\n"
-        "Here are PRs labeled as breaking changes for this release:\n\n"
-        f"{pr_summaries}\n\n"
         "Task:\n"
         "- Write user-facing bullet point text summarizing what is breaking and how users should adapt.\n"
         "- Produce one bullet per breaking PR, unless a small grouping is clearly warranted.\n"
@@ -124,29 +370,34 @@ def build_breaking_changes_prompt(
         "The caller will format bullets.\n"
         "- Always set `bullets`; if there is nothing meaningful to summarize, return an empty list.\n"
         "- Avoid implementation details; focus on behavioral changes, removals, renamed APIs, "
-        "compatibility requirements, or required migration steps.\n"
+        "compatibility requirements, or required migration steps."
+    )
+    heading = "Here are PRs labeled as breaking changes for this release:\n\n"
+    pr_summaries = _packed_pr_summaries(
+        breaking_prs,
+        lambda pr, body_chars: _detailed_pr_summary(pr, body_chars=body_chars, include_pr_links=include_pr_links),
+        input_token_budget=input_token_budget,
+        reserved_chars=len(join_prompt_segments(instructions, heading)),
     )
+    return join_prompt_segments(instructions, heading + pr_summaries)
 
 def build_release_notes_body_prompt(
     prs: List[Dict[str, Any]],
     source_repo: str,
     include_pr_links: bool,
+    *,
+    input_token_budget: int = RELEASE_NOTES_BODY_PROMPT_INPUT_TOKENS,
 ) -> str:
     audience = _audience_for_source_repo(source_repo)
-    pr_summaries = "\n".join(
-        _inline_pr_summary(pr, body_chars=500, include_number_prefix=True) for pr in prs
-    )
     include_links_instruction = (
         "Include a markdown link to every input PR using the exact format [PR #<number>](<url>)."
         if include_pr_links
         else "Do not include PR links, raw URLs, or PR numbers; keep the prose concise."
     )
-    return (
+    instructions = (
         "You are writing the release notes body for ZenML.\n\n"
         f"Repository: {source_repo}\n"
         f"Audience: {audience}\n\n"
-        "Merged PRs to cover (release-notes label):\n"
-        f"{pr_summaries}\n\n"
         "Output rules (CRITICAL):\n"
         "- Output markdown for the body only.\n"
         "- Do NOT include the `## <release_tag>` header (the caller will render the release header).\n"
@@ -174,8 +425,62 @@ def build_release_notes_body_prompt(
         "Writing guidance:\n"
         "- Highlight the most user-facing improvements first.\n"
         "- Avoid low-level implementation details; focus on what users can now do.\n"
-        "- Keep sections clear, readable, and scannable.\n"
+        "- Keep sections clear, readable, and scannable."
+    )
+    heading = "Merged PRs to cover (release-notes label):\n"
+    pr_summaries = _packed_pr_summaries(
+        prs,
+        lambda pr, body_chars: _inline_pr_summary(
+            pr,
+            body_chars=body_chars,
+            include_number_prefix=True,
+            include_pr_links=include_pr_links,
+        ),
+        input_token_budget=input_token_budget,
+        reserved_chars=len(join_prompt_segments(instructions, heading)),
+    )
+    return join_prompt_segments(instructions, heading + pr_summaries)
+
+def build_release_notes_body_merge_prompt(
+    drafts: List[str],
+    prs: List[Dict[str, Any]],
+    source_repo: str,
+    include_pr_links: bool,
+) -> str:
+    audience = _audience_for_source_repo(source_repo)
+    draft_sections = "\n\n".join(
+        f"Draft {index}:\n{draft.strip()}" for index, draft in enumerate(drafts, start=1)
+    )
+    pr_index = "\n".join(_pr_index_line(pr, include_pr_links) for pr in prs)
+    include_links_instruction = (
+        "Keep a markdown link to every covered PR using the exact format [PR #<number>](<url>)."
+        if include_pr_links
+        else "Do not include PR links, raw URLs, or PR numbers; keep the prose concise."
+    )
+    instructions = (
+        "You are writing the release notes body for ZenML.\n\n"
+        f"Repository: {source_repo}\n"
+        f"Audience: {audience}\n\n"
+        "This release is large, so draft bodies were written for batches of PRs. "
+        "You will get the drafts and the PRs they cover; merge the drafts into one release notes body.\n\n"
+        "Output rules (CRITICAL):\n"
+        "- Output markdown for the body only.\n"
+        "- Do NOT include the `## <release_tag>` header, the `<img>` tag, a \"Breaking Changes\" heading, "
+        "the footer, any release link section, or `***`.\n\n"
+        "Merging requirements:\n"
+        "- Keep every distinct user-facing change from the drafts; do not drop a PR.\n"
+        "- Merge `#### Subsection` headers that share a theme across drafts and order the most user-facing "
+        "improvements first.\n"
+        "- Collect all bug-fix bullets into a single `<details><summary>Fixed</summary>...</details>` block.\n"
+        f"- {include_links_instruction}"
+    )
+    release_data = (
+        "Merge these drafts into one release notes body:\n\n"
+        f"{draft_sections}\n\n"
+        "PRs covered by the drafts:\n"
+        f"{pr_index}"
     )
+    return join_prompt_segments(instructions, release_data)
 
 def build_markdown_section_prompt(
     prs: List[Dict[str, Any]],
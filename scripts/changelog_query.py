@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Indexed, read-only queries over changelog.json for internal tools.
+
+`load_changelog_query` parses the changelog once, fills in schema defaults,
+and builds indexes by id, slug, audience, label, published flag and
+highlight, plus every entry's rank in `published_at` order (newest first).
+Posting lists hold ranks, so range, top-N and combined filters walk only the
+smallest matching list inside a bisected time range, and stop at the limit.
+
+The derived part of the index (ranks, timestamps, posting lists) is cached
+in a per-user cache directory (`CHANGELOG_QUERY_CACHE_DIR`, else
+`$XDG_CACHE_HOME/zenml-changelog`, else `~/.cache/zenml-changelog`), never
+in the repository. It is built lazily on first load and reused while the
+changelog's hash and the schema's hash match.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Collection, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+from pydantic import BaseModel, Field, ValidationError
+
+try:
+    from scripts.build_changelog_artifacts import published_at_key, schema_defaults
+    from scripts.changelog_env import env_value
+    from scripts.changelog_schema_validation import validate_changelog_data
+except ModuleNotFoundError:  # pragma: no cover - direct script execution
+    from build_changelog_artifacts import published_at_key, schema_defaults  # type: ignore[no-redef]
+    from changelog_env import env_value  # type: ignore[no-redef]
+    from changelog_schema_validation import validate_changelog_data  # type: ignore[no-redef]
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CHANGELOG_PATH = REPO_ROOT / "changelog.json"
+DEFAULT_SCHEMA_PATH = REPO_ROOT / "changelog_schema" / "announcement-schema.json"
+QUERY_INDEX_VERSION = 1
+QUERY_CACHE_DIR_ENV = "CHANGELOG_QUERY_CACHE_DIR"
+
+Timestamp = Union[str, datetime]
+
+
+class ChangelogQueryIndex(BaseModel):
+    """The cached, derived part of the index. Every list of ints below holds ranks, ascending."""
+
+    version: int = QUERY_INDEX_VERSION
+    content_sha256: str
+    schema_sha256: str
+    # `recency[rank]` is the file position of the entry with that rank; newest
+    # `published_at` first, ties broken by higher id.
+    recency: List[int] = Field(default_factory=list)
+    # `published_at` as epoch seconds, per rank (so non-increasing).
+    timestamps: List[float] = Field(default_factory=list)
+    audiences: Dict[str, List[int]] = Field(default_factory=dict)
+    labels: Dict[str, List[int]] = Field(default_factory=dict)
+    published: List[int] = Field(default_factory=list)
+    unpublished: List[int] = Field(default_factory=list)
+    # Ranks with `should_highlight`, and the `highlight_until` epoch seconds
+    # (None when unbounded).
+    highlighted: List[int] = Field(default_factory=list)
+    highlight_until: List[Optional[float]] = Field(default_factory=list)
+
+
+def _epoch_seconds(value: Timestamp) -> float:
+    moment = value if isinstance(value, datetime) else published_at_key(value)
+    return moment.timestamp()
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def with_schema_defaults(entries: List[Dict[str, Any]], defaults: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{**defaults, **entry} for entry in entries]
+
+
+def build_query_index(entries: List[Dict[str, Any]], *, content_sha256: str, schema_sha256: str) -> ChangelogQueryIndex:
+    """Index `entries`, which must already carry their schema defaults."""
+    timestamps = [_epoch_seconds(str(entry["published_at"])) for entry in entries]
+    recency = sorted(range(len(entries)), key=lambda position: (-timestamps[position], -entries[position]["id"]))
+    audiences: Dict[str, List[int]] = defaultdict(list)
+    labels: Dict[str, List[int]] = defaultdict(list)
+    index = ChangelogQueryIndex(
+        content_sha256=content_sha256,
+        schema_sha256=schema_sha256,
+        recency=recency,
+        timestamps=[timestamps[position] for position in recency],
+    )
+    for rank, position in enumerate(recency):
+        entry = entries[position]
+        audiences[str(entry["audience"])].append(rank)
+        for label in entry["labels"]:
+            labels[str(label)].append(rank)
+        (index.published if entry["published"] else index.unpublished).append(rank)
+        if entry["should_highlight"]:
+            index.highlighted.append(rank)
+            until = entry.get("highlight_until")
+            index.highlight_until.append(_epoch_seconds(str(until)) if until else None)
+    index.audiences = dict(audiences)
+    index.labels = dict(labels)
+    return index
+
+
+def query_cache_dir() -> Path:
+    configured = env_value(QUERY_CACHE_DIR_ENV)
+    if configured:
+        return Path(configured)
+    return Path(env_value("XDG_CACHE_HOME") or Path.home() / ".cache") / "zenml-changelog"
+
+
+def query_index_path(changelog_path: Path) -> Path:
+    """The cached index for `changelog_path`, keyed by its absolute path so checkouts do not share a file."""
+    location = _sha256(str(changelog_path.resolve()).encode("utf-8"))[:16]
+    return query_cache_dir() / f"{changelog_path.stem}-{location}.index.json"
+
+
+def _read_query_index(path: Path) -> Optional[ChangelogQueryIndex]:
+    if not path.exists():
+        return None
+    try:
+        return ChangelogQueryIndex.model_validate_json(path.read_text())
+    except (ValidationError, ValueError) as error:
+        print(f"Warning: ignoring unreadable changelog query index {path}: {error}")
+        return None
+
+
+def _write_query_index(index: ChangelogQueryIndex, path: Path) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(index.model_dump(mode="json"), separators=(",", ":")) + "\n")
+    except OSError as error:
+        print(f"Warning: could not write changelog query index {path}: {error}")
+
+
+class ChangelogQuery:
+    """Read-only query interface over loaded entries and their index. Results are newest first."""
+
+    def __init__(self, entries: List[Dict[str, Any]], index: ChangelogQueryIndex) -> None:
+        self.entries = entries
+        self.index = index
+        self._by_id = {entry["id"]: position for position, entry in enumerate(entries)}
+        self._by_slug = {entry["slug"]: position for position, entry in enumerate(entries)}
+        self._negated_timestamps = [-timestamp for timestamp in index.timestamps]
+        self._audience_lists: Dict[frozenset, List[int]] = {}
+        # Membership sets for posting lists, keyed like the filter that selected them.
+        self._sets: Dict[Hashable, frozenset] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, entry_id: int) -> Optional[Dict[str, Any]]:
+        position = self._by_id.get(entry_id)
+        return None if position is None else self.entries[position]
+
+    def by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
+        position = self._by_slug.get(slug)
+        return None if position is None else self.entries[position]
+
+    def _rank_range(self, since: Optional[Timestamp], until: Optional[Timestamp]) -> Tuple[int, int]:
+        """Ranks published in [since, until)."""
+        low = 0 if until is None else bisect_right(self._negated_timestamps, -_epoch_seconds(until))
+        high = len(self.entries) if since is None else bisect_right(self._negated_timestamps, -_epoch_seconds(since))
+        return low, high
+
+    def _audience_list(self, audiences: frozenset) -> List[int]:
+        if audiences not in self._audience_lists:
+            self._audience_lists[audiences] = sorted(
+                rank for name in audiences for rank in self.index.audiences.get(name, [])
+            )
+        return self._audience_lists[audiences]
+
+    def _set(self, key: Hashable, ranks: List[int]) -> frozenset:
+        if key is None:
+            return frozenset(ranks)
+        if key not in self._sets:
+            self._sets[key] = frozenset(ranks)
+        return self._sets[key]
+
+    def _highlighted_at(self, moment: Timestamp) -> List[int]:
+        seconds = _epoch_seconds(moment)
+        return [
+            rank
+            for rank, until in zip(self.index.highlighted, self.index.highlight_until)
+            if until is None or seconds <= until
+        ]
+
+    def query(
+        self,
+        *,
+        audience: Union[str, Collection[str], None] = None,
+        label: Optional[str] = None,
+        published: Optional[bool] = None,
+        highlighted_at: Optional[Timestamp] = None,
+        since: Optional[Timestamp] = None,
+        until: Optional[Timestamp] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Entries matching every given filter, published in [since, until), newest first.
+
+        `audience` may be one value or several (e.g. `("oss", "all")` for what
+        OSS users see). `highlighted_at` keeps entries with `should_highlight`
+        whose `highlight_until` is unset or not before that moment.
+        """
+        low, high = self._rank_range(since, until)
+        # (cache key, ranks); per-query lists have no key.
+        postings: List[Tuple[Hashable, List[int]]] = []
+        if audience is not None:
+            audiences = frozenset([audience] if isinstance(audience, str) else audience)
+            postings.append((("audience", audiences), self._audience_list(audiences)))
+        if label is not None:
+            postings.append((("label", label), self.index.labels.get(label, [])))
+        if published is not None:
+            postings.append((("published", published), self.index.published if published else self.index.unpublished))
+        if highlighted_at is not None:
+            postings.append((None, self._highlighted_at(highlighted_at)))
+
+        if not postings:
+            candidates: Sequence[int] = range(low, high)
+            others: List[frozenset] = []
+        else:
+            smallest = min(range(len(postings)), key=lambda position: len(postings[position][1]))
+            ranks = postings[smallest][1]
+            candidates = ranks[bisect_left(ranks, low) : bisect_left(ranks, high)]
+            others = [self._set(key, other) for position, (key, other) in enumerate(postings) if position != smallest]
+
+        results: List[Dict[str, Any]] = []
+        for rank in candidates:
+            if limit is not None and len(results) >= limit:
+                break
+            if all(rank in ranks for ranks in others):
+                results.append(self.entries[self.index.recency[rank]])
+        return results
+
+    def latest(self, count: int, **filters: Any) -> List[Dict[str, Any]]:
+        """The `count` newest entries matching `filters` (see `query`)."""
+        return self.query(limit=count, **filters)
+
+    def published_between(self, since: Optional[Timestamp], until: Optional[Timestamp]) -> List[Dict[str, Any]]:
+        return self.query(since=since, until=until)
+
+
+def load_changelog_query(
+    changelog_path: Path = DEFAULT_CHANGELOG_PATH,
+    schema_path: Path = DEFAULT_SCHEMA_PATH,
+    *,
+    index_path: Optional[Path] = None,
+    use_index_cache: bool = True,
+) -> ChangelogQuery:
+    """Load the changelog and its index, building and caching the index if it is missing or stale.
+
+    Entries are schema-validated when the index is (re)built; a matching
+    cached index means this exact text already passed validation.
+    """
+    source = changelog_path.read_bytes()
+    raw_entries = json.loads(source)
+    entries = with_schema_defaults(raw_entries, schema_defaults(schema_path))
+    content_sha256 = _sha256(source)
+    schema_sha256 = _sha256(schema_path.read_bytes())
+    index_path = index_path or query_index_path(changelog_path)
+
+    index = _read_query_index(index_path) if use_index_cache else None
+    if index is None or (index.version, index.content_sha256, index.schema_sha256) != (
+        QUERY_INDEX_VERSION,
+        content_sha256,
+        schema_sha256,
+    ):
+        validate_changelog_data(raw_entries, schema_path)
+        index = build_query_index(entries, content_sha256=content_sha256, schema_sha256=schema_sha256)
+        if use_index_cache:
+            _write_query_index(index, index_path)
+    return ChangelogQuery(entries, index)
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# dependencies = ["jsonschema"]
+# ///
+"""Compile the announcement schema into a plain Python validation function.
+
+The generated function reports the same errors as jsonschema's Draft 7
+validator (same messages, same `absolute_path`s, same order) for the
+keywords the changelog schema uses, without interpreting the schema for
+every value.
+
+    uv run scripts/changelog_schema_codegen.py source
+    uv run scripts/changelog_schema_codegen.py benchmark --entries 10000 --entries 100000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple, Union
+
+from jsonschema import Draft7Validator, FormatChecker
+
+# Keywords that never produce errors for an instance.
+ANNOTATION_KEYWORDS = frozenset({"$schema", "$id", "title", "description", "default", "examples", "$comment"})
+SUPPORTED_KEYWORDS = ANNOTATION_KEYWORDS | {
+    "type",
+    "properties",
+    "required",
+    "additionalProperties",
+    "items",
+    "enum",
+    "format",
+}
+
+_TYPE_CHECKS = {
+    "array": "isinstance({v}, list)",
+    "boolean": "isinstance({v}, bool)",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool) or isinstance({v}, float) and {v}.is_integer())",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "object": "isinstance({v}, dict)",
+    "string": "isinstance({v}, str)",
+}
+
+
+class SchemaCodegenError(RuntimeError):
+    """Raised for schemas that use keywords the generator does not compile."""
+
+
+class SchemaViolation(NamedTuple):
+    """One schema error, shaped like the parts of `jsonschema.ValidationError` the repo reports."""
+
+    absolute_path: Tuple[Union[str, int], ...]
+    validator: str
+    message: str
+
+
+SchemaValidatorFunction = Callable[[Any], List[SchemaViolation]]
+
+
+class _Emitter:
+    def __init__(self, format_checker: FormatChecker) -> None:
+        self.format_checker = format_checker
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {}
+        self.depth = 0
+
+    def constant(self, value: Any) -> str:
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def close_block(self, indent: int, start: int) -> None:
+        if len(self.lines) == start:
+            self.emit(indent, "pass")
+
+    def error(self, indent: int, path: List[str], keyword: str, message: str) -> None:
+        path_expr = f"({path[0]},)" if len(path) == 1 else f"({', '.join(path)})"
+        self.emit(indent, f"_errors.append(_violation({path_expr}, {keyword!r}, {message}))")
+
+    def schema(self, schema: Any, value: str, path: List[str], indent: int) -> None:
+        if schema is True or schema == {}:
+            return
+        if not isinstance(schema, dict):
+            raise SchemaCodegenError(f"Unsupported schema at {path}: {schema!r}")
+        unsupported = sorted(set(schema) - SUPPORTED_KEYWORDS)
+        if unsupported:
+            raise SchemaCodegenError(f"Unsupported schema keywords {unsupported} at {path}")
+        if "default" in schema and not Draft7Validator(schema, format_checker=self.format_checker).is_valid(
+            schema["default"]
+        ):
+            raise SchemaCodegenError(f"Default {schema['default']!r} at {path} does not match its own schema")
+        # jsonschema applies keywords in the schema's own order.
+        for keyword, argument in schema.items():
+            if keyword in ANNOTATION_KEYWORDS:
+                continue
+            getattr(self, f"keyword_{keyword}")(argument, schema, value, path, indent)
+
+    def keyword_type(self, types: Any, schema: Dict[str, Any], value: str, path: List[str], indent: int) -> None:
+        names = types if isinstance(types, list) else [types]
+        unknown = [name for name in names if name not in _TYPE_CHECKS]
+        if unknown:
+            raise SchemaCodegenError(f"Unsupported types {unknown} at {path}")
+        check = " or ".join(_TYPE_CHECKS[name].format(v=value) for name in names)
+        reprs = ", ".join(repr(name) for name in names)
+        self.emit(indent, f"if not ({check}):")
+        self.error(indent + 1, path, "type", f'f"{{{value}!r}} is not of type {{{self.constant(reprs)}}}"')
+
+    def keyword_enum(self, enums: Any, schema: Dict[str, Any], value: str, path: List[str], indent: int) -> None:
+        if not isinstance(enums, list) or not all(isinstance(each, str) for each in enums):
+            raise SchemaCodegenError(f"Only string enums are supported, at {path}")
+        allowed = self.constant(frozenset(enums))
+        self.emit(indent, f"if not (isinstance({value}, str) and {value} in {allowed}):")
+        self.error(indent + 1, path, "enum", f'f"{{{value}!r}} is not one of {{{self.constant(repr(enums))}}}"')
+
+    def keyword_format(
+        self, format_name: str, schema: Dict[str, Any], value: str, path: List[str], indent: int
+    ) -> None:
+        if format_name not in self.format_checker.checkers:
+            return  # jsonschema ignores formats its checker does not know.
+        function, raises = self.format_checker.checkers[format_name]
+        check = self.constant(function)
+        message = f'f"{{{value}!r}} is not a {{{self.constant(repr(format_name))}}}"'
+        if raises:
+            self.emit(indent, "try:")
+            self.emit(indent + 1, f"_conforms = {check}({value})")
+            self.emit(indent, f"except {self.constant(raises)}:")
+            self.emit(indent + 1, "_conforms = False")
+            self.emit(indent, "if not _conforms:")
+        else:
+            self.emit(indent, f"if not {check}({value}):")
+        self.error(indent + 1, path, "format", message)
+
+    def keyword_properties(
+        self, properties: Dict[str, Any], schema: Dict[str, Any], value: str, path: List[str], indent: int
+    ) -> None:
+        self.emit(indent, f"if isinstance({value}, dict):")
+        self.depth += 1
+        child = f"_v{self.depth}"
+        start = len(self.lines)
+        for name, subschema in properties.items():
+            self.emit(indent + 1, f"if {name!r} in {value}:")
+            self.emit(indent + 2, f"{child} = {value}[{name!r}]")
+            before = len(self.lines)
+            self.schema(subschema, child, [*path, repr(name)], indent + 2)
+            if len(self.lines) == before:
+                del self.lines[-2:]
+        self.close_block(indent + 1, start)
+
+    def keyword_required(
+        self, required: List[str], schema: Dict[str, Any], value: str, path: List[str], indent: int
+    ) -> None:
+        if not required:
+            return
+        self.emit(indent, f"if isinstance({value}, dict):")
+        for name in required:
+            self.emit(indent + 1, f"if {name!r} not in {value}:")
+            self.error(indent + 2, path, "required", repr(f"{name!r} is a required property"))
+
+    def keyword_additionalProperties(
+        self, allowed: Any, schema: Dict[str, Any], value: str, path: List[str], indent: int
+    ) -> None:
+        if allowed is True:
+            return
+        if allowed is not False:
+            raise SchemaCodegenError(f"Only boolean additionalProperties is supported, at {path}")
+        known = self.constant(frozenset(schema.get("properties", {})))
+        self.emit(indent, f"if isinstance({value}, dict) and not {value}.keys() <= {known}:")
+        self.emit(indent + 1, f"_extras = sorted({{key for key in {value} if key not in {known}}}, key=str)")
+        message = (
+            '"Additional properties are not allowed (%s %s unexpected)" % '
+            '(", ".join(repr(extra) for extra in _extras), "was" if len(_extras) == 1 else "were")'
+        )
+        self.error(indent + 1, path, "additionalProperties", message)
+
+    def keyword_items(self, items: Any, schema: Dict[str, Any], value: str, path: List[str], indent: int) -> None:
+        if isinstance(items, list):
+            raise SchemaCodegenError(f"Tuple-form items are not supported, at {path}")
+        self.depth += 1
+        index, child = f"_i{self.depth}", f"_v{self.depth}"
+        self.emit(indent, f"if isinstance({value}, list):")
+        self.emit(indent + 1, f"for {index}, {child} in enumerate({value}):")
+        start = len(self.lines)
+        self.schema(items, child, [*path, index], indent + 2)
+        self.close_block(indent + 2, start)
+
+
+def generate_validator_source(schema: Dict[str, Any], format_checker: FormatChecker) -> Tuple[str, Dict[str, Any]]:
+    """Return the generated function's source and the constants it refers to."""
+    emitter = _Emitter(format_checker)
+    emitter.emit(0, "def validate(_v0):")
+    emitter.emit(1, "_errors = []")
+    emitter.schema(schema, "_v0", [], 1)
+    emitter.emit(1, "return _errors")
+    return "\n".join(emitter.lines) + "\n", emitter.constants
+
+
+def compile_schema_validator(schema: Dict[str, Any], format_checker: FormatChecker) -> SchemaValidatorFunction:
+    source, constants = generate_validator_source(schema, format_checker)
+    namespace: Dict[str, Any] = {"_violation": SchemaViolation, **constants}
+    exec(compile(source, "<generated changelog validator>", "exec"), namespace)  # noqa: S102 - our own generated code
+    return namespace["validate"]
+
+
+def benchmark_entries(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": count - index,
+            "slug": f"entry-{count - index}",
+            "title": f"Entry {count - index}",
+            "description": "Pipelines start faster and the dashboard shows step logs as they stream in.",
+            "published_at": "2026-06-18T15:04:53Z",
+            "published": True,
+            "audience": "oss",
+            "labels": ["improvement", "feature"],
+            "docs_url": "https://docs.zenml.io/concepts/steps_and_pipelines",
+            "should_highlight": False,
+        }
+        for index in range(count)
+    ]
+
+
+def main(argv: List[str] | None = None) -> int:
+    try:
+        from scripts.changelog_schema_validation import changelog_format_checker
+    except ModuleNotFoundError:  # pragma: no cover - direct script execution
+        from changelog_schema_validation import changelog_format_checker  # type: ignore[no-redef]
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--schema",
+        type=Path,
+        default=Path(__file__).resolve().parents[1] / "changelog_schema" / "announcement-schema.json",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("source", help="Print the generated validator source.")
+    benchmark_parser = subparsers.add_parser("benchmark", help="Time jsonschema against the generated validator.")
+    benchmark_parser.add_argument("--entries", type=int, action="append", default=[])
+    args = parser.parse_args(argv)
+
+    schema = json.loads(args.schema.read_text())
+    format_checker = changelog_format_checker()
+    if args.command == "source":
+        print(generate_validator_source(schema, format_checker)[0], end="")
+        return 0
+
+    interpreted = Draft7Validator(schema, format_checker=format_checker)
+    generated = compile_schema_validator(schema, format_checker)
+    for count in args.entries or [10_000, 100_000]:
+        entries = benchmark_entries(count)
+        start = time.perf_counter()
+        interpreted_errors = list(interpreted.iter_errors(entries))
+        interpreted_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        generated_errors = generated(entries)
+        generated_seconds = time.perf_counter() - start
+        assert len(interpreted_errors) == len(generated_errors)
+        print(
+            f"{count} entries: jsonschema {interpreted_seconds:.3f}s, generated {generated_seconds:.3f}s "
+            f"({interpreted_seconds / max(generated_seconds, 1e-9):.0f}x)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,17 +2,186 @@
 from __future__ import annotations
 
 import json
+import re
+import threading
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+from urllib.parse import urlsplit
 
-from jsonschema import Draft7Validator
+from jsonschema import Draft7Validator, FormatChecker
+
+try:
+    from scripts.changelog_json_stream import iter_json_array_items
+    from scripts.changelog_schema_codegen import (
+        ANNOTATION_KEYWORDS,
+        SchemaCodegenError,
+        SchemaValidatorFunction,
+        SchemaViolation,
+        compile_schema_validator,
+    )
+except ModuleNotFoundError:  # pragma: no cover - direct script execution
+    from changelog_json_stream import iter_json_array_items  # type: ignore[no-redef]
+    from changelog_schema_codegen import (  # type: ignore[no-redef]
+        ANNOTATION_KEYWORDS,
+        SchemaCodegenError,
+        SchemaValidatorFunction,
+        SchemaViolation,
+        compile_schema_validator,
+    )
+
+# RFC 3339 date-time, as used by `published_at` / `highlight_until`.
+_DATE_TIME_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}[Tt]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[Zz]|[+-]\d{2}:\d{2})$")
+
+# Per schema path: (mtime_ns, jsonschema validator, generated validator or None
+# when the schema uses keywords the generator does not compile, validator for
+# one array item or None when the schema is not a plain `items` array).
+_VALIDATORS: Dict[
+    Path,
+    Tuple[int, Draft7Validator, Optional[SchemaValidatorFunction], Optional[SchemaValidatorFunction]],
+] = {}
+_VALIDATORS_LOCK = threading.Lock()
+
+
+class ChangelogSchemaError(RuntimeError):
+    """Raised when changelog data does not match the announcement schema."""
+
+    def __init__(self, errors: List[SchemaViolation]) -> None:
+        self.errors = errors
+        super().__init__("\n".join(format_schema_error(error) for error in errors))
+
+
+def _is_date_time(value: object) -> bool:
+    if not isinstance(value, str):
+        return True
+    if not _DATE_TIME_PATTERN.match(value):
+        return False
+    try:
+        datetime.fromisoformat(re.sub(r"[Zz]$", "+00:00", value.replace("t", "T")))
+    except ValueError:
+        return False
+    return True
+
+
+def _is_uri(value: object) -> bool:
+    if not isinstance(value, str):
+        return True
+    if any(character.isspace() for character in value):
+        return False
+    return bool(urlsplit(value).scheme)
+
+
+def changelog_format_checker() -> FormatChecker:
+    """Format checker for the schema's formats that needs no optional jsonschema extras."""
+    checker = FormatChecker()
+    checker.checkers["date-time"] = (_is_date_time, ())
+    checker.checkers["uri"] = (_is_uri, ())
+    return checker
+
+
+def _interpreted_validator_function(validator: Draft7Validator) -> SchemaValidatorFunction:
+    def validate(instance: Any) -> List[SchemaViolation]:
+        return [
+            SchemaViolation(tuple(error.absolute_path), str(error.validator), error.message)
+            for error in validator.iter_errors(instance)
+        ]
+
+    return validate
+
+
+def _item_validator(schema: Dict[str, Any], format_checker: FormatChecker) -> Optional[SchemaValidatorFunction]:
+    # Validating items one at a time is only equivalent when nothing but
+    # `type: array` and `items` constrains the array itself.
+    constraints = set(schema) - ANNOTATION_KEYWORDS
+    if schema.get("type") != "array" or constraints != {"type", "items"} or not isinstance(schema["items"], dict):
+        return None
+    try:
+        return compile_schema_validator(schema["items"], format_checker)
+    except SchemaCodegenError:
+        return _interpreted_validator_function(Draft7Validator(schema["items"], format_checker=format_checker))
+
+
+def _compiled_validators(
+    schema_path: Path,
+) -> Tuple[Draft7Validator, Optional[SchemaValidatorFunction], Optional[SchemaValidatorFunction]]:
+    key = schema_path.resolve()
+    mtime_ns = key.stat().st_mtime_ns
+    with _VALIDATORS_LOCK:
+        cached = _VALIDATORS.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2], cached[3]
+        schema = json.loads(key.read_text())
+        Draft7Validator.check_schema(schema)
+        format_checker = changelog_format_checker()
+        validator = Draft7Validator(schema, format_checker=format_checker)
+        try:
+            generated: Optional[SchemaValidatorFunction] = compile_schema_validator(schema, format_checker)
+        except SchemaCodegenError as error:
+            print(f"Warning: using the interpreted schema validator for {key}: {error}")
+            generated = None
+        item_validator = _item_validator(schema, format_checker)
+        _VALIDATORS[key] = (mtime_ns, validator, generated, item_validator)
+        return validator, generated, item_validator
+
+
+def compiled_changelog_validator(schema_path: Path) -> Draft7Validator:
+    """Return the process-wide jsonschema validator for `schema_path`, rebuilt when the file changes."""
+    return _compiled_validators(schema_path)[0]
+
+
+def generated_changelog_validator(schema_path: Path) -> Optional[SchemaValidatorFunction]:
+    """Return the code-generated validator for `schema_path`, or None if the schema cannot be compiled."""
+    return _compiled_validators(schema_path)[1]
+
+
+def changelog_item_validator(schema_path: Path) -> Optional[SchemaValidatorFunction]:
+    """Return a validator for one changelog entry, or None if the schema cannot be checked item by item."""
+    return _compiled_validators(schema_path)[2]
+
+
+def reset_schema_validator_cache() -> None:
+    with _VALIDATORS_LOCK:
+        _VALIDATORS.clear()
+
+
+def format_schema_error(error: SchemaViolation) -> str:
+    location = f" (at {list(error.absolute_path)})" if error.absolute_path else ""
+    return f"- {error.message}{location}"
+
+
+def changelog_schema_errors(changelog_data: Any, schema_path: Path) -> List[SchemaViolation]:
+    """Collect every schema violation in one pass over the data, in jsonschema's order."""
+    validator, generated, _ = _compiled_validators(schema_path)
+    if generated is not None:
+        return generated(changelog_data)
+    return _interpreted_validator_function(validator)(changelog_data)
+
+
+def iter_streamed_changelog_errors(
+    stream: TextIO,
+    schema_path: Path,
+) -> Iterator[Tuple[int, int, List[SchemaViolation]]]:
+    """Validate entries as they are read from `stream`, one at a time.
+
+    Yields `(array number, entry index, violations)` for every entry; the
+    violation paths start with the entry index, as in `changelog_schema_errors`.
+    Raises `JSONStreamError` for malformed JSON, at the point it is reached.
+    """
+    item_validator = changelog_item_validator(schema_path)
+    if item_validator is None:
+        raise ValueError(f"{schema_path} is not an array schema with only `items`; validate the whole file instead.")
+    for document, index, item in iter_json_array_items(stream):
+        yield document, index, [
+            SchemaViolation((index, *violation.absolute_path), violation.validator, violation.message)
+            for violation in item_validator(item)
+        ]
 
 
 def validate_changelog_data(changelog_data: Any, schema_path: Path) -> None:
     """Validate candidate changelog data against the announcement schema."""
-    schema = json.loads(schema_path.read_text())
-    validator = Draft7Validator(schema)
-    validator.validate(changelog_data)
+    errors = changelog_schema_errors(changelog_data, schema_path)
+    if errors:
+        raise ChangelogSchemaError(errors)
 
 
 def validate_changelog(changelog_path: Path, schema_path: Path) -> None:
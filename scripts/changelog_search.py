@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# dependencies = ["pydantic>=2"]
+# ///
+"""Full-text search over changelog entries and GitBook release-note sections.
+
+Documents are changelog.json entries (title and description) and each
+`## X.Y.Z` section of the release-note files. The build writes a compact
+inverted index: per term, the documents holding it with the term frequency
+and the character offset of its first occurrence. Queries rank documents by
+tf-idf and cut snippets from the source files at those offsets.
+
+The build is incremental: documents whose text hash matches the previous
+index keep their postings and are not re-tokenized, so a new release only
+tokenizes its own section and entries.
+
+    uv run scripts/changelog_search.py build
+    uv run scripts/changelog_search.py query "mlflow tracking"
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel, Field, ValidationError
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CHANGELOG_FILE = "changelog.json"
+RELEASE_NOTE_FILES = ("gitbook-release-notes/server-sdk.md", "gitbook-release-notes/pro-control-plane.md")
+DEFAULT_INDEX_PATH = REPO_ROOT / "dist" / "changelog" / "search-index.json"
+SEARCH_INDEX_VERSION = 1
+SNIPPET_RADIUS = 80
+
+_SECTION_HEADING_PATTERN = re.compile(r"^## (\d+\.\d+\.\d+)(?: \((\d{4}-\d{2}-\d{2})\))?[^\n]*$", re.MULTILINE)
+# Versions, dotted names and hyphenated words stay single tokens.
+_TOKEN_PATTERN = re.compile(r"[0-9a-z]+(?:[._-][0-9a-z]+)*")
+# HTML tags, link targets and bare URLs; blanked (not removed) so offsets still match the source.
+_MARKUP_PATTERN = re.compile(r"<[^>]*>|\]\([^)]*\)|https?://\S+")
+STOPWORDS = frozenset(
+    "a an and are as at be by can for from has have in into is it its more new now of on or so that the their "
+    "them this to was were when which will with you your".split()
+)
+
+
+class SourceDocument(NamedTuple):
+    key: str
+    source: str
+    title: str
+    date: str
+    text: str
+    # Character range of the section in the source file; 0, 0 for changelog entries.
+    start: int
+    end: int
+
+
+class SearchDocument(BaseModel):
+    key: str
+    source: str
+    title: str
+    date: str
+    sha256: str
+    tokens: int
+    start: int = 0
+    end: int = 0
+
+
+class SearchIndex(BaseModel):
+    version: int = SEARCH_INDEX_VERSION
+    docs: List[SearchDocument] = Field(default_factory=list)
+    # term -> flat [doc, tf, first offset, doc, tf, first offset, ...], docs ascending.
+    terms: Dict[str, List[int]] = Field(default_factory=dict)
+
+
+class SearchHit(NamedTuple):
+    document: SearchDocument
+    score: float
+    # Offset of the first matched query term in the document text.
+    offset: int
+
+
+def tokenize(text: str) -> List[Tuple[str, int]]:
+    """Lowercased tokens and their character offsets, without markup and stopwords."""
+    cleaned = _MARKUP_PATTERN.sub(lambda match: " " * len(match.group()), text.lower())
+    return [
+        (match.group(), match.start())
+        for match in _TOKEN_PATTERN.finditer(cleaned)
+        if match.group() not in STOPWORDS
+    ]
+
+
+def _text_sha256(text: str) -> str:
+    # A short hash is plenty for change detection and keeps the artifact small.
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def entry_text(entry: Dict[str, object]) -> str:
+    return f"{entry.get('title', '')}\n\n{entry.get('description', '')}"
+
+
+def release_sections(source: str, markdown: str) -> List[SourceDocument]:
+    """One document per `## X.Y.Z` section, running to the next level-2 heading."""
+    starts = list(_SECTION_HEADING_PATTERN.finditer(markdown))
+    boundaries = [match.start() for match in re.finditer(r"^## ", markdown, re.MULTILINE)] + [len(markdown)]
+    documents = []
+    for match in starts:
+        end = next(boundary for boundary in boundaries if boundary > match.start())
+        documents.append(
+            SourceDocument(
+                key=f"{Path(source).stem}@{match.group(1)}",
+                source=source,
+                title=match.group(0)[3:].strip(),
+                date=match.group(2) or "",
+                text=markdown[match.start() : end],
+                start=match.start(),
+                end=end,
+            )
+        )
+    return documents
+
+
+def collect_documents(repo_root: Path = REPO_ROOT) -> List[SourceDocument]:
+    documents = [
+        SourceDocument(
+            key=f"entry:{entry['id']}",
+            source=CHANGELOG_FILE,
+            title=str(entry.get("title", "")),
+            date=str(entry.get("published_at", ""))[:10],
+            text=entry_text(entry),
+            start=0,
+            end=0,
+        )
+        for entry in json.loads((repo_root / CHANGELOG_FILE).read_text())
+    ]
+    for source in RELEASE_NOTE_FILES:
+        path = repo_root / source
+        if path.exists():
+            documents.extend(release_sections(source, path.read_text()))
+    return documents
+
+
+def _term_stats(text: str) -> Dict[str, Tuple[int, int]]:
+    """term -> (frequency, first offset)."""
+    tokens = tokenize(text)
+    counts = Counter(term for term, _ in tokens)
+    stats: Dict[str, Tuple[int, int]] = {}
+    for term, offset in tokens:
+        if term not in stats:
+            stats[term] = (counts[term], offset)
+    return stats
+
+
+def _previous_term_stats(index: SearchIndex) -> Dict[str, Dict[str, Tuple[int, int]]]:
+    """Invert the previous index back into per-document term stats, keyed by document key."""
+    per_document: Dict[str, Dict[str, Tuple[int, int]]] = defaultdict(dict)
+    for term, postings in index.terms.items():
+        for position in range(0, len(postings), 3):
+            doc, frequency, offset = postings[position : position + 3]
+            per_document[index.docs[doc].key][term] = (frequency, offset)
+    return per_document
+
+
+class SearchBuildStats(NamedTuple):
+    documents: int
+    tokenized: int
+    reused: int
+
+
+def build_search_index(
+    documents: Iterable[SourceDocument],
+    previous: Optional[SearchIndex] = None,
+) -> Tuple[SearchIndex, SearchBuildStats]:
+    """Index `documents`, reusing postings from `previous` for documents whose text did not change."""
+    previous_hashes = {doc.key: doc.sha256 for doc in previous.docs} if previous else {}
+    previous_stats: Optional[Dict[str, Dict[str, Tuple[int, int]]]] = None
+    index = SearchIndex()
+    postings: Dict[str, List[int]] = defaultdict(list)
+    tokenized = reused = 0
+    for position, document in enumerate(documents):
+        sha256 = _text_sha256(document.text)
+        if previous is not None and previous_hashes.get(document.key) == sha256:
+            if previous_stats is None:
+                previous_stats = _previous_term_stats(previous)
+            stats = previous_stats.get(document.key, {})
+            reused += 1
+        else:
+            stats = _term_stats(document.text)
+            tokenized += 1
+        index.docs.append(
+            SearchDocument(
+                key=document.key,
+                source=document.source,
+                title=document.title,
+                date=document.date,
+                sha256=sha256,
+                tokens=sum(frequency for frequency, _ in stats.values()),
+                start=document.start,
+                end=document.end,
+            )
+        )
+        for term, (frequency, offset) in stats.items():
+            postings[term].extend((position, frequency, offset))
+    index.terms = {term: postings[term] for term in sorted(postings)}
+    return index, SearchBuildStats(len(index.docs), tokenized, reused)
+
+
+def read_search_index(path: Path) -> Optional[SearchIndex]:
+    if not path.exists():
+        return None
+    try:
+        return SearchIndex.model_validate_json(path.read_text())
+    except (ValidationError, ValueError) as error:
+        print(f"Warning: ignoring unreadable search index {path}: {error}")
+        return None
+
+
+def write_search_index(index: SearchIndex, path: Path) -> bool:
+    """Write the index minified; returns False when the file already had these bytes."""
+    data = json.dumps(index.model_dump(mode="json"), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def search(index: SearchIndex, query: str, limit: int = 10) -> List[SearchHit]:
+    """Rank documents holding any query term by summed tf-idf, normalized by document length."""
+    total = len(index.docs)
+    scores: Dict[int, float] = defaultdict(float)
+    first_offsets: Dict[int, int] = {}
+    for term in dict.fromkeys(term for term, _ in tokenize(query)):
+        postings = index.terms.get(term)
+        if not postings:
+            continue
+        idf = math.log(1 + total / (len(postings) // 3))
+        for position in range(0, len(postings), 3):
+            doc, frequency, offset = postings[position : position + 3]
+            scores[doc] += (1 + math.log(frequency)) * idf
+            first_offsets[doc] = min(offset, first_offsets.get(doc, offset))
+    ranked = sorted(
+        ((score / math.sqrt(max(index.docs[doc].tokens, 1)), doc) for doc, score in scores.items()),
+        key=lambda item: (-item[0], item[1]),
+    )
+    return [SearchHit(index.docs[doc], score, first_offsets[doc]) for score, doc in ranked[:limit]]
+
+
+class SnippetSource:
+    """Reads document text back from the source files to cut snippets around hit offsets."""
+
+    def __init__(self, repo_root: Path = REPO_ROOT) -> None:
+        self.repo_root = repo_root
+        self._files: Dict[str, str] = {}
+        self._entries: Optional[Dict[str, str]] = None
+
+    def text(self, document: SearchDocument) -> Optional[str]:
+        if document.source == CHANGELOG_FILE:
+            if self._entries is None:
+                entries = json.loads((self.repo_root / CHANGELOG_FILE).read_text())
+                self._entries = {f"entry:{entry['id']}": entry_text(entry) for entry in entries}
+            text = self._entries.get(document.key)
+        else:
+            if document.source not in self._files:
+                path = self.repo_root / document.source
+                self._files[document.source] = path.read_text() if path.exists() else ""
+            text = self._files[document.source][document.start : document.end]
+        # Offsets are only meaningful for the text that was indexed.
+        return text if text is not None and _text_sha256(text) == document.sha256 else None
+
+    def snippet(self, hit: SearchHit, radius: int = SNIPPET_RADIUS) -> str:
+        text = self.text(hit.document)
+        if text is None:
+            return ""
+        start = max(hit.offset - radius, 0)
+        snippet = " ".join(text[start : hit.offset + radius].split())
+        return ("…" if start else "") + snippet + ("…" if hit.offset + radius < len(text) else "")
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--index", type=Path, default=DEFAULT_INDEX_PATH)
+    parser.add_argument("--repo-root", type=Path, default=REPO_ROOT)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build", help="Build or update the search index.")
+    build_parser.add_argument("--full", action="store_true", help="Ignore the previous index and re-tokenize all.")
+    query_parser = subparsers.add_parser("query", help="Search the index.")
+    query_parser.add_argument("query")
+    query_parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    if args.command == "build":
+        previous = None if args.full else read_search_index(args.index)
+        index, stats = build_search_index(collect_documents(args.repo_root), previous)
+        written = write_search_index(index, args.index)
+        print(
+            f"{'Wrote' if written else 'Unchanged'} {args.index}: {stats.documents} documents "
+            f"({stats.tokenized} tokenized, {stats.reused} reused), {len(index.terms)} terms, "
+            f"{args.index.stat().st_size} bytes in {(time.perf_counter() - start) * 1000:.0f} ms"
+        )
+        return 0
+
+    index = read_search_index(args.index)
+    if index is None:
+        print(f"No search index at {args.index}; run `uv run scripts/changelog_search.py build`.", file=sys.stderr)
+        return 1
+    hits = search(index, args.query, args.limit)
+    snippets = SnippetSource(args.repo_root)
+    for hit in hits:
+        print(f"{hit.score:6.3f}  {hit.document.key}  {hit.document.date}  {hit.document.title}")
+        snippet = snippets.snippet(hit)
+        if snippet:
+            print(f"        {snippet}")
+    print(f"{len(hits)} results in {(time.perf_counter() - start) * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
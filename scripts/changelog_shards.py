@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# dependencies = []
+# ///
+"""Quarterly changelog shards and the combined changelog.json built from them.
+
+Entries live in `changelog_shards/<year>-Q<n>.json`, one file per quarter of
+`published_at`, each sorted newest id first. `changelog.json` is generated by
+concatenating the shards newest quarter first, so it is byte-identical to
+`json.dumps(all_entries, indent=2)` without re-serializing old entries.
+
+    uv run scripts/changelog_shards.py split   # one-off: shard an existing changelog.json
+    uv run scripts/changelog_shards.py build   # regenerate changelog.json from the shards
+    uv run scripts/changelog_shards.py check   # fail if changelog.json is out of date
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CHANGELOG_SHARDS_DIR = "changelog_shards"
+_SHARD_NAME_PATTERN = re.compile(r"^\d{4}-Q[1-4]\.json$")
+_EMPTY_ARRAY_TEXT = "[]\n"
+
+
+class ChangelogShardError(RuntimeError):
+    """Raised when entries cannot be placed in shards without breaking the combined order."""
+
+
+def shard_period(entry: Dict[str, Any]) -> str:
+    published_at = str(entry.get("published_at", ""))
+    if not re.match(r"^\d{4}-\d{2}", published_at):
+        raise ChangelogShardError(f"Entry {entry.get('id')} has no usable published_at: {published_at!r}")
+    return f"{published_at[:4]}-Q{(int(published_at[5:7]) - 1) // 3 + 1}"
+
+
+def shard_paths(shards_dir: Path) -> List[Path]:
+    """Shard files, newest quarter first."""
+    if not shards_dir.is_dir():
+        return []
+    return sorted(
+        (path for path in shards_dir.iterdir() if _SHARD_NAME_PATTERN.match(path.name)),
+        key=lambda path: path.name,
+        reverse=True,
+    )
+
+
+def shard_text(entries: List[Dict[str, Any]]) -> str:
+    return json.dumps(entries, indent=2) + "\n"
+
+
+def read_shard(path: Path) -> List[Dict[str, Any]]:
+    return json.loads(path.read_text()) if path.exists() else []
+
+
+def _array_items_text(text: str) -> str:
+    """The item lines of an `indent=2` JSON array, exactly as they appear inside it."""
+    stripped = text.strip()
+    if stripped == "[]":
+        return ""
+    if not (stripped.startswith("[\n") and stripped.endswith("\n]")):
+        raise ChangelogShardError("Shard files must be JSON arrays written with indent=2.")
+    return stripped[2:-2]
+
+
+def combined_changelog_text(shards_dir: Path, overrides: Optional[Dict[Path, str]] = None) -> str:
+    """Concatenate shard texts into the combined changelog, newest quarter first.
+
+    `overrides` supplies replacement text for shards about to be written; a
+    path that does not exist yet is included too.
+    """
+    overrides = overrides or {}
+    paths = sorted(set(shard_paths(shards_dir)) | set(overrides), key=lambda path: path.name, reverse=True)
+    items = [_array_items_text(overrides[path] if path in overrides else path.read_text()) for path in paths]
+    items = [item for item in items if item]
+    return "[\n" + ",\n".join(items) + "\n]\n" if items else _EMPTY_ARRAY_TEXT
+
+
+def newest_changelog_id(shards_dir: Path) -> int:
+    """Highest entry id, read from the newest non-empty shard only."""
+    for path in shard_paths(shards_dir):
+        entries = read_shard(path)
+        if entries:
+            return max(int(entry.get("id", 0)) for entry in entries)
+    return 0
+
+
+def plan_shard_update(shards_dir: Path, new_entries: List[Dict[str, Any]]) -> Dict[Path, str]:
+    """Return the new text of each shard that `new_entries` land in. Other shards are not read.
+
+    New entries carry the highest ids, so they must land in the newest
+    existing quarter or a later one for the combined file to stay id-sorted.
+    """
+    by_period: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for entry in new_entries:
+        by_period[shard_period(entry)].append(entry)
+    existing = shard_paths(shards_dir)
+    newest_period = existing[0].stem if existing else None
+    planned: Dict[Path, str] = {}
+    for period, entries in by_period.items():
+        if newest_period is not None and period < newest_period:
+            raise ChangelogShardError(
+                f"New entries published in {period} would sort below existing entries from {newest_period}."
+            )
+        path = shards_dir / f"{period}.json"
+        merged = entries + read_shard(path)
+        merged.sort(key=lambda entry: entry["id"], reverse=True)
+        planned[path] = shard_text(merged)
+    return planned
+
+
+def write_shards(planned: Dict[Path, str]) -> None:
+    for path, text in planned.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+
+def split_changelog_into_shards(entries: List[Dict[str, Any]], shards_dir: Path) -> List[Path]:
+    """Write every entry to its quarter's shard, replacing existing shard files."""
+    by_period: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for entry in entries:
+        by_period[shard_period(entry)].append(entry)
+    for path in shard_paths(shards_dir):
+        path.unlink()
+    planned = {
+        shards_dir / f"{period}.json": shard_text(sorted(group, key=lambda entry: entry["id"], reverse=True))
+        for period, group in by_period.items()
+    }
+    write_shards(planned)
+    return sorted(planned, key=lambda path: path.name, reverse=True)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["split", "build", "check"])
+    parser.add_argument("--changelog", type=Path, default=REPO_ROOT / "changelog.json")
+    parser.add_argument("--shards-dir", type=Path, default=REPO_ROOT / CHANGELOG_SHARDS_DIR)
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "split":
+            written = split_changelog_into_shards(json.loads(args.changelog.read_text()), args.shards_dir)
+            print(f"Wrote {len(written)} shards to {args.shards_dir}")
+            return 0
+        combined = combined_changelog_text(args.shards_dir)
+        if args.command == "build":
+            args.changelog.write_text(combined)
+            print(f"Wrote {args.changelog} from {len(shard_paths(args.shards_dir))} shards")
+            return 0
+        if not args.changelog.exists() or args.changelog.read_text() != combined:
+            print(f"{args.changelog} does not match {args.shards_dir}; run `uv run scripts/changelog_shards.py build`.")
+            return 1
+        print(f"{args.changelog} matches {args.shards_dir}")
+        return 0
+    except ChangelogShardError as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,26 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import json
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from scripts.changelog_llm_outputs import GroupedChangelogOutput
-    from scripts.changelog_llm_providers import LLMOutputValidationError
+    from scripts.changelog_llm_providers import LLMOutputValidationError, StreamValidator
+    from scripts.changelog_pr_references import scan_pr_references
 except ModuleNotFoundError:  # pragma: no cover
     from changelog_llm_outputs import GroupedChangelogOutput  # type: ignore[no-redef]
-    from changelog_llm_providers import LLMOutputValidationError  # type: ignore[no-redef]
+    from changelog_llm_providers import LLMOutputValidationError, StreamValidator  # type: ignore[no-redef]
+    from changelog_pr_references import scan_pr_references  # type: ignore[no-redef]
+
+BODY_RELEASE_HEADER_DETAIL = "Release-note body must not include the deterministic `##` release header."
+BODY_FORBIDDEN_PR_REFERENCE_DETAIL = (
+    "Release-note body must not include PR links, raw PR URLs, or PR numbers for this audience."
+)
+BREAKING_FORBIDDEN_PR_REFERENCE_DETAIL = (
+    "Breaking-change bullets must not include PR links, raw PR URLs, or PR numbers for this audience."
+)
 
 class GroupedChangelogSemanticError(RuntimeError):
     """Recoverable semantic validation failure for grouped changelog output."""
@@ -26,38 +37,23 @@ def markdown_pr_link_pattern(pr: Dict[str, Any]) -> str:
     return rf"\[PR #{number}\]\({url}\)"
 
 def missing_markdown_pr_links(text: str, prs: List[Dict[str, Any]]) -> List[int]:
-    missing: List[int] = []
-    for pr in prs:
-        if not re.search(markdown_pr_link_pattern(pr), text):
-            missing.append(int(pr["number"]))
-    return missing
+    references = scan_pr_references(text)
+    return [
+        int(pr["number"])
+        for pr in prs
+        if not references.has_markdown_link(int(pr["number"]), str(pr.get("url", "")))
+    ]
 
 def contains_forbidden_pr_reference(text: str, prs: List[Dict[str, Any]]) -> bool:
-    if re.search(r"https://github\.com/[^\s)]+/pull/\d+", text):
-        return True
-    for pr in prs:
-        number = int(pr["number"])
-        if re.search(rf"\[[^\]]*(?:PR\s*#?\s*{number}|#{number})[^\]]*\]\([^)]*\)", text, flags=re.IGNORECASE):
-            return True
-        if re.search(rf"\bPR\s*#?\s*{number}\b", text, flags=re.IGNORECASE):
-            return True
-        if re.search(rf"(?<![\w/])#{number}\b", text):
-            return True
-    return False
+    references = scan_pr_references(text)
+    return references.has_pull_url or any(references.mentions(int(pr["number"])) for pr in prs)
 
-def validate_release_notes_body_output(
-    *,
-    body: str,
-    prs: List[Dict[str, Any]],
-    include_pr_links: bool,
-) -> List[str]:
-    """Validate model-generated release-note body before deterministic assembly."""
+def _release_notes_body_layout_details(body: str) -> List[str]:
+    """Return violations of the deterministic release-note layout the caller adds."""
     details: List[str] = []
-    warnings: List[str] = []
     lines = body.splitlines()
-
     if any(line.startswith("## ") for line in lines):
-        details.append("Release-note body must not include the deterministic `##` release header.")
+        details.append(BODY_RELEASE_HEADER_DETAIL)
     if re.search(r"<\s*img\b", body, flags=re.IGNORECASE):
         details.append("Release-note body must not include the deterministic image tag.")
     if re.search(r"^#+\s+Breaking Changes\b", body, flags=re.IGNORECASE | re.MULTILINE):
@@ -66,6 +62,17 @@ def validate_release_notes_body_output(
         details.append("Release-note body must not include the deterministic release footer link.")
     if any(line.strip() == "***" for line in lines):
         details.append("Release-note body must not include the deterministic `***` footer.")
+    return details
+
+def validate_release_notes_body_output(
+    *,
+    body: str,
+    prs: List[Dict[str, Any]],
+    include_pr_links: bool,
+) -> List[str]:
+    """Validate model-generated release-note body before deterministic assembly."""
+    warnings: List[str] = []
+    details = _release_notes_body_layout_details(body)
 
     if prs and include_pr_links:
         missing = missing_markdown_pr_links(body, prs)
@@ -73,7 +80,7 @@ def validate_release_notes_body_output(
             missing_str = ", ".join(f"#{number}" for number in missing)
             details.append(f"Release-note body is missing required PR links for: {missing_str}.")
     if not include_pr_links and contains_forbidden_pr_reference(body, prs):
-        details.append("Release-note body must not include PR links, raw PR URLs, or PR numbers for this audience.")
+        details.append(BODY_FORBIDDEN_PR_REFERENCE_DETAIL)
 
     has_bugfix_prs = any(
         any(label.lower() in {"bug", "bugfix", "fix"} for label in pr.get("labels", []))
@@ -124,12 +131,123 @@ def validate_breaking_changes_output(
             missing_str = ", ".join(f"#{number}" for number in missing)
             details.append(f"Breaking-change bullets are missing required PR links for: {missing_str}.")
     if not include_pr_links and contains_forbidden_pr_reference(combined, breaking_prs):
-        details.append("Breaking-change bullets must not include PR links, raw PR URLs, or PR numbers for this audience.")
+        details.append(BREAKING_FORBIDDEN_PR_REFERENCE_DETAIL)
 
     if details:
         raise LLMOutputValidationError(details)
     return warnings
 
+def _json_string_end(text: str, start: int) -> Tuple[int, bool]:
+    """Return where the JSON string opened at `start` ends, and whether it is closed.
+
+    For an unterminated string the end stops before any trailing partial escape.
+    """
+    index = start + 1
+    while index < len(text):
+        char = text[index]
+        if char == '"':
+            return index, True
+        if char == "\\":
+            width = 6 if text[index + 1 : index + 2] == "u" else 2
+            if index + width > len(text):
+                return index, False
+            index += width
+            continue
+        index += 1
+    return index, False
+
+def partial_json_string_values(text: str) -> List[Tuple[str, bool]]:
+    """Decode the string values (not keys) of a possibly truncated JSON document.
+
+    Each value is returned with a flag telling whether its closing quote has
+    arrived, so streaming validators can tell settled text from text in flight.
+    """
+    values: List[Tuple[str, bool]] = []
+    containers: List[str] = []
+    expecting_key = False
+    index = 0
+    while index < len(text):
+        char = text[index]
+        if char == '"':
+            end, closed = _json_string_end(text, index)
+            if not (containers and containers[-1] == "{" and expecting_key):
+                values.append((json.loads(f'"{text[index + 1 : end]}"', strict=False), closed))
+            index = end + 1
+            continue
+        if char in "{[":
+            containers.append(char)
+            expecting_key = char == "{"
+        elif char in "}]":
+            if containers:
+                containers.pop()
+        elif char == ":":
+            expecting_key = False
+        elif char == ",":
+            expecting_key = bool(containers) and containers[-1] == "{"
+        index += 1
+    return values
+
+def release_notes_body_stream_validator(
+    *,
+    prs: List[Dict[str, Any]],
+    include_pr_links: bool,
+) -> StreamValidator:
+    """Build a streaming check for the hard body rules that more text cannot undo.
+
+    Only finished lines are checked, except for a `## ` prefix, which is final
+    as soon as it appears. Missing PR links can only be judged on the full body.
+    """
+    checked_settled_chars = -1
+
+    def validate(partial_output: str) -> None:
+        nonlocal checked_settled_chars
+        values = partial_json_string_values(partial_output)
+        if not values:
+            return
+        body, closed = values[0]
+        settled = body if closed else body[: body.rfind("\n") + 1]
+        in_flight_header = body[len(settled) :].startswith("## ")
+        # Settled text only grows, so re-check it only when a line completes.
+        if len(settled) == checked_settled_chars and not in_flight_header:
+            return
+        checked_settled_chars = len(settled)
+        details = _release_notes_body_layout_details(settled)
+        if in_flight_header and BODY_RELEASE_HEADER_DETAIL not in details:
+            details.append(BODY_RELEASE_HEADER_DETAIL)
+        if not include_pr_links and contains_forbidden_pr_reference(settled, prs):
+            details.append(BODY_FORBIDDEN_PR_REFERENCE_DETAIL)
+        if details:
+            raise LLMOutputValidationError(details)
+
+    return validate
+
+def breaking_changes_stream_validator(
+    *,
+    breaking_prs: List[Dict[str, Any]],
+    include_pr_links: bool,
+) -> StreamValidator:
+    """Build a streaming check that rejects each breaking-change bullet once it is complete."""
+    checked_bullet_count = 0
+
+    def validate(partial_output: str) -> None:
+        nonlocal checked_bullet_count
+        bullets = [value for value, closed in partial_json_string_values(partial_output) if closed]
+        if len(bullets) == checked_bullet_count:
+            return
+        checked_bullet_count = len(bullets)
+        details: List[str] = []
+        for index, bullet in enumerate(bullets, start=1):
+            if bullet.strip().startswith(("-", "*")):
+                details.append(f"Breaking-change bullet {index} must not start with '-' or '*'.")
+            if breaking_prs and include_pr_links and not re.search(r"\[PR #\d+\]\([^)]*\)", bullet):
+                details.append(f"Breaking-change bullet {index} must include a markdown PR link.")
+        if not include_pr_links and contains_forbidden_pr_reference("\n".join(bullets), breaking_prs):
+            details.append(BREAKING_FORBIDDEN_PR_REFERENCE_DETAIL)
+        if details:
+            raise LLMOutputValidationError(details)
+
+    return validate
+
 def format_repo_qualified_pr(pr: Dict[str, Any]) -> str:
     """Return a compact repo-qualified PR identifier for hard validation errors."""
     repo = pr.get("repo") or "<unknown repo>"
@@ -209,6 +327,34 @@ def validate_grouped_changelog_output(
             invalid_grouping_summary=summarize_grouped_changelog_output(grouped_output),
         )
 
+def repair_grouped_changelog_output(
+    grouped_output: GroupedChangelogOutput,
+    prs: List[Dict[str, Any]],
+) -> Tuple[Optional[GroupedChangelogOutput], List[int]]:
+    """Deterministically drop unknown and duplicated PR numbers from a grouping.
+
+    Returns the repaired grouping (or None when no entry survives) and the sorted
+    input PR numbers that are still unassigned after the local fix.
+    """
+    known_numbers = {pr["number"] for pr in prs}
+    assigned: set[int] = set()
+    repaired_entries = []
+
+    for entry in grouped_output.entries:
+        kept_numbers: List[int] = []
+        for pr_number in entry.pr_numbers:
+            if pr_number not in known_numbers or pr_number in assigned:
+                continue
+            assigned.add(pr_number)
+            kept_numbers.append(pr_number)
+        if kept_numbers:
+            repaired_entries.append(entry.model_copy(update={"pr_numbers": kept_numbers}))
+
+    missing_numbers = sorted(known_numbers - assigned)
+    if not repaired_entries:
+        return None, missing_numbers
+    return GroupedChangelogOutput(entries=repaired_entries), missing_numbers
+
 def build_grouped_retry_feedback(error: GroupedChangelogSemanticError) -> str:
     """Build compact validation feedback for a semantic grouped-output retry."""
     validation_feedback = "\n".join(f"- {detail}" for detail in error.details)
@@ -28,7 +28,7 @@ import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Literal, Sequence, TypeVar
+from typing import Any, Callable, Literal, Sequence, TypeVar, get_args
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -40,17 +40,23 @@ from scripts import changelog_artifact_safety as artifact_safety
 from scripts import changelog_config as cfg
 from scripts import changelog_entry_builder as entry_builder
 from scripts import changelog_env as env
+from scripts import changelog_llm_batches as batches
 from scripts import changelog_llm_generation as generation
 from scripts import changelog_llm_providers as providers
+from scripts import changelog_pr_digests as pr_digests
 from scripts import changelog_rendering as rendering
 from scripts import changelog_schema_validation as schema_validation
 from scripts import changelog_validators as validators
 from scripts import changelog_fixture_capture as capture
 from scripts.changelog_llm_outputs import (
     LLM_CALL_BREAKING_CHANGES,
+    LLM_CALL_GROUPED_CHANGELOG_CHUNK,
     LLM_CALL_GROUPED_CHANGELOG_ENTRIES,
+    LLM_CALL_GROUPED_CHANGELOG_MERGE,
     LLM_CALL_RELEASE_NOTES_BODY,
     GroupedChangelogOutput,
+    LLMUsage,
+    routed_llm_call,
 )
 
 DEFAULT_FIXTURES_DIR = REPO_ROOT / "tests" / "fixtures" / "changelog-evals"
@@ -152,6 +158,11 @@ class ProviderCallRecord(BaseModel):
     estimated_input_tokens: int
     estimated_output_tokens: int | None = None
     estimated_cost_usd: float | None = None
+    # Provider-reported usage; `None` for offline fixtures and providers without usage data.
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    cached_input_tokens: int | None = None
+    reasoning_tokens: int | None = None
 
 
 class HardCheck(BaseModel):
@@ -189,6 +200,11 @@ class RunSummary(BaseModel):
     pass_count: int
     fail_count: int
     unexpected_count: int
+    # Pre-grouping hint A/B: compare these across runs with and without --no-pregroup-hints.
+    pregroup_hints: bool = True
+    grouped_first_attempt_count: int = 0
+    grouped_first_attempt_pass_count: int = 0
+    grouped_prompt_chars: int = 0
     results: list[CandidateEvalResult]
 
 
@@ -213,9 +229,14 @@ def make_provider_call_record(
     max_output_tokens: int,
     latency_seconds: float,
     parsed_output: BaseModel | None = None,
+    usage: LLMUsage | None = None,
 ) -> ProviderCallRecord:
     input_tokens = estimate_tokens(prompt)
     output_tokens = estimate_tokens(parsed_output.model_dump_json()) if parsed_output else None
+    if usage is None:
+        cost_usd = estimate_cost_usd(model, input_tokens, output_tokens)
+    else:
+        cost_usd = estimate_cost_usd(model, usage.input_tokens, usage.output_tokens)
     return ProviderCallRecord(
         call_name=call_name,
         output_model=output_model.__name__,
@@ -224,7 +245,28 @@ def make_provider_call_record(
         latency_seconds=latency_seconds,
         estimated_input_tokens=input_tokens,
         estimated_output_tokens=output_tokens,
-        estimated_cost_usd=estimate_cost_usd(model, input_tokens, output_tokens),
+        estimated_cost_usd=cost_usd,
+        input_tokens=usage.input_tokens if usage else None,
+        output_tokens=usage.output_tokens if usage else None,
+        cached_input_tokens=usage.cached_input_tokens if usage else None,
+        reasoning_tokens=usage.reasoning_tokens if usage else None,
+    )
+
+
+def format_token_usage(calls: Sequence[ProviderCallRecord]) -> str:
+    """Summarize provider-reported tokens, falling back to the len/4 estimate."""
+    measured = [call for call in calls if call.input_tokens is not None]
+    if not measured:
+        estimated = sum(call.estimated_input_tokens + (call.estimated_output_tokens or 0) for call in calls)
+        return f"~{estimated} (estimated)" if calls else "0"
+    input_tokens = sum(call.input_tokens or 0 for call in measured)
+    output_tokens = sum(call.output_tokens or 0 for call in measured)
+    cached_tokens = sum(call.cached_input_tokens or 0 for call in measured)
+    reasoning_tokens = sum(call.reasoning_tokens or 0 for call in measured)
+    hit_rate = providers.format_cache_hit_rate(cached_tokens, input_tokens)
+    return (
+        f"{input_tokens} in ({cached_tokens} cached, {hit_rate}) / "
+        f"{output_tokens} out ({reasoning_tokens} reasoning)"
     )
 
 
@@ -244,9 +286,12 @@ class OfflineFixtureProvider:
         output_model: type[TOutput],
         max_output_tokens: int,
         call_name: str,
+        stream_validator: providers.StreamValidator | None = None,
     ) -> TOutput:
+        # Fixture outputs arrive whole, so the final validators cover them and
+        # `stream_validator` is not applied here.
         start = time.perf_counter()
-        fixture_field = LLM_CALL_FIXTURE_FIELDS.get(call_name)
+        fixture_field = LLM_CALL_FIXTURE_FIELDS.get(routed_llm_call(call_name))
         if fixture_field is None:
             raise EvalHarnessError(f"Offline fixture lookup is not configured for LLM call {call_name!r}.")
         raw_output = getattr(self.outputs, fixture_field)
@@ -296,6 +341,7 @@ class MeasuredLiveProvider:
         output_model: type[TOutput],
         max_output_tokens: int,
         call_name: str,
+        stream_validator: providers.StreamValidator | None = None,
     ) -> TOutput:
         start = time.perf_counter()
         parsed = self.client.parse_structured_output(
@@ -303,7 +349,9 @@ class MeasuredLiveProvider:
             output_model=output_model,
             max_output_tokens=max_output_tokens,
             call_name=call_name,
+            stream_validator=stream_validator,
         )
+        latency_seconds = time.perf_counter() - start
         resolved_model = getattr(self.client, "model_for_call", lambda _: self.model)(call_name)
         self.calls.append(
             make_provider_call_record(
@@ -312,8 +360,9 @@ class MeasuredLiveProvider:
                 output_model=output_model,
                 prompt=prompt,
                 max_output_tokens=max_output_tokens,
-                latency_seconds=time.perf_counter() - start,
+                latency_seconds=latency_seconds,
                 parsed_output=parsed,
+                usage=providers.last_llm_usage(),
             )
         )
         return parsed
@@ -581,6 +630,8 @@ def fixture_candidates(
 def provider_for_candidate(
     candidate: OfflineCandidate | LiveCandidateConfig,
 ) -> OfflineFixtureProvider | MeasuredLiveProvider:
+    if isinstance(candidate, BatchCandidate):
+        return BatchResultProvider(candidate)
     if isinstance(candidate, OfflineCandidate):
         return OfflineFixtureProvider(candidate)
     if isinstance(candidate, RoutedLiveCandidate):
@@ -670,6 +721,9 @@ def evaluate_candidate(
     fixture: EvalFixture,
     candidate: OfflineCandidate | LiveCandidateConfig,
     run_dir: Path,
+    pregroup_hints: bool = True,
+    max_chunk_prs: int = generation.HIERARCHICAL_CHUNK_MAX_PRS,
+    max_chunk_chars: int = generation.HIERARCHICAL_CHUNK_MAX_CHARS,
 ) -> CandidateEvalResult:
     state = CandidateEvaluationState(fixture=fixture, candidate=candidate, run_dir=run_dir)
     has_changes = bool(fixture.release_notes_prs or fixture.breaking_prs)
@@ -693,6 +747,9 @@ def evaluate_candidate(
             client=state.provider,
             prs=grouping_prs,
             source_repo=fixture.source_repo,
+            max_chunk_prs=max_chunk_prs,
+            max_chunk_chars=max_chunk_chars,
+            pregroup_hints=pregroup_hints,
         )
         state.hard_checks.append(check_pass("grouped_structured_parse"))
         validators.validate_grouped_changelog_output(state.grouped_output, grouping_prs)
@@ -719,6 +776,8 @@ def evaluate_candidate(
                 breaking_prs=fixture.breaking_prs,
                 source_repo=fixture.source_repo,
                 include_pr_links=include_pr_links,
+                max_chunk_prs=max_chunk_prs,
+                max_chunk_chars=max_chunk_chars,
             )
             state.hard_checks.append(check_pass("breaking_structured_parse"))
             state.breaking_bullets = breaking_output.bullets
@@ -735,6 +794,8 @@ def evaluate_candidate(
                 prs=body_prs,
                 source_repo=fixture.source_repo,
                 include_pr_links=include_pr_links,
+                max_chunk_prs=max_chunk_prs,
+                max_chunk_chars=max_chunk_chars,
             )
             state.hard_checks.append(check_pass("release_notes_body_structured_parse"))
             state.release_body = body_output.content
@@ -819,6 +880,7 @@ def render_candidate_report_md(result: CandidateEvalResult) -> str:
         f"- Hard gate: **{result.hard_gate_status}**",
         f"- Expected: `{result.expected_hard_gate_status}`",
         f"- Provider calls: {result.provider_call_count}",
+        f"- Tokens: {format_token_usage(result.provider_calls)}",
         "",
         "## Hard checks",
         "",
@@ -865,15 +927,19 @@ def render_summary_md(summary: RunSummary) -> str:
         f"- Candidate results: {summary.candidate_result_count}",
         f"- Hard-gate pass/fail: {summary.pass_count} pass / {summary.fail_count} fail",
         f"- Unexpected outcomes: {summary.unexpected_count}",
+        f"- Pre-grouping hints: {'on' if summary.pregroup_hints else 'off'}",
+        "- Grouped first-attempt validation: "
+        f"{summary.grouped_first_attempt_pass_count}/{summary.grouped_first_attempt_count} pass, "
+        f"{summary.grouped_prompt_chars} grouped prompt chars",
         "",
         "## Results",
         "",
-        "| Fixture | Candidate | Provider/model | Hard gate | Expected | Calls |",
-        "| --- | --- | --- | --- | --- | ---: |",
+        "| Fixture | Candidate | Provider/model | Hard gate | Expected | Calls | Tokens |",
+        "| --- | --- | --- | --- | --- | ---: | --- |",
     ]
     for result in summary.results:
         lines.append(
-            "| {fixture} | {candidate} | `{provider}` / `{model}` | {status} | {expected} | {calls} |".format(
+            "| {fixture} | {candidate} | `{provider}` / `{model}` | {status} | {expected} | {calls} | {tokens} |".format(
                 fixture=result.fixture_id,
                 candidate=result.display_name,
                 provider=result.provider,
@@ -881,6 +947,7 @@ def render_summary_md(summary: RunSummary) -> str:
                 status=result.hard_gate_status,
                 expected=result.expected_hard_gate_status,
                 calls=result.provider_call_count,
+                tokens=format_token_usage(result.provider_calls),
             )
         )
     lines.extend(["", "## Manual scoring form", ""])
@@ -959,6 +1026,49 @@ def render_comparison_html(summary: RunSummary) -> str:
 """
 
 
+# Calls that make up one grouped generation: a single call, or per-chunk calls
+# plus their merge when the release is split hierarchically. Repairs are not
+# part of the first attempt.
+GROUPED_GENERATION_CALL_NAMES = frozenset(
+    {LLM_CALL_GROUPED_CHANGELOG_ENTRIES, LLM_CALL_GROUPED_CHANGELOG_CHUNK, LLM_CALL_GROUPED_CHANGELOG_MERGE}
+)
+
+
+def grouped_first_attempt_stats(results: Sequence[CandidateEvalResult]) -> tuple[int, int, int]:
+    """Return (attempted, passed, prompt chars) for the single grouped generation each result makes.
+
+    A hierarchical generation counts as one attempt, with the prompt chars of
+    all its chunk and merge calls.
+    """
+    attempted = passed = prompt_chars = 0
+    for result in results:
+        grouped_calls = [call for call in result.provider_calls if call.call_name in GROUPED_GENERATION_CALL_NAMES]
+        if not grouped_calls:
+            continue
+        attempted += 1
+        passed += any(check.name == "grouped_pr_assignment" and check.passed for check in result.hard_checks)
+        prompt_chars += sum(call.prompt_chars for call in grouped_calls)
+    return attempted, passed, prompt_chars
+
+
+def attach_fixture_pr_digests(fixtures: list[EvalFixture], cache_path: Path) -> list[EvalFixture]:
+    """Give fixture PRs the same cached digests the release workflow prompts with."""
+    cache = pr_digests.read_pr_digest_cache(cache_path)
+    stats = pr_digests.PRDigestStats()
+    digested = [
+        fixture.model_copy(
+            update={
+                "release_notes_prs": pr_digests.attach_pr_digests(fixture.release_notes_prs, cache, stats=stats),
+                "breaking_prs": pr_digests.attach_pr_digests(fixture.breaking_prs, cache, stats=stats),
+            }
+        )
+        for fixture in fixtures
+    ]
+    print(pr_digests.format_pr_digest_summary(stats, "extractive"))
+    pr_digests.write_pr_digest_cache(cache, cache_path)
+    return digested
+
+
 def run_eval(
     *,
     fixtures_dir: Path,
@@ -968,6 +1078,8 @@ def run_eval(
     candidate_filter: set[str] | None,
     live_candidates: Sequence[LiveCandidateConfig],
     allow_live_provider_calls: bool = False,
+    pregroup_hints: bool = True,
+    pr_digest_cache: Path | None = None,
 ) -> RunSummary:
     if live_candidates and not allow_live_provider_calls:
         raise EvalHarnessError(
@@ -980,19 +1092,50 @@ def run_eval(
     run_dir.mkdir(parents=True, exist_ok=True)
 
     fixtures = load_fixtures(fixtures_dir, fixture_ids)
+    if pr_digest_cache is not None:
+        fixtures = attach_fixture_pr_digests(fixtures, pr_digest_cache)
     results: list[CandidateEvalResult] = []
     for fixture in fixtures:
         for candidate in fixture_candidates(fixture, live_candidates, candidate_filter):
-            results.append(evaluate_candidate(fixture=fixture, candidate=candidate, run_dir=run_dir))
+            results.append(
+                evaluate_candidate(
+                    fixture=fixture,
+                    candidate=candidate,
+                    run_dir=run_dir,
+                    pregroup_hints=pregroup_hints,
+                )
+            )
+    return write_run_summary(
+        run_id=run_id,
+        run_dir=run_dir,
+        fixture_count=len(fixtures),
+        results=results,
+        pregroup_hints=pregroup_hints,
+    )
+
+
+def write_run_summary(
+    *,
+    run_id: str,
+    run_dir: Path,
+    fixture_count: int,
+    results: list[CandidateEvalResult],
+    pregroup_hints: bool,
+) -> RunSummary:
+    grouped_attempts, grouped_passes, grouped_prompt_chars = grouped_first_attempt_stats(results)
 
     summary = RunSummary(
         run_id=run_id,
         run_dir=str(run_dir),
-        fixture_count=len(fixtures),
+        fixture_count=fixture_count,
         candidate_result_count=len(results),
         pass_count=sum(1 for result in results if result.hard_gate_status == "pass"),
         fail_count=sum(1 for result in results if result.hard_gate_status == "fail"),
         unexpected_count=sum(1 for result in results if not result.matched_expectation),
+        pregroup_hints=pregroup_hints,
+        grouped_first_attempt_count=grouped_attempts,
+        grouped_first_attempt_pass_count=grouped_passes,
+        grouped_prompt_chars=grouped_prompt_chars,
         results=results,
     )
     safe_write_json(run_dir, "summary.json", summary.model_dump(mode="json"))
@@ -1001,6 +1144,323 @@ def run_eval(
     return summary
 
 
+# Batch mode sends each call as one request, so PR lists are never chunked
+# into the hierarchical map/merge calls that need a second round trip.
+BATCH_CHUNK_MAX_PRS = 10**6
+BATCH_CHUNK_MAX_CHARS = 10**9
+BATCH_MANIFEST_FILE = "manifest.json"
+
+
+def batch_requests_file(provider: providers.LLMProviderName) -> str:
+    return f"requests-{provider}.jsonl"
+
+
+class BatchRequestEntry(BaseModel):
+    custom_id: str
+    fixture_id: str
+    candidate_id: str
+    provider: providers.LLMProviderName
+    model: str
+    call_name: str
+    prompt_chars: int
+    max_output_tokens: int
+
+
+class BatchManifest(BaseModel):
+    fixtures_dir: str
+    pregroup_hints: bool = True
+    candidates: list[LiveCandidate | RoutedLiveCandidate]
+    requests: list[BatchRequestEntry]
+
+
+class BatchCandidate(OfflineCandidate):
+    """Offline candidate whose outputs came back from a provider batch result file."""
+
+    batch_errors: dict[str, str] = Field(default_factory=dict)
+    batch_usage: dict[str, LLMUsage] = Field(default_factory=dict)
+
+
+class _BatchRequestRecorded(Exception):
+    pass
+
+
+class BatchRequestRecorder:
+    """Structured-output seam that records the provider batch request for a call instead of sending it."""
+
+    def __init__(self, candidate: LiveCandidateConfig, custom_id: str) -> None:
+        self.provider = candidate.provider
+        self.custom_id = custom_id
+        self.client: providers.AnthropicStructuredLLMClient | providers.OpenAIStructuredLLMClient
+        if candidate.provider == providers.LLM_PROVIDER_ANTHROPIC:
+            self.client = providers.AnthropicStructuredLLMClient(None, model=candidate.model)  # type: ignore[arg-type]
+        else:
+            self.client = providers.OpenAIStructuredLLMClient(
+                None,
+                model=candidate.model,
+                models_by_call=getattr(candidate, "models_by_call", None),
+            )
+        self.request: dict[str, Any] | None = None
+        self.entry_fields: dict[str, Any] = {}
+
+    def parse_structured_output(
+        self,
+        *,
+        prompt: str,
+        output_model: type[TOutput],
+        max_output_tokens: int,
+        call_name: str,
+        stream_validator: providers.StreamValidator | None = None,
+    ) -> TOutput:
+        build_request = (
+            batches.anthropic_batch_request
+            if self.provider == providers.LLM_PROVIDER_ANTHROPIC
+            else batches.openai_batch_request
+        )
+        self.request = build_request(
+            self.client,  # type: ignore[arg-type]
+            custom_id=self.custom_id,
+            prompt=prompt,
+            output_model=output_model,
+            max_output_tokens=max_output_tokens,
+            call_name=call_name,
+        )
+        self.entry_fields = {
+            "model": getattr(self.client, "model_for_call", lambda _: self.client.model)(call_name),
+            "call_name": call_name,
+            "prompt_chars": len(prompt),
+            "max_output_tokens": max_output_tokens,
+        }
+        raise _BatchRequestRecorded
+
+
+def _fixture_batch_calls(fixture: EvalFixture, pregroup_hints: bool) -> list[Callable[[Any], Any]]:
+    include_pr_links = include_pr_links_for_fixture(fixture)
+    chunking = {"max_chunk_prs": BATCH_CHUNK_MAX_PRS, "max_chunk_chars": BATCH_CHUNK_MAX_CHARS}
+    grouping_prs = changed_prs_for_grouping(fixture)
+    body_prs = body_prs_for_fixture(fixture)
+    calls: list[Callable[[Any], Any]] = []
+    if grouping_prs:
+        calls.append(
+            lambda client: generation.generate_grouped_changelog_output(
+                client=client,
+                prs=grouping_prs,
+                source_repo=fixture.source_repo,
+                pregroup_hints=pregroup_hints,
+                **chunking,
+            )
+        )
+    if fixture.breaking_prs:
+        calls.append(
+            lambda client: generation.generate_breaking_changes_output(
+                client=client,
+                breaking_prs=fixture.breaking_prs,
+                source_repo=fixture.source_repo,
+                include_pr_links=include_pr_links,
+                **chunking,
+            )
+        )
+    if body_prs:
+        calls.append(
+            lambda client: generation.generate_release_notes_body_output(
+                client=client,
+                prs=body_prs,
+                source_repo=fixture.source_repo,
+                include_pr_links=include_pr_links,
+                **chunking,
+            )
+        )
+    return calls
+
+
+def prepare_batch_eval(
+    *,
+    fixtures_dir: Path,
+    batch_dir: Path,
+    fixture_ids: set[str] | None,
+    live_candidates: Sequence[LiveCandidateConfig],
+    pregroup_hints: bool = True,
+) -> BatchManifest:
+    """Phase one: write every fixture x candidate x call request as provider batch JSONL.
+
+    Writes one request file per provider plus a manifest that maps each
+    `custom_id` back to its fixture, candidate and call. No provider is called.
+    """
+    if not live_candidates:
+        raise EvalHarnessError("Batch evaluation needs at least one live candidate.")
+    validate_eval_run_dir(batch_dir.resolve())
+    fixtures = load_fixtures(fixtures_dir, fixture_ids)
+    requests_by_provider: dict[str, list[dict[str, Any]]] = {}
+    entries: list[BatchRequestEntry] = []
+    for fixture in fixtures:
+        for candidate in live_candidates:
+            for call in _fixture_batch_calls(fixture, pregroup_hints):
+                recorder = BatchRequestRecorder(candidate, custom_id=f"req-{len(entries) + 1:05d}")
+                try:
+                    call(recorder)
+                except _BatchRequestRecorded:
+                    pass
+                if recorder.request is None:
+                    raise EvalHarnessError(f"Fixture {fixture.fixture_id} produced no batch request.")
+                requests_by_provider.setdefault(candidate.provider, []).append(recorder.request)
+                entries.append(
+                    BatchRequestEntry(
+                        custom_id=recorder.custom_id,
+                        fixture_id=fixture.fixture_id,
+                        candidate_id=candidate.candidate_id,
+                        provider=candidate.provider,
+                        **recorder.entry_fields,
+                    )
+                )
+    manifest = BatchManifest(
+        fixtures_dir=str(fixtures_dir.resolve()),
+        pregroup_hints=pregroup_hints,
+        candidates=list(live_candidates),
+        requests=entries,
+    )
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    for provider, requests in requests_by_provider.items():
+        batches.write_jsonl(batch_dir / batch_requests_file(provider), requests)
+    (batch_dir / BATCH_MANIFEST_FILE).write_text(manifest.model_dump_json(indent=2) + "\n", encoding="utf-8")
+    return manifest
+
+
+class BatchResultProvider(OfflineFixtureProvider):
+    """Offline provider that replays batch outputs and reports batch errors and usage per call."""
+
+    def __init__(self, candidate: BatchCandidate) -> None:
+        super().__init__(candidate)
+        self.batch_errors = candidate.batch_errors
+        self.batch_usage = candidate.batch_usage
+
+    def parse_structured_output(
+        self,
+        *,
+        prompt: str,
+        output_model: type[TOutput],
+        max_output_tokens: int,
+        call_name: str,
+        stream_validator: providers.StreamValidator | None = None,
+    ) -> TOutput:
+        if call_name in self.batch_errors:
+            raise EvalHarnessError(self.batch_errors[call_name])
+        parsed = super().parse_structured_output(
+            prompt=prompt,
+            output_model=output_model,
+            max_output_tokens=max_output_tokens,
+            call_name=call_name,
+        )
+        usage = self.batch_usage.get(call_name)
+        if usage is not None:
+            self.calls[-1] = make_provider_call_record(
+                model=usage.model,
+                call_name=call_name,
+                output_model=output_model,
+                prompt=prompt,
+                max_output_tokens=max_output_tokens,
+                latency_seconds=self.calls[-1].latency_seconds,
+                parsed_output=parsed,
+                usage=usage,
+            )
+        return parsed
+
+
+def _batch_candidate(
+    candidate: LiveCandidateConfig,
+    entries: Sequence[BatchRequestEntry],
+    results: dict[str, dict[str, Any]],
+) -> BatchCandidate:
+    outputs: dict[str, Any] = {}
+    errors: dict[str, str] = {}
+    usage: dict[str, LLMUsage] = {}
+    for entry in entries:
+        line = results.get(entry.custom_id)
+        if line is None:
+            errors[entry.call_name] = f"No batch result for {entry.custom_id} ({entry.call_name})."
+            continue
+        result = batches.parse_batch_result(entry.provider, line, call_name=entry.call_name, model=entry.model)
+        if result.usage is not None:
+            usage[entry.call_name] = result.usage
+        if result.error is not None:
+            errors[entry.call_name] = result.error
+            continue
+        try:
+            outputs[LLM_CALL_FIXTURE_FIELDS[entry.call_name]] = json.loads(result.text or "")
+        except json.JSONDecodeError as error:
+            errors[entry.call_name] = f"Batch result {entry.custom_id} is not JSON: {error}"
+    return BatchCandidate(
+        candidate_id=candidate.candidate_id,
+        provider=candidate.provider,
+        model=candidate.model,
+        display_name=candidate.display_name,
+        outputs=CandidateOutputs(**outputs),
+        batch_errors=errors,
+        batch_usage=usage,
+    )
+
+
+def ingest_batch_eval(
+    *,
+    batch_dir: Path,
+    results_paths: Sequence[Path],
+    output_root: Path,
+    run_id: str | None,
+) -> RunSummary:
+    """Phase two: run the normal hard checks on outputs read from provider batch result files."""
+    manifest = BatchManifest.model_validate_json((batch_dir / BATCH_MANIFEST_FILE).read_text(encoding="utf-8"))
+    results: dict[str, dict[str, Any]] = {}
+    for path in results_paths:
+        for line in batches.read_jsonl(path):
+            results[str(line.get("custom_id"))] = line
+
+    run_id = run_id or datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+    run_dir = (output_root / run_id).resolve()
+    validate_eval_run_dir(run_dir)
+    run_dir.mkdir(parents=True, exist_ok=True)
+
+    fixture_ids = {entry.fixture_id for entry in manifest.requests}
+    fixtures = load_fixtures(Path(manifest.fixtures_dir), fixture_ids)
+    eval_results: list[CandidateEvalResult] = []
+    for fixture in fixtures:
+        for candidate in manifest.candidates:
+            entries = [
+                entry
+                for entry in manifest.requests
+                if entry.fixture_id == fixture.fixture_id and entry.candidate_id == candidate.candidate_id
+            ]
+            eval_results.append(
+                evaluate_candidate(
+                    fixture=fixture,
+                    candidate=_batch_candidate(candidate, entries, results),
+                    run_dir=run_dir,
+                    pregroup_hints=manifest.pregroup_hints,
+                    max_chunk_prs=BATCH_CHUNK_MAX_PRS,
+                    max_chunk_chars=BATCH_CHUNK_MAX_CHARS,
+                )
+            )
+    return write_run_summary(
+        run_id=run_id,
+        run_dir=run_dir,
+        fixture_count=len(fixtures),
+        results=eval_results,
+        pregroup_hints=manifest.pregroup_hints,
+    )
+
+
+def build_batch_sdk_client(provider: providers.LLMProviderName, base_url: str | None) -> Any:
+    """Build the raw SDK client the local batch runner sends requests with."""
+    key_name = "ANTHROPIC_API_KEY" if provider == providers.LLM_PROVIDER_ANTHROPIC else "OPENAI_API_KEY"
+    api_key = env.env_value(key_name) or ("local-stub" if base_url else None)
+    if not api_key:
+        raise EvalHarnessError(f"{key_name} is required to run a batch file against the live API.")
+    if provider == providers.LLM_PROVIDER_ANTHROPIC:
+        from anthropic import Anthropic
+
+        return Anthropic(api_key=api_key, base_url=base_url, max_retries=2)
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key, base_url=base_url, max_retries=2)
+
+
 def capture_fixture(*, input_path: Path, output_path: Path) -> None:
     fixture = EvalFixture.model_validate_json(input_path.read_text(encoding="utf-8"))
     validate_capture_output_path(output_path)
@@ -1099,6 +1559,54 @@ def build_parser() -> argparse.ArgumentParser:
             "'Label|grouped=model,breaking=model,release=model'. Requires --allow-live-provider-calls."
         ),
     )
+    run_parser.add_argument(
+        "--no-pregroup-hints",
+        dest="pregroup_hints",
+        action="store_false",
+        help="Leave the local starting-group hints out of grouped prompts (for A/B runs).",
+    )
+    run_parser.add_argument(
+        "--pr-digest-cache",
+        type=Path,
+        default=None,
+        help="Prompt with cached per-PR digests instead of raw bodies, reading and updating this JSON file.",
+    )
+
+    batch_prepare_parser = subparsers.add_parser(
+        "batch-prepare",
+        help="Write every fixture x live candidate x call request as provider batch JSONL (no provider calls).",
+    )
+    batch_prepare_parser.add_argument("--fixtures-dir", type=Path, default=DEFAULT_FIXTURES_DIR)
+    batch_prepare_parser.add_argument("--batch-dir", type=Path, required=True)
+    batch_prepare_parser.add_argument("--fixture-id", action="append", default=[])
+    batch_prepare_parser.add_argument("--live-candidate", action="append", type=parse_live_candidate, default=[])
+    batch_prepare_parser.add_argument(
+        "--live-openai-routed-candidate",
+        action="append",
+        type=parse_live_openai_routed_candidate,
+        default=[],
+    )
+    batch_prepare_parser.add_argument("--no-pregroup-hints", dest="pregroup_hints", action="store_false")
+
+    batch_local_parser = subparsers.add_parser(
+        "batch-run-local",
+        help="Answer a batch request file through the synchronous API, writing a provider-format result file.",
+    )
+    batch_local_parser.add_argument("--provider", choices=list(get_args(providers.LLMProviderName)), required=True)
+    batch_local_parser.add_argument("--requests", type=Path, required=True)
+    batch_local_parser.add_argument("--results", type=Path, required=True)
+    batch_local_parser.add_argument("--base-url", default=None, help="Send to a compatible server, e.g. the stub.")
+    batch_local_parser.add_argument("--max-workers", type=int, default=batches.LOCAL_BATCH_MAX_WORKERS)
+    batch_local_parser.add_argument("--allow-live-provider-calls", action="store_true")
+
+    batch_ingest_parser = subparsers.add_parser(
+        "batch-ingest",
+        help="Run the hard checks on provider batch result files written for a batch-prepare manifest.",
+    )
+    batch_ingest_parser.add_argument("--batch-dir", type=Path, required=True)
+    batch_ingest_parser.add_argument("--results", type=Path, action="append", required=True)
+    batch_ingest_parser.add_argument("--output-root", type=Path, default=DEFAULT_OUTPUT_ROOT)
+    batch_ingest_parser.add_argument("--run-id", default=None)
 
     capture_parser = subparsers.add_parser("capture-fixture", help="Normalize a local fixture JSON file.")
     capture_parser.add_argument("--input", type=Path, required=True)
@@ -1147,6 +1655,8 @@ def main(argv: Sequence[str] | None = None) -> int:
                 candidate_filter=set(args.candidate) or None,
                 live_candidates=live_candidates,
                 allow_live_provider_calls=args.allow_live_provider_calls,
+                pregroup_hints=args.pregroup_hints,
+                pr_digest_cache=args.pr_digest_cache,
             )
             print(f"Wrote evaluation reports to {summary.run_dir}")
             print(f"Hard-gate results: {summary.pass_count} pass / {summary.fail_count} fail")
@@ -1155,6 +1665,43 @@ def main(argv: Sequence[str] | None = None) -> int:
                 return 1
             return 0
 
+        if args.command == "batch-prepare":
+            manifest = prepare_batch_eval(
+                fixtures_dir=args.fixtures_dir,
+                batch_dir=args.batch_dir,
+                fixture_ids=set(args.fixture_id) or None,
+                live_candidates=[*args.live_candidate, *args.live_openai_routed_candidate],
+                pregroup_hints=args.pregroup_hints,
+            )
+            print(f"Wrote {len(manifest.requests)} batch requests to {args.batch_dir}")
+            return 0
+
+        if args.command == "batch-run-local":
+            if not args.allow_live_provider_calls and not args.base_url:
+                raise EvalHarnessError(
+                    "Running a batch file against the live API requires --allow-live-provider-calls."
+                )
+            sent = batches.run_batch_locally(
+                provider=args.provider,
+                client=build_batch_sdk_client(args.provider, args.base_url),
+                requests_path=args.requests,
+                results_path=args.results,
+                max_workers=args.max_workers,
+            )
+            print(f"Wrote {sent} batch results to {args.results}")
+            return 0
+
+        if args.command == "batch-ingest":
+            summary = ingest_batch_eval(
+                batch_dir=args.batch_dir,
+                results_paths=args.results,
+                output_root=args.output_root,
+                run_id=args.run_id,
+            )
+            print(f"Wrote evaluation reports to {summary.run_dir}")
+            print(f"Hard-gate results: {summary.pass_count} pass / {summary.fail_count} fail")
+            return 1 if summary.unexpected_count else 0
+
         if args.command == "capture-fixture":
             capture_fixture(input_path=args.input, output_path=args.output)
             print(f"Wrote normalized fixture to {args.output}")
@@ -1171,7 +1718,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             )
             print(f"Wrote {len(written)} fixture(s) to {args.fixtures_dir}")
             return 0
-    except (EvalHarnessError, capture.FixtureCaptureError) as error:
+    except (EvalHarnessError, capture.FixtureCaptureError, batches.LLMBatchError) as error:
         print(f"error: {error}", file=sys.stderr)
         return 2
 
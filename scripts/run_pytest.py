@@ -8,6 +8,7 @@
 #     "requests",
 #     "PyGithub",
 #     "anthropic",
+#     "brotli",
 #     "openai",
 #     "jsonschema",
 #     "pydantic",
@@ -21,7 +21,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from github import Auth, Github
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 try:
     from scripts import changelog_llm_providers as _llm_providers
@@ -39,12 +39,16 @@ try:
         build_grouped_changelog_entries,
         map_labels,
         slugify_title,
+        with_unique_slugs,
     )
     from scripts.changelog_env import env_value, require_env_values
     from scripts.changelog_llm_generation import (
+        SPECULATIVE_GROUPED_MAX_SPEND_TOKENS,
         generate_breaking_changes_output,
         generate_grouped_changelog_output,
+        generate_grouped_changelog_repair_output,
         generate_release_notes_body_output,
+        generate_speculative_grouped_changelog_output,
     )
     from scripts.changelog_llm_outputs import (
         LLM_CALL_BREAKING_CHANGES,
@@ -75,6 +79,31 @@ try:
         llm_retryable,
         openai_response_has_refusal,
     )
+    from scripts.changelog_output_sizing import (
+        OUTPUT_TOKEN_SIZER,
+        output_token_history_path_from_env,
+        read_output_token_history,
+        reset_output_token_sizer,
+        write_output_token_history,
+    )
+    from scripts.changelog_pr_bodies import (
+        format_pr_body_normalization_summary,
+        normalized_pr_body,
+        pr_body_normalization_metrics,
+    )
+    from scripts.changelog_pr_digests import (
+        PRDigestCache,
+        PRDigestSource,
+        PRDigestStats,
+        attach_pr_digests,
+        extractive_pr_digest,
+        format_pr_digest_summary,
+        pr_digest_cache_path_from_env,
+        pr_digest_source_from_env,
+        read_pr_digest_cache,
+        write_pr_digest_cache,
+    )
+    from scripts.changelog_pr_similarity import collapse_near_duplicate_prs, format_near_duplicate_summary
     from scripts.changelog_prompts import (
         build_breaking_changes_prompt,
         build_changelog_copy_prompt,
@@ -89,9 +118,19 @@ try:
         render_release_notes_section,
         update_markdown_file,
     )
-    from scripts.changelog_schema_validation import (
-        validate_changelog,
-        validate_changelog_data,
+    from scripts.changelog_shards import (
+        CHANGELOG_SHARDS_DIR,
+        combined_changelog_text,
+        newest_changelog_id,
+        plan_shard_update,
+        write_shards,
+    )
+    from scripts.changelog_incremental_validation import (
+        changelog_index_path_from_env,
+        existing_changelog_slugs,
+        read_changelog_index,
+        validate_changelog_update,
+        write_changelog_index,
     )
     from scripts.changelog_validators import (
         GroupedChangelogSemanticError,
@@ -102,6 +141,7 @@ try:
         format_repo_qualified_pr,
         markdown_pr_link_pattern,
         missing_markdown_pr_links,
+        repair_grouped_changelog_output,
         summarize_grouped_changelog_output,
         validate_breaking_changes_output,
         validate_grouped_changelog_output,
@@ -123,12 +163,16 @@ except ModuleNotFoundError:  # pragma: no cover - direct `uv run scripts/update_
         build_grouped_changelog_entries,
         map_labels,
         slugify_title,
+        with_unique_slugs,
     )
     from changelog_env import env_value, require_env_values  # type: ignore[no-redef]
     from changelog_llm_generation import (  # type: ignore[no-redef]
+        SPECULATIVE_GROUPED_MAX_SPEND_TOKENS,
         generate_breaking_changes_output,
         generate_grouped_changelog_output,
+        generate_grouped_changelog_repair_output,
         generate_release_notes_body_output,
+        generate_speculative_grouped_changelog_output,
     )
     from changelog_llm_outputs import (  # type: ignore[no-redef]
         LLM_CALL_BREAKING_CHANGES,
@@ -159,6 +203,34 @@ except ModuleNotFoundError:  # pragma: no cover - direct `uv run scripts/update_
         llm_retryable,
         openai_response_has_refusal,
     )
+    from changelog_output_sizing import (  # type: ignore[no-redef]
+        OUTPUT_TOKEN_SIZER,
+        output_token_history_path_from_env,
+        read_output_token_history,
+        reset_output_token_sizer,
+        write_output_token_history,
+    )
+    from changelog_pr_bodies import (  # type: ignore[no-redef]
+        format_pr_body_normalization_summary,
+        normalized_pr_body,
+        pr_body_normalization_metrics,
+    )
+    from changelog_pr_digests import (  # type: ignore[no-redef]
+        PRDigestCache,
+        PRDigestSource,
+        PRDigestStats,
+        attach_pr_digests,
+        extractive_pr_digest,
+        format_pr_digest_summary,
+        pr_digest_cache_path_from_env,
+        pr_digest_source_from_env,
+        read_pr_digest_cache,
+        write_pr_digest_cache,
+    )
+    from changelog_pr_similarity import (  # type: ignore[no-redef]
+        collapse_near_duplicate_prs,
+        format_near_duplicate_summary,
+    )
     from changelog_prompts import (  # type: ignore[no-redef]
         build_breaking_changes_prompt,
         build_changelog_copy_prompt,
@@ -173,9 +245,19 @@ except ModuleNotFoundError:  # pragma: no cover - direct `uv run scripts/update_
         render_release_notes_section,
         update_markdown_file,
     )
-    from changelog_schema_validation import (  # type: ignore[no-redef]
-        validate_changelog,
-        validate_changelog_data,
+    from changelog_shards import (  # type: ignore[no-redef]
+        CHANGELOG_SHARDS_DIR,
+        combined_changelog_text,
+        newest_changelog_id,
+        plan_shard_update,
+        write_shards,
+    )
+    from changelog_incremental_validation import (  # type: ignore[no-redef]
+        changelog_index_path_from_env,
+        existing_changelog_slugs,
+        read_changelog_index,
+        validate_changelog_update,
+        write_changelog_index,
     )
     from changelog_validators import (  # type: ignore[no-redef]
         GroupedChangelogSemanticError,
@@ -186,6 +268,7 @@ except ModuleNotFoundError:  # pragma: no cover - direct `uv run scripts/update_
         format_repo_qualified_pr,
         markdown_pr_link_pattern,
         missing_markdown_pr_links,
+        repair_grouped_changelog_output,
         summarize_grouped_changelog_output,
         validate_breaking_changes_output,
         validate_grouped_changelog_output,
@@ -250,6 +333,8 @@ except ModuleNotFoundError:  # pragma: no cover - direct `uv run scripts/update_
     )
 
 IMAGE_STATE_FILE = Path(".image_state")
+GROUPED_SPECULATIVE_ATTEMPTS_ENV = "CHANGELOG_GROUPED_SPECULATIVE_ATTEMPTS"
+GROUPED_SPECULATIVE_MAX_TOKENS_ENV = "CHANGELOG_GROUPED_SPECULATIVE_MAX_TOKENS"
 MAX_IMAGE_NUMBER = 49
 
 # Placeholder URLs that pass schema validation but are clearly marked for review
@@ -609,6 +694,43 @@ def llm_generate_changelog_copy(pr_title: str, pr_body: str, pr_url: str, repo_t
     )
 
 
+def llm_pr_digest(pr: Dict[str, Any], repo_type: str) -> str:
+    """Summarize one PR for the digest cache with the changelog-copy call."""
+    copy = llm_generate_changelog_copy(pr["title"], normalized_pr_body(pr), pr["url"], repo_type)
+    return f"{copy.title}. {copy.description}"
+
+
+def attach_release_pr_digests(
+    release_notes_prs: List[Dict[str, Any]],
+    breaking_prs: List[Dict[str, Any]],
+    repo_type: str,
+    cache: PRDigestCache,
+    source: PRDigestSource,
+    stats: PRDigestStats,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Attach cached digests to every prompted PR and make the missing ones, once per PR.
+
+    LLM digests cost a call each, so they are left pending and only made for
+    PRs whose prompt does not fit their full bodies.
+    """
+    prompt_prs = {(pr.get("repo", ""), pr["number"]): pr for pr in release_notes_prs + breaking_prs}
+    digested = {
+        (pr.get("repo", ""), pr["number"]): pr
+        for pr in attach_pr_digests(
+            list(prompt_prs.values()),
+            cache,
+            summarize=(lambda pr: llm_pr_digest(pr, repo_type)) if source == "llm" else extractive_pr_digest,
+            source=source,
+            stats=stats,
+            lazy=source == "llm",
+        )
+    }
+    return (
+        [digested[(pr.get("repo", ""), pr["number"])] for pr in release_notes_prs],
+        [digested[(pr.get("repo", ""), pr["number"])] for pr in breaking_prs],
+    )
+
+
 @llm_retryable()
 def llm_generate_grouped_changelog_entries(
     prs: List[Dict[str, Any]],
@@ -623,6 +745,46 @@ def llm_generate_grouped_changelog_entries(
     )
 
 
+@llm_retryable()
+def llm_generate_speculative_grouped_changelog_entries(
+    prs: List[Dict[str, Any]],
+    source_repo: str,
+    retry_feedback: Optional[str] = None,
+    attempts: int = 1,
+    max_spend_tokens: int = SPECULATIVE_GROUPED_MAX_SPEND_TOKENS,
+) -> GroupedChangelogOutput:
+    result = generate_speculative_grouped_changelog_output(
+        client=require_llm_client(),
+        prs=prs,
+        source_repo=source_repo,
+        attempts=attempts,
+        retry_feedback=retry_feedback,
+        max_spend_tokens=max_spend_tokens,
+    )
+    if result.valid:
+        print(
+            f"Speculative grouped generation: attempt {result.first_valid_attempt} of {result.attempts_sent} "
+            f"was the first valid output after {result.first_valid_seconds:.1f}s"
+        )
+    else:
+        print(f"Speculative grouped generation: none of {result.attempts_sent} attempts was valid")
+    return result.output
+
+
+@llm_retryable()
+def llm_repair_grouped_changelog_entries(
+    grouped_output: GroupedChangelogOutput,
+    unassigned_prs: List[Dict[str, Any]],
+    source_repo: str,
+) -> GroupedChangelogOutput:
+    return generate_grouped_changelog_repair_output(
+        client=require_llm_client(),
+        grouped_output=grouped_output,
+        unassigned_prs=unassigned_prs,
+        source_repo=source_repo,
+    )
+
+
 @llm_retryable()
 def llm_generate_breaking_changes_bullets(
     breaking_prs: List[Dict[str, Any]],
@@ -706,15 +868,93 @@ def collect_needs_attention(
     return needs_attention
 
 
+def repair_grouped_changelog_entries(
+    grouped_output: GroupedChangelogOutput,
+    prs: List[Dict[str, Any]],
+    source_repo: str,
+    published_at: str,
+    starting_id: int,
+) -> Optional[List[Dict[str, Any]]]:
+    """Try to fix a semantically invalid grouping without regenerating it.
+
+    Unknown and duplicated PR numbers are dropped locally. PRs that are still
+    unassigned are placed by a small repair prompt that only carries the valid
+    grouping and those PRs. Returns None when the grouping cannot be repaired,
+    including when the repair call itself fails.
+    """
+    repaired_output, missing_numbers = repair_grouped_changelog_output(grouped_output, prs)
+    if repaired_output is None:
+        return None
+
+    if missing_numbers:
+        missing = set(missing_numbers)
+        unassigned_prs = [pr for pr in prs if pr["number"] in missing]
+        print(
+            "Repairing grouped changelog output for unassigned PRs: "
+            + ", ".join(f"#{number}" for number in missing_numbers)
+        )
+        try:
+            repaired_output = llm_repair_grouped_changelog_entries(
+                grouped_output=repaired_output,
+                unassigned_prs=unassigned_prs,
+                source_repo=source_repo,
+            )
+        except (LLMProviderRetryableError, LLMProviderNonRetryableError, ValidationError) as error:
+            # Retries or the retry budget ran out; the caller regenerates the whole grouping instead.
+            print(f"Grouped changelog repair call failed: {error}")
+            return None
+    else:
+        print("Repaired grouped changelog output locally by dropping unknown or duplicated PR numbers")
+
+    try:
+        return build_grouped_changelog_entries(
+            grouped_output=repaired_output,
+            prs=prs,
+            source_repo=source_repo,
+            published_at=published_at,
+            starting_id=starting_id,
+        )
+    except GroupedChangelogSemanticError as error:
+        print("Grouped changelog repair failed semantic validation: " + "; ".join(error.details))
+        return None
+
+
+def positive_int_from_env(name: str, default: int) -> int:
+    """Return a positive integer setting, treating blank values as missing."""
+    raw = env_value(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError as error:
+        raise RuntimeError(f"Invalid {name}={raw!r}. Expected a positive integer.") from error
+    if value < 1:
+        raise RuntimeError(f"Invalid {name}={raw!r}. Expected a positive integer.")
+    return value
+
+
 def generate_valid_grouped_changelog_entries(
     prs: List[Dict[str, Any]],
     source_repo: str,
     published_at: str,
     starting_id: int,
     max_attempts: int = 3,
+    speculative_attempts: int = 1,
+    speculative_max_spend_tokens: int = SPECULATIVE_GROUPED_MAX_SPEND_TOKENS,
 ) -> List[Dict[str, Any]]:
-    """Generate grouped changelog entries, retrying only semantic PR assignment errors."""
+    """Generate grouped changelog entries, repairing or retrying semantic PR assignment errors.
+
+    A semantically invalid grouping is first repaired locally or with a small
+    repair prompt; the whole grouping is regenerated only when repair fails.
+    Near-duplicate PRs are prompted as one representative and expanded again
+    when the entries are built. With `speculative_attempts` above one, each
+    attempt sends that many grouped requests at once, within the spend cap,
+    and keeps the first valid one.
+    """
     assert_unique_grouped_pr_numbers(prs)
+    collapsed_prs = collapse_near_duplicate_prs(prs)
+    if len(collapsed_prs) < len(prs):
+        print(format_near_duplicate_summary(collapsed_prs))
 
     retry_feedback: Optional[str] = None
     attempt_errors: List[GroupedChangelogSemanticError] = []
@@ -726,16 +966,25 @@ def generate_valid_grouped_changelog_entries(
                 f"(attempt {attempt}/{max_attempts})"
             )
 
-        grouped_output = llm_generate_grouped_changelog_entries(
-            prs=prs,
-            source_repo=source_repo,
-            retry_feedback=retry_feedback,
-        )
+        if speculative_attempts > 1:
+            grouped_output = llm_generate_speculative_grouped_changelog_entries(
+                prs=collapsed_prs,
+                source_repo=source_repo,
+                retry_feedback=retry_feedback,
+                attempts=speculative_attempts,
+                max_spend_tokens=speculative_max_spend_tokens,
+            )
+        else:
+            grouped_output = llm_generate_grouped_changelog_entries(
+                prs=collapsed_prs,
+                source_repo=source_repo,
+                retry_feedback=retry_feedback,
+            )
 
         try:
             return build_grouped_changelog_entries(
                 grouped_output=grouped_output,
-                prs=prs,
+                prs=collapsed_prs,
                 source_repo=source_repo,
                 published_at=published_at,
                 starting_id=starting_id,
@@ -746,7 +995,17 @@ def generate_valid_grouped_changelog_entries(
                 f"Grouped changelog semantic validation failed on attempt {attempt}/{max_attempts}: "
                 + "; ".join(error.details)
             )
-            retry_feedback = build_grouped_retry_feedback(error)
+
+        repaired_entries = repair_grouped_changelog_entries(
+            grouped_output=grouped_output,
+            prs=collapsed_prs,
+            source_repo=source_repo,
+            published_at=published_at,
+            starting_id=starting_id,
+        )
+        if repaired_entries is not None:
+            return repaired_entries
+        retry_feedback = build_grouped_retry_feedback(attempt_errors[-1])
 
     raise RuntimeError(
         f"Grouped changelog generation failed semantic validation after {max_attempts} attempts.\n\n"
@@ -839,7 +1098,23 @@ def main() -> None:
             "Refusing to write changelog artifacts without source-window metadata."
         )
 
+    prompt_prs = {(pr.get("repo", ""), pr["number"]): pr for pr in release_notes_prs + breaking_prs}
+    print(format_pr_body_normalization_summary(pr_body_normalization_metrics(list(prompt_prs.values()))))
+
     llm_client = build_structured_llm_client_from_env()
+    _llm_providers.reset_llm_retry_budget()
+    _llm_providers.reset_llm_usage_log()
+    output_history_path = output_token_history_path_from_env()
+    reset_output_token_sizer(read_output_token_history(output_history_path) if output_history_path else None)
+    # The digest cache lives in `CHANGELOG_PR_DIGEST_CACHE` when it is set; it
+    # is written back at the end of the run, once pending digests were made.
+    digest_cache_path = pr_digest_cache_path_from_env()
+    digest_cache = read_pr_digest_cache(digest_cache_path) if digest_cache_path else PRDigestCache()
+    digest_source = pr_digest_source_from_env()
+    digest_stats = PRDigestStats()
+    release_notes_prs, breaking_prs = attach_release_pr_digests(
+        release_notes_prs, breaking_prs, config["type"], digest_cache, digest_source, digest_stats
+    )
 
     # Use release-notes PRs for changelog entries; fall back to breaking PRs if none
     grouping_prs = release_notes_prs if release_notes_prs else breaking_prs
@@ -847,17 +1122,25 @@ def main() -> None:
     breaking_pr_keys = {(pr.get("repo", ""), pr["number"]) for pr in breaking_prs}
     body_prs = [pr for pr in release_notes_prs if (pr.get("repo", ""), pr["number"]) not in breaking_pr_keys]
 
+    # Near-duplicates are prompted once; the body and breaking validators still require each PR.
+    breaking_prompt_prs = collapse_near_duplicate_prs(breaking_prs)
+    body_prompt_prs = collapse_near_duplicate_prs(body_prs)
+    for collapsed_prs, prs in ((breaking_prompt_prs, breaking_prs), (body_prompt_prs, body_prs)):
+        if len(collapsed_prs) < len(prs):
+            print(format_near_duplicate_summary(collapsed_prs))
+
     include_pr_links = config["type"] == "oss"
     breaking_bullets = llm_generate_breaking_changes_bullets(
-        breaking_prs=breaking_prs,
+        breaking_prs=breaking_prompt_prs,
         source_repo=source_repo,
         include_pr_links=include_pr_links,
     )
 
+    # changelog.json is generated from the quarterly shards; only the newest shard is parsed here.
     changelog_path = Path("changelog.json")
-    existing_changelog = json.loads(changelog_path.read_text())
-    max_existing_id = max((entry.get("id", 0) for entry in existing_changelog), default=0)
-    starting_id = max_existing_id + 1
+    shards_dir = Path(CHANGELOG_SHARDS_DIR)
+    existing_changelog_text = combined_changelog_text(shards_dir)
+    starting_id = newest_changelog_id(shards_dir) + 1
 
     # Identify PRs with insufficient descriptions that should be reviewed manually
     needs_attention = collect_needs_attention(grouping_prs)
@@ -877,21 +1160,44 @@ def main() -> None:
         source_repo=source_repo,
         published_at=published_at,
         starting_id=starting_id,
+        speculative_attempts=positive_int_from_env(GROUPED_SPECULATIVE_ATTEMPTS_ENV, 1),
+        speculative_max_spend_tokens=positive_int_from_env(
+            GROUPED_SPECULATIVE_MAX_TOKENS_ENV,
+            SPECULATIVE_GROUPED_MAX_SPEND_TOKENS,
+        ),
     )
 
     for entry in new_entries:
         print(f"Created grouped changelog entry #{entry['id']}: {entry['title']}")
 
     markdown_file = config["markdown_file"]
-    body = llm_generate_release_notes_body(body_prs, source_repo, include_pr_links) if body_prs else ""
+    body = llm_generate_release_notes_body(body_prompt_prs, source_repo, include_pr_links) if body_prs else ""
 
 
+    changelog_index_path = changelog_index_path_from_env()
+    cached_changelog_index = read_changelog_index(changelog_index_path) if changelog_index_path else None
+    # Titles can repeat across releases; suffix slugs so they stay unique across the changelog.
+    new_entries = with_unique_slugs(
+        new_entries,
+        existing_changelog_slugs(existing_changelog_text, cached_changelog_index),
+    )
     new_entries.sort(key=lambda entry: entry["id"], reverse=True)
-    updated_changelog = new_entries + existing_changelog
+    changed_shards = plan_shard_update(shards_dir, new_entries)
+    updated_changelog_text = combined_changelog_text(shards_dir, changed_shards)
     schema_path = Path(__file__).resolve().parents[1] / "changelog_schema" / "announcement-schema.json"
-    validate_changelog_data(updated_changelog, schema_path)
-    changelog_path.write_text(json.dumps(updated_changelog, indent=2) + "\n")
-    validate_changelog(changelog_path, schema_path)
+    # Only the new entries are schema-checked when the cached index matches the existing file.
+    changelog_index = validate_changelog_update(
+        new_entries=new_entries,
+        load_existing_entries=lambda: json.loads(existing_changelog_text),
+        existing_text=existing_changelog_text,
+        updated_text=updated_changelog_text,
+        schema_path=schema_path,
+        index=cached_changelog_index,
+    )
+    write_shards(changed_shards)
+    changelog_path.write_text(updated_changelog_text)
+    if changelog_index_path:
+        write_changelog_index(changelog_index, changelog_index_path)
 
     image_number = get_next_image_number(
         release_tag=env["RELEASE_TAG"],
@@ -926,6 +1232,16 @@ def main() -> None:
         f"{config['markdown_file']} (image {image_number}), and "
         f"{CONSUMED_SOURCE_STATE_FILE}."
     )
+    llm_calls = _llm_providers.LLM_USAGE_LOG.records()
+    print(_llm_providers.format_llm_usage_summary(llm_calls))
+    for call_name, hit_rate in _llm_providers.llm_cache_hit_rates(llm_calls).items():
+        print(f"  {call_name}: {hit_rate} of input tokens served from the prompt cache")
+    print(format_pr_digest_summary(digest_stats, digest_source))
+    if digest_cache_path:
+        write_pr_digest_cache(digest_cache, digest_cache_path)
+    if output_history_path:
+        OUTPUT_TOKEN_SIZER.record(llm_calls)
+        write_output_token_history(OUTPUT_TOKEN_SIZER.history, output_history_path)
 
     write_changelog_workflow_result(
         ChangelogWorkflowResult(
@@ -937,6 +1253,7 @@ def main() -> None:
             ),
             needs_attention=format_needs_attention_output(needs_attention),
             source_windows=source_windows_body,
+            llm_calls=llm_calls,
         ),
         workflow_result_path,
     )
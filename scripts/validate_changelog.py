@@ -4,41 +4,101 @@
 # ///
 """Validate changelog.json against the announcement schema.
 
-Used by pre-commit hook and can be run standalone.
+Used by pre-commit hook and can be run standalone. By default the whole file
+is loaded and every violation is listed at once. `--stream` reads entries one
+at a time and reports each violation as soon as it is found, so memory stays
+flat for very large or concatenated changelog files; `--fail-fast` stops at
+the first invalid entry.
 """
 
+import argparse
 import json
 import sys
 from pathlib import Path
+from typing import List, Optional
 
-from jsonschema import Draft7Validator
+try:
+    from scripts.changelog_json_stream import JSONStreamError
+    from scripts.changelog_schema_codegen import SchemaViolation
+    from scripts.changelog_schema_validation import changelog_schema_errors, iter_streamed_changelog_errors
+except ModuleNotFoundError:  # pragma: no cover - direct script execution
+    from changelog_json_stream import JSONStreamError  # type: ignore[no-redef]
+    from changelog_schema_codegen import SchemaViolation  # type: ignore[no-redef]
+    from changelog_schema_validation import (  # type: ignore[no-redef]
+        changelog_schema_errors,
+        iter_streamed_changelog_errors,
+    )
 
+REPO_ROOT = Path(__file__).parent.parent
 
-def main() -> int:
-    repo_root = Path(__file__).parent.parent
-    changelog_path = repo_root / "changelog.json"
-    schema_path = repo_root / "changelog_schema" / "announcement-schema.json"
 
+def print_error(error: SchemaViolation, document: int = 0) -> None:
+    print(f"  - {error.message}")
+    if error.absolute_path:
+        array = f" (array {document})" if document else ""
+        print(f"    at: {list(error.absolute_path)}{array}")
+
+
+def validate_whole_file(changelog_path: Path, schema_path: Path) -> int:
     with open(changelog_path) as f:
         data = json.load(f)
 
-    with open(schema_path) as f:
-        schema = json.load(f)
-
-    validator = Draft7Validator(schema)
-    errors = list(validator.iter_errors(data))
+    errors = changelog_schema_errors(data, schema_path)
 
     if errors:
         print("Changelog validation failed:")
         for error in errors:
-            print(f"  - {error.message}")
-            if error.path:
-                print(f"    at: {list(error.path)}")
+            print_error(error)
         return 1
 
     print("Changelog validation passed")
     return 0
 
 
+def validate_streaming(changelog_path: Path, schema_path: Path, fail_fast: bool) -> int:
+    entries = invalid_entries = 0
+    with open(changelog_path) as f:
+        try:
+            for document, _, errors in iter_streamed_changelog_errors(f, schema_path):
+                entries += 1
+                if not errors:
+                    continue
+                if not invalid_entries:
+                    print("Changelog validation failed:", flush=True)
+                invalid_entries += 1
+                for error in errors:
+                    print_error(error, document)
+                sys.stdout.flush()
+                if fail_fast:
+                    print("Stopped at the first invalid entry (--fail-fast).")
+                    return 1
+        except JSONStreamError as error:
+            print(f"Changelog is not valid JSON ({entries} entries read): {error}")
+            return 1
+
+    if invalid_entries:
+        print(f"{invalid_entries} of {entries} entries are invalid")
+        return 1
+    print(f"Changelog validation passed ({entries} entries)")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("changelog", nargs="?", type=Path, default=REPO_ROOT / "changelog.json")
+    parser.add_argument(
+        "--schema",
+        type=Path,
+        default=REPO_ROOT / "changelog_schema" / "announcement-schema.json",
+    )
+    parser.add_argument("--stream", action="store_true", help="Validate entries one at a time as they are read.")
+    parser.add_argument("--fail-fast", action="store_true", help="Stop at the first invalid entry (implies --stream).")
+    args = parser.parse_args(argv)
+
+    if args.stream or args.fail_fast:
+        return validate_streaming(args.changelog, args.schema, args.fail_fast)
+    return validate_whole_file(args.changelog, args.schema)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -13,7 +13,12 @@ import sys
 from pathlib import Path
 from typing import List, Sequence, TypedDict
 
-from pydantic import BaseModel, ConfigDict, StrictBool, StrictStr, ValidationError, model_validator
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr, ValidationError, model_validator
+
+try:
+    from scripts.changelog_llm_outputs import LLMUsage
+except ModuleNotFoundError:  # pragma: no cover - direct `uv run scripts/workflow_result.py`
+    from changelog_llm_outputs import LLMUsage  # type: ignore[no-redef]
 
 DEFAULT_CHANGELOG_WORKFLOW_RESULT_FILE = Path("changelog_workflow_result.json")
 CHANGELOG_WORKFLOW_RESULT_ENV = "CHANGELOG_WORKFLOW_RESULT"
@@ -47,6 +52,8 @@ class ChangelogWorkflowResult(BaseModel):
     breaking_changes: StrictStr
     needs_attention: StrictStr
     source_windows: StrictStr
+    # Provider-reported token usage, one record per LLM response in the run.
+    llm_calls: List[LLMUsage] = Field(default_factory=list)
 
     @model_validator(mode="after")
     def require_changed_artifacts(self) -> "ChangelogWorkflowResult":
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import gzip
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import build_changelog_artifacts as artifacts
+
+SCHEMA_PATH = REPO_ROOT / "changelog_schema" / "announcement-schema.json"
+
+
+def make_entry(entry_id: int, audience: str | None, **overrides: object) -> dict[str, object]:
+    entry: dict[str, object] = {
+        "id": entry_id,
+        "slug": f"entry-{entry_id}",
+        "title": f"Entry {entry_id}",
+        "description": "Description.",
+        "published_at": "2026-06-18T15:04:53Z",
+        "published": True,
+        "labels": [],
+        "should_highlight": False,
+    }
+    if audience is not None:
+        entry["audience"] = audience
+    entry.update(overrides)
+    return entry
+
+
+ENTRIES = [
+    make_entry(5, "pro"),
+    make_entry(4, "oss", labels=["feature"]),
+    make_entry(3, None),
+    make_entry(2, "all", published=False),
+    make_entry(1, "oss"),
+]
+
+
+def build(tmp_path: Path, entries: list[dict[str, object]] = ENTRIES) -> artifacts.ArtifactManifest:
+    changelog_path = tmp_path / "changelog.json"
+    changelog_path.write_text(json.dumps(entries, indent=2) + "\n")
+    return artifacts.build_changelog_artifacts(
+        changelog_path=changelog_path,
+        schema_path=SCHEMA_PATH,
+        output_dir=tmp_path / "out",
+    )
+
+
+def read_json(path: Path) -> object:
+    return json.loads(path.read_bytes())
+
+
+def test_audience_splits_hold_published_entries_without_default_fields(tmp_path: Path) -> None:
+    build(tmp_path)
+    out = tmp_path / "out"
+
+    assert read_json(out / "changelog.min.json") == ENTRIES
+    assert [entry["id"] for entry in read_json(out / "changelog.oss.min.json")] == [4, 3, 1]
+    assert [entry["id"] for entry in read_json(out / "changelog.pro.min.json")] == [5, 3]
+    assert [entry["id"] for entry in read_json(out / "changelog.all.min.json")] == [3]
+    assert read_json(out / "changelog.oss.min.json")[0] == {
+        "id": 4,
+        "slug": "entry-4",
+        "title": "Entry 4",
+        "description": "Description.",
+        "published_at": "2026-06-18T15:04:53Z",
+        "audience": "oss",
+        "labels": ["feature"],
+    }
+
+
+def test_manifest_hashes_and_sizes_match_the_files(tmp_path: Path) -> None:
+    manifest = build(tmp_path)
+    out = tmp_path / "out"
+
+    assert read_json(out / artifacts.MANIFEST_FILE) == manifest.model_dump(mode="json")
+    for artifact in manifest.files.values():
+        raw = (out / artifact.path).read_bytes()
+        assert (artifact.sha256, artifact.bytes) == (artifacts.sha256_hex(raw), len(raw))
+        gzip_entry = artifact.encodings["gzip"]
+        assert gzip.decompress((out / gzip_entry.path).read_bytes()) == raw
+        assert gzip_entry.bytes == (out / gzip_entry.path).stat().st_size
+
+
+def test_brotli_variants_decompress_to_the_minified_json(tmp_path: Path) -> None:
+    brotli = pytest.importorskip("brotli")
+    manifest = build(tmp_path)
+    out = tmp_path / "out"
+
+    for artifact in manifest.files.values():
+        compressed = (out / artifact.encodings["br"].path).read_bytes()
+        assert brotli.decompress(compressed) == (out / artifact.path).read_bytes()
+
+
+def test_rebuilds_are_deterministic_and_skip_unchanged_files(tmp_path: Path) -> None:
+    first = build(tmp_path)
+    pro_split = tmp_path / "out" / "changelog.pro.min.json"
+    pro_mtime = pro_split.stat().st_mtime_ns
+
+    second = build(tmp_path, [make_entry(6, "oss"), *ENTRIES])
+
+    assert build(tmp_path, [make_entry(6, "oss"), *ENTRIES]) == second
+    assert second.files["changelog.pro.min.json"] == first.files["changelog.pro.min.json"]
+    assert second.files["changelog.oss.min.json"].sha256 != first.files["changelog.oss.min.json"].sha256
+    assert pro_split.stat().st_mtime_ns == pro_mtime
+
+
+def test_deltas_hold_entries_above_each_recent_id_and_head_describes_them(tmp_path: Path) -> None:
+    changelog_path = tmp_path / "changelog.json"
+    changelog_path.write_text(json.dumps(ENTRIES, indent=2) + "\n")
+    manifest = artifacts.build_changelog_artifacts(
+        changelog_path=changelog_path,
+        schema_path=SCHEMA_PATH,
+        output_dir=tmp_path / "out",
+        delta_window=3,
+    )
+    out = tmp_path / "out"
+
+    assert [entry["id"] for entry in read_json(out / "delta" / "since-4.min.json")] == [5]
+    assert [entry["id"] for entry in read_json(out / "delta" / "since-2.min.json")] == [5, 4, 3]
+    assert not (out / "delta" / "since-1.min.json").exists()
+    assert "delta/since-3.min.json" in manifest.files
+    assert read_json(out / artifacts.HEAD_FILE) == {
+        "version": artifacts.HEAD_VERSION,
+        "max_id": 5,
+        "published_at": "2026-06-18T15:04:53Z",
+        "entries": 5,
+        "source_sha256": manifest.source_sha256,
+        "delta_ids": [4, 3, 2],
+        "delta_floor_published_at": "2026-06-18T15:04:53Z",
+    }
+
+
+def test_rebuild_removes_deltas_that_left_the_window(tmp_path: Path) -> None:
+    changelog_path = tmp_path / "changelog.json"
+    out = tmp_path / "out"
+    for entries in (ENTRIES, [make_entry(6, "oss"), *ENTRIES]):
+        changelog_path.write_text(json.dumps(entries, indent=2) + "\n")
+        artifacts.build_changelog_artifacts(
+            changelog_path=changelog_path,
+            schema_path=SCHEMA_PATH,
+            output_dir=out,
+            delta_window=2,
+        )
+
+    assert sorted(path.name for path in (out / "delta").iterdir() if path.suffix == ".json") == [
+        "since-4.min.json",
+        "since-5.min.json",
+    ]
+    assert not (out / "delta" / "since-3.min.json.gz").exists()
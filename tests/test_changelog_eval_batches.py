@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_llm_batches as batches
+from scripts import changelog_llm_providers as providers
+from scripts import changelog_llm_stub_server as stub
+from scripts import evaluate_changelog_llms as evaluator
+from scripts.changelog_llm_outputs import GroupedChangelogOutput
+
+FIXTURES_DIR = REPO_ROOT / "tests" / "fixtures" / "changelog-evals"
+FIXTURE_ID = "synthetic-oss-small"
+PROVIDERS = [providers.LLM_PROVIDER_ANTHROPIC, providers.LLM_PROVIDER_OPENAI]
+
+
+def prepare(tmp_path: Path, provider: providers.LLMProviderName) -> evaluator.BatchManifest:
+    return evaluator.prepare_batch_eval(
+        fixtures_dir=FIXTURES_DIR,
+        batch_dir=tmp_path / "batch",
+        fixture_ids={FIXTURE_ID},
+        live_candidates=[evaluator.parse_live_candidate(f"{provider}:stub-model:Stub {provider}")],
+    )
+
+
+def run_against_stub(tmp_path: Path, provider: providers.LLMProviderName, **overrides: object) -> Path:
+    config = stub.stub_config_from_fixture(
+        FIXTURES_DIR / f"{FIXTURE_ID}.json",
+        candidate_id="fake-claude-baseline",
+        **overrides,
+    )
+    results_path = tmp_path / "batch" / f"results-{provider}.jsonl"
+    with stub.LLMStubServer(config) as server:
+        batches.run_batch_locally(
+            provider=provider,
+            client=evaluator.build_batch_sdk_client(
+                provider,
+                f"{server.url}/v1" if provider == providers.LLM_PROVIDER_OPENAI else server.url,
+            ),
+            requests_path=tmp_path / "batch" / evaluator.batch_requests_file(provider),
+            results_path=results_path,
+            max_workers=1,
+        )
+    return results_path
+
+
+@pytest.mark.parametrize("provider", PROVIDERS)
+def test_prepare_writes_provider_batch_requests_without_calls(tmp_path: Path, provider: providers.LLMProviderName) -> None:
+    manifest = prepare(tmp_path, provider)
+
+    lines = batches.read_jsonl(tmp_path / "batch" / evaluator.batch_requests_file(provider))
+    # The fixture has no breaking PRs, so there is no breaking-changes request.
+    assert [entry.call_name for entry in manifest.requests] == ["grouped_changelog_entries", "release_notes_body"]
+    assert [line["custom_id"] for line in lines] == ["req-00001", "req-00002"]
+    if provider == providers.LLM_PROVIDER_OPENAI:
+        assert lines[0]["url"] == "/v1/responses"
+        assert lines[0]["body"]["text"]["format"]["name"] == "GroupedChangelogOutput"
+    else:
+        assert lines[0]["params"]["output_config"]["format"]["type"] == "json_schema"
+        assert "betas" not in lines[0]["params"]
+
+
+def test_openai_text_format_is_a_strict_json_schema() -> None:
+    text_format = batches.openai_text_format(GroupedChangelogOutput)
+    schema = text_format["schema"]
+    entry = schema["$defs"]["GroupedChangelogEntry"]
+
+    assert (text_format["type"], text_format["strict"], text_format["name"]) == (
+        "json_schema",
+        True,
+        "GroupedChangelogOutput",
+    )
+    assert schema["additionalProperties"] is False and schema["required"] == ["entries"]
+    assert entry["additionalProperties"] is False
+    assert entry["required"] == list(entry["properties"])
+    assert schema["properties"]["entries"]["items"] == {"$ref": "#/$defs/GroupedChangelogEntry"}
+
+
+@pytest.mark.parametrize("provider", PROVIDERS)
+def test_local_batch_results_pass_the_normal_hard_checks(tmp_path: Path, provider: providers.LLMProviderName) -> None:
+    prepare(tmp_path, provider)
+    results_path = run_against_stub(tmp_path, provider)
+
+    summary = evaluator.ingest_batch_eval(
+        batch_dir=tmp_path / "batch",
+        results_paths=[results_path],
+        output_root=tmp_path / "eval-results",
+        run_id="batch",
+    )
+
+    assert (summary.pass_count, summary.fail_count) == (1, 0)
+    result = summary.results[0]
+    assert result.provider_call_count == 2
+    assert all(call.output_tokens for call in result.provider_calls)
+
+
+def test_failed_batch_line_fails_its_hard_gate(tmp_path: Path) -> None:
+    provider = providers.LLM_PROVIDER_OPENAI
+    prepare(tmp_path, provider)
+    results_path = run_against_stub(tmp_path, provider, scripted_faults=["incomplete"])
+
+    summary = evaluator.ingest_batch_eval(
+        batch_dir=tmp_path / "batch",
+        results_paths=[results_path],
+        output_root=tmp_path / "eval-results",
+        run_id="batch",
+    )
+
+    result = summary.results[0]
+    assert result.hard_gate_status == "fail"
+    assert "was incomplete" in result.errors[0]
+
+
+def test_missing_result_lines_are_reported(tmp_path: Path) -> None:
+    prepare(tmp_path, providers.LLM_PROVIDER_OPENAI)
+    empty = tmp_path / "empty.jsonl"
+    empty.write_text("")
+
+    summary = evaluator.ingest_batch_eval(
+        batch_dir=tmp_path / "batch",
+        results_paths=[empty],
+        output_root=tmp_path / "eval-results",
+        run_id="batch",
+    )
+
+    assert summary.results[0].errors == ["No batch result for req-00001 (grouped_changelog_entries)."]
+
+
+def test_malformed_result_file_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "results.jsonl"
+    path.write_text(json.dumps({"custom_id": "req-00001"}) + "\n{not json\n")
+
+    with pytest.raises(batches.LLMBatchError, match="results.jsonl:2"):
+        batches.read_jsonl(path)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import build_changelog_artifacts as artifacts
+from scripts.changelog_feed_reader import ChangelogFeedReader
+
+SCHEMA_PATH = REPO_ROOT / "changelog_schema" / "announcement-schema.json"
+
+
+def make_entry(entry_id: int, published_at: str) -> dict[str, object]:
+    return {
+        "id": entry_id,
+        "slug": f"entry-{entry_id}",
+        "title": f"Entry {entry_id}",
+        "description": "Description.",
+        "published_at": published_at,
+        "published": True,
+        "audience": "all",
+        "labels": [],
+        "should_highlight": False,
+    }
+
+
+ENTRIES = [make_entry(entry_id, f"2026-06-{entry_id:02d}T12:00:00Z") for entry_id in range(10, 0, -1)]
+
+
+def build_reader(
+    tmp_path: Path,
+    delta_window: int = 3,
+    entries: list[dict[str, object]] = ENTRIES,
+) -> ChangelogFeedReader:
+    changelog_path = tmp_path / "changelog.json"
+    changelog_path.write_text(json.dumps(entries, indent=2) + "\n")
+    artifacts.build_changelog_artifacts(
+        changelog_path=changelog_path,
+        schema_path=SCHEMA_PATH,
+        output_dir=tmp_path / "out",
+        delta_window=delta_window,
+    )
+    return ChangelogFeedReader.from_location(str(tmp_path / "out"))
+
+
+def test_up_to_date_client_fetches_only_the_head(tmp_path: Path) -> None:
+    reader = build_reader(tmp_path)
+
+    assert reader.entries_since_id(10) == []
+    assert reader.entries_since("2026-06-10T12:00:00Z") == []
+    assert reader.fetched == [artifacts.HEAD_FILE, artifacts.HEAD_FILE]
+
+
+def test_recent_client_reads_the_smallest_covering_delta(tmp_path: Path) -> None:
+    reader = build_reader(tmp_path)
+
+    assert [entry["id"] for entry in reader.entries_since_id(8)] == [10, 9]
+    assert reader.fetched == [artifacts.HEAD_FILE, "delta/since-8.min.json"]
+
+
+def test_timestamp_inside_the_window_reads_the_oldest_delta(tmp_path: Path) -> None:
+    reader = build_reader(tmp_path)
+
+    assert [entry["id"] for entry in reader.entries_since("2026-06-08T00:00:00Z")] == [10, 9, 8]
+    assert reader.fetched == [artifacts.HEAD_FILE, "delta/since-7.min.json"]
+
+
+def test_entries_published_after_a_higher_id_are_not_missed(tmp_path: Path) -> None:
+    # Entry 27 was written before entry 28 but published after it.
+    entries = [
+        make_entry(28, "2026-03-19T17:11:00Z"),
+        make_entry(27, "2026-03-20T09:37:00Z"),
+        make_entry(26, "2026-03-12T10:00:00Z"),
+    ]
+    reader = build_reader(tmp_path, delta_window=1, entries=entries)
+
+    assert reader.head().published_at == "2026-03-20T09:37:00Z"
+    assert [entry["id"] for entry in reader.entries_since("2026-03-19T20:00:00Z")] == [27]
+    assert [entry["id"] for entry in reader.entries_since("2026-03-19T12:00:00Z")] == [28, 27]
+
+
+def test_clients_older_than_the_window_fall_back_to_the_full_changelog(tmp_path: Path) -> None:
+    reader = build_reader(tmp_path)
+
+    assert [entry["id"] for entry in reader.entries_since_id(5)] == [10, 9, 8, 7, 6]
+    assert [entry["id"] for entry in reader.entries_since("2026-06-06T00:00:00Z")] == [10, 9, 8, 7, 6]
+    assert reader.fetched.count("changelog.min.json") == 2
+
+
+def test_poll_with_no_news_downloads_a_few_hundred_bytes(tmp_path: Path) -> None:
+    reader = build_reader(tmp_path, delta_window=artifacts.DELTA_WINDOW)
+
+    reader.entries_since_id(10)
+
+    assert reader.bytes_fetched < 500
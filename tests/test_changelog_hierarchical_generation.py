@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import re
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_entry_builder as entry_builder
+from scripts import changelog_llm_generation as generation
+from scripts.changelog_llm_outputs import (
+    LLM_CALL_BREAKING_CHANGES,
+    LLM_CALL_GROUPED_CHANGELOG_CHUNK,
+    LLM_CALL_GROUPED_CHANGELOG_ENTRIES,
+    LLM_CALL_GROUPED_CHANGELOG_MERGE,
+    LLM_CALL_RELEASE_NOTES_BODY,
+    LLM_CALL_RELEASE_NOTES_BODY_CHUNK,
+    LLM_CALL_RELEASE_NOTES_BODY_MERGE,
+    BreakingChangesOutput,
+    GroupedChangelogEntry,
+    GroupedChangelogOutput,
+    MarkdownSection,
+)
+from scripts.changelog_llm_providers import LLMOutputValidationError, OpenAIStructuredLLMClient
+
+PR_LINE_PATTERN = re.compile(r"^- #(\d+):", flags=re.MULTILINE)
+PR_LINK_PATTERN = re.compile(r"\[PR #\d+\]\([^)]*\)")
+
+
+def make_pr(number: int, repo: str = "zenml-io/zenml") -> dict[str, Any]:
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "labels": ["release-notes"],
+        "url": f"https://github.com/{repo}/pull/{number}",
+        "body": f"Release-note body for PR {number}",
+        "repo": repo,
+    }
+
+
+def make_prs(count: int) -> list[dict[str, Any]]:
+    return [make_pr(number) for number in range(1, count + 1)]
+
+
+def link(number: int) -> str:
+    return f"[PR #{number}](https://github.com/zenml-io/zenml/pull/{number})"
+
+
+class ScriptedClient:
+    """Fake structured-output client that answers from the prompt contents."""
+
+    def __init__(self, respond: Callable[[str, str], Any]) -> None:
+        self.respond = respond
+        self.calls: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    def parse_structured_output(
+        self,
+        *,
+        prompt: str,
+        output_model: type[Any],
+        max_output_tokens: int,
+        call_name: str,
+        stream_validator: Any = None,
+    ) -> Any:
+        with self._lock:
+            self.calls.append((call_name, prompt))
+        return self.respond(call_name, prompt)
+
+
+def grouped_response(call_name: str, prompt: str) -> GroupedChangelogOutput:
+    numbers = [int(number) for number in PR_LINE_PATTERN.findall(prompt)]
+    if "partial groups from every batch" in prompt:
+        assert call_name == LLM_CALL_GROUPED_CHANGELOG_MERGE
+        return GroupedChangelogOutput(
+            entries=[
+                GroupedChangelogEntry(
+                    title="Merged release",
+                    description="Everything in one place.",
+                    suggested_labels=[],
+                    pr_numbers=numbers,
+                )
+            ]
+        )
+    assert call_name in {LLM_CALL_GROUPED_CHANGELOG_ENTRIES, LLM_CALL_GROUPED_CHANGELOG_CHUNK}
+    # Chunk pre-grouping drops its last PR to exercise the leftover safety net.
+    return GroupedChangelogOutput(
+        entries=[
+            GroupedChangelogEntry(
+                title="Chunk group",
+                description="Chunk description.",
+                suggested_labels=[],
+                pr_numbers=numbers[:-1],
+            )
+        ]
+    )
+
+
+def test_chunk_prs_respects_count_and_size_bounds() -> None:
+    prs = make_prs(10)
+
+    assert [len(chunk) for chunk in generation.chunk_prs(prs, max_prs=4)] == [4, 4, 2]
+    assert [len(chunk) for chunk in generation.chunk_prs(prs, max_prs=100, max_chars=300)] == [2] * 5
+    assert generation.chunk_prs(prs, max_prs=100) == [prs]
+
+
+def test_small_release_keeps_single_grouped_call() -> None:
+    client = ScriptedClient(grouped_response)
+
+    generation.generate_grouped_changelog_output(
+        client=client,
+        prs=make_prs(3),
+        source_repo="zenml-io/zenml",
+    )
+
+    assert len(client.calls) == 1
+    assert client.calls[0][0] == LLM_CALL_GROUPED_CHANGELOG_ENTRIES
+    assert "partial groups from every batch" not in client.calls[0][1]
+
+
+def test_large_release_grouping_is_map_reduced_and_accounts_for_every_pr() -> None:
+    prs = make_prs(150)
+    client = ScriptedClient(grouped_response)
+
+    output = generation.generate_grouped_changelog_output(
+        client=client,
+        prs=prs,
+        source_repo="zenml-io/zenml",
+        max_chunk_prs=40,
+    )
+
+    assert len(client.calls) == 5
+    assert [call_name for call_name, _ in client.calls] == [LLM_CALL_GROUPED_CHANGELOG_CHUNK] * 4 + [
+        LLM_CALL_GROUPED_CHANGELOG_MERGE
+    ]
+    merge_prompt = client.calls[-1][1]
+    assert "partial groups from every batch" in merge_prompt
+    assert "Other changes" in merge_prompt
+    assert "Release-note body for PR" not in merge_prompt
+    entries = entry_builder.build_grouped_changelog_entries(
+        grouped_output=output,
+        prs=prs,
+        source_repo="zenml-io/zenml",
+        published_at="2026-06-02T10:00:00Z",
+        starting_id=1,
+    )
+    assert len(entries) == 1
+
+
+def test_large_release_breaking_bullets_are_concatenated_in_order() -> None:
+    prs = make_prs(5)
+
+    def respond(call_name: str, prompt: str) -> BreakingChangesOutput:
+        assert call_name == LLM_CALL_BREAKING_CHANGES
+        numbers = [int(number) for number in PR_LINE_PATTERN.findall(prompt)]
+        return BreakingChangesOutput(bullets=[f"Rename the API {link(number)}" for number in numbers])
+
+    client = ScriptedClient(respond)
+
+    output, warnings = generation.generate_breaking_changes_output(
+        client=client,
+        breaking_prs=prs,
+        source_repo="zenml-io/zenml",
+        include_pr_links=True,
+        max_chunk_prs=2,
+    )
+
+    assert len(client.calls) == 3
+    assert output.bullets == [f"Rename the API {link(number)}" for number in range(1, 6)]
+    assert warnings == []
+
+
+def test_large_release_body_merges_validated_chunk_drafts() -> None:
+    prs = make_prs(6)
+
+    def respond(call_name: str, prompt: str) -> MarkdownSection:
+        if "Merge these drafts" in prompt:
+            assert call_name == LLM_CALL_RELEASE_NOTES_BODY_MERGE
+            links = " ".join(dict.fromkeys(PR_LINK_PATTERN.findall(prompt)))
+            return MarkdownSection(content=f"#### Everything\n\n- **All of it**: {links}")
+        assert call_name in {LLM_CALL_RELEASE_NOTES_BODY, LLM_CALL_RELEASE_NOTES_BODY_CHUNK}
+        numbers = re.findall(r"\(#(\d+)\)", prompt)
+        return MarkdownSection(content=" ".join(link(int(number)) for number in numbers))
+
+    client = ScriptedClient(respond)
+
+    output, _ = generation.generate_release_notes_body_output(
+        client=client,
+        prs=prs,
+        source_repo="zenml-io/zenml",
+        include_pr_links=True,
+        max_chunk_prs=2,
+    )
+
+    assert len(client.calls) == 4
+    assert all(link(number) in output.content for number in range(1, 7))
+
+
+def test_invalid_chunk_draft_fails_before_merge_call() -> None:
+    def respond(call_name: str, prompt: str) -> MarkdownSection:
+        return MarkdownSection(content="## 1.0.0\n\nNo links here.")
+
+    client = ScriptedClient(respond)
+
+    with pytest.raises(LLMOutputValidationError):
+        generation.generate_release_notes_body_output(
+            client=client,
+            prs=make_prs(4),
+            source_repo="zenml-io/zenml",
+            include_pr_links=True,
+            max_chunk_prs=2,
+            max_workers=1,
+        )
+
+    assert all("Merge these drafts" not in prompt for _, prompt in client.calls)
+
+
+def test_chunk_and_merge_calls_route_to_their_parent_call_model() -> None:
+    client = OpenAIStructuredLLMClient(
+        object(),
+        model="default-model",
+        models_by_call={LLM_CALL_GROUPED_CHANGELOG_ENTRIES: "grouped-model", LLM_CALL_RELEASE_NOTES_BODY: "body-model"},
+    )
+
+    assert client.model_for_call(LLM_CALL_GROUPED_CHANGELOG_CHUNK) == "grouped-model"
+    assert client.model_for_call(LLM_CALL_GROUPED_CHANGELOG_MERGE) == "grouped-model"
+    assert client.model_for_call(LLM_CALL_RELEASE_NOTES_BODY_MERGE) == "body-model"
+    assert client.model_for_call(LLM_CALL_BREAKING_CHANGES) == "default-model"
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_incremental_validation as incremental
+from scripts.changelog_entry_builder import with_unique_slugs
+from scripts.changelog_schema_validation import ChangelogSchemaError
+
+SCHEMA_PATH = REPO_ROOT / "changelog_schema" / "announcement-schema.json"
+
+
+def make_entry(entry_id: int, **overrides: object) -> dict[str, object]:
+    entry: dict[str, object] = {
+        "id": entry_id,
+        "slug": f"entry-{entry_id}",
+        "title": f"Entry {entry_id}",
+        "description": "Description.",
+        "published_at": "2026-06-18T15:04:53Z",
+    }
+    entry.update(overrides)
+    return entry
+
+
+def dump(entries: list[dict[str, object]]) -> str:
+    return json.dumps(entries, indent=2) + "\n"
+
+
+def update(new_entries, existing_entries, index=None) -> incremental.ChangelogIndex:
+    return incremental.validate_changelog_update(
+        new_entries=new_entries,
+        load_existing_entries=lambda: existing_entries,
+        existing_text=dump(existing_entries),
+        updated_text=dump(new_entries + existing_entries),
+        schema_path=SCHEMA_PATH,
+        index=index,
+    )
+
+
+def test_matching_index_skips_revalidating_existing_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    existing = [make_entry(2), make_entry(1)]
+    index = update(existing, [])
+    checked: list[int] = []
+    real_validate = incremental.validate_changelog_data
+
+    def counting_validate(entries, schema_path):
+        checked.append(len(entries))
+        real_validate(entries, schema_path)
+
+    monkeypatch.setattr(incremental, "validate_changelog_data", counting_validate)
+
+    next_index = update([make_entry(3)], existing, index)
+    update([make_entry(3)], existing, index.model_copy(update={"content_sha256": "stale"}))
+
+    assert checked == [1, 2, 1]
+    assert next_index.ids == [3, 2, 1]
+    assert next_index.content_sha256 == incremental.text_sha256(dump([make_entry(3)] + existing))
+
+
+def test_new_entries_must_keep_ids_and_slugs_unique_and_descending() -> None:
+    existing = [make_entry(2), make_entry(1)]
+    index = update(existing, [])
+
+    with pytest.raises(incremental.ChangelogInvariantError) as exc_info:
+        update([make_entry(4, slug="entry-1"), make_entry(5), make_entry(2)], existing, index)
+
+    assert exc_info.value.details == [
+        "Entry 0 reuses slug 'entry-1'.",
+        "Entry 1 (id 5) is not below the previous id 4.",
+        "Entry 2 reuses id 2.",
+        "Entry 2 reuses slug 'entry-2'.",
+        "New entries must have ids above the newest existing id 2.",
+    ]
+
+
+def test_repeated_titles_get_suffixed_slugs_that_pass_the_invariants() -> None:
+    existing = [make_entry(2, slug="faster-runs"), make_entry(1, slug="faster-runs-2")]
+    index = update(existing, [])
+    new_entries = [make_entry(4, slug="faster-runs"), make_entry(3, slug="faster-runs")]
+
+    unique = with_unique_slugs(new_entries, incremental.existing_changelog_slugs(dump(existing), index))
+
+    assert [entry["slug"] for entry in unique] == ["faster-runs-3", "faster-runs-4"]
+    assert new_entries[0]["slug"] == "faster-runs"
+    assert update(unique, existing, index).slugs[:2] == ["faster-runs-3", "faster-runs-4"]
+
+
+def test_existing_slugs_are_read_from_the_text_when_the_index_is_stale() -> None:
+    existing = [make_entry(2), make_entry(1)]
+    stale = update([make_entry(9)], [])
+
+    assert incremental.existing_changelog_slugs(dump(existing), stale) == ["entry-2", "entry-1"]
+    assert incremental.existing_changelog_slugs(dump(existing)) == ["entry-2", "entry-1"]
+
+
+def test_schema_errors_in_new_entries_still_fail() -> None:
+    with pytest.raises(ChangelogSchemaError, match="audience"):
+        update([make_entry(1, audience="everyone")], [])
+
+
+def test_index_round_trips_and_ignores_unreadable_files(tmp_path: Path) -> None:
+    path = tmp_path / "index.json"
+    index = update([make_entry(1)], [])
+
+    incremental.write_changelog_index(index, path)
+
+    assert incremental.read_changelog_index(path) == index
+    path.write_text("{")
+    assert incremental.read_changelog_index(path) is None
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import io
+import json
+import random
+import re
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import validate_changelog
+from scripts.changelog_json_stream import JSONStreamError, iter_json_array_items
+from scripts.changelog_schema_codegen import benchmark_entries
+
+TRICKY_ITEMS = [
+    {"title": 'Quotes " and braces } ] { [ inside strings', "labels": ["a,b", "\\"]},
+    {"nested": {"list": [1, [2, {"x": None}]], "escaped": "é\\n\\\""}},
+    12345.678e-2,
+    "plain string",
+    True,
+    None,
+    [],
+    {},
+]
+
+
+def items(text: str, chunk_size: int = 7) -> list[tuple[int, int, object]]:
+    return list(iter_json_array_items(io.StringIO(text), chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 16])
+def test_items_survive_every_chunk_boundary(chunk_size: int) -> None:
+    for indent in (None, 2):
+        text = json.dumps(TRICKY_ITEMS, indent=indent)
+
+        assert [item for _, _, item in items(text, chunk_size)] == TRICKY_ITEMS
+
+
+def test_concatenated_arrays_are_read_in_turn() -> None:
+    text = '[{"id": 2}, {"id": 1}]\n[]\n[{"id": 3}]\n'
+
+    assert items(text) == [(0, 0, {"id": 2}), (0, 1, {"id": 1}), (2, 0, {"id": 3})]
+
+
+def test_random_documents_round_trip() -> None:
+    rng = random.Random(5)
+    alphabet = 'ab"\\{}[],: \né'
+    for _ in range(200):
+        document = [
+            {"id": rng.randint(-5, 10**6), "text": "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))}
+            for _ in range(rng.randint(0, 6))
+        ]
+
+        assert [item for _, _, item in items(json.dumps(document), rng.randint(1, 9))] == document
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [
+        ("", "found no data"),
+        ('{"id": 1}', "Expected '['"),
+        ('[{"id": 1},]', "Expecting value"),
+        ('[{"id": 1} {"id": 2}]', "Expected ',' or ']' after array item 0"),
+        ('[{"id": 1}', "Expected ',' or ']' after array item 0, found the end of the input"),
+        ('[{"id": 1, "title": "unterminated}]', "Invalid JSON"),
+        ("[1,", "Unterminated JSON array"),
+    ],
+)
+def test_malformed_input_is_reported_where_it_is_reached(text: str, message: str) -> None:
+    with pytest.raises(JSONStreamError, match=re.escape(message)):
+        items(text)
+
+
+def test_items_before_a_syntax_error_are_still_yielded() -> None:
+    reader = iter_json_array_items(io.StringIO('[{"id": 2}, {"id": 1}, oops]'), chunk_size=4)
+
+    assert next(reader) == (0, 0, {"id": 2})
+    assert next(reader) == (0, 1, {"id": 1})
+    with pytest.raises(JSONStreamError) as error:
+        next(reader)
+    assert error.value.offset == len('[{"id": 2}, {"id": 1}, ')
+
+
+def peak_memory(argv: list[str]) -> int:
+    tracemalloc.start()
+    try:
+        assert validate_changelog.main(argv) == 0
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_streaming_validation_memory_stays_flat(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    small, large = tmp_path / "small.json", tmp_path / "large.json"
+    small.write_text(json.dumps(benchmark_entries(500), indent=2))
+    large.write_text(json.dumps(benchmark_entries(5_000), indent=2))
+    validate_changelog.main([str(small), "--stream"])  # compile the validators outside the measurement
+
+    streamed_small = peak_memory([str(small), "--stream"])
+    streamed_large = peak_memory([str(large), "--stream"])
+    whole_large = peak_memory([str(large)])
+
+    assert streamed_large < streamed_small * 1.5
+    assert streamed_large * 10 < whole_large
+    assert "Changelog validation passed (5000 entries)" in capsys.readouterr().out
+
+
+def test_fail_fast_stops_at_the_first_invalid_entry(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    entries = benchmark_entries(5)
+    entries[1]["audience"] = "everyone"
+    entries[3]["audience"] = "nobody"
+    changelog_path = tmp_path / "changelog.json"
+    changelog_path.write_text(json.dumps(entries))
+
+    assert validate_changelog.main([str(changelog_path), "--fail-fast"]) == 1
+
+    output = capsys.readouterr().out
+    assert "'everyone' is not one of" in output and "nobody" not in output
+    assert "at: [1, 'audience']" in output
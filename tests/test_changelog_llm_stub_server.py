@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_llm_providers as providers
+from scripts import changelog_llm_stub_server as stub
+from scripts.changelog_llm_outputs import GroupedChangelogOutput, MarkdownSection
+
+FIXTURE_PATH = REPO_ROOT / "tests" / "fixtures" / "changelog-evals" / "synthetic-oss-small.json"
+PROVIDERS = [providers.LLM_PROVIDER_ANTHROPIC, providers.LLM_PROVIDER_OPENAI]
+
+
+def make_config(**overrides: object) -> stub.StubServerConfig:
+    return stub.stub_config_from_fixture(FIXTURE_PATH, candidate_id="fake-claude-baseline", **overrides)
+
+
+def parse_body(client: providers.StructuredLLMClient, *, stream: bool) -> MarkdownSection:
+    return client.parse_structured_output(
+        prompt="Write the release notes body.",
+        output_model=MarkdownSection,
+        max_output_tokens=500,
+        call_name="release_notes_body",
+        stream_validator=(lambda text: None) if stream else None,
+    )
+
+
+def test_parse_latency_accepts_known_distributions() -> None:
+    assert stub.parse_latency("fixed:0.25") == stub.LatencyDistribution(kind="fixed", params=(0.25,))
+    assert stub.parse_latency("uniform:0.1:0.8").params == (0.1, 0.8)
+    assert stub.parse_latency("lognormal:0.4:0.5").kind == "lognormal"
+    with pytest.raises(argparse.ArgumentTypeError):
+        stub.parse_latency("uniform:0.1")
+    with pytest.raises(argparse.ArgumentTypeError):
+        stub.parse_latency("pareto:1")
+
+
+@pytest.mark.parametrize("provider", PROVIDERS)
+@pytest.mark.parametrize("stream", [False, True])
+def test_real_clients_parse_replayed_fixture_outputs(provider: providers.LLMProviderName, stream: bool) -> None:
+    config = make_config()
+
+    with stub.LLMStubServer(config) as server:
+        output = parse_body(stub.build_stub_client(provider, server.url), stream=stream)
+        stats = server.stats
+
+    assert output.content == config.outputs["release_notes_body"]["content"]
+    assert stats.completed == 1
+    assert stats.streamed == int(stream)
+    usage = providers.last_llm_usage()
+    assert usage is not None and usage.output_tokens > 0
+
+
+@pytest.mark.parametrize("provider", PROVIDERS)
+def test_scripted_rate_limit_is_retried_with_server_retry_after(provider: providers.LLMProviderName) -> None:
+    config = make_config(scripted_faults=["rate_limit", "server_error"], retry_after_seconds=0)
+    providers.reset_llm_retry_budget(30)
+
+    with stub.LLMStubServer(config) as server:
+        client = stub.build_stub_client(provider, server.url)
+        output = providers.llm_retryable()(lambda: parse_body(client, stream=False))()
+        stats = server.stats
+
+    assert output.content
+    assert (stats.requests, stats.rate_limited, stats.server_errors, stats.completed) == (3, 1, 1, 1)
+
+
+@pytest.mark.parametrize("provider", PROVIDERS)
+@pytest.mark.parametrize("stream", [False, True])
+@pytest.mark.parametrize(("fault", "message"), [("refusal", "was refused"), ("incomplete", "was incomplete")])
+def test_refusal_and_incomplete_responses_are_not_retried(
+    provider: providers.LLMProviderName,
+    stream: bool,
+    fault: stub.StubFault,
+    message: str,
+) -> None:
+    with stub.LLMStubServer(make_config(scripted_faults=[fault])) as server:
+        with pytest.raises(providers.LLMProviderNonRetryableError, match=message):
+            parse_body(stub.build_stub_client(provider, server.url), stream=stream)
+
+
+def test_unknown_output_schema_is_rejected() -> None:
+    config = make_config()
+    config = config.model_copy(update={"outputs": {"release_notes_body": config.outputs["release_notes_body"]}})
+
+    with stub.LLMStubServer(config) as server:
+        client = stub.build_stub_client(providers.LLM_PROVIDER_OPENAI, server.url)
+        with pytest.raises(Exception, match="No stub output for schema 'GroupedChangelogOutput'"):
+            client.parse_structured_output(
+                prompt="Group these PRs.",
+                output_model=GroupedChangelogOutput,
+                max_output_tokens=500,
+                call_name="grouped_changelog_entries",
+            )
+
+
+def test_load_test_reports_latency_and_fault_counts() -> None:
+    config = make_config(
+        latency=stub.parse_latency("uniform:0:0.01"),
+        scripted_faults=["rate_limit", "rate_limit"],
+        retry_after_seconds=0,
+        seed=7,
+    )
+
+    report = stub.run_load_test(
+        config=config,
+        provider=providers.LLM_PROVIDER_OPENAI,
+        calls=8,
+        concurrency=4,
+        stream=True,
+    )
+
+    assert (report.succeeded, report.failed) == (8, 0)
+    assert report.server.requests == 10
+    assert report.server.rate_limited == 2
+    assert 0 < report.p50_seconds <= report.p95_seconds
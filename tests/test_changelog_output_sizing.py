@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_llm_generation as generation
+from scripts import changelog_output_sizing as sizing
+from scripts.changelog_llm_outputs import LLM_CALL_BREAKING_CHANGES, BreakingChangesOutput, LLMUsage
+from scripts.changelog_llm_providers import LLMOutputIncompleteError
+
+MODEL = "gpt-5.4"
+
+
+@pytest.fixture(autouse=True)
+def fresh_sizer() -> Iterator[None]:
+    sizing.reset_output_token_sizer()
+    yield
+    sizing.reset_output_token_sizer()
+
+
+def usage(output_tokens: int, *, input_tokens: int = 1000, truncated: bool = False) -> LLMUsage:
+    return LLMUsage(
+        call_name=LLM_CALL_BREAKING_CHANGES,
+        model=MODEL,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        truncated=truncated,
+    )
+
+
+def sizer_with(*records: LLMUsage) -> sizing.OutputTokenSizer:
+    sizer = sizing.OutputTokenSizer()
+    sizer.record(list(records))
+    return sizer
+
+
+def cap(sizer: sizing.OutputTokenSizer, prompt: str = "short prompt", default: int = 900) -> int:
+    return sizer.max_output_tokens(call_name=LLM_CALL_BREAKING_CHANGES, model=MODEL, prompt=prompt, default=default)
+
+
+def test_default_cap_is_used_until_enough_samples() -> None:
+    sizer = sizer_with(*[usage(100) for _ in range(sizing.OUTPUT_SIZING_MIN_SAMPLES - 1)])
+
+    assert cap(sizer) == 900
+    assert sizer.max_output_tokens(call_name="other", model=MODEL, prompt="x", default=1200) == 1200
+
+
+def test_learned_cap_uses_output_percentile_with_headroom() -> None:
+    sizer = sizer_with(*[usage(tokens) for tokens in (300, 320, 340, 360, 400)])
+
+    assert cap(sizer) == 500
+
+
+def test_learned_cap_scales_with_prompt_size_and_is_clamped() -> None:
+    sizer = sizer_with(*[usage(400, input_tokens=1000) for _ in range(5)])
+
+    # 0.4 output tokens per input token on a 4,000-token prompt.
+    assert cap(sizer, prompt="x" * 16_000) == 2000
+    assert cap(sizer_with(*[usage(10) for _ in range(5)])) == sizing.OUTPUT_SIZING_MIN_TOKENS
+    assert cap(sizer, prompt="x" * 1_000_000) == sizing.OUTPUT_SIZING_MAX_TOKENS
+
+
+def test_truncated_outputs_are_not_recorded() -> None:
+    sizer = sizer_with(*[usage(900, truncated=True) for _ in range(5)], usage(100))
+
+    assert [sample.output_tokens for sample in sizer.history.samples_for(LLM_CALL_BREAKING_CHANGES, MODEL)] == [100]
+
+
+def test_history_round_trips_and_ignores_unreadable_files(tmp_path: Path) -> None:
+    path = tmp_path / "history.json"
+    history = sizer_with(*[usage(tokens) for tokens in range(1, 60)]).history
+
+    sizing.write_output_token_history(history, path)
+    samples = sizing.read_output_token_history(path).samples_for(LLM_CALL_BREAKING_CHANGES, MODEL)
+
+    assert len(samples) == sizing.OUTPUT_HISTORY_MAX_SAMPLES
+    assert samples[-1].output_tokens == 59
+    path.write_text("{not json")
+    assert sizing.read_output_token_history(path).samples == {}
+    assert sizing.read_output_token_history(tmp_path / "missing.json").samples == {}
+
+
+class IncompleteOnceClient:
+    model = MODEL
+
+    def __init__(self, incomplete_calls: int = 1) -> None:
+        self.incomplete_calls = incomplete_calls
+        self.caps: list[int] = []
+
+    def parse_structured_output(self, *, max_output_tokens: int, **kwargs: Any) -> BreakingChangesOutput:
+        self.caps.append(max_output_tokens)
+        if len(self.caps) <= self.incomplete_calls:
+            raise LLMOutputIncompleteError("incomplete", max_output_tokens=max_output_tokens)
+        return BreakingChangesOutput(bullets=["- Removed the old API."])
+
+
+def breaking_pr() -> dict[str, Any]:
+    return {
+        "number": 7,
+        "title": "Remove old API",
+        "labels": ["breaking-change"],
+        "url": "https://github.com/zenml-io/zenml/pull/7",
+        "body": "Removes the old API.",
+        "repo": "zenml-io/zenml",
+    }
+
+
+def test_incomplete_response_is_retried_once_with_escalated_cap() -> None:
+    client = IncompleteOnceClient()
+
+    generation._breaking_changes_chunk_output(client, [breaking_pr()], "zenml-io/zenml", False)
+
+    assert client.caps == [900, 1800]
+
+
+def test_second_incomplete_response_is_raised() -> None:
+    client = IncompleteOnceClient(incomplete_calls=2)
+
+    with pytest.raises(LLMOutputIncompleteError):
+        generation._breaking_changes_chunk_output(client, [breaking_pr()], "zenml-io/zenml", False)
+    assert client.caps == [900, 1800]
+
+
+def test_escalation_from_a_low_learned_cap_reaches_the_call_default() -> None:
+    sizing.OUTPUT_TOKEN_SIZER.record([usage(10) for _ in range(sizing.OUTPUT_SIZING_MIN_SAMPLES)])
+    client = IncompleteOnceClient()
+
+    generation._breaking_changes_chunk_output(client, [breaking_pr()], "zenml-io/zenml", False)
+
+    # Doubling the 256-token learned cap would stay below the 900-token default.
+    assert client.caps == [sizing.OUTPUT_SIZING_MIN_TOKENS, generation.BREAKING_MAX_OUTPUT_TOKENS]
+    assert sizing.escalated_max_output_tokens(600, 900) == 1200
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_pr_bodies as pr_bodies
+from scripts import changelog_prompts as prompts
+
+TEMPLATE_BODY = """## Describe changes
+I implemented/fixed _ to achieve _.
+
+Adds **retry status** to the run summary panel.
+<!-- Describe the motivation here -->
+
+![screenshot](https://example.com/shot.png)
+[![CI](https://img.shields.io/badge/ci-passing-green)](https://ci.example.com)
+<img src="https://example.com/demo.gif" width="400">
+
+```python
+print("debug")
+```
+
+## Pre-requisites
+Please ensure you have done the following:
+- [x] I have read the **CONTRIBUTING.md** document.
+- [ ] I have added tests to cover my changes.
+
+## Types of changes
+<!--- What types of changes does your code introduce? -->
+- [x] Bug fix (non-breaking change which fixes an issue)
+- [ ] New feature
+"""
+
+
+def make_pr(number: int, body: str) -> dict[str, object]:
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "labels": [],
+        "url": f"https://github.com/zenml-io/zenml/pull/{number}",
+        "body": body,
+        "repo": "zenml-io/zenml",
+    }
+
+
+def test_normalize_pr_body_strips_template_noise() -> None:
+    normalized = pr_bodies.normalize_pr_body(TEMPLATE_BODY)
+
+    assert normalized == "Describe changes Adds **retry status** to the run summary panel."
+
+
+def test_normalize_pr_body_keeps_plain_descriptions_and_collapses_whitespace() -> None:
+    body = "Faster run listings.\r\n\r\n- Paginated queries avoid N+1 lookups.\n\n#### Notes\nNo migration needed."
+
+    assert pr_bodies.normalize_pr_body(body) == (
+        "Faster run listings. - Paginated queries avoid N+1 lookups. Notes No migration needed."
+    )
+
+
+def test_normalize_pr_body_drops_unclosed_comments_and_fences() -> None:
+    assert pr_bodies.normalize_pr_body("Useful text\n<!-- never closed") == "Useful text"
+    assert pr_bodies.normalize_pr_body("Useful text\n```\nlog output") == "Useful text"
+
+
+def test_prompt_body_slices_use_normalized_text() -> None:
+    pr = make_pr(101, TEMPLATE_BODY)
+
+    prompt = prompts.build_grouped_changelog_entries_prompt([pr], "zenml-io/zenml")
+
+    assert "Body (truncated): Describe changes Adds **retry status**" in prompt
+    assert "CONTRIBUTING" not in prompt
+    assert "<!--" not in prompt
+
+
+def test_pr_body_normalization_metrics_report_bytes_saved() -> None:
+    metrics = pr_bodies.pr_body_normalization_metrics([make_pr(101, TEMPLATE_BODY), make_pr(102, "")])
+
+    assert metrics[0].raw_bytes == len(TEMPLATE_BODY.encode("utf-8"))
+    assert metrics[0].saved_bytes > metrics[0].normalized_bytes
+    assert metrics[1].saved_bytes == 0
+    summary = pr_bodies.format_pr_body_normalization_summary(metrics)
+    assert summary.startswith("Normalized 2 PR bodies: saved ")
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_pr_digests as digests
+from scripts.changelog_pr_bodies import PR_DIGEST_KEY
+from scripts.changelog_prompts import build_release_notes_body_prompt, render_prompt
+
+LONG_BODY = (
+    "Pipelines can now be scheduled from the dashboard. "
+    "The schedule form supports cron expressions and intervals. "
+    + "Implementation detail. " * 40
+    + "Trailing notes that only the raw body has."
+)
+
+
+def make_pr(number: int, body: str = LONG_BODY, repo: str = "zenml-io/zenml") -> dict[str, Any]:
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "labels": ["release-notes"],
+        "url": f"https://github.com/{repo}/pull/{number}",
+        "body": body,
+        "repo": repo,
+    }
+
+
+def test_extractive_digest_keeps_leading_whole_sentences() -> None:
+    digest = digests.extractive_pr_digest(make_pr(1), max_chars=120)
+
+    assert digest == (
+        "Pipelines can now be scheduled from the dashboard. "
+        "The schedule form supports cron expressions and intervals."
+    )
+    assert digests.extractive_pr_digest(make_pr(2, body="Short body."), max_chars=120) == "Short body."
+    assert digests.extractive_pr_digest(make_pr(3, body="word " * 100), max_chars=22) == "word word word word"
+
+
+def test_digests_are_reused_until_the_body_changes() -> None:
+    cache = digests.PRDigestCache()
+    calls: list[int] = []
+
+    def summarize(pr: dict[str, Any]) -> str:
+        calls.append(pr["number"])
+        return f"Digest of #{pr['number']}"
+
+    stats = digests.PRDigestStats()
+    first = digests.attach_pr_digests([make_pr(1), make_pr(2, body="")], cache, summarize=summarize, stats=stats)
+    digests.attach_pr_digests([make_pr(1)], cache, summarize=summarize, stats=stats)
+    digests.attach_pr_digests([make_pr(1, body="Edited body.")], cache, summarize=summarize, stats=stats)
+    digests.attach_pr_digests([make_pr(1)], cache, summarize=summarize, source="llm", stats=stats)
+
+    assert first[0][PR_DIGEST_KEY] == "Digest of #1"
+    assert PR_DIGEST_KEY not in first[1]
+    assert calls == [1, 1, 1]
+    assert (stats.hits, stats.misses) == (1, 3)
+
+
+def test_cache_round_trips_and_ignores_unreadable_files(tmp_path: Path) -> None:
+    path = tmp_path / "digests.json"
+    cache = digests.PRDigestCache()
+    digests.attach_pr_digests([make_pr(1)], cache)
+
+    digests.write_pr_digest_cache(cache, path)
+
+    assert digests.read_pr_digest_cache(path).get(make_pr(1), "extractive") == cache.get(make_pr(1), "extractive")
+    path.write_text("[]")
+    assert digests.read_pr_digest_cache(path).digests == {}
+
+
+def test_prompts_use_full_bodies_when_they_fit() -> None:
+    pr = digests.attach_pr_digests([make_pr(1)], digests.PRDigestCache())[0]
+
+    prompt = render_prompt(build_release_notes_body_prompt([pr], "zenml-io/zenml", include_pr_links=True))
+
+    assert "Trailing notes that only the raw body has." in prompt
+
+
+def test_prompts_fall_back_to_digests_when_bodies_do_not_fit() -> None:
+    prs = [make_pr(number) for number in range(1, 31)]
+    digested = digests.attach_pr_digests(
+        prs,
+        digests.PRDigestCache(),
+        summarize=lambda pr: f"Digest of #{pr['number']}",
+        source="llm",
+    )
+
+    prompt = render_prompt(build_release_notes_body_prompt(digested, "zenml-io/zenml", include_pr_links=True))
+
+    assert all(f"Digest of #{number}" in prompt for number in range(1, 31))
+    assert "Pipelines can now be scheduled" not in prompt
+
+
+def test_lazy_digests_are_only_made_for_prompts_that_need_them() -> None:
+    cache = digests.PRDigestCache()
+    calls: list[int] = []
+
+    def summarize(pr: dict[str, Any]) -> str:
+        calls.append(pr["number"])
+        return f"Digest of #{pr['number']}"
+
+    stats = digests.PRDigestStats()
+    small = digests.attach_pr_digests([make_pr(1)], cache, summarize=summarize, source="llm", stats=stats, lazy=True)
+    render_prompt(build_release_notes_body_prompt(small, "zenml-io/zenml", include_pr_links=True))
+
+    assert calls == []
+    assert digests.format_pr_digest_summary(stats, "llm") == (
+        "PR digests (llm): 0 reused from cache, 0 made, 1 not needed"
+    )
+
+    stats = digests.PRDigestStats()
+    large = digests.attach_pr_digests(
+        [make_pr(number) for number in range(1, 31)], cache, summarize=summarize, source="llm", stats=stats, lazy=True
+    )
+    prompt = render_prompt(build_release_notes_body_prompt(large, "zenml-io/zenml", include_pr_links=True))
+    render_prompt(build_release_notes_body_prompt(large, "zenml-io/zenml", include_pr_links=True))
+
+    assert "Digest of #30" in prompt
+    assert calls == list(range(1, 31))
+    assert cache.get(make_pr(30), "llm") is not None
+    assert digests.format_pr_digest_summary(stats, "llm") == (
+        "PR digests (llm): 0 reused from cache, 30 made (one LLM call each)"
+    )
+
+
+def test_invalid_digest_summarizer_env_is_rejected(monkeypatch) -> None:
+    monkeypatch.setenv(digests.PR_DIGEST_SUMMARIZER_ENV, "abstractive")
+
+    with pytest.raises(RuntimeError, match="Invalid CHANGELOG_PR_DIGEST_SUMMARIZER='abstractive'"):
+        digests.pr_digest_source_from_env()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_validators as validators
+from scripts.changelog_pr_references import scan_pr_references
+
+
+def make_pr(number: int) -> dict[str, Any]:
+    return {"number": number, "url": f"https://github.com/zenml-io/zenml/pull/{number}"}
+
+
+def regex_missing_markdown_pr_links(text: str, prs: list[dict[str, Any]]) -> list[int]:
+    """The per-PR regex implementation the scanner replaced, kept as the reference."""
+    return [int(pr["number"]) for pr in prs if not re.search(validators.markdown_pr_link_pattern(pr), text)]
+
+
+def regex_contains_forbidden_pr_reference(text: str, prs: list[dict[str, Any]]) -> bool:
+    if re.search(r"https://github\.com/[^\s)]+/pull/\d+", text):
+        return True
+    for pr in prs:
+        number = int(pr["number"])
+        if re.search(rf"\[[^\]]*(?:PR\s*#?\s*{number}|#{number})[^\]]*\]\([^)]*\)", text, flags=re.IGNORECASE):
+            return True
+        if re.search(rf"\bPR\s*#?\s*{number}\b", text, flags=re.IGNORECASE):
+            return True
+        if re.search(rf"(?<![\w/])#{number}\b", text):
+            return True
+    return False
+
+
+def test_scanner_finds_each_reference_shape() -> None:
+    references = scan_pr_references(
+        "See [PR #12](https://github.com/zenml-io/zenml/pull/12), pr 7, issue #30 and [docs #401](x)."
+    )
+
+    assert references.has_pull_url
+    assert references.has_markdown_link(12, "https://github.com/zenml-io/zenml/pull/12")
+    assert not references.has_markdown_link(12, "https://github.com/zenml-io/zenml/pull/13")
+    assert {12, 7, 30, 4, 40, 401} <= {n for n in range(500) if references.mentions(n)}
+    assert not references.mentions(3)
+
+
+def test_validators_ignore_numbers_that_are_not_references() -> None:
+    prs = [make_pr(5), make_pr(42)]
+
+    assert not validators.contains_forbidden_pr_reference("Version 5 ships API/#42 and item#5 fixes.", prs)
+    assert not validators.contains_forbidden_pr_reference("Fixed #05 and #420.", prs)
+    assert validators.contains_forbidden_pr_reference("Fixed (#42).", prs)
+    assert validators.missing_markdown_pr_links("[PR #5](https://github.com/zenml-io/zenml/pull/5)", prs) == [42]
+
+
+def test_scanner_matches_the_per_pr_regex_validators() -> None:
+    rng = random.Random(41)
+    tokens = [
+        "[", "]", "(", ")", "PR", "pr", "#", " ", "  ", "x", "/", "_", "\n", "Fix", "0",
+        "1", "2", "12", "123", "7", "[PR #12](https://github.com/zenml-io/zenml/pull/12)",
+        "https://github.com/zenml-io/zenml/pull/", "https://github.com/zenml-io/zenml/pull/7",
+    ]
+    pr_sets = [[make_pr(1), make_pr(12)], [make_pr(2), make_pr(7)], [make_pr(123)], []]
+
+    for _ in range(3000):
+        text = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 24)))
+        for prs in pr_sets:
+            assert validators.missing_markdown_pr_links(text, prs) == regex_missing_markdown_pr_links(text, prs), text
+            assert validators.contains_forbidden_pr_reference(text, prs) == regex_contains_forbidden_pr_reference(
+                text, prs
+            ), text
+
+
+def test_scanner_handles_bodies_with_hundreds_of_prs() -> None:
+    prs = [make_pr(number) for number in range(10_000, 10_600)]
+    body = "\n".join(
+        f"- Improved step caching for pipelines in area {number % 17} [PR #{pr['number']}]({pr['url']})"
+        for number, pr in enumerate(prs)
+    )
+    prose = "\n".join(f"- Improved step caching for pipelines in area {number % 17}." for number in range(600))
+
+    start = time.perf_counter()
+    missing = validators.missing_markdown_pr_links(body, prs)
+    forbidden_in_links = validators.contains_forbidden_pr_reference(body, prs)
+    forbidden_in_prose = validators.contains_forbidden_pr_reference(prose, prs)
+    elapsed = time.perf_counter() - start
+
+    assert (missing, forbidden_in_links, forbidden_in_prose) == ([], True, False)
+    assert elapsed < 0.5
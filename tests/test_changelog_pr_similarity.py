@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_entry_builder as entry_builder
+from scripts import changelog_pr_similarity as similarity
+from scripts import update_changelog as uc
+from scripts.changelog_llm_generation import generate_release_notes_body_output
+from scripts.changelog_llm_outputs import GroupedChangelogEntry, GroupedChangelogOutput, MarkdownSection
+from scripts.changelog_llm_providers import LLMOutputValidationError
+from scripts.changelog_prompts import (
+    build_grouped_changelog_entries_prompt,
+    build_release_notes_body_prompt,
+    render_prompt,
+)
+
+RUN_TEMPLATES_BODY = (
+    "Adds support for creating run templates from an existing pipeline run and triggering them "
+    "with custom parameters. Templates show up in the new templates tab with their stack."
+)
+
+
+def make_pr(number: int, title: str, body: str, labels: list[str] | None = None, **extra: Any) -> dict[str, Any]:
+    return {
+        "number": number,
+        "title": title,
+        "labels": labels or ["release-notes"],
+        "url": f"https://github.com/zenml-io/zenml/pull/{number}",
+        "body": body,
+        "repo": "zenml-io/zenml",
+        **extra,
+    }
+
+
+def release_prs() -> list[dict[str, Any]]:
+    return [
+        make_pr(1, "Speed up artifact loading", "Artifacts are now loaded lazily from the store."),
+        make_pr(2, "Add run templates", RUN_TEMPLATES_BODY, ["enhancement"]),
+        make_pr(3, "Fix Kubernetes pod cleanup", "Finished pods are deleted after the step completes."),
+        make_pr(
+            4,
+            "[Backport 0.80] Add run templates",
+            RUN_TEMPLATES_BODY + " Docs included.",
+            ["bug"],
+            repo="zenml-io/zenml-dashboard",
+        ),
+    ]
+
+
+def grouping(*numbers: list[int]) -> GroupedChangelogOutput:
+    return GroupedChangelogOutput(
+        entries=[
+            GroupedChangelogEntry(title=f"Group {index}", description="d", suggested_labels=[], pr_numbers=group)
+            for index, group in enumerate(numbers)
+        ]
+    )
+
+
+def test_backport_pair_is_collapsed_into_longest_body_representative() -> None:
+    prs = release_prs()
+
+    collapsed = similarity.collapse_near_duplicate_prs(prs)
+
+    assert [pr["number"] for pr in collapsed] == [1, 4, 3]
+    representative = collapsed[1]
+    assert [member["number"] for member in representative[similarity.COLLAPSED_PRS_KEY]] == [2]
+    assert similarity.COLLAPSED_PRS_KEY not in prs[3]
+    assert [pr["number"] for pr in similarity.expand_collapsed_prs(collapsed)] == [1, 4, 2, 3]
+    assert similarity.format_near_duplicate_summary(collapsed) == (
+        "Collapsed 1 near-duplicate PRs into 1 representatives: #4 covers #2"
+    )
+
+
+def test_distinct_templated_prs_are_not_collapsed() -> None:
+    prs = [make_pr(number, f"PR {number}", f"Release-note body for PR {number}") for number in range(1, 30)]
+
+    assert similarity.collapse_near_duplicate_prs(prs) == prs
+
+
+def test_minhash_estimate_tracks_exact_jaccard() -> None:
+    left = similarity.pr_shingles(make_pr(1, "Add run templates", RUN_TEMPLATES_BODY))
+    right = similarity.pr_shingles(make_pr(2, "Add run templates", RUN_TEMPLATES_BODY + " Docs included."))
+    left_signature = similarity.minhash_signature(left)
+    right_signature = similarity.minhash_signature(right)
+
+    estimate = sum(a == b for a, b in zip(left_signature, right_signature)) / len(left_signature)
+
+    assert abs(estimate - similarity.jaccard_similarity(left, right)) < 0.15
+
+
+def test_grouped_prompt_lists_collapsed_members_under_representative() -> None:
+    prompt = render_prompt(
+        build_grouped_changelog_entries_prompt(similarity.collapse_near_duplicate_prs(release_prs()), "zenml-io/zenml")
+    )
+
+    assert "- #4: [Backport 0.80] Add run templates" in prompt
+    assert "- #2:" not in prompt
+    assert "#2 Add run templates (zenml-io/zenml)" in prompt
+
+
+def test_build_grouped_entries_expands_representative_numbers() -> None:
+    collapsed = similarity.collapse_near_duplicate_prs(release_prs())
+
+    entries = entry_builder.build_grouped_changelog_entries(
+        grouped_output=grouping([4], [1, 3]),
+        prs=collapsed,
+        source_repo="zenml-io/zenml",
+        published_at="2026-06-02T10:00:00Z",
+        starting_id=1,
+    )
+
+    # Labels aggregate over both the representative (#4, bug) and its collapsed member (#2, enhancement).
+    assert entries[0]["labels"] == ["bugfix", "improvement"]
+    expanded = similarity.expand_collapsed_pr_numbers(grouping([4], [1, 3]), collapsed)
+    assert [entry.pr_numbers for entry in expanded.entries] == [[4, 2], [1, 3]]
+
+
+def test_generate_valid_grouped_entries_prompts_only_representatives(monkeypatch) -> None:
+    prompted: list[list[int]] = []
+
+    def fake_generate(prs: list[dict[str, Any]], source_repo: str, retry_feedback: str | None = None):
+        prompted.append([pr["number"] for pr in prs])
+        return grouping([pr["number"] for pr in prs])
+
+    monkeypatch.setattr(uc, "llm_generate_grouped_changelog_entries", fake_generate)
+
+    entries = uc.generate_valid_grouped_changelog_entries(
+        prs=release_prs(),
+        source_repo="zenml-io/zenml",
+        published_at="2026-06-02T10:00:00Z",
+        starting_id=1,
+    )
+
+    assert prompted == [[1, 4, 3]]
+    assert len(entries) == 1
+
+
+def test_release_notes_body_prompt_asks_for_collapsed_member_links() -> None:
+    prompt = render_prompt(
+        build_release_notes_body_prompt(similarity.collapse_near_duplicate_prs(release_prs()), "zenml-io/zenml", True)
+    )
+
+    assert "- [Backport 0.80] Add run templates (#4):" in prompt
+    assert "- Add run templates (#2):" not in prompt
+    assert "#2 Add run templates (https://github.com/zenml-io/zenml/pull/2)" in prompt
+
+
+def test_release_notes_body_validation_requires_collapsed_member_links() -> None:
+    prs = [{**pr, "labels": ["release-notes"]} for pr in release_prs()]
+    collapsed = similarity.collapse_near_duplicate_prs(prs)
+    links = {pr["number"]: f"[PR #{pr['number']}]({pr['url']})" for pr in prs}
+
+    class Client:
+        def __init__(self, content: str) -> None:
+            self.content = content
+
+        def parse_structured_output(self, **_: Any) -> MarkdownSection:
+            return MarkdownSection(content=self.content)
+
+    representatives_only = "\n".join(f"- **Change**: Details {links[number]}." for number in (1, 4, 3))
+    with pytest.raises(LLMOutputValidationError, match="#2"):
+        generate_release_notes_body_output(
+            client=Client(representatives_only),
+            prs=collapsed,
+            source_repo="zenml-io/zenml",
+            include_pr_links=True,
+        )
+
+    every_pr = representatives_only + f"\n- **Backport**: Same change {links[2]}."
+    output, _ = generate_release_notes_body_output(
+        client=Client(every_pr),
+        prs=collapsed,
+        source_repo="zenml-io/zenml",
+        include_pr_links=True,
+    )
+    assert output.content == every_pr
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_pregrouping as pregrouping
+from scripts.changelog_prompts import build_grouped_changelog_entries_prompt, render_prompt
+
+
+def make_pr(number: int, title: str, labels: list[str], repo: str = "zenml-io/zenml") -> dict[str, Any]:
+    return {
+        "number": number,
+        "title": title,
+        "labels": ["release-notes", *labels],
+        "url": f"https://github.com/{repo}/pull/{number}",
+        "body": f"Body for {title}",
+        "repo": repo,
+    }
+
+
+def release_prs() -> list[dict[str, Any]]:
+    return [
+        make_pr(1, "Add Kubernetes step operator retries", ["feature"]),
+        make_pr(2, "Fix Kubernetes pod cleanup", ["bug"]),
+        make_pr(3, "Show artifact lineage graph", ["feature"], repo="zenml-io/zenml-dashboard"),
+        make_pr(4, "Speed up artifact listing", ["enhancement"]),
+        make_pr(5, "Fix Kubernetes orchestrator timeout", ["bug"]),
+        make_pr(6, "Add artifact version tags in the dashboard", ["feature"], repo="zenml-io/zenml-dashboard"),
+    ]
+
+
+def test_title_keywords_drop_stopwords_and_bracket_tags() -> None:
+    assert pregrouping.title_keywords("[Backport 0.80] Fix the Kubernetes pod cleanup for ZenML") == [
+        "kubernetes",
+        "pod",
+        "cleanup",
+    ]
+
+
+def test_hints_cover_every_pr_once_in_at_most_three_groups() -> None:
+    prs = release_prs()
+
+    hints = pregrouping.propose_pr_group_hints(prs)
+
+    assert 2 <= len(hints) <= 3
+    numbers = [number for hint in hints for number in hint.pr_numbers]
+    assert sorted(numbers) == [pr["number"] for pr in prs]
+    assert [2, 5] in [hint.pr_numbers for hint in hints]
+
+
+def test_hints_are_deterministic_and_order_independent_of_dict_state() -> None:
+    first = pregrouping.propose_pr_group_hints(release_prs())
+    second = pregrouping.propose_pr_group_hints([dict(pr) for pr in release_prs()])
+
+    assert first == second
+
+
+def test_single_bucket_release_is_split_on_title_keyword() -> None:
+    prs = [
+        make_pr(1, "Faster artifact upload", ["enhancement"]),
+        make_pr(2, "Faster artifact download", ["enhancement"]),
+        make_pr(3, "Clearer stack deploy errors", ["enhancement"]),
+        make_pr(4, "Quieter stack deploy logs", ["enhancement"]),
+    ]
+
+    hints = pregrouping.propose_pr_group_hints(prs)
+
+    assert [hint.pr_numbers for hint in hints] == [[1, 2], [3, 4]]
+
+
+def test_tiny_releases_get_one_group_or_none() -> None:
+    assert pregrouping.propose_pr_group_hints(release_prs()[:1]) == []
+    assert len(pregrouping.propose_pr_group_hints(release_prs()[:3])) == 1
+
+
+def test_grouped_prompt_carries_hints_only_when_enabled() -> None:
+    prs = release_prs()
+
+    with_hints = render_prompt(build_grouped_changelog_entries_prompt(prs, "zenml-io/zenml"))
+    without_hints = render_prompt(build_grouped_changelog_entries_prompt(prs, "zenml-io/zenml", pregroup_hints=False))
+
+    assert "Suggested starting groups:" in with_hints
+    assert "- Suggested group 1 (" in with_hints
+    assert "Suggested" not in without_hints
+    # The hint stays small relative to the PR list it summarizes.
+    assert len(with_hints) - len(without_hints) < 800
+
+
+def test_pre_pass_is_fast_for_large_releases() -> None:
+    labels = [["feature"], ["bug"], []]
+    repos = ["zenml-io/zenml", "zenml-io/zenml-dashboard"]
+    prs = [
+        make_pr(number, f"Change {number % 17} for component{number % 11}", labels[number % 3], repos[number % 2])
+        for number in range(1, 401)
+    ]
+
+    start = time.perf_counter()
+    hints = pregrouping.propose_pr_group_hints(prs)
+
+    assert time.perf_counter() - start < 1.0
+    assert sum(len(hint.pr_numbers) for hint in hints) == 400
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_prompts as prompts
+
+
+def make_pr(number: int, body: str) -> dict[str, Any]:
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "labels": ["release-notes"],
+        "url": f"https://github.com/zenml-io/zenml/pull/{number}",
+        "body": body,
+        "repo": "zenml-io/zenml",
+    }
+
+
+def test_pack_pr_body_chars_gives_unused_space_to_long_bodies() -> None:
+    prs = [make_pr(1, "x" * 50), make_pr(2, "y" * 5000), make_pr(3, "z" * 100)]
+
+    limits = prompts.pack_pr_body_chars(prs, 1000)
+
+    assert limits == [50, 850, 100]
+
+
+def test_pack_pr_body_chars_caps_each_pr_and_handles_empty_budget() -> None:
+    prs = [make_pr(1, "x" * 5000), make_pr(2, "")]
+
+    assert prompts.pack_pr_body_chars(prs, 100_000, max_chars_per_pr=1500) == [1500, 0]
+    assert prompts.pack_pr_body_chars(prs, -10) == [0, 0]
+
+
+def test_prompt_stays_within_budget_at_any_pr_count() -> None:
+    budget = 3000
+    for count in (2, 20, 60):
+        prs = [make_pr(number, "Detailed change description. " * 200) for number in range(1, count + 1)]
+
+        prompt = prompts.build_grouped_changelog_entries_prompt(
+            prs=prs,
+            source_repo="zenml-io/zenml",
+            input_token_budget=budget,
+        )
+
+        assert len(prompt) <= budget * prompts.CHARS_PER_TOKEN
+        assert all(f"#{number}" in prompt for number in range(1, count + 1))
+
+
+def test_small_release_gets_richer_body_context_than_fixed_slices() -> None:
+    body = "Explains the new behaviour in detail. " * 40
+    prs = [make_pr(1, body), make_pr(2, "Short.")]
+
+    prompt = prompts.build_breaking_changes_prompt(
+        breaking_prs=prs,
+        source_repo="zenml-io/zenml",
+        include_pr_links=True,
+    )
+
+    assert body.strip() in prompt
+
+
+def test_grouped_retry_keeps_instructions_and_pr_list_as_cacheable_prefix() -> None:
+    prs = [make_pr(number, f"Body {number}") for number in range(1, 4)]
+
+    first = prompts.build_grouped_changelog_entries_prompt(prs, "zenml-io/zenml")
+    retry = prompts.build_grouped_changelog_entries_prompt(prs, "zenml-io/zenml", "- PR #2 was missing.")
+
+    first_segments = prompts.prompt_cache_segments(first)
+    retry_segments = prompts.prompt_cache_segments(retry)
+    assert len(first_segments) == 2
+    assert retry_segments[:2] == first_segments
+    assert "PR #2 was missing" in retry_segments[2]
+
+
+def test_instruction_prefix_is_shared_across_pr_chunks() -> None:
+    chunk_a = [make_pr(1, "First change")]
+    chunk_b = [make_pr(2, "Second change"), make_pr(3, "Third change")]
+
+    for build in (
+        lambda prs: prompts.build_breaking_changes_prompt(prs, "zenml-io/zenml", True),
+        lambda prs: prompts.build_release_notes_body_prompt(prs, "zenml-io/zenml", True),
+    ):
+        prefix_a = prompts.prompt_cache_segments(build(chunk_a))[0]
+        prefix_b = prompts.prompt_cache_segments(build(chunk_b))[0]
+        assert prefix_a == prefix_b
+        assert "#1" not in prefix_a
+
+
+def test_render_prompt_drops_cache_markers() -> None:
+    prompt = prompts.join_prompt_segments("Instructions", "", "PR list")
+
+    assert prompts.render_prompt(prompt) == "Instructions\n\nPR list"
+    assert prompts.PROMPT_CACHE_BOUNDARY not in prompts.render_prompt(prompt)
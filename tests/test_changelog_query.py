@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_query
+from scripts.changelog_schema_validation import ChangelogSchemaError
+
+SCHEMA_PATH = REPO_ROOT / "changelog_schema" / "announcement-schema.json"
+AUDIENCES = ["oss", "pro", "all", None]
+LABELS = ["bugfix", "deprecation", "improvement", "feature"]
+
+
+@pytest.fixture(autouse=True)
+def query_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(changelog_query.QUERY_CACHE_DIR_ENV, str(cache_dir))
+    return cache_dir
+
+
+def random_entries(count: int, seed: int = 7) -> list[dict[str, object]]:
+    rng = random.Random(seed)
+    entries = []
+    for entry_id in range(count, 0, -1):
+        entry: dict[str, object] = {
+            "id": entry_id,
+            "slug": f"entry-{entry_id}",
+            "title": f"Entry {entry_id}",
+            "description": "Description.",
+            "published_at": f"2026-{rng.randint(1, 6):02d}-{rng.randint(1, 28):02d}T12:00:00Z",
+        }
+        if (audience := rng.choice(AUDIENCES)) is not None:
+            entry["audience"] = audience
+        if rng.random() < 0.7:
+            entry["labels"] = rng.sample(LABELS, rng.randint(0, 2))
+        if rng.random() < 0.2:
+            entry["published"] = False
+        if rng.random() < 0.3:
+            entry["should_highlight"] = True
+            if rng.random() < 0.6:
+                entry["highlight_until"] = f"2026-{rng.randint(1, 6):02d}-15T00:00:00Z"
+        entries.append(entry)
+    return entries
+
+
+def write_changelog(tmp_path: Path, entries: list[dict[str, object]]) -> Path:
+    path = tmp_path / "changelog.json"
+    path.write_text(json.dumps(entries, indent=2) + "\n")
+    return path
+
+
+def brute_force(entries: list[dict[str, object]], **filters: object) -> list[object]:
+    def keep(entry: dict[str, object]) -> bool:
+        audience = filters.get("audience")
+        if audience is not None:
+            allowed = {audience} if isinstance(audience, str) else set(audience)  # type: ignore[arg-type]
+            if entry.get("audience", "all") not in allowed:
+                return False
+        if filters.get("label") is not None and filters["label"] not in entry.get("labels", []):
+            return False
+        if filters.get("published") is not None and entry.get("published", True) != filters["published"]:
+            return False
+        if filters.get("since") is not None and str(entry["published_at"]) < str(filters["since"]):
+            return False
+        if filters.get("until") is not None and str(entry["published_at"]) >= str(filters["until"]):
+            return False
+        if filters.get("highlighted_at") is not None:
+            until = entry.get("highlight_until")
+            if not entry.get("should_highlight", False):
+                return False
+            if until is not None and str(until) < str(filters["highlighted_at"]):
+                return False
+        return True
+
+    ordered = sorted(entries, key=lambda entry: (str(entry["published_at"]), entry["id"]), reverse=True)
+    return [entry["id"] for entry in ordered if keep(entry)]
+
+
+def test_queries_match_a_linear_scan(tmp_path: Path) -> None:
+    entries = random_entries(400)
+    query = changelog_query.load_changelog_query(write_changelog(tmp_path, entries), SCHEMA_PATH)
+    rng = random.Random(11)
+
+    for _ in range(300):
+        filters: dict[str, object] = {}
+        if rng.random() < 0.5:
+            filters["audience"] = rng.choice(["oss", "pro", "all", ("oss", "all"), ("pro", "all")])
+        if rng.random() < 0.4:
+            filters["label"] = rng.choice(LABELS)
+        if rng.random() < 0.4:
+            filters["published"] = rng.random() < 0.7
+        if rng.random() < 0.2:
+            filters["highlighted_at"] = f"2026-{rng.randint(1, 6):02d}-10T00:00:00Z"
+        if rng.random() < 0.5:
+            filters["since"] = f"2026-{rng.randint(1, 6):02d}-01T00:00:00Z"
+        if rng.random() < 0.3:
+            filters["until"] = f"2026-{rng.randint(1, 6):02d}-20T00:00:00Z"
+        limit = rng.choice([None, 1, 5])
+
+        expected = brute_force(entries, **filters)
+        actual = [entry["id"] for entry in query.query(limit=limit, **filters)]
+        assert actual == (expected if limit is None else expected[:limit]), filters
+
+
+def test_point_lookups_fill_in_schema_defaults(tmp_path: Path) -> None:
+    entries = random_entries(20)
+    query = changelog_query.load_changelog_query(write_changelog(tmp_path, entries), SCHEMA_PATH)
+
+    entry = query.by_slug("entry-3")
+    assert entry is not None and entry is query.get(3)
+    assert {"audience", "labels", "published", "should_highlight"} <= set(entry)
+    assert query.get(999) is None and query.by_slug("missing") is None
+
+
+def test_index_file_is_built_lazily_and_reused_until_the_changelog_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    entries = random_entries(30)
+    changelog_path = write_changelog(tmp_path, entries)
+    index_path = changelog_query.query_index_path(changelog_path)
+    builds: list[int] = []
+    original_build = changelog_query.build_query_index
+
+    def counting_build(*args: object, **kwargs: object) -> changelog_query.ChangelogQueryIndex:
+        builds.append(1)
+        return original_build(*args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(changelog_query, "build_query_index", counting_build)
+
+    assert not index_path.exists()
+    first = changelog_query.load_changelog_query(changelog_path, SCHEMA_PATH)
+    assert index_path.exists()
+    assert list(tmp_path.glob("*.index.json")) == []
+    second = changelog_query.load_changelog_query(changelog_path, SCHEMA_PATH)
+    assert len(builds) == 1
+    assert second.index == first.index
+
+    write_changelog(tmp_path, random_entries(31))
+    changelog_query.load_changelog_query(changelog_path, SCHEMA_PATH)
+    assert len(builds) == 2
+
+
+def test_corrupt_index_is_rebuilt(tmp_path: Path) -> None:
+    changelog_path = write_changelog(tmp_path, random_entries(10))
+    index_path = changelog_query.query_index_path(changelog_path)
+    index_path.parent.mkdir(parents=True)
+    index_path.write_text("{not json")
+
+    query = changelog_query.load_changelog_query(changelog_path, SCHEMA_PATH)
+
+    assert len(query) == 10
+    assert json.loads(index_path.read_text())["content_sha256"] == query.index.content_sha256
+
+
+def test_index_path_defaults_to_the_user_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(changelog_query.QUERY_CACHE_DIR_ENV)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    first = changelog_query.query_index_path(tmp_path / "a" / "changelog.json")
+
+    assert first.parent == tmp_path / "xdg" / "zenml-changelog"
+    assert first.name.startswith("changelog-") and first.name.endswith(".index.json")
+    assert first != changelog_query.query_index_path(tmp_path / "b" / "changelog.json")
+
+
+def test_invalid_changelog_is_rejected_when_indexing(tmp_path: Path) -> None:
+    changelog_path = write_changelog(tmp_path, [{"id": 1, "slug": "a", "title": "A", "description": "x"}])
+
+    with pytest.raises(ChangelogSchemaError):
+        changelog_query.load_changelog_query(changelog_path, SCHEMA_PATH, use_index_cache=False)
+
+    assert not changelog_query.query_index_path(changelog_path).exists()
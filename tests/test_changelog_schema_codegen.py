@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import copy
+import functools
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from jsonschema import Draft7Validator
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_schema_codegen as codegen
+from scripts.changelog_schema_validation import changelog_format_checker
+
+SCHEMA = json.loads((REPO_ROOT / "changelog_schema" / "announcement-schema.json").read_text())
+ODD_VALUES: list[Any] = [
+    None, True, 0, 1.5, -3, "", "not a uri", "2026-13-40T99:00:00Z", "oss", "bugfix", [], [1], {}, {"a": 1}
+]
+
+
+@functools.lru_cache(maxsize=None)
+def validators(schema_json: str) -> tuple[Draft7Validator, codegen.SchemaValidatorFunction]:
+    schema = json.loads(schema_json)
+    return (
+        Draft7Validator(schema, format_checker=changelog_format_checker()),
+        codegen.compile_schema_validator(schema, changelog_format_checker()),
+    )
+
+
+def interpreted_errors(schema: dict[str, Any], instance: Any) -> list[tuple[Any, ...]]:
+    validator = validators(json.dumps(schema))[0]
+    return [(tuple(error.absolute_path), error.validator, error.message) for error in validator.iter_errors(instance)]
+
+
+def generated_errors(schema: dict[str, Any], instance: Any) -> list[tuple[Any, ...]]:
+    return [tuple(error) for error in validators(json.dumps(schema))[1](instance)]
+
+
+def mutate(entries: list[dict[str, Any]], rng: random.Random) -> Any:
+    mutated = copy.deepcopy(entries)
+    for _ in range(rng.randint(0, 4)):
+        entry = rng.choice([item for item in mutated if isinstance(item, dict)])
+        action = rng.randrange(5)
+        if action == 0 and entry:
+            del entry[rng.choice(sorted(entry))]
+        elif action == 1:
+            entry[rng.choice(sorted(SCHEMA["items"]["properties"]))] = rng.choice(ODD_VALUES)
+        elif action == 2:
+            entry[rng.choice(["extra", "zzz", "Audience"])] = rng.choice(ODD_VALUES)
+        elif action == 3:
+            entry["labels"] = [rng.choice(["feature", "misc", 7, None]) for _ in range(rng.randint(0, 3))]
+        else:
+            mutated[mutated.index(entry)] = rng.choice(ODD_VALUES)
+    return mutated
+
+
+def test_generated_validator_matches_jsonschema_on_mutated_changelogs() -> None:
+    rng = random.Random(44)
+    base = codegen.benchmark_entries(4)
+
+    for _ in range(1500):
+        instance = mutate(base, rng)
+        assert generated_errors(SCHEMA, instance) == interpreted_errors(SCHEMA, instance), instance
+
+    for instance in [None, {}, "changelog", [], base]:
+        assert generated_errors(SCHEMA, instance) == interpreted_errors(SCHEMA, instance)
+
+
+def test_generated_validator_matches_jsonschema_for_other_supported_types() -> None:
+    schema = {
+        "type": "object",
+        "properties": {
+            "count": {"type": "integer"},
+            "maybe": {"type": ["string", "null"]},
+            "tags": {"type": "array", "items": {"type": "object", "required": ["name"]}},
+        },
+    }
+    for value in [*ODD_VALUES, 2.0, 7]:
+        for key in ["count", "maybe", "tags"]:
+            instance = {key: value}
+            assert generated_errors(schema, instance) == interpreted_errors(schema, instance)
+    instance = {"tags": [{"name": "a"}, {}, 3]}
+    assert generated_errors(schema, instance) == interpreted_errors(schema, instance)
+
+
+def test_committed_changelog_has_no_errors() -> None:
+    changelog = json.loads((REPO_ROOT / "changelog.json").read_text())
+
+    assert generated_errors(SCHEMA, changelog) == []
+
+
+def test_unsupported_schemas_are_rejected() -> None:
+    with pytest.raises(codegen.SchemaCodegenError, match="maxItems"):
+        codegen.compile_schema_validator({"type": "array", "maxItems": 2}, changelog_format_checker())
+    with pytest.raises(codegen.SchemaCodegenError, match="does not match its own schema"):
+        codegen.compile_schema_validator({"type": "string", "default": 3}, changelog_format_checker())
+
+
+def test_generated_validator_is_faster_than_jsonschema() -> None:
+    entries = codegen.benchmark_entries(10_000)
+    interpreted = Draft7Validator(SCHEMA, format_checker=changelog_format_checker())
+    generated = codegen.compile_schema_validator(SCHEMA, changelog_format_checker())
+
+    start = time.perf_counter()
+    assert generated(entries) == []
+    generated_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    assert list(interpreted.iter_errors(entries)) == []
+    interpreted_seconds = time.perf_counter() - start
+
+    assert generated_seconds * 3 < interpreted_seconds
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_schema_validation as schema_validation
+
+SCHEMA_PATH = REPO_ROOT / "changelog_schema" / "announcement-schema.json"
+
+
+def make_entry(**overrides: object) -> dict[str, object]:
+    entry: dict[str, object] = {
+        "id": 1,
+        "slug": "faster-pipelines",
+        "title": "Faster pipelines",
+        "description": "Pipelines start faster.",
+        "published_at": "2026-06-18T15:04:53Z",
+        "published": True,
+        "audience": "oss",
+        "labels": ["improvement"],
+    }
+    entry.update(overrides)
+    return entry
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    schema_validation.reset_schema_validator_cache()
+    yield
+    schema_validation.reset_schema_validator_cache()
+
+
+def test_validator_is_compiled_once_per_schema_version(tmp_path: Path) -> None:
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(SCHEMA_PATH.read_text())
+
+    first = schema_validation.compiled_changelog_validator(schema_path)
+    assert schema_validation.compiled_changelog_validator(schema_path) is first
+
+    schema_path.write_text(json.dumps({"type": "array", "maxItems": 0}))
+    stat = schema_path.stat()
+    os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    rebuilt = schema_validation.compiled_changelog_validator(schema_path)
+    assert rebuilt is not first
+    assert schema_validation.changelog_schema_errors([make_entry()], schema_path)
+
+
+def test_formats_are_checked() -> None:
+    errors = schema_validation.changelog_schema_errors(
+        [
+            make_entry(published_at="18 June 2026"),
+            make_entry(docs_url="not a uri"),
+            make_entry(docs_url="https://docs.zenml.io"),
+        ],
+        SCHEMA_PATH,
+    )
+
+    assert [list(error.absolute_path) for error in errors] == [[0, "published_at"], [1, "docs_url"]]
+
+
+def test_every_error_is_reported_at_once() -> None:
+    with pytest.raises(schema_validation.ChangelogSchemaError) as exc_info:
+        schema_validation.validate_changelog_data(
+            [make_entry(audience="everyone"), make_entry(labels=["misc"]), make_entry()],
+            SCHEMA_PATH,
+        )
+
+    assert len(exc_info.value.errors) == 2
+    assert "(at [0, 'audience'])" in str(exc_info.value)
+    assert "(at [1, 'labels', 0])" in str(exc_info.value)
+
+
+def test_committed_changelog_passes() -> None:
+    changelog = json.loads((REPO_ROOT / "changelog.json").read_text())
+
+    assert schema_validation.changelog_schema_errors(changelog, SCHEMA_PATH) == []
+
+
+def test_streamed_errors_match_whole_file_validation() -> None:
+    entries = [
+        make_entry(id=4, slug="a"),
+        make_entry(id=3, slug="b", audience="everyone"),
+        make_entry(id=2, slug="c", published_at="yesterday", extra=True),
+        make_entry(id=1, slug="d"),
+    ]
+    del entries[3]["title"]
+
+    streamed = [
+        violation
+        for _, _, violations in schema_validation.iter_streamed_changelog_errors(
+            io.StringIO(json.dumps(entries, indent=2)), SCHEMA_PATH
+        )
+        for violation in violations
+    ]
+
+    assert streamed == schema_validation.changelog_schema_errors(entries, SCHEMA_PATH)
+    assert [violation.absolute_path[0] for violation in streamed] == [1, 2, 2, 3]
+
+
+def test_streaming_needs_a_plain_items_schema(tmp_path: Path) -> None:
+    schema = json.loads(SCHEMA_PATH.read_text())
+    schema["maxItems"] = 10
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps(schema))
+
+    assert schema_validation.changelog_item_validator(schema_path) is None
+    with pytest.raises(ValueError, match="only `items`"):
+        next(schema_validation.iter_streamed_changelog_errors(io.StringIO("[]"), schema_path))
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_search as search_module
+
+SERVER_SDK = """---
+description: Changelog for ZenML OSS.
+---
+
+# ZenML OSS Changelog
+
+## 0.2.0 (2026-06-18)
+
+<img src="https://example.com/mlflow.jpg" alt="header">
+
+- Local MLflow tracking now uses a SQLite backend. [PR #4900](https://github.com/zenml-io/zenml/pull/4900)
+
+***
+
+## 0.1.0 (2026-05-01)
+
+- Kubernetes orchestrator pods restart faster.
+
+***
+"""
+
+ENTRIES = [
+    {
+        "id": 2,
+        "title": "Faster Kubernetes pods",
+        "description": "Kubernetes pods start faster.",
+        "published_at": "2026-06-18T00:00:00Z",
+    },
+    {
+        "id": 1,
+        "title": "Dashboard search",
+        "description": "Search pipelines by name.",
+        "published_at": "2026-05-01T00:00:00Z",
+    },
+]
+
+
+def make_repo(tmp_path: Path) -> Path:
+    (tmp_path / "gitbook-release-notes").mkdir()
+    (tmp_path / "gitbook-release-notes" / "server-sdk.md").write_text(SERVER_SDK)
+    (tmp_path / "changelog.json").write_text(json.dumps(ENTRIES, indent=2) + "\n")
+    return tmp_path
+
+
+def test_tokenize_keeps_versions_and_offsets_and_drops_markup() -> None:
+    text = "Upgrade to 0.95.1 with the `fsspec` store <img src=\"https://x.io/a.png\"> [docs](https://docs.zenml.io)"
+
+    tokens = search_module.tokenize(text)
+
+    assert [term for term, _ in tokens] == ["upgrade", "0.95.1", "fsspec", "store", "docs"]
+    assert all(text.lower()[offset : offset + len(term)] == term for term, offset in tokens)
+
+
+def test_release_sections_split_on_version_headings() -> None:
+    sections = search_module.release_sections("gitbook-release-notes/server-sdk.md", SERVER_SDK)
+
+    assert [(section.key, section.date) for section in sections] == [
+        ("server-sdk@0.2.0", "2026-06-18"),
+        ("server-sdk@0.1.0", "2026-05-01"),
+    ]
+    assert all(SERVER_SDK[section.start : section.end] == section.text for section in sections)
+    assert "Kubernetes" not in sections[0].text
+
+
+def test_search_ranks_by_tf_idf_and_cuts_snippets_from_the_source(tmp_path: Path) -> None:
+    repo = make_repo(tmp_path)
+    index, _ = search_module.build_search_index(search_module.collect_documents(repo))
+
+    hits = search_module.search(index, "kubernetes pods")
+    assert [hit.document.key for hit in hits] == ["entry:2", "server-sdk@0.1.0"]
+
+    [hit] = search_module.search(index, "SQLite")
+    assert hit.document.key == "server-sdk@0.2.0"
+    assert "SQLite backend" in search_module.SnippetSource(repo).snippet(hit)
+    assert search_module.search(index, "mlflow.jpg") == []
+    assert search_module.search(index, "nothing-matches") == []
+
+
+def test_rebuild_reuses_unchanged_documents(tmp_path: Path) -> None:
+    repo = make_repo(tmp_path)
+    first, _ = search_module.build_search_index(search_module.collect_documents(repo))
+
+    notes = repo / "gitbook-release-notes" / "server-sdk.md"
+    new_release = "\n## 0.3.0 (2026-07-01)\n\n- Adds caching.\n\n***\n"
+    notes.write_text(notes.read_text().replace("# ZenML OSS Changelog\n", "# ZenML OSS Changelog\n" + new_release))
+    second, stats = search_module.build_search_index(search_module.collect_documents(repo), first)
+    full, _ = search_module.build_search_index(search_module.collect_documents(repo))
+
+    assert (stats.tokenized, stats.reused) == (1, 4)
+    assert second == full
+    assert [hit.document.key for hit in search_module.search(second, "caching")] == ["server-sdk@0.3.0"]
+
+
+def test_snippets_are_skipped_when_the_source_changed_since_the_build(tmp_path: Path) -> None:
+    repo = make_repo(tmp_path)
+    index, _ = search_module.build_search_index(search_module.collect_documents(repo))
+    [hit] = search_module.search(index, "sqlite")
+
+    (repo / "gitbook-release-notes" / "server-sdk.md").write_text("# Rewritten\n")
+
+    assert search_module.SnippetSource(repo).snippet(hit) == ""
+
+
+def test_cli_builds_once_then_reports_unchanged(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    repo = make_repo(tmp_path)
+    index_path = tmp_path / "search-index.json"
+    args = ["--index", str(index_path), "--repo-root", str(repo)]
+
+    assert search_module.main([*args, "build"]) == 0
+    assert search_module.main([*args, "build"]) == 0
+    assert search_module.main([*args, "query", "dashboard"]) == 0
+
+    output = capsys.readouterr().out
+    assert "Wrote" in output and "Unchanged" in output and "(0 tokenized, 4 reused)" in output
+    assert "entry:1" in output
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_shards as shards
+
+
+def make_entry(entry_id: int, published_at: str) -> dict[str, object]:
+    return {
+        "id": entry_id,
+        "slug": f"entry-{entry_id}",
+        "title": f"Entry {entry_id} ✨",
+        "description": "Description.",
+        "published_at": published_at,
+    }
+
+
+ENTRIES = [
+    make_entry(4, "2026-04-02T10:00:00Z"),
+    make_entry(3, "2026-03-30T10:00:00Z"),
+    make_entry(2, "2026-01-01T00:00:00Z"),
+    make_entry(1, "2025-12-31T23:59:59Z"),
+]
+
+
+def test_combined_text_matches_a_single_json_dump(tmp_path: Path) -> None:
+    written = shards.split_changelog_into_shards(ENTRIES, tmp_path)
+
+    assert [path.name for path in written] == ["2026-Q2.json", "2026-Q1.json", "2025-Q4.json"]
+    assert shards.combined_changelog_text(tmp_path) == json.dumps(ENTRIES, indent=2) + "\n"
+    assert shards.combined_changelog_text(tmp_path / "missing") == "[]\n"
+    assert shards.newest_changelog_id(tmp_path) == 4
+
+
+def test_update_rewrites_only_the_new_entries_shard(tmp_path: Path) -> None:
+    shards.split_changelog_into_shards(ENTRIES, tmp_path)
+    new_entries = [make_entry(6, "2026-05-01T00:00:00Z"), make_entry(5, "2026-04-30T00:00:00Z")]
+
+    planned = shards.plan_shard_update(tmp_path, new_entries)
+
+    assert list(planned) == [tmp_path / "2026-Q2.json"]
+    assert shards.combined_changelog_text(tmp_path, planned) == json.dumps(new_entries + ENTRIES, indent=2) + "\n"
+    next_quarter = shards.plan_shard_update(tmp_path, [make_entry(5, "2026-07-01T00:00:00Z")])
+    shards.write_shards(next_quarter)
+    assert shards.shard_paths(tmp_path)[0].name == "2026-Q3.json"
+
+
+def test_new_entries_cannot_land_in_an_older_quarter(tmp_path: Path) -> None:
+    shards.split_changelog_into_shards(ENTRIES, tmp_path)
+
+    with pytest.raises(shards.ChangelogShardError, match="2026-Q1 would sort below"):
+        shards.plan_shard_update(tmp_path, [make_entry(5, "2026-02-01T00:00:00Z")])
+
+
+def test_check_reports_a_stale_combined_file(tmp_path: Path) -> None:
+    shards_dir = tmp_path / "changelog_shards"
+    changelog = tmp_path / "changelog.json"
+    shards.split_changelog_into_shards(ENTRIES, shards_dir)
+    args = ["--changelog", str(changelog), "--shards-dir", str(shards_dir)]
+
+    assert shards.main(["check", *args]) == 1
+    assert shards.main(["build", *args]) == 0
+    assert shards.main(["check", *args]) == 0
+
+
+def test_committed_changelog_matches_its_shards() -> None:
+    assert shards.main(["check"]) == 0
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from scripts import changelog_llm_generation as generation
+from scripts import changelog_llm_providers as providers
+from scripts import update_changelog as uc
+from scripts.changelog_llm_outputs import (
+    LLM_CALL_GROUPED_CHANGELOG_ENTRIES,
+    GroupedChangelogEntry,
+    GroupedChangelogOutput,
+)
+from scripts.changelog_llm_providers import LLMProviderRetryableError
+
+
+def make_pr(number: int) -> dict[str, Any]:
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "labels": ["release-notes"],
+        "url": f"https://github.com/zenml-io/zenml/pull/{number}",
+        "body": f"Release-note body for PR {number}",
+        "repo": "zenml-io/zenml",
+    }
+
+
+PRS = [make_pr(number) for number in (1, 2, 3)]
+
+
+def grouping(*numbers: list[int]) -> GroupedChangelogOutput:
+    return GroupedChangelogOutput(
+        entries=[
+            GroupedChangelogEntry(title=f"Group {index}", description="d", suggested_labels=[], pr_numbers=group)
+            for index, group in enumerate(numbers)
+        ]
+    )
+
+
+class TemperatureClient:
+    """Fake client whose answer and delay depend on the sampling temperature."""
+
+    def __init__(self, answers: dict[float, Any], delays: dict[float, float] | None = None) -> None:
+        self.temperature = 0.0
+        self.answers = answers
+        self.delays = delays or {}
+        self.temperatures: list[float] = []
+        self._lock = threading.Lock()
+
+    def parse_structured_output(self, **kwargs: Any) -> GroupedChangelogOutput:
+        with self._lock:
+            self.temperatures.append(self.temperature)
+        time.sleep(self.delays.get(self.temperature, 0))
+        answer = self.answers[self.temperature]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+def test_first_valid_speculative_output_wins() -> None:
+    client = TemperatureClient(
+        answers={0.0: grouping([1, 2]), 0.5: grouping([1], [2, 3]), 0.8: grouping([1, 2, 3])},
+        delays={0.0: 0.0, 0.5: 0.05, 0.8: 0.3},
+    )
+
+    result = generation.generate_speculative_grouped_changelog_output(
+        client=client,
+        prs=PRS,
+        source_repo="zenml-io/zenml",
+        attempts=3,
+    )
+
+    assert result.valid
+    assert result.output == grouping([1], [2, 3])
+    assert (result.attempts_sent, result.first_valid_attempt) == (3, 2)
+    assert result.first_valid_seconds is not None and result.first_valid_seconds < 0.3
+    assert sorted(client.temperatures) == [0.0, 0.5, 0.8]
+    assert client.temperature == 0.0
+
+
+class StreamingClient:
+    """Fake client that streams slow attempts in small deltas before answering."""
+
+    model = "gpt-5.4"
+
+    def __init__(self, answers: dict[float, Any], deltas: dict[float, int]) -> None:
+        self.temperature = 0.0
+        self.answers = answers
+        self.deltas = deltas
+        self.streamed: dict[float, int] = {}
+
+    def parse_structured_output(self, *, stream_validator: Any = None, **kwargs: Any) -> GroupedChangelogOutput:
+        temperature = self.temperature
+        text = ""
+        for delta in range(self.deltas.get(temperature, 0)):
+            time.sleep(0.01)
+            text += "x" * 40
+            self.streamed[temperature] = delta + 1
+            stream_validator(text)
+        return self.answers[temperature]
+
+
+def test_losing_attempts_are_cancelled_and_their_usage_is_recorded() -> None:
+    providers.reset_llm_usage_log()
+    client = StreamingClient(
+        answers={0.0: grouping([1, 2, 3]), 0.5: grouping([1], [2, 3])},
+        deltas={0.0: 2, 0.5: 200},
+    )
+
+    result = generation.generate_speculative_grouped_changelog_output(
+        client=client,
+        prs=PRS,
+        source_repo="zenml-io/zenml",
+        attempts=2,
+    )
+
+    assert result.first_valid_attempt == 1
+    assert client.streamed[0.5] < 200
+    # The loser stopped before the provider reported usage; an estimate stands in for it.
+    [estimate] = providers.LLM_USAGE_LOG.records()
+    assert estimate.truncated and estimate.call_name == LLM_CALL_GROUPED_CHANGELOG_ENTRIES
+    assert estimate.output_tokens == client.streamed[0.5] * 10
+    assert estimate.input_tokens > 0
+    providers.reset_llm_usage_log()
+
+
+def test_without_valid_output_the_first_arrival_is_returned_for_repair() -> None:
+    client = TemperatureClient(
+        answers={0.0: grouping([1, 2]), 0.5: LLMProviderRetryableError("overloaded")},
+        delays={0.0: 0.05},
+    )
+
+    result = generation.generate_speculative_grouped_changelog_output(
+        client=client,
+        prs=PRS,
+        source_repo="zenml-io/zenml",
+        attempts=2,
+    )
+
+    assert not result.valid
+    assert result.output == grouping([1, 2])
+
+
+def test_all_failed_attempts_raise_the_last_error() -> None:
+    client = TemperatureClient(answers={0.0: LLMProviderRetryableError("overloaded")})
+
+    with pytest.raises(LLMProviderRetryableError):
+        generation.generate_speculative_grouped_changelog_output(
+            client=client,
+            prs=PRS,
+            source_repo="zenml-io/zenml",
+            attempts=1,
+        )
+
+
+def test_spend_cap_limits_parallel_attempts() -> None:
+    uncapped = generation.speculative_grouped_attempt_count(PRS, "zenml-io/zenml", 8, max_spend_tokens=10**9)
+    capped = generation.speculative_grouped_attempt_count(PRS, "zenml-io/zenml", 8, max_spend_tokens=4000)
+
+    assert uncapped == 8
+    assert capped == 2
+    assert generation.speculative_grouped_attempt_count(PRS, "zenml-io/zenml", 8, max_spend_tokens=1) == 1
+
+
+def test_generate_valid_grouped_entries_uses_speculative_mode_when_enabled(monkeypatch) -> None:
+    calls: list[int] = []
+
+    def fake_speculative(**kwargs: Any) -> GroupedChangelogOutput:
+        calls.append(kwargs["attempts"])
+        return grouping([1, 2, 3])
+
+    monkeypatch.setattr(uc, "llm_generate_speculative_grouped_changelog_entries", fake_speculative)
+
+    entries = uc.generate_valid_grouped_changelog_entries(
+        prs=PRS,
+        source_repo="zenml-io/zenml",
+        published_at="2026-06-02T10:00:00Z",
+        starting_id=1,
+        speculative_attempts=3,
+    )
+
+    assert calls == [3]
+    assert len(entries) == 1
+
+
+def test_speculative_attempts_env_must_be_positive(monkeypatch) -> None:
+    monkeypatch.setenv(uc.GROUPED_SPECULATIVE_ATTEMPTS_ENV, "0")
+
+    with pytest.raises(RuntimeError, match="Expected a positive integer"):
+        uc.positive_int_from_env(uc.GROUPED_SPECULATIVE_ATTEMPTS_ENV, 1)
@@ -10,16 +10,20 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from scripts import changelog_llm_providers as providers
 from scripts import changelog_rendering as rendering
 from scripts import evaluate_changelog_llms as evaluator
 from scripts import update_changelog as uc
 from scripts.changelog_llm_outputs import (
     LLM_CALL_BREAKING_CHANGES,
+    LLM_CALL_GROUPED_CHANGELOG_CHUNK,
     LLM_CALL_GROUPED_CHANGELOG_ENTRIES,
+    LLM_CALL_GROUPED_CHANGELOG_MERGE,
     LLM_CALL_RELEASE_NOTES_BODY,
     BreakingChangesOutput,
     GroupedChangelogOutput,
     GroupedChangelogEntry,
+    LLMUsage,
     MarkdownSection,
 )
 
@@ -110,6 +114,50 @@ def test_invalid_grouping_fails_hard_gate(tmp_path: Path) -> None:
     assert not (Path(summary.run_dir) / result.fixture_id / result.candidate_id / "candidate-release-notes.md").exists()
 
 
+def test_summary_reports_grouped_first_attempt_pass_rate_and_prompt_size(tmp_path: Path) -> None:
+    fixture_ids = {"synthetic-oss-small", "synthetic-bad-grouping"}
+    with_hints = run_static_eval(tmp_path, fixture_ids=fixture_ids)
+    without_hints = evaluator.run_eval(
+        fixtures_dir=FIXTURES_DIR,
+        output_root=tmp_path / "eval-results",
+        run_id="test-run-no-hints",
+        fixture_ids=fixture_ids,
+        candidate_filter=None,
+        live_candidates=[],
+        pregroup_hints=False,
+    )
+
+    assert with_hints.grouped_first_attempt_count == len(with_hints.results)
+    assert with_hints.grouped_first_attempt_pass_count == sum(
+        result.fixture_id == "synthetic-oss-small" for result in with_hints.results
+    )
+    assert without_hints.pregroup_hints is False
+    assert 0 < without_hints.grouped_prompt_chars < with_hints.grouped_prompt_chars
+    summary_md = (Path(with_hints.run_dir) / "summary.md").read_text()
+    assert "- Pre-grouping hints: on" in summary_md
+    assert "- Grouped first-attempt validation: " in summary_md
+
+
+def test_grouped_first_attempt_stats_count_hierarchical_generation_once(tmp_path: Path) -> None:
+    result = run_static_eval(tmp_path, fixture_ids={"synthetic-oss-small"}).results[0]
+    template = result.provider_calls[0]
+    hierarchical = result.model_copy(
+        update={
+            "provider_calls": [
+                template.model_copy(update={"call_name": call_name, "prompt_chars": prompt_chars})
+                for call_name, prompt_chars in [
+                    (LLM_CALL_GROUPED_CHANGELOG_CHUNK, 1000),
+                    (LLM_CALL_GROUPED_CHANGELOG_CHUNK, 1200),
+                    (LLM_CALL_GROUPED_CHANGELOG_MERGE, 400),
+                    (LLM_CALL_BREAKING_CHANGES, 300),
+                ]
+            ]
+        }
+    )
+
+    assert evaluator.grouped_first_attempt_stats([hierarchical]) == (1, 1, 2600)
+
+
 def test_ambiguous_pr_numbers_fail_before_provider_call(tmp_path: Path) -> None:
     summary = run_static_eval(tmp_path, fixture_ids={"synthetic-ambiguous-pr-numbers"})
 
@@ -326,6 +374,51 @@ def test_measured_live_provider_records_routed_client_model_per_call() -> None:
     ]
 
 
+def test_measured_live_provider_records_provider_reported_usage() -> None:
+    release = MarkdownSection(content="#### Release notes")
+    usage = LLMUsage(
+        call_name=LLM_CALL_RELEASE_NOTES_BODY,
+        model="gpt-5.5",
+        input_tokens=5000,
+        output_tokens=700,
+        cached_input_tokens=4096,
+        reasoning_tokens=300,
+    )
+
+    class FakeReportingClient:
+        def parse_structured_output(self, **kwargs: Any) -> object:
+            providers.record_llm_usage(usage)
+            return release
+
+    provider = evaluator.MeasuredLiveProvider(
+        provider="openai",
+        model="gpt-5.5",
+        client=FakeReportingClient(),  # type: ignore[arg-type]
+    )
+
+    provider.parse_structured_output(
+        prompt="release",
+        output_model=MarkdownSection,
+        max_output_tokens=100,
+        call_name=LLM_CALL_RELEASE_NOTES_BODY,
+    )
+
+    [record] = provider.calls
+    assert (record.input_tokens, record.output_tokens) == (5000, 700)
+    assert (record.cached_input_tokens, record.reasoning_tokens) == (4096, 300)
+    assert evaluator.format_token_usage(provider.calls) == "5000 in (4096 cached, 82%) / 700 out (300 reasoning)"
+
+
+def test_offline_token_usage_falls_back_to_estimate(tmp_path: Path) -> None:
+    summary = run_static_eval(tmp_path)
+
+    result = next(result for result in summary.results if result.provider_calls)
+    assert all(call.input_tokens is None for call in result.provider_calls)
+    assert "(estimated)" in evaluator.format_token_usage(result.provider_calls)
+    summary_md = (Path(summary.run_dir) / "summary.md").read_text(encoding="utf-8")
+    assert "| Tokens |" in summary_md
+
+
 def test_parse_live_candidate_rejects_empty_provider() -> None:
     with pytest.raises(Exception, match="Live provider"):
         evaluator.parse_live_candidate(":gpt-5.4-mini:OpenAI mini")
@@ -126,8 +126,8 @@ def test_semantic_retry_succeeds_on_second_attempt(monkeypatch: pytest.MonkeyPat
     calls: list[str | None] = []
     invalid_output = make_output(
         [
-            make_entry("Duplicate", [101, 102]),
-            make_entry("Duplicate again", [101, 103]),
+            make_entry("Invented", [9998]),
+            make_entry("Invented again", [9999]),
         ]
     )
     valid_output = make_output(
@@ -163,15 +163,15 @@ def test_semantic_retry_succeeds_on_second_attempt(monkeypatch: pytest.MonkeyPat
     assert calls[1]
     assert "Validation feedback:" in calls[1]
     assert "Previous invalid grouping:" in calls[1]
-    assert "PR #101 appears in more than one grouped changelog entry" in calls[1]
+    assert "references unknown PR #9998" in calls[1]
 
 
 def test_retry_exhaustion_fails_after_three_attempts(monkeypatch: pytest.MonkeyPatch) -> None:
     calls: list[str | None] = []
     invalid_output = make_output(
         [
-            make_entry("Duplicate", [101, 102]),
-            make_entry("Duplicate again", [101, 103]),
+            make_entry("Invented", [9998]),
+            make_entry("Invented again", [9999]),
         ]
     )
 
@@ -277,3 +277,184 @@ def test_duplicate_input_pr_numbers_fail_before_llm_without_semantic_retry(
             published_at="2026-05-12T10:00:00Z",
             starting_id=100,
         )
+
+
+def test_local_repair_drops_duplicates_and_unknown_numbers() -> None:
+    grouped_output = make_output(
+        [
+            make_entry("Better pipelines", [101, 102, 9999]),
+            make_entry("More fixes", [101, 103]),
+            make_entry("Invented", [9998]),
+        ]
+    )
+
+    repaired, missing = validators.repair_grouped_changelog_output(grouped_output, sample_prs())
+
+    assert repaired is not None
+    assert [entry.pr_numbers for entry in repaired.entries] == [[101, 102], [103]]
+    assert missing == []
+
+
+def test_local_repair_reports_missing_numbers_and_unrepairable_groupings() -> None:
+    repaired, missing = validators.repair_grouped_changelog_output(
+        make_output([make_entry("Better pipelines", [101])]),
+        sample_prs(),
+    )
+    assert repaired is not None
+    assert missing == [102, 103]
+
+    repaired, missing = validators.repair_grouped_changelog_output(
+        make_output([make_entry("Invented", [9999])]),
+        sample_prs(),
+    )
+    assert repaired is None
+    assert missing == [101, 102, 103]
+
+
+def test_duplicate_grouping_is_repaired_without_another_llm_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str | None] = []
+
+    def fake_llm_generate_grouped_changelog_entries(
+        prs: list[dict[str, Any]],
+        source_repo: str,
+        retry_feedback: str | None = None,
+    ) -> GroupedChangelogOutput:
+        calls.append(retry_feedback)
+        return make_output(
+            [
+                make_entry("Better pipelines", [101, 102]),
+                make_entry("Cleaner metadata", [101, 103]),
+            ]
+        )
+
+    def forbidden_repair(**kwargs: Any) -> GroupedChangelogOutput:
+        raise AssertionError("local repair should not need a repair prompt")
+
+    monkeypatch.setattr(uc, "llm_generate_grouped_changelog_entries", fake_llm_generate_grouped_changelog_entries)
+    monkeypatch.setattr(uc, "llm_repair_grouped_changelog_entries", forbidden_repair)
+
+    entries = uc.generate_valid_grouped_changelog_entries(
+        prs=sample_prs(),
+        source_repo="zenml-io/zenml",
+        published_at="2026-05-12T10:00:00Z",
+        starting_id=100,
+    )
+
+    assert calls == [None]
+    assert [entry["title"] for entry in entries] == ["Better pipelines", "Cleaner metadata"]
+
+
+def test_missing_prs_use_targeted_repair_prompt(monkeypatch: pytest.MonkeyPatch) -> None:
+    grouped_calls = 0
+    repair_calls: list[dict[str, Any]] = []
+
+    def fake_llm_generate_grouped_changelog_entries(
+        prs: list[dict[str, Any]],
+        source_repo: str,
+        retry_feedback: str | None = None,
+    ) -> GroupedChangelogOutput:
+        nonlocal grouped_calls
+        grouped_calls += 1
+        return make_output([make_entry("Better pipelines", [101, 101, 102])])
+
+    def fake_llm_repair_grouped_changelog_entries(
+        grouped_output: GroupedChangelogOutput,
+        unassigned_prs: list[dict[str, Any]],
+        source_repo: str,
+    ) -> GroupedChangelogOutput:
+        repair_calls.append({"grouped_output": grouped_output, "unassigned_prs": unassigned_prs})
+        return make_output(
+            [
+                make_entry("Better pipelines", [101, 102]),
+                make_entry("Cleaner metadata", [103]),
+            ]
+        )
+
+    monkeypatch.setattr(uc, "llm_generate_grouped_changelog_entries", fake_llm_generate_grouped_changelog_entries)
+    monkeypatch.setattr(uc, "llm_repair_grouped_changelog_entries", fake_llm_repair_grouped_changelog_entries)
+
+    entries = uc.generate_valid_grouped_changelog_entries(
+        prs=sample_prs(),
+        source_repo="zenml-io/zenml",
+        published_at="2026-05-12T10:00:00Z",
+        starting_id=100,
+    )
+
+    assert grouped_calls == 1
+    assert len(repair_calls) == 1
+    assert [pr["number"] for pr in repair_calls[0]["unassigned_prs"]] == [103]
+    assert repair_calls[0]["grouped_output"].entries[0].pr_numbers == [101, 102]
+    assert [entry["title"] for entry in entries] == ["Better pipelines", "Cleaner metadata"]
+
+
+def test_failed_repair_falls_back_to_full_regeneration(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str | None] = []
+
+    def fake_llm_generate_grouped_changelog_entries(
+        prs: list[dict[str, Any]],
+        source_repo: str,
+        retry_feedback: str | None = None,
+    ) -> GroupedChangelogOutput:
+        calls.append(retry_feedback)
+        if len(calls) == 1:
+            return make_output([make_entry("Better pipelines", [101])])
+        return make_output(
+            [
+                make_entry("Better pipelines", [101, 102]),
+                make_entry("Cleaner metadata", [103]),
+            ]
+        )
+
+    def fake_llm_repair_grouped_changelog_entries(**kwargs: Any) -> GroupedChangelogOutput:
+        return make_output([make_entry("Still incomplete", [101, 102])])
+
+    monkeypatch.setattr(uc, "llm_generate_grouped_changelog_entries", fake_llm_generate_grouped_changelog_entries)
+    monkeypatch.setattr(uc, "llm_repair_grouped_changelog_entries", fake_llm_repair_grouped_changelog_entries)
+
+    entries = uc.generate_valid_grouped_changelog_entries(
+        prs=sample_prs(),
+        source_repo="zenml-io/zenml",
+        published_at="2026-05-12T10:00:00Z",
+        starting_id=100,
+    )
+
+    assert len(calls) == 2
+    assert calls[1] is not None
+    assert "not assigned to any grouped changelog entry" in calls[1]
+    assert [entry["title"] for entry in entries] == ["Better pipelines", "Cleaner metadata"]
+
+
+def test_repair_call_errors_fall_back_to_full_regeneration(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str | None] = []
+
+    def fake_llm_generate_grouped_changelog_entries(
+        prs: list[dict[str, Any]],
+        source_repo: str,
+        retry_feedback: str | None = None,
+    ) -> GroupedChangelogOutput:
+        calls.append(retry_feedback)
+        if len(calls) == 1:
+            return make_output([make_entry("Better pipelines", [101])])
+        return make_output(
+            [
+                make_entry("Better pipelines", [101, 102]),
+                make_entry("Cleaner metadata", [103]),
+            ]
+        )
+
+    def failing_repair(**kwargs: Any) -> GroupedChangelogOutput:
+        raise uc.LLMProviderRetryableError("LLM retry budget exhausted")
+
+    monkeypatch.setattr(uc, "llm_generate_grouped_changelog_entries", fake_llm_generate_grouped_changelog_entries)
+    monkeypatch.setattr(uc, "llm_repair_grouped_changelog_entries", failing_repair)
+
+    entries = uc.generate_valid_grouped_changelog_entries(
+        prs=sample_prs(),
+        source_repo="zenml-io/zenml",
+        published_at="2026-05-12T10:00:00Z",
+        starting_id=100,
+    )
+
+    assert len(calls) == 2
+    assert calls[1] is not None
+    assert [entry["title"] for entry in entries] == ["Better pipelines", "Cleaner metadata"]
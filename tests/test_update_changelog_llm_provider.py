@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import random
 import sys
 from pathlib import Path
 from types import SimpleNamespace
@@ -13,10 +14,12 @@ if str(REPO_ROOT) not in sys.path:
 
 from scripts import changelog_llm_outputs as outputs
 from scripts import changelog_llm_providers as providers
+from scripts import changelog_prompts as prompts
 
 
 class FakeAnthropicMessages:
-    def __init__(self) -> None:
+    def __init__(self, usage: object | None = None) -> None:
+        self.usage = usage
         self.kwargs: dict[str, Any] | None = None
 
     def parse(self, **kwargs: Any) -> Any:
@@ -26,13 +29,14 @@ class FakeAnthropicMessages:
                 title="A useful update",
                 description="Users can do something useful.",
                 suggested_labels=[],
-            )
+            ),
+            usage=self.usage,
         )
 
 
 class FakeAnthropicClient:
-    def __init__(self) -> None:
-        self.messages = FakeAnthropicMessages()
+    def __init__(self, usage: object | None = None) -> None:
+        self.messages = FakeAnthropicMessages(usage)
         self.beta = SimpleNamespace(messages=self.messages)
 
 
@@ -44,11 +48,13 @@ class FakeOpenAIResponses:
         status: str = "completed",
         output: list[object] | None = None,
         incomplete_details: object | None = None,
+        usage: object | None = None,
     ) -> None:
         self.parsed = parsed
         self.status = status
         self.output = output or []
         self.incomplete_details = incomplete_details
+        self.usage = usage
         self.kwargs: dict[str, Any] | None = None
 
     def parse(self, **kwargs: Any) -> Any:
@@ -58,6 +64,7 @@ class FakeOpenAIResponses:
             status=self.status,
             output=self.output,
             incomplete_details=self.incomplete_details,
+            usage=self.usage,
         )
 
 
@@ -69,12 +76,14 @@ class FakeOpenAIClient:
         status: str = "completed",
         output: list[object] | None = None,
         incomplete_details: object | None = None,
+        usage: object | None = None,
     ) -> None:
         self.responses = FakeOpenAIResponses(
             parsed,
             status=status,
             output=output,
             incomplete_details=incomplete_details,
+            usage=usage,
         )
 
 
@@ -94,8 +103,8 @@ def test_anthropic_structured_client_maps_common_parse_arguments() -> None:
         "model": "claude-test",
         "betas": ["structured-outputs-2025-11-13"],
         "max_tokens": 123,
-        "temperature": 0,
         "output_format": outputs.ChangelogCopy,
+        "extra_body": {"temperature": 0},
         "messages": [{"role": "user", "content": "Write copy"}],
     }
 
@@ -119,9 +128,59 @@ def test_openai_structured_client_maps_responses_parse_arguments() -> None:
         "text_format": outputs.BreakingChangesOutput,
         "max_output_tokens": 456,
         "store": False,
+        "prompt_cache_key": providers.openai_prompt_cache_key("breaking", "Summarize breaking changes"),
     }
 
 
+def test_anthropic_client_marks_stable_prompt_segments_for_caching() -> None:
+    fake = FakeAnthropicClient()
+    client = providers.AnthropicStructuredLLMClient(fake, model="claude-test")  # type: ignore[arg-type]
+
+    client.parse_structured_output(
+        prompt=prompts.join_prompt_segments("Instructions", "PR list", "Retry feedback"),
+        output_model=outputs.ChangelogCopy,
+        max_output_tokens=123,
+        call_name="copy",
+    )
+
+    assert fake.messages.kwargs is not None
+    assert fake.messages.kwargs["messages"][0]["content"] == [
+        {"type": "text", "text": "Instructions", "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "PR list", "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "Retry feedback"},
+    ]
+
+
+def test_openai_client_sends_rendered_prompt_with_shared_cache_key() -> None:
+    fake = FakeOpenAIClient(outputs.BreakingChangesOutput(bullets=[]))
+    client = providers.OpenAIStructuredLLMClient(fake, model="gpt-test")
+    keys = []
+
+    for retry_feedback in ("First feedback", "Second feedback"):
+        client.parse_structured_output(
+            prompt=prompts.join_prompt_segments("Instructions", "PR list", retry_feedback),
+            output_model=outputs.BreakingChangesOutput,
+            max_output_tokens=100,
+            call_name="grouped",
+        )
+        assert fake.responses.kwargs is not None
+        keys.append(fake.responses.kwargs["prompt_cache_key"])
+
+    assert fake.responses.kwargs["input"][0]["content"] == "Instructions\n\nPR list\n\nSecond feedback"
+    assert keys[0] == keys[1]
+    assert keys[0] != providers.openai_prompt_cache_key("grouped", "Other instructions")
+
+
+def test_llm_cache_hit_rates_are_reported_per_call() -> None:
+    records = [
+        outputs.LLMUsage(call_name="grouped", model="m", input_tokens=2000, output_tokens=10),
+        outputs.LLMUsage(call_name="grouped", model="m", input_tokens=2000, output_tokens=10, cached_input_tokens=1800),
+        outputs.LLMUsage(call_name="body", model="m", input_tokens=0, output_tokens=10),
+    ]
+
+    assert providers.llm_cache_hit_rates(records) == {"grouped": "45%", "body": "n/a"}
+
+
 def test_openai_structured_client_uses_routed_model_for_known_call() -> None:
     parsed = outputs.BreakingChangesOutput(bullets=[])
     fake = FakeOpenAIClient(parsed)
@@ -188,6 +247,222 @@ def test_openai_structured_client_fails_closed_on_incomplete_response() -> None:
         )
 
 
+def test_openai_structured_client_records_reported_token_usage() -> None:
+    providers.reset_llm_usage_log()
+    usage = SimpleNamespace(
+        input_tokens=1500,
+        output_tokens=400,
+        input_tokens_details=SimpleNamespace(cached_tokens=1024),
+        output_tokens_details=SimpleNamespace(reasoning_tokens=250),
+    )
+    client = providers.OpenAIStructuredLLMClient(
+        FakeOpenAIClient(outputs.BreakingChangesOutput(bullets=[]), usage=usage),
+        model="gpt-test",
+    )
+
+    client.parse_structured_output(
+        prompt="Summarize",
+        output_model=outputs.BreakingChangesOutput,
+        max_output_tokens=100,
+        call_name="breaking",
+    )
+
+    recorded = providers.last_llm_usage()
+    assert recorded is not None
+    assert (recorded.call_name, recorded.model) == ("breaking", "gpt-test")
+    assert (recorded.input_tokens, recorded.output_tokens) == (1500, 400)
+    assert (recorded.cached_input_tokens, recorded.reasoning_tokens) == (1024, 250)
+    assert providers.LLM_USAGE_LOG.records() == [recorded]
+
+
+def test_openai_incomplete_response_usage_is_still_recorded() -> None:
+    providers.reset_llm_usage_log()
+    client = providers.OpenAIStructuredLLMClient(
+        FakeOpenAIClient(
+            None,
+            status="incomplete",
+            usage=SimpleNamespace(input_tokens=900, output_tokens=100),
+        ),
+        model="gpt-test",
+    )
+
+    with pytest.raises(providers.LLMProviderNonRetryableError):
+        client.parse_structured_output(
+            prompt="Summarize",
+            output_model=outputs.BreakingChangesOutput,
+            max_output_tokens=100,
+            call_name="breaking",
+        )
+
+    assert [record.output_tokens for record in providers.LLM_USAGE_LOG.records()] == [100]
+
+
+def test_anthropic_usage_counts_cache_reads_and_writes_as_input() -> None:
+    providers.reset_llm_usage_log()
+    fake = FakeAnthropicClient(
+        usage=SimpleNamespace(
+            input_tokens=200,
+            output_tokens=80,
+            cache_read_input_tokens=3000,
+            cache_creation_input_tokens=500,
+        )
+    )
+    client = providers.AnthropicStructuredLLMClient(fake, model="claude-test")  # type: ignore[arg-type]
+
+    client.parse_structured_output(
+        prompt="Write copy",
+        output_model=outputs.ChangelogCopy,
+        max_output_tokens=123,
+        call_name="copy",
+    )
+
+    recorded = providers.last_llm_usage()
+    assert recorded is not None
+    assert (recorded.input_tokens, recorded.cached_input_tokens, recorded.output_tokens) == (3700, 3000, 80)
+    assert providers.format_llm_usage_summary([recorded]) == (
+        "LLM usage: 1 responses, 3700 input tokens (3000 cached, 81% hit rate), 80 output tokens (0 reasoning)"
+    )
+
+
+def test_responses_without_usage_are_not_recorded() -> None:
+    providers.reset_llm_usage_log()
+    client = providers.AnthropicStructuredLLMClient(FakeAnthropicClient(), model="claude-test")  # type: ignore[arg-type]
+
+    client.parse_structured_output(
+        prompt="Write copy",
+        output_model=outputs.ChangelogCopy,
+        max_output_tokens=123,
+        call_name="copy",
+    )
+
+    assert providers.last_llm_usage() is None
+    assert providers.LLM_USAGE_LOG.records() == []
+
+
+class FakeStream:
+    """Context-managed event stream that records how far it was consumed."""
+
+    def __init__(self, events: list[object], final: object) -> None:
+        self.events = events
+        self.final = final
+        self.consumed = 0
+        self.closed = False
+
+    def __enter__(self) -> "FakeStream":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.closed = True
+
+    def __iter__(self) -> Any:
+        for event in self.events:
+            self.consumed += 1
+            yield event
+
+    def get_final_response(self) -> object:
+        return self.final
+
+    def get_final_message(self) -> object:
+        return self.final
+
+
+def openai_text_deltas(*deltas: str) -> list[object]:
+    return [SimpleNamespace(type="response.output_text.delta", delta=delta) for delta in deltas]
+
+
+def reject_header(text: str) -> None:
+    if "## 1." in text:
+        raise providers.LLMOutputValidationError(["Release-note body must not include the deterministic `##` release header."])
+
+
+def test_openai_stream_validator_cancels_request_on_first_violation() -> None:
+    stream = FakeStream(
+        openai_text_deltas('{"content": "', "## 1.0", ".0\\n", "more text", '"}'),
+        final=SimpleNamespace(output_parsed=None, status="completed", output=[], usage=None),
+    )
+    fake = SimpleNamespace(responses=SimpleNamespace(stream=lambda **kwargs: stream))
+    client = providers.OpenAIStructuredLLMClient(fake, model="gpt-test")
+
+    with pytest.raises(providers.LLMOutputValidationError, match="release header"):
+        client.parse_structured_output(
+            prompt="Write notes",
+            output_model=outputs.MarkdownSection,
+            max_output_tokens=100,
+            call_name="body",
+            stream_validator=reject_header,
+        )
+
+    assert stream.consumed == 2
+    assert stream.closed is True
+
+
+def test_openai_stream_returns_final_parsed_output() -> None:
+    parsed = outputs.MarkdownSection(content="#### Notes")
+    stream_kwargs: dict[str, Any] = {}
+
+    def open_stream(**kwargs: Any) -> FakeStream:
+        stream_kwargs.update(kwargs)
+        return FakeStream(
+            openai_text_deltas('{"content": ', '"#### Notes"}'),
+            final=SimpleNamespace(output_parsed=parsed, status="completed", output=[], usage=None),
+        )
+
+    client = providers.OpenAIStructuredLLMClient(
+        SimpleNamespace(responses=SimpleNamespace(stream=open_stream)),
+        model="gpt-test",
+    )
+
+    assert client.parse_structured_output(
+        prompt="Write notes",
+        output_model=outputs.MarkdownSection,
+        max_output_tokens=100,
+        call_name="body",
+        stream_validator=reject_header,
+    ) == parsed
+    assert stream_kwargs["text_format"] is outputs.MarkdownSection
+
+
+def test_openai_stream_surfaces_incomplete_responses() -> None:
+    incomplete = SimpleNamespace(output_parsed=None, status="incomplete", output=[], usage=None, incomplete_details=None)
+    stream = FakeStream(
+        [*openai_text_deltas('{"content": "'), SimpleNamespace(type="response.incomplete", response=incomplete)],
+        final=None,
+    )
+    client = providers.OpenAIStructuredLLMClient(
+        SimpleNamespace(responses=SimpleNamespace(stream=lambda **kwargs: stream)),
+        model="gpt-test",
+    )
+
+    with pytest.raises(providers.LLMProviderNonRetryableError, match="was incomplete"):
+        client.parse_structured_output(
+            prompt="Write notes",
+            output_model=outputs.MarkdownSection,
+            max_output_tokens=100,
+            call_name="body",
+            stream_validator=reject_header,
+        )
+
+
+def test_anthropic_stream_validator_cancels_request_on_first_violation() -> None:
+    stream = FakeStream(
+        [SimpleNamespace(type="text", text=text) for text in ('{"content": "', "## 1.0", '"}')],
+        final=SimpleNamespace(parsed_output=None, usage=None),
+    )
+    fake = SimpleNamespace(beta=SimpleNamespace(messages=SimpleNamespace(stream=lambda **kwargs: stream)))
+    client = providers.AnthropicStructuredLLMClient(fake, model="claude-test")  # type: ignore[arg-type]
+
+    with pytest.raises(providers.LLMOutputValidationError):
+        client.parse_structured_output(
+            prompt="Write notes",
+            output_model=outputs.MarkdownSection,
+            max_output_tokens=100,
+            call_name="body",
+            stream_validator=reject_header,
+        )
+
+    assert (stream.consumed, stream.closed) == (2, True)
+
+
 def test_openai_structured_client_fails_closed_on_refusal() -> None:
     refusal_output = [
         SimpleNamespace(
@@ -381,3 +656,173 @@ def test_blank_openai_api_key_is_missing(monkeypatch: pytest.MonkeyPatch) -> Non
 
     with pytest.raises(RuntimeError, match="OPENAI_API_KEY"):
         providers.build_structured_llm_client_from_env()
+
+
+class FakeHTTPError(Exception):
+    def __init__(self, headers: dict[str, str]) -> None:
+        super().__init__("rate limited")
+        self.response = SimpleNamespace(headers=headers)
+
+
+def make_retry_policy(
+    budget_seconds: float = 300.0,
+    **kwargs: Any,
+) -> providers.LLMRetryPolicy:
+    return providers.LLMRetryPolicy(
+        budget=providers.LLMRetryBudget(budget_seconds),
+        rng=random.Random(0),
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"retry-after-ms": "1500"}, 1.5),
+        ({"retry-after": "7"}, 7.0),
+        ({"retry-after": "Thu, 01 Jan 1970 00:00:00 GMT"}, 0.0),
+        ({"retry-after": "not-a-date"}, None),
+        ({}, None),
+    ],
+)
+def test_retry_after_seconds_from_error_reads_provider_hints(
+    headers: dict[str, str],
+    expected: float | None,
+) -> None:
+    assert providers.retry_after_seconds_from_error(FakeHTTPError(headers)) == expected
+
+
+def test_retry_policy_retries_validation_failures_immediately() -> None:
+    policy = make_retry_policy()
+
+    assert policy.wait_for_error(providers.LLMOutputValidationError(["bad"]), 3) == 0.0
+
+
+def test_retry_policy_honors_retry_after_hint_with_jitter() -> None:
+    policy = make_retry_policy(hint_jitter_seconds=1.0)
+    error = providers.LLMProviderRetryableError("429", retry_after_seconds=12.0)
+
+    wait = policy.wait_for_error(error, 1)
+
+    assert 12.0 <= wait <= 13.0
+
+
+def test_retry_policy_uses_jittered_exponential_backoff_without_hint() -> None:
+    policy = make_retry_policy(backoff_min_seconds=2.0, backoff_max_seconds=60.0)
+    error = providers.LLMProviderRetryableError("502")
+
+    assert 1.0 <= policy.wait_for_error(error, 1) <= 2.0
+    assert 4.0 <= policy.wait_for_error(error, 3) <= 8.0
+    assert 30.0 <= policy.wait_for_error(error, 10) <= 60.0
+
+
+def test_llm_retryable_retries_validation_errors_without_sleeping(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    attempts = 0
+
+    @providers.llm_retryable(make_retry_policy())
+    def flaky() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise providers.LLMOutputValidationError(["missing link"])
+        return "ok"
+
+    assert flaky() == "ok"
+    assert attempts == 3
+    assert all(sleep == 0 for sleep in sleeps)
+
+
+def test_llm_retryable_stops_when_hint_exceeds_retry_budget(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    attempts = 0
+
+    @providers.llm_retryable(make_retry_policy(budget_seconds=30.0))
+    def rate_limited() -> str:
+        nonlocal attempts
+        attempts += 1
+        raise providers.LLMProviderRetryableError("429", retry_after_seconds=120.0)
+
+    with pytest.raises(providers.LLMProviderRetryableError, match="429"):
+        rate_limited()
+
+    assert attempts == 1
+    assert sum(sleeps) == 0
+
+
+def test_llm_retryable_sleeps_the_retry_after_hint_before_every_retry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+
+    @providers.llm_retryable(make_retry_policy(max_attempts=3, hint_jitter_seconds=0.5))
+    def rate_limited() -> str:
+        raise providers.LLMProviderRetryableError("429", retry_after_seconds=7.0)
+
+    with pytest.raises(providers.LLMProviderRetryableError, match="429"):
+        rate_limited()
+
+    assert len(sleeps) == 2
+    assert all(7.0 <= sleep <= 7.5 for sleep in sleeps)
+
+
+def test_llm_retryable_waits_for_the_error_of_the_attempt_that_just_failed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    errors: list[Exception] = [
+        providers.LLMOutputValidationError(["missing link"]),
+        providers.LLMProviderRetryableError("429", retry_after_seconds=7.0),
+        providers.LLMOutputValidationError(["missing link"]),
+    ]
+
+    @providers.llm_retryable(make_retry_policy(hint_jitter_seconds=0.0))
+    def flaky() -> str:
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    assert flaky() == "ok"
+    assert sleeps == [0.0, 7.0, 0.0]
+
+
+def test_retry_budget_is_shared_across_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    policy = make_retry_policy(budget_seconds=10.0, hint_jitter_seconds=0.0)
+    attempts = 0
+
+    @providers.llm_retryable(policy)
+    def rate_limited() -> str:
+        nonlocal attempts
+        attempts += 1
+        raise providers.LLMProviderRetryableError("429", retry_after_seconds=4.0)
+
+    with pytest.raises(providers.LLMProviderRetryableError):
+        rate_limited()
+    first_call_attempts = attempts
+    with pytest.raises(providers.LLMProviderRetryableError):
+        rate_limited()
+
+    assert first_call_attempts == 3
+    assert attempts == first_call_attempts + 1
+    assert policy.budget.remaining() < 4.0
+
+
+def test_retry_budget_seconds_env_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(providers.LLM_RETRY_BUDGET_SECONDS_ENV, "  ")
+    assert providers.llm_retry_budget_seconds_from_env() == providers.DEFAULT_LLM_RETRY_BUDGET_SECONDS
+
+    monkeypatch.setenv(providers.LLM_RETRY_BUDGET_SECONDS_ENV, "45")
+    assert providers.llm_retry_budget_seconds_from_env() == 45.0
+
+    monkeypatch.setenv(providers.LLM_RETRY_BUDGET_SECONDS_ENV, "soon")
+    with pytest.raises(RuntimeError, match=providers.LLM_RETRY_BUDGET_SECONDS_ENV):
+        providers.llm_retry_budget_seconds_from_env()
@@ -171,8 +171,6 @@ def test_main_happy_path_writes_structured_result(
             }
         ],
     )
-    monkeypatch.setattr(uc, "validate_changelog_data", lambda *args, **kwargs: None)
-    monkeypatch.setattr(uc, "validate_changelog", lambda *args, **kwargs: None)
     monkeypatch.setattr(uc, "get_next_image_number", lambda **kwargs: 3)
     monkeypatch.setattr(uc, "llm_generate_release_notes_body", lambda *args, **kwargs: "BODY")
     monkeypatch.setattr(uc, "render_release_notes_section", lambda *args, **kwargs: "RELEASE NOTES\n")
@@ -234,7 +232,7 @@ def test_main_validates_release_note_body_before_writing_artifacts(
         raise AssertionError("production artifact writer should not be called")
 
     monkeypatch.setattr(uc, "llm_generate_release_notes_body", fail_release_note_body)
-    monkeypatch.setattr(uc, "validate_changelog", fail_if_called)
+    monkeypatch.setattr(uc, "validate_changelog_update", fail_if_called)
     monkeypatch.setattr(uc, "get_next_image_number", fail_if_called)
     monkeypatch.setattr(uc, "update_markdown_file", fail_if_called)
     monkeypatch.setattr(uc, "write_consumed_source_state", fail_if_called)
@@ -204,3 +204,45 @@ def test_breaking_changes_validator_warns_without_action_language() -> None:
     )
 
     assert warnings == ["Breaking-change bullet 1 may need clearer migration/action language."]
+
+
+def test_partial_json_string_values_decodes_truncated_output() -> None:
+    partial = '{"bullets": ["Rename `x`\\n", "Remove the \\"old\\" API", "Upda\\u00e'
+
+    assert validators.partial_json_string_values(partial) == [
+        ("Rename `x`\n", True),
+        ('Remove the "old" API', True),
+        ("Upda", False),
+    ]
+    assert validators.partial_json_string_values('{"content": "') == [("", False)]
+    assert validators.partial_json_string_values('{"cont') == []
+
+
+def test_body_stream_validator_aborts_on_release_header_before_line_ends() -> None:
+    validate = validators.release_notes_body_stream_validator(prs=[make_pr(101)], include_pr_links=True)
+
+    validate('{"content": "#### Better pipelines\\n')
+    with pytest.raises(LLMOutputValidationError, match="release header"):
+        validate('{"content": "#### Better pipelines\\n## 0.85')
+
+
+def test_body_stream_validator_waits_for_complete_lines() -> None:
+    validate = validators.release_notes_body_stream_validator(prs=[make_pr(101)], include_pr_links=False)
+
+    validate('{"content": "Improved #10')
+    with pytest.raises(LLMOutputValidationError, match="must not include PR links"):
+        validate('{"content": "Improved #101 for everyone.\\n')
+
+
+def test_body_stream_validator_leaves_missing_links_to_final_validation() -> None:
+    validate = validators.release_notes_body_stream_validator(prs=[make_pr(101)], include_pr_links=True)
+
+    validate('{"content": "#### Better pipelines\\n\\nNo links yet.\\n"}')
+
+
+def test_breaking_stream_validator_checks_each_completed_bullet() -> None:
+    validate = validators.breaking_changes_stream_validator(breaking_prs=[make_pr(201)], include_pr_links=True)
+
+    validate('{"bullets": ["Rename the API without a li')
+    with pytest.raises(LLMOutputValidationError, match="bullet 1 must include a markdown PR link"):
+        validate('{"bullets": ["Rename the API without a link", "')
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
 
@@ -10,6 +11,7 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from scripts import workflow_result as wr
+from scripts.changelog_llm_outputs import LLMUsage
 
 
 def make_result(**overrides: object) -> wr.ChangelogWorkflowResult:
@@ -84,6 +86,7 @@ def test_workflow_result_json_round_trip_is_deterministic(tmp_path: Path) -> Non
         "{\n"
         '  "breaking_changes": "- Removed old behavior",\n'
         '  "has_changes": true,\n'
+        '  "llm_calls": [],\n'
         '  "markdown_file": "gitbook-release-notes/server-sdk.md",\n'
         '  "needs_attention": "Needs review",\n'
         '  "source_windows": "included zenml-io/zenml 0.84.0 -> 0.85.0 release_notes=2 breaking=1 filtered=0"\n'
@@ -93,6 +96,26 @@ def test_workflow_result_json_round_trip_is_deterministic(tmp_path: Path) -> Non
     assert loaded == result
 
 
+def test_workflow_result_round_trips_llm_call_metrics(tmp_path: Path) -> None:
+    path = tmp_path / "result.json"
+    usage = LLMUsage(
+        call_name="grouped_changelog_entries",
+        model="gpt-5.4",
+        input_tokens=1200,
+        output_tokens=300,
+        cached_input_tokens=1024,
+        reasoning_tokens=128,
+        latency_seconds=2.5,
+    )
+    result = make_result(llm_calls=[usage])
+
+    wr.write_changelog_workflow_result(result, path)
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    assert payload["llm_calls"][0]["cached_input_tokens"] == 1024
+    assert wr.read_changelog_workflow_result(path).llm_calls == [usage]
+
+
 def test_read_workflow_result_fails_closed_for_missing_file(tmp_path: Path) -> None:
     with pytest.raises(RuntimeError, match="not found"):
         wr.read_changelog_workflow_result(tmp_path / "missing.json")